@@ -5,6 +5,31 @@ import scipy.integrate as integrate
 import matplotlib.pyplot as plt
 import statistics
 import PhlyGreen.Utilities.Atmosphere as ISA
+from . import climate_engine
+
+# ATR evaluation (ClimateImpactInput['ATR Method']): shared-grid convolutions, or the
+# nested adaptive quadrature kept as the reference
+ATR_METHODS = ('Grid', 'Quadrature')
+
+# Filippone EINOx correlation: coefficients for climb-out, idle and approach, applied to the
+# climb, cruise and descent segments (Profile.Categories), and the overall pressure ratio
+FILIPPONE_COEFF = np.array([
+    [0.7194e+1, 0.5609e+0, -0.1059e-1, -0.3223e+1, 0.2889e+0, 0.2591e+0],
+    [0.1605e+0, 0.2412e+0, -0.1650e-2, -0.8818e+1, 0.3714e+2, -0.2268e+0],
+    [ 0.3699e+0, 0.5470e+0, -0.7445e-2, -0.6914e+1, 0.6782e+1, 0.1138e+0]
+])
+FILIPPONE_OPR = 15.77
+
+
+def EINOx_filippone(portata, phase):
+    """EINOx [g/kg(fuel)] of the two engines at total fuel flows ``portata`` [kg/s].
+
+    ``phase`` holds the segment category (0 climb, 1 cruise, 2 descent) of every point.
+    """
+    c = FILIPPONE_COEFF[np.asarray(phase)].T
+    OPR = FILIPPONE_OPR
+    mfuel = 0.5*np.asarray(portata)  # portata di combustibile del singolo motore
+    return 2*(c[0] + c[1]*OPR + c[2]*(OPR)**2 + c[3]*mfuel + c[4]*(mfuel)**2 + c[5]*OPR*mfuel)
 
 
 class ClimateImpact:
@@ -30,6 +55,7 @@ class ClimateImpact:
         Grid_CO2      : CO2 intensity of electricity [kg CO2 / MJ]
         WTW_CO2       : well-to-wake CO2 intensity of fuel [kg CO2 / MJ]
         EINOx_model   : {'unset', 'Filippone'}
+        ATR Method    : {'Grid' (default), 'Quadrature'}
 
     The class relies on mission profiles produced by the Mission module, including:
         • continuous or discrete altitude/velocity profiles
@@ -53,6 +79,7 @@ class ClimateImpact:
         self.N = None   # numero di voli all'anno (durante gli anni di attività)
         self.Y = None   # numero di anni di attività
         self.EINOx_model = 'unset'
+        self.ATR_method = 'Grid'
 
         self.RF_2CO2 = 3.7  # [W/m^2]
 
@@ -152,7 +179,7 @@ class ClimateImpact:
         Load climate-impact parameters from aircraft.ClimateImpactInput.
 
         Expected fields:
-            H, N, Y, Grid_CO2, WTW_CO2, EINOx_model
+            H, N, Y, Grid_CO2, WTW_CO2, EINOx_model (optional: ATR Method)
         """
         required_keys = {'H', 'N', 'Y', 'EINOx_model'}
         if required_keys.issubset(self.aircraft.ClimateImpactInput.keys()):
@@ -162,6 +189,9 @@ class ClimateImpact:
             self.Grid_CO2 = self.aircraft.ClimateImpactInput.get("Grid_CO2")
             self.WTW_CO2 = self.aircraft.ClimateImpactInput.get("WTW_CO2")
             self.EINOx_model = self.aircraft.ClimateImpactInput.get("EINOx_model")
+            self.ATR_method = self.aircraft.ClimateImpactInput.get("ATR Method", 'Grid')
+            if self.ATR_method not in ATR_METHODS:
+                raise ValueError(f"Unknown ATR method {self.ATR_method!r}. Available: {ATR_METHODS}")
         else:
             raise ValueError("Error: Missing required climate impact input keys")
 
@@ -182,9 +212,12 @@ class ClimateImpact:
 
     # NUMERO DI VOLI ALL'ANNO
 
+    # breakpoints of U(t) [yr]: ramp-up, steady operation, phase-out
+    U_BREAKS = (0, 30, 35, 65)
+
     def U(self,year):
         """
-        Annual mission count function U(t).
+        Annual mission count function U(t); accepts arrays of years.
 
         Model:
             • Ramp-up from 0 to N over 30 years
@@ -192,21 +225,7 @@ class ClimateImpact:
             • Linear phase-out to 0 over 30 years
         """
 
-        if year >= 0 and year <= 30:
-
-            U = np.interp(year, [0, 30], [0, self.N])
-
-        elif year > 30 and year <= 35:
-
-            U = self.N
-
-        elif year > 35 and year <= 65:
-
-            U = np.interp(year, [35, 65], [self.N, 0]) 
-
-        else:
-            
-            U = 0
+        U = np.interp(year, self.U_BREAKS, [0, self.N, self.N, 0], left=0, right=0)
 
         # if year >= 0 and year <= self.Y:
         #     U = self.N
@@ -256,177 +275,28 @@ class ClimateImpact:
         def E_nox_1m():  # emissione di NOx in kg della singola missione
                 
                 if self.EINOx_model == 'Filippone':
-                    times = np.array([])
-                    beta = np.array([])
-                    for array in self.aircraft.mission.integral_solution:
-                        times = np.concatenate([times, array.t])
-                        if self.aircraft.Configuration == 'Traditional':
-                            beta = np.concatenate([beta, array.y[1]])
-                        elif self.aircraft.Configuration == 'Hybrid':
-                            beta = np.concatenate([beta, array.y[2]])
-
-                    # times = self.aircraft.mission.MissionTimes
-                    # beta = self.aircraft.mission.Beta_Output 
-                    
-                    v0 = self.aircraft.mission.profile.Velocity(times)  # [m/s]
-                    alt = self.aircraft.mission.profile.Altitude(times)  # [m]
-
-                    if self.aircraft.Configuration == 'Hybrid':
-                        spr = [self.aircraft.mission.profile.SuppliedPowerRatio(t) for t in times]
-
-
-                    # calculate breakpoint times
-                    breakpoint_times = np.zeros(5)
-                    alt_cruise = self.aircraft.MissionStages['Cruise']['input']['Altitude']
-                    alt_start_diversion = self.aircraft.DiversionStages['Climb1']['input']['StartAltitude']
-                    alt_diversion_cruise = self.aircraft.DiversionStages['Cruise']['input']['Altitude']
-                    indices_alt_cruise = np.where(alt == alt_cruise)
-                    breakpoint_times[0] = times[indices_alt_cruise[0][0]]
-                    breakpoint_times[1] = times[indices_alt_cruise[0][-1]]
-                    indices_alt_start_diversion = np.where(alt == alt_start_diversion)
-                    for index in indices_alt_start_diversion[0]:
-                        if times[index] > breakpoint_times[1]:
-                            breakpoint_times[2] = times[index]
-                            break
-                    indices_alt_diversion_cruise = np.where(alt == alt_diversion_cruise)
-                    for index in indices_alt_diversion_cruise[0]:
-                        if times[index] > breakpoint_times[2]:
-                            breakpoint_times[3] = times[index]
-                            break
-                    breakpoint_times[4] = times[indices_alt_diversion_cruise[0][-1]]
-
-
-                    portata = np.zeros(len(times))  # [kg(fuel)/s]
-                    coeff = np.array([
-                        [0.7194e+1, 0.5609e+0, -0.1059e-1, -0.3223e+1, 0.2889e+0, 0.2591e+0],
-                        [0.1605e+0, 0.2412e+0, -0.1650e-2, -0.8818e+1, 0.3714e+2, -0.2268e+0],
-                        [ 0.3699e+0, 0.5470e+0, -0.7445e-2, -0.6914e+1, 0.6782e+1, 0.1138e+0]
-                    ])
-                    # coeff sono i coefficienti del metodo di Filippone per climbout, idle e approach
-
-                    EI_NOx = np.zeros(len(times))  # [g/kg(fuel)]
-                    OPR = 15.77
-                
+                    # fuel flow at the mission solver points, phase coefficients by segment
+                    trajectory = self._mission_trajectory()
+                    times, portata = trajectory.t, trajectory.fuel_flow
+                    phase = np.asarray(self.aircraft.mission.profile.Categories)[trajectory.segment]
+                    EI_NOx = EINOx_filippone(portata, phase)  # [g/kg(fuel)]
 
-                    for t in range(len(times)):
-                        power = (self.aircraft.weight.WTO) * self.aircraft.performance.PoWTO(self.aircraft.DesignWTOoS,beta[t],self.aircraft.mission.profile.PowerExcess(times[t]),1,alt[t],self.aircraft.mission.DISA,v0[t],'TAS')
-                        if self.aircraft.Configuration == 'Traditional':
-                            PRatio = self.aircraft.powertrain.Traditional(alt[t],v0[t],power) 
-                        elif self.aircraft.Configuration == 'Hybrid':
-                            PRatio = self.aircraft.powertrain.Hybrid(spr[t],alt[t],v0[t],power)
-                        portata[t] = power * PRatio[0]/self.aircraft.weight.ef
-
-
-           
-
-
-                        if times[t] <= breakpoint_times[0] or (times[t] <= breakpoint_times[3] and times[t] >= breakpoint_times[2]):
-                            c = coeff[0]
-                        elif (times[t] > breakpoint_times[0] and times[t] < breakpoint_times[1]) or (times[t] > breakpoint_times[3] and times[t] < breakpoint_times[4]):
-                            c = coeff[1]
-                        else:
-                            c = coeff[2]
-
-                        mfuel = 0.5*portata[t]  # portata di combustibile del singolo motore
-                        
-                    
-
-                        EI_NOx[t] =  2*(c[0] + c[1]*OPR + c[2]*(OPR)**2 + c[3]*mfuel + c[4]*(mfuel)**2 + c[5]*OPR*mfuel)
-
-
-                    # plt.figure(2)
-                    # plt.plot(times/60, EI_NOx, 'b')
-                    # plt.grid(visible=True)
-                    # plt.xlabel('t [min]')
-                    # plt.ylabel('EI_NOx [g/kg(fuel)]')
-                    # plt.show()    
-
-                    integranda = portata*EI_NOx
-                    massa_di_NOx = integrate.cumulative_trapezoid(integranda, times, initial=0.0)
-                    # l'elemento n-esimo del vettore massa_di_NOx è l'integrale definito dell'integranda tra t = 0 e t = times[n]
-                    E_nox_1m = massa_di_NOx[-1]
-
-
-                    return E_nox_1m* 10**(-3)
+                    return integrate.trapezoid(portata*EI_NOx, times) * 10**(-3)
 
 
 
         def E_nox_1m_DISCRETO():  # emissione di NOx in kg della singola missione
                 
                 if self.EINOx_model == 'Filippone':
+                    # mission fuel-flow history interpolated on the discretized profile
+                    mission = self.aircraft.mission
+                    times = mission.profile.DiscretizedTime
+                    trajectory = self._mission_trajectory()
+                    portata = np.interp(times, trajectory.t, trajectory.fuel_flow)  # [kg(fuel)/s]
+                    phase = np.asarray(mission.profile.Categories)[mission.profile.segment_index(times)]
+                    EI_NOx = EINOx_filippone(portata, phase)  # [g/kg(fuel)]
 
-                    beta = self.aircraft.mission.beta_values
-                    times = self.aircraft.mission.profile.DiscretizedTime
-                   
-
-                    v0 = self.aircraft.mission.profile.DiscretizedVelocities  # [m/s]
-                    alt = self.aircraft.mission.profile.DiscretizedAltitudes  # [m]
-
-                    if self.aircraft.Configuration == 'Hybrid':
-                        spr = [self.aircraft.mission.profile.SuppliedPowerRatio(t) for t in times]
-
-
-                    breakpoint_times = np.zeros(5)
-
-                    breakpoint_times[0] = self.aircraft.mission.profile.BreaksClimb[-1]
-                    breakpoint_times[1] = self.aircraft.mission.profile.TimesCruise[-1] 
-                    breakpoint_times[2] = self.aircraft.mission.profile.BreaksDescent[-1]
-                    breakpoint_times[3] = self.aircraft.mission.profile.BreaksClimbDiversion[-1]
-                    breakpoint_times[4] = self.aircraft.mission.profile.TimesCruiseDiversion[-1]
-                    
-
-                    portata = np.zeros(len(times))  # [kg(fuel)/s]
-                    coeff = np.array([
-                        [0.7194e+1, 0.5609e+0, -0.1059e-1, -0.3223e+1, 0.2889e+0, 0.2591e+0],
-                        [0.1605e+0, 0.2412e+0, -0.1650e-2, -0.8818e+1, 0.3714e+2, -0.2268e+0],
-                        [ 0.3699e+0, 0.5470e+0, -0.7445e-2, -0.6914e+1, 0.6782e+1, 0.1138e+0]
-                    ])
-                    # coeff sono i coefficienti del metodo di Filippone per climbout, idle e approach
-
-                    EI_NOx = np.zeros(len(times))  # [g/kg(fuel)]
-                    OPR = 15.77
-                
-
-                    for t in range(len(times)):
-                        power = (self.aircraft.weight.WTO) * self.aircraft.performance.PoWTO(self.aircraft.DesignWTOoS,beta[t],self.aircraft.mission.profile.DiscretizedPowerExcess[t],1,alt[t],self.aircraft.mission.DISA,v0[t],'TAS')
-                        if self.aircraft.Configuration == 'Traditional':
-                            PRatio = self.aircraft.powertrain.Traditional(alt[t],v0[t],power) 
-                        elif self.aircraft.Configuration == 'Hybrid':
-                            PRatio = self.aircraft.powertrain.Hybrid(spr[t],alt[t],v0[t],power)
-                        portata[t] = power * PRatio[0]/self.aircraft.weight.ef
-
-
-           
-
-
-                        if times[t] <= breakpoint_times[0] or (times[t] <= breakpoint_times[3] and times[t] >= breakpoint_times[2]):
-                            c = coeff[0]
-                        elif (times[t] > breakpoint_times[0] and times[t] < breakpoint_times[1]) or (times[t] > breakpoint_times[3] and times[t] < breakpoint_times[4]):
-                            c = coeff[1]
-                        else:
-                            c = coeff[2]
-
-                        mfuel = 0.5*portata[t]  # portata di combustibile del singolo motore
-                        
-                        
-
-                        EI_NOx[t] =  2*(c[0] + c[1]*OPR + c[2]*(OPR)**2 + c[3]*mfuel + c[4]*(mfuel)**2 + c[5]*OPR*mfuel)
-
-
-                    # plt.figure(2)
-                    # plt.plot(times/60, EI_NOx, 'b')
-                    # plt.grid(visible=True)
-                    # plt.xlabel('t [min]')
-                    # plt.ylabel('EI_NOx [g/kg(fuel)]')
-                    # plt.show()    
-
-                    integranda = portata*EI_NOx
-                    massa_di_NOx = integrate.cumulative_trapezoid(integranda, times, initial=0.0)
-                    # l'elemento n-esimo del vettore massa_di_NOx è l'integrale definito dell'integranda tra t = 0 e t = times[n]
-                    E_nox_1m = massa_di_NOx[-1]
-
-
-                    return E_nox_1m* 10**(-3)
+                    return integrate.trapezoid(portata*EI_NOx, times) * 10**(-3)
 
 
 
@@ -447,19 +317,26 @@ class ClimateImpact:
         self.mission_emissions_calculated = True
 
 
+    def _mission_trajectory(self):
+        """The flown mission at its solver points (``Mission.trajectory``)."""
+        trajectory = getattr(self.aircraft.mission, 'trajectory', None)
+        if trajectory is None:
+            raise ValueError("No mission trajectory: evaluate the mission first.")
+        return trajectory
+
     def _ensure_emission_surrogate(self):
         """Attach the packaged EmissionSurrogate (PW127) if none was set."""
         if self.emission_surrogate is None:
-            from PhlyGreen.Systems.Powertrain.emissions_surrogate import EmissionSurrogate
-            self.emission_surrogate = EmissionSurrogate()   # packaged default artifact
+            from PhlyGreen.Systems.Powertrain import surrogate_registry
+            self.emission_surrogate = surrogate_registry.emissions()   # packaged default artifact
         return self.emission_surrogate
 
     def _integrate_surrogate_emissions(self, power_fraction_basis='engineRating'):
         """Set ``mission_emissions['nox'|'co'|'uhc']`` from the EI surrogate; return them.
 
-        Walks the (continuous) mission exactly as the Filippone path does — recovering, at each
-        solver point, the altitude, true airspeed and required shaft power, hence the fuel mass
-        flow ``portata = power * PRatio[0] / ef`` — then queries the surrogate for
+        Reads the (continuous) mission fuel-flow history as the Filippone path does — the
+        required propulsive power and fuel mass flow at each solver point, with the altitude
+        and true airspeed there — then queries the surrogate for
         ``EI(alt_ft, Mach, power_fraction)`` and integrates ``EI * portata`` over time. Does not
         touch CO2 (the caller handles it). ``power_fraction`` is ``power / engineRating`` clipped
         to the surrogate's training domain. Thermal-engine configs (Traditional / Hybrid) only.
@@ -471,34 +348,15 @@ class ClimateImpact:
             raise ValueError("The EI surrogate path requires MissionType == 'Continue'.")
         self._ensure_emission_surrogate()
 
-        # --- 1. walk the mission (same recovery as the Filippone path) ---
-        times = np.array([])
-        beta = np.array([])
-        for arr in self.aircraft.mission.integral_solution:
-            times = np.concatenate([times, arr.t])
-            beta = np.concatenate([beta, arr.y[1] if self.aircraft.Configuration == 'Traditional'
-                                   else arr.y[2]])
-        v0 = self.aircraft.mission.profile.Velocity(times)   # [m/s] TAS
-        alt = self.aircraft.mission.profile.Altitude(times)  # [m]
-        spr = ([self.aircraft.mission.profile.SuppliedPowerRatio(t) for t in times]
-               if self.aircraft.Configuration == 'Hybrid' else None)
-
+        # --- 1. the flown mission (same fuel-flow history as the Filippone path) ---
+        trajectory = self._mission_trajectory()
+        times, power, portata = trajectory.t, trajectory.PP, trajectory.fuel_flow
+        v0 = trajectory.velocity                     # [m/s] TAS
+        alt = trajectory.altitude                    # [m]
         DISA = self.aircraft.mission.DISA
-        power = np.zeros(len(times))
-        portata = np.zeros(len(times))   # [kg fuel / s]
-        for t in range(len(times)):
-            p = self.aircraft.weight.WTO * self.aircraft.performance.PoWTO(
-                self.aircraft.DesignWTOoS, beta[t],
-                self.aircraft.mission.profile.PowerExcess(times[t]), 1, alt[t], DISA, v0[t], 'TAS')
-            if self.aircraft.Configuration == 'Traditional':
-                PRatio = self.aircraft.powertrain.Traditional(alt[t], v0[t], p)
-            else:
-                PRatio = self.aircraft.powertrain.Hybrid(spr[t], alt[t], v0[t], p)
-            power[t] = p
-            portata[t] = p * PRatio[0] / self.aircraft.weight.ef
 
         # --- 2. operating-point coordinates for the surrogate ---
-        T = np.array([ISA.atmosphere.Tstd(float(a)) for a in alt]) + DISA   # static temp [K]
+        T = ISA.atmosphere.Tstd(alt) + DISA                  # static temp [K]
         mach = v0 / (20.0468 * np.sqrt(T))           # a = sqrt(gamma R T), gamma R ~ 401.9
         alt_ft = alt / 0.3048
         rating = getattr(self.aircraft.powertrain, 'engineRating', None) \
@@ -514,8 +372,7 @@ class ClimateImpact:
         out = {}
         for key, col in species.items():
             if col in ei:
-                grams = integrate.cumulative_trapezoid(np.asarray(ei[col]) * portata, times,
-                                                       initial=0.0)[-1]
+                grams = integrate.trapezoid(np.asarray(ei[col]) * portata, times)
                 self.mission_emissions[key] = float(grams) * 1e-3   # g -> kg
                 out[key] = self.mission_emissions[key]
         return out
@@ -762,9 +619,9 @@ class ClimateImpact:
         def G_xco2(year):
             # qui G_xco2 non ha le dimensioni corrette perchè manca un fattore 10^-12, che aggiungerò a valle
             # della convoluzione per diminuire il tempo d'esecuzione dell'integrale
-            alpha = np.array([0.1135, 0.152, 0.0970, 0.041])  # [moltiplicato per 10^-12 sarebbe ppmv/kg(CO2)]
-            tau = np.array([313.8, 79.8, 18.8, 1.7])  # [anni]
-            G_xco2 = 0.067e-12  # [moltiplicato per 10^-12 sarebbe ppmv/kg(CO2)]
+            alpha = np.array(climate_engine.CO2_ALPHA)  # [moltiplicato per 10^-12 sarebbe ppmv/kg(CO2)]
+            tau = np.array(climate_engine.CO2_TAU)  # [anni]
+            G_xco2 = climate_engine.CO2_CONSTANT  # [moltiplicato per 10^-12 sarebbe ppmv/kg(CO2)]
             for i in range(len(alpha)):
                 G_xco2 = G_xco2 + alpha[i]*np.exp(-year/tau[i])
             return G_xco2
@@ -782,7 +639,7 @@ class ClimateImpact:
 
         discretized_integral = integrate.trapezoid(discretized_func, x = discretized_time)
 
-        XCO2_0 = 380 # concentrazione di background [ppmv]
+        XCO2_0 = climate_engine.XCO2_0 # concentrazione di background [ppmv]
         # rf_co2 = np.log((XCO2_0 + DeltaXCO2(year))/XCO2_0)/np.log(2)
         rf_co2 = np.log((XCO2_0 + discretized_integral*1e-12)/XCO2_0)/np.log(2)
 
@@ -791,9 +648,9 @@ class ClimateImpact:
 
     def rf_h2o(self,year):
 
-        c_h2o = 7.43e-15 # [(w/m^2)/kg(h2o)]
+        c_h2o = climate_engine.C_H2O # [(w/m^2)/kg(h2o)]
         RF_h2o = c_h2o * self.E_h2o(year)
-        eff_h2o = 1.14
+        eff_h2o = climate_engine.EFF_H2O
         rf_h2o = RF_h2o * eff_h2o/self.RF_2CO2
 
         return rf_h2o
@@ -801,9 +658,9 @@ class ClimateImpact:
 
     def rf_so4(self,year):
 
-        c_so4 = -1e-10 # [(w/m^2)/kg(so4)]
+        c_so4 = climate_engine.C_SO4 # [(w/m^2)/kg(so4)]
         RF_so4 = c_so4 * self.E_so4(year)
-        eff_so4 = 0.9
+        eff_so4 = climate_engine.EFF_SO4
         rf_so4 = RF_so4 * eff_so4/self.RF_2CO2
 
         return rf_so4
@@ -811,9 +668,9 @@ class ClimateImpact:
 
     def rf_soot(self,year):
 
-        c_soot = 5e-10 # [(w/m^2)/kg(soot)]
+        c_soot = climate_engine.C_SOOT # [(w/m^2)/kg(soot)]
         RF_soot = c_soot * self.E_soot(year)
-        eff_soot = 0.7
+        eff_soot = climate_engine.EFF_SOOT
         rf_soot = RF_soot * eff_soot/self.RF_2CO2
 
         return rf_soot
@@ -827,8 +684,8 @@ class ClimateImpact:
         def G_ch4(year):
             # qui G_ch4 non ha le dimensioni corrette perchè manca un fattore 10^-13, che aggiungerò a valle
             # della convoluzione per diminuire il tempo d'esecuzione dell'integrale
-            A = -5.16  # [moltiplicato per 10^-13 sarebbe (W/m^2)/kg(NOx)]
-            tau = 12  # [anni]
+            A = climate_engine.CH4_A  # [moltiplicato per 10^-13 sarebbe (W/m^2)/kg(NOx)]
+            tau = climate_engine.NOX_TAU  # [anni]
             G_ch4 = A*np.exp(-year/tau)
             return G_ch4
         
@@ -844,7 +701,7 @@ class ClimateImpact:
         s_ch4 = np.interp(self.media_pesata_quote,self.Altitudes_for_forcing,self.s_o3l_data)
         # RF_ch4 = discretized_integral * 1e-13 * self.s_ch4(self.media_pesata_quote)
         RF_ch4 = discretized_integral * 1e-13 * s_ch4
-        eff_ch4 = 1.18
+        eff_ch4 = climate_engine.EFF_CH4
         rf_ch4 = RF_ch4 * eff_ch4/self.RF_2CO2
         return rf_ch4
     
@@ -857,8 +714,8 @@ class ClimateImpact:
         def G_o3l(year):
             # qui G_o3l non ha le dimensioni corrette perchè manca un fattore 10^-13, che aggiungerò a valle
             # della convoluzione per diminuire il tempo d'esecuzione dell'integrale
-            A = -1.21  # [moltiplicato per 10^-13 sarebbe (W/m^2)/kg(NOx)]
-            tau = 12  # [anni]
+            A = climate_engine.O3L_A  # [moltiplicato per 10^-13 sarebbe (W/m^2)/kg(NOx)]
+            tau = climate_engine.NOX_TAU  # [anni]
             G_o3l = A*np.exp(-year/tau)
             return G_o3l
         
@@ -874,7 +731,7 @@ class ClimateImpact:
         s_o3l = np.interp(self.media_pesata_quote,self.Altitudes_for_forcing,self.s_o3l_data)
         # RF_o3l = discretized_integral * 1e-13 * self.s_o3l(self.media_pesata_quote)
         RF_o3l = discretized_integral * 1e-13 * s_o3l
-        eff_o3 = 1.37
+        eff_o3 = climate_engine.EFF_O3
         rf_o3l = RF_o3l * eff_o3/self.RF_2CO2
 
         
@@ -887,11 +744,11 @@ class ClimateImpact:
         # if self.media_pesata_quote is None:
         #     self.calculate_media_pesata_quote()
 
-        c_o3s = 1.01e-11 # [(w/m^2)/kg(NOx)]
+        c_o3s = climate_engine.C_O3S # [(w/m^2)/kg(NOx)]
         s_o3s = np.interp(self.media_pesata_quote,self.Altitudes_for_forcing,self.s_o3s_data)
         # RF_o3s = c_o3s * self.E_nox(year) * self.s_o3s(self.media_pesata_quote)
         RF_o3s = c_o3s * self.E_nox(year) * s_o3s
-        eff_o3 = 1.37
+        eff_o3 = climate_engine.EFF_O3
         rf_o3s = RF_o3s * eff_o3/self.RF_2CO2
 
         return rf_o3s
@@ -899,7 +756,7 @@ class ClimateImpact:
 
     def rf_AIC(self,year):
         if ISA.atmosphere.Tstd(self.media_pesata_quote) < 235. :
-            c_AIC = 2.21e-12
+            c_AIC = climate_engine.C_AIC
             s_AIC = np.interp(self.media_pesata_quote,self.Altitudes_for_forcing,self.s_aic_data)
             rf = s_AIC * c_AIC * self.aircraft.mission.profile.MissionRange * self.U(year) 
         else:
@@ -921,8 +778,8 @@ class ClimateImpact:
         
         def Function(k, year):
             
-            alpha = 2.246/36.8  # [K/yr]
-            tau = 36.8  # [anni]
+            alpha = climate_engine.T_ALPHA  # [K/yr]
+            tau = climate_engine.T_TAU  # [anni]
             G_T = alpha*np.exp(-(year - k)/tau)
 
             integrand = G_T * self.rf(k)
@@ -952,11 +809,65 @@ class ClimateImpact:
 
     # ATR
 
-    def ATR(self):   # [K]
+    def climate_response(self, step=climate_engine.STEP):
+        """
+        Forcing, temperature response and ATR of the fleet on a shared time grid.
+
+        Evaluates the same model as ``rf``/``DeltaT``/``ATR`` with exact exponential
+        convolutions of the emission schedule (see ``climate_engine``), on a grid of about
+        ``step`` years over the horizon H.
+
+        Returns:
+            ClimateResponse: grid times, U(t), per-species RF*(t), DeltaT(t) [K] and ATR [K].
+        """
+        if not self.mission_emissions_calculated:
+            self.calculate_mission_emissions()
+        self.calculate_media_pesata_quote()
+        h = self.media_pesata_quote
+
+        if ISA.atmosphere.Tstd(h) < 235.:
+            s_AIC = np.interp(h,self.Altitudes_for_forcing,self.s_aic_data)
+            aic = s_AIC * climate_engine.C_AIC * self.aircraft.mission.profile.MissionRange
+        else:
+            aic = 0.
+
+        t = climate_engine.grid(self.H, step, kinks=self.U_BREAKS)
+        U = self.U(t)
+        rf = climate_engine.forcing(
+            t, U, self.mission_emissions,
+            s_o3l=np.interp(h,self.Altitudes_for_forcing,self.s_o3l_data),
+            s_o3s=np.interp(h,self.Altitudes_for_forcing,self.s_o3s_data),
+            aic=aic, rf_2co2=self.RF_2CO2)
+        DeltaT = climate_engine.temperature(t, sum(rf.values()))
+        return climate_engine.ClimateResponse(t=t, U=U, rf=rf, DeltaT=DeltaT,
+                                              ATR=climate_engine.average(t, DeltaT))
+
+    def ATR(self, species=None):   # [K]
+        """
+        Average Temperature Response over the horizon H [K].
+
+        ``species`` restricts the forcing to a subset of ``climate_engine.SPECIES`` (e.g.
+        ``('co2',)``); by default every species contributes. Evaluated with
+        ``climate_response`` unless ``ATR_method`` is ``'Quadrature'``.
+        """
+        if self.ATR_method == 'Grid':
+            response = self.climate_response()
+            return response.ATR if species is None else response.ATR_of(species)
+        if species is None:
+            return self._ATR_quadrature()
+        terms = [getattr(self, 'rf_AIC' if s == 'aic' else 'rf_' + s) for s in species]
+        self.rf = lambda year: sum(term(year) for term in terms)
+        try:
+            return self._ATR_quadrature()
+        finally:
+            del self.rf
+
+    def _ATR_quadrature(self):
+        """Reference ATR: adaptive quadrature of DeltaT, itself a quadrature of rf."""
         self.calculate_media_pesata_quote()
         integrand = lambda k: self.DeltaT(k)
         ATR, _ = integrate.quad(integrand, 0, self.H, epsabs=1e-2, epsrel=1e-1)   
 
         # print(ATR/self.H)
 
-        return ATR/self.H
\ No newline at end of file
+        return ATR/self.H
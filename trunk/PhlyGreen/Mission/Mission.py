@@ -6,9 +6,21 @@ import PhlyGreen.Utilities.Atmosphere as ISA
 import PhlyGreen.Utilities.Speed as Speed
 import PhlyGreen.Utilities.Units as Units
 import scipy.integrate as integrate
+from scipy.optimize import OptimizeResult
 from .Profile import Profile
+from .integrators import integrate_segments
+from .battery_sizing import PowerHistory
+from .tank_coupling import integrate_with_tank
+from .trajectory import MissionTrajectory, SolverPointRecorder
 from PhlyGreen.Systems.Battery.Battery import BatteryError
 
+# Class-II battery P-number search strategies (MissionInput['Battery Sizing'])
+BATTERY_SIZING = ('Incremental', 'Full')
+
+# LH2 tank tracking modes (MissionInput['Tank Tracking']): tank states inside the mission ODE,
+# or explicit time_step micro-steps over the mission solution
+TANK_TRACKING = ('Coupled', 'Micro-step')
+
 class Mission:
     """
     Mission-level performance and energy simulation.
@@ -59,10 +71,14 @@ class Mission:
         # when True (and aircraft.tank is set) the LH2 tank thermodynamic state is
         # advanced through the mission; off by default so the weight loop stays fast.
         self.track_tank = False
+        self.tank_tracking = 'Coupled'
 
         self.ef = None
         self.profile = None
         self.t = None
+        self.MissionTimes = None
+        # the last mission at its solver points (PhlyGreen.Mission.trajectory)
+        self.trajectory = None
         self.Ef = None
         self.EBat = None
         self.Beta = None
@@ -75,6 +91,19 @@ class Mission:
         self.optimal_n=None
 
         self.size_battery_pack = True
+        # Class-II P-number search: 'Incremental' probes candidate packs with cell-only
+        # flights through one power history per WTO (PhlyGreen.Mission.battery_sizing),
+        # 'Full' re-flies the whole mission for every probe (reference)
+        self.battery_sizing = 'Incremental'
+        self._power_history = None
+
+        # mission ODE backend (see PhlyGreen.Mission.integrators); rtol/max_step of None
+        # keep each configuration's own defaults
+        self.integrator = 'BDF'
+        self.integrator_rtol = None
+        self.integrator_max_step = None
+        self.nfev = 0  # right-hand-side evaluations of the last mission integration
+        self.evaluations = 0  # EvaluateMission calls (counted by the weight loop)
 
     """ Properties """
 
@@ -137,6 +166,16 @@ class Mission:
 
         self.beta0 = self.aircraft.MissionInput['Beta start']
         self.ef = self.aircraft.EnergyInput['Ef']
+        self.integrator = self.aircraft.MissionInput.get('Integrator', 'BDF')
+        self.integrator_rtol = self.aircraft.MissionInput.get('Integrator rtol')
+        self.integrator_max_step = self.aircraft.MissionInput.get('Integrator Max Step')
+        self.battery_sizing = self.aircraft.MissionInput.get('Battery Sizing', 'Incremental')
+        if self.battery_sizing not in BATTERY_SIZING:
+            raise ValueError(f"Unknown battery sizing {self.battery_sizing!r}. Available: {BATTERY_SIZING}")
+        self.tank_tracking = self.aircraft.MissionInput.get('Tank Tracking', 'Coupled')
+        if self.tank_tracking not in TANK_TRACKING:
+            raise ValueError(f"Unknown tank tracking {self.tank_tracking!r}. Available: {TANK_TRACKING}")
+        self._power_history = None
 
     def InitializeProfile(self):
         """
@@ -146,11 +185,157 @@ class Mission:
         """
         
         self.profile = Profile(self.aircraft)
+        self._power_history = None
         
         self.profile.DefineMission()
         
         self.t = np.linspace(0,self.profile.MissionTime2,num=1000)
 
+    def integrate_segments(self, model, y0, rtol, max_step=np.inf, dense_output=False,
+                           fixed_step=False):
+        """
+        Integrate the mission ODE segment by segment with the selected backend.
+
+        Resets ``integral_solution`` and ``nfev`` and yields each segment solution as it
+        is appended, so callers can post-process a segment before the next one is solved.
+
+        Parameters
+        ----------
+        model : callable
+            Right-hand side ``model(t, y)``.
+        y0 : list
+            Initial state at the start of the mission.
+        rtol, max_step : float
+            Configuration defaults, overridden by ``MissionInput['Integrator rtol']`` and
+            ``MissionInput['Integrator Max Step']`` when given.
+        dense_output : bool
+            Forwarded to ``solve_ivp`` by the reference ``'BDF'`` backend.
+        fixed_step : bool
+            Whether the mission ODE is smooth and non-stiff enough for ``'RK4-fixed'``
+            (Traditional and Class-I hybrid only).
+        """
+        if self.integrator == 'RK4-fixed' and not fixed_step:
+            raise ValueError("The 'RK4-fixed' mission integrator is only available for the "
+                             "Traditional and Class-I hybrid configurations")
+        times = np.append(self.profile.Breaks, self.profile.MissionTime2)
+        self.integral_solution = []
+        self.nfev = 0
+        for sol in integrate_segments(
+            model, times, y0, method=self.integrator,
+            rtol=self.integrator_rtol if self.integrator_rtol is not None else rtol,
+            max_step=self.integrator_max_step if self.integrator_max_step is not None else max_step,
+            dense_output=dense_output, enter_segment=self.profile.pin_segment,
+        ):
+            self.integral_solution.append(sol)
+            self.nfev += sol.nfev
+            yield sol
+
+    def integrate_segments_with_tank(self, model, y0, tank, mass_flow, rtol, max_step=np.inf):
+        """
+        Integrate the mission ODE with the LH2 tank states appended (see ``tank_coupling``).
+
+        Always uses ``solve_ivp`` BDF, whatever the selected integrator, since the tank
+        pressure regulation is located with state events. Resets ``integral_solution`` and
+        ``nfev`` and yields the segment solutions of the mission states, as
+        ``integrate_segments`` does; the tank history is filled along the way.
+        """
+        self.integral_solution = []
+        self.nfev = 0
+        for sol in integrate_with_tank(
+            model, tank, np.append(self.profile.Breaks, self.profile.MissionTime2), y0,
+            mass_flow, lambda t: float(self.profile.Altitude(t)),
+            rtol=self.integrator_rtol if self.integrator_rtol is not None else rtol,
+            max_step=self.integrator_max_step if self.integrator_max_step is not None else max_step,
+        ):
+            self.integral_solution.append(sol)
+            self.nfev += sol.nfev
+            yield sol
+
+    def integrator_error(self, WTO, reference='BDF'):
+        """
+        Relative error of the selected integrator against a reference backend.
+
+        Flies the mission at ``WTO`` with ``reference`` and then with the selected
+        integrator (so the mission state left behind is the selected one's) and compares
+        the cumulative energies at the end of the mission.
+
+        Parameters
+        ----------
+        WTO : float
+            Takeoff weight [kg].
+        reference : str
+            Reference backend, ``'BDF'`` by default.
+
+        Returns
+        -------
+        dict
+            ``'Ef'`` (and ``'EBat'`` for hybrids) relative errors, plus ``'nfev'`` and
+            ``'nfev_reference'``.
+        """
+        def final_energies():
+            out = {'Ef': float(self.Ef[-1])}
+            if self.EBat is not None:
+                out['EBat'] = float(self.EBat[-1])
+            return out
+
+        selected = self.integrator
+        self.integrator = reference
+        try:
+            self.EvaluateMission(WTO)
+        finally:
+            self.integrator = selected
+        ref, nfev_ref = final_energies(), self.nfev
+        self.EvaluateMission(WTO)
+        errors = {key: abs(value - ref[key]) / abs(ref[key]) if ref[key] else abs(value)
+                  for key, value in final_energies().items()}
+        errors.update(nfev=self.nfev, nfev_reference=nfev_ref)
+        return errors
+
+
+    def _record_trajectory(self, beta, PP, fuel_power, **columns):
+        """Keep the flown mission at the points of ``integral_solution`` in ``trajectory``.
+
+        ``fuel_power`` is the fuel (or hydrogen) chemical power [W]; ``columns`` are the
+        optional :class:`MissionTrajectory` columns.
+        """
+        self.trajectory = MissionTrajectory.from_solution(
+            self.integral_solution, self.profile, beta, PP,
+            np.asarray(fuel_power, dtype=float) / self.ef, **columns)
+        self.MissionTimes = self.trajectory.t
+        return self.trajectory
+
+    def _fuel_cell_trajectory(self, beta, PP, P_fc, fc_points, **columns):
+        """Record a fuel-cell mission with its power ratios on the fuel-cell share ``P_fc``.
+
+        ``fc_points`` (a :class:`SolverPointRecorder`) holds the ``(PRatio, Q_thermal)`` the
+        right-hand side computed at the solver points; ``FuelCell.ComputePRatio`` is solved
+        again only where it has none.
+        """
+        fc = self.aircraft.fuelcell
+        times = np.concatenate([a.t for a in self.integral_solution])
+        segments = np.repeat(np.arange(len(self.integral_solution)),
+                             [len(a.t) for a in self.integral_solution])
+        P_fc = np.asarray(P_fc, dtype=float)
+        PRatio, fc_heat = np.zeros((len(times), 2)), np.zeros(len(times))
+        for i in np.flatnonzero(P_fc > 0):
+            point = fc_points.get(segments[i], times[i])
+            if point is None:
+                alt, vel = self.profile.Altitude(times[i]), self.profile.Velocity(times[i])
+                point = fc.ComputePRatio(alt, vel, P_fc[i]), fc.Q_thermal
+            PRatio[i], fc_heat[i] = point
+        return self._record_trajectory(beta, PP, P_fc * PRatio[:, 0], PRatio=PRatio,
+                                       fc_heat=fc_heat, **columns)
+
+    def _hybrid_trajectory(self, beta, PP, **columns):
+        """Record the phi-split hybrid mission: ``Powertrain.Hybrid`` at every solver point."""
+        times = np.concatenate([a.t for a in self.integral_solution])
+        phi = np.asarray(self.profile.SuppliedPowerRatio(times), dtype=float)
+        alt, vel = self.profile.Altitude(times), self.profile.Velocity(times)
+        PRatio = np.array([self.aircraft.powertrain.Hybrid(float(phi[i]), alt[i], vel[i], PP[i])
+                           for i in range(len(times))])
+        return self._record_trajectory(beta, PP, PP * PRatio[:, 0], phi=phi, PRatio=PRatio,
+                                       gt_power=PP * PRatio[:, 1],
+                                       battery_power=PP * PRatio[:, 5], **columns)
 
     def EvaluateMission(self,WTO):
         """
@@ -168,7 +353,8 @@ class Mission:
             Hybrid Class I: (cumulative fuel energy [J], cumulative battery energy [J])
             Hybrid Class II: same, after battery sizing
         """
-        
+        self.evaluations += 1
+
         if self.aircraft.Configuration == 'Traditional':     
             return self.TraditionalConfiguration(WTO)
             
@@ -239,7 +425,7 @@ class Mission:
         self.WTO = WTO
 
         def PowerPropulsive(Beta, t):
-            PPoWTO = self.aircraft.performance.PoWTO(
+            PPoWTO = self.aircraft.performance.PoWTO_batch(
                 self.aircraft.DesignWTOoS, Beta, self.profile.PowerExcess(t), 1,
                 self.profile.Altitude(t), self.DISA, self.profile.Velocity(t), 'TAS')
             return PPoWTO * WTO
@@ -253,6 +439,7 @@ class Mission:
             dEdt_chem = PP * PRatio[0]                 # hydrogen chemical power [W]
             dbetadt = - dEdt_chem / (self.ef * self.WTO)
             q = self.aircraft.fuelcell.Q_thermal
+            fc_points.record(t, (PRatio, q))
             if q > self.Max_FC_Thermal_Pwr:
                 self.Max_FC_Thermal_Pwr = q
                 self.Max_FC_Thermal_Pwr_alt = self.profile.Altitude(t)
@@ -273,20 +460,21 @@ class Mission:
         track = self.track_tank and getattr(self.aircraft, 'tank', None) is not None
         if track:
             tank = self.aircraft.tank
-            tank.m_curr = tank.capacity_single        # start full
-            tank.P_curr = tank.P_min
-            tank.history = {'t': [], 'P': [], 'm_tot': [], 'Vent': [], 'Q_in': [],
-                            'Alt': [], 'Q_heater': [], 'm_vent_cum': [], 'Consumption': []}
-            tank.cum_vented_mass = 0.0
+            tank.reset_state()                        # start full, at P_min
 
+        fc_points = SolverPointRecorder()
         y0 = [0, self.beta0]
-        self.integral_solution = []
-        times = np.append(self.profile.Breaks, self.profile.MissionTime2)
-        for i in range(len(times) - 1):
-            sol = integrate.solve_ivp(model, [times[i], times[i + 1]], y0,
-                                      method='BDF', rtol=1e-5, max_step=60.0)
-            self.integral_solution.append(sol)
-            if track:
+        micro_step = track and self.tank_tracking == 'Micro-step'
+        if track and not micro_step:
+            # tank pressure, mass and vented mass as extra states (BDF with state events)
+            solutions = self.integrate_segments_with_tank(
+                model, y0, tank, mass_flow=lambda t, y, dydt: dydt[0] / self.ef,
+                rtol=1e-5, max_step=60.0)
+        else:
+            solutions = self.integrate_segments(model, y0, rtol=1e-5, max_step=60.0)
+        for sol in solutions:
+            fc_points.close_segment()
+            if micro_step:
                 # Drive the tank with the hydrogen mass flow over each solver micro-step.
                 for k in range(1, len(sol.t)):
                     dt_mini = sol.t[k] - sol.t[k - 1]
@@ -294,18 +482,17 @@ class Mission:
                     m_dot = (dE / self.ef) / dt_mini if dt_mini > 0 else 0.0
                     t_mid = 0.5 * (sol.t[k] + sol.t[k - 1])
                     tank.time_step(dt_mini, m_dot, float(self.profile.Altitude(t_mid)))
-            y0 = [sol.y[0][-1], sol.y[1][-1]]
 
         self.Ef = sol.y[0]
         self.Beta = sol.y[1]
 
         # Peak mission propulsive power (no hidden margin — the sizing margin and the
         # take-off/OEI floor are applied by the weight loop / FuelCell sizing).
-        pp_peak = 0.0
-        for arr in self.integral_solution:
-            for k in range(len(arr.t)):
-                pp_peak = max(pp_peak, PowerPropulsive(arr.y[1][k], arr.t[k]))
-        self.Max_PEng = pp_peak
+        times = np.concatenate([arr.t for arr in self.integral_solution])
+        beta = np.concatenate([arr.y[1] for arr in self.integral_solution])
+        PP = PowerPropulsive(beta, times)
+        self._fuel_cell_trajectory(beta, PP, PP, fc_points)
+        self.Max_PEng = max(0.0, float(np.max(PP)))
         self.Max_PEng_alt = 0.0
         return self.Ef[-1]
 
@@ -338,7 +525,7 @@ class Mission:
             return em * fc.EtaPM * fc.EtaGB
 
         def PowerPropulsive(Beta, t):
-            PPoWTO = self.aircraft.performance.PoWTO(
+            PPoWTO = self.aircraft.performance.PoWTO_batch(
                 self.aircraft.DesignWTOoS, Beta, self.profile.PowerExcess(t), 1,
                 self.profile.Altitude(t), self.DISA, self.profile.Velocity(t), 'TAS')
             return PPoWTO * WTO
@@ -356,7 +543,11 @@ class Mission:
             self.check_PP(PP)
             P_fc = fuel_cell_share(t, PP)
             alt, vel = self.profile.Altitude(t), self.profile.Velocity(t)
-            dEh2 = P_fc * fc.ComputePRatio(alt, vel, P_fc)[0] if P_fc > 0 else 0.0
+            dEh2 = 0.0
+            if P_fc > 0:
+                PRatio = fc.ComputePRatio(alt, vel, P_fc)
+                dEh2 = P_fc * PRatio[0]
+                fc_points.record(t, (PRatio, fc.Q_thermal))
             dbetadt = - dEh2 / (self.ef * self.WTO)
             q = fc.Q_thermal
             if q > self.Max_FC_Thermal_Pwr:
@@ -372,31 +563,30 @@ class Mission:
         self.TO_PBat = phi_TO * P_total_TO          # battery propulsive share at take-off/OEI
         self.Max_FC_Thermal_Pwr = -1.0
 
+        fc_points = SolverPointRecorder()
         y0 = [0.0, self.beta0]
-        self.integral_solution = []
-        times = np.append(self.profile.Breaks, self.profile.MissionTime2)
-        for i in range(len(times) - 1):
-            sol = integrate.solve_ivp(model, [times[i], times[i + 1]], y0,
-                                      method='BDF', rtol=1e-5, max_step=60.0)
-            self.integral_solution.append(sol)
-            y0 = [sol.y[0][-1], sol.y[1][-1]]
+        for sol in self.integrate_segments(model, y0, rtol=1e-5, max_step=60.0):
+            fc_points.close_segment()  # segments are collected in self.integral_solution
 
         self.Ef = sol.y[0]
         self.Beta = sol.y[1]
 
         # Post-process the battery: electrical energy drawn and peak battery shaft power.
-        E_bat = 0.0
-        pp_fc_peak, pp_bat_peak = 0.0, 0.0
-        for arr in self.integral_solution:
-            p_bat = np.array([float(self.profile.SuppliedPowerRatio(t)) *
-                              PowerPropulsive(b, t) for t, b in zip(arr.t, arr.y[1])])
-            p_fc = np.array([PowerPropulsive(b, t) for t, b in zip(arr.t, arr.y[1])]) - p_bat
-            if len(arr.t) > 1:
-                eta_arr = np.array([eta_elec_at(self.profile.Altitude(t), self.profile.Velocity(t), pb)
-                                    for t, pb in zip(arr.t, p_bat)])
-                E_bat += float(np.trapezoid(p_bat / eta_arr, arr.t))
-            pp_bat_peak = max(pp_bat_peak, float(p_bat.max()) if len(p_bat) else 0.0)
-            pp_fc_peak = max(pp_fc_peak, float(p_fc.max()) if len(p_fc) else 0.0)
+        times = np.concatenate([arr.t for arr in self.integral_solution])
+        beta = np.concatenate([arr.y[1] for arr in self.integral_solution])
+        PP = PowerPropulsive(beta, times)
+        phi = np.asarray(self.profile.SuppliedPowerRatio(times), dtype=float)
+        p_bat = phi * PP
+        p_fc = PP - p_bat
+        alts, vels = self.profile.Altitude(times), self.profile.Velocity(times)
+        eta_arr = np.array([eta_elec_at(alt, vel, pb) for alt, vel, pb in zip(alts, vels, p_bat)])
+        trajectory = self._fuel_cell_trajectory(beta, PP, p_fc, fc_points, phi=phi,
+                                                battery_power=p_bat / eta_arr,
+                                                battery_propulsive_power=p_bat)
+        # zero-width intervals at the segment joins add nothing
+        E_bat = float(np.trapezoid(trajectory.battery_power, times)) if len(times) > 1 else 0.0
+        pp_bat_peak = max(0.0, float(p_bat.max()) if len(p_bat) else 0.0)
+        pp_fc_peak = max(0.0, float(p_fc.max()) if len(p_fc) else 0.0)
         self.EBat = E_bat
         self.Max_PEng = pp_fc_peak           # fuel-cell propulsive peak (no hidden margin)
         self.Max_PEng_alt = 0.0
@@ -429,7 +619,7 @@ class Mission:
             return em * fc.EtaPM * fc.EtaGB
 
         def PowerPropulsive(Beta, t):
-            return WTO * self.aircraft.performance.PoWTO(
+            return WTO * self.aircraft.performance.PoWTO_batch(
                 self.aircraft.DesignWTOoS, Beta, self.profile.PowerExcess(t), 1,
                 self.profile.Altitude(t), self.DISA, self.profile.Velocity(t), 'TAS')
 
@@ -442,7 +632,11 @@ class Mission:
 
             # fuel-cell (hydrogen) branch — the fuel cell supplies (1 - phi) of the power
             P_fc = (1.0 - phi) * PP
-            dEh2 = P_fc * fc.ComputePRatio(alt, vel, P_fc)[0] if P_fc > 0 else 0.0
+            dEh2 = 0.0
+            if P_fc > 0:
+                PRatio = fc.ComputePRatio(alt, vel, P_fc)
+                dEh2 = P_fc * PRatio[0]
+                fc_points.record(t, (PRatio, fc.Q_thermal))
             q = fc.Q_thermal
             if q > self.Max_FC_Thermal_Pwr:
                 self.Max_FC_Thermal_Pwr = q
@@ -476,6 +670,8 @@ class Mission:
         self.TO_PP = (1.0 - phi_TO) * P_total_TO            # fuel-cell propulsive share at TO/OEI
         self.TO_PBat = phi_TO * P_total_TO                 # battery propulsive share at TO/OEI
 
+        fc_points = SolverPointRecorder()
+
         def evaluate_mission_given_P(P_number):
             """Fly the whole mission for a given parallel-cell count; (feasible, error_code)."""
             self.P_n_arr.append(P_number)
@@ -497,23 +693,19 @@ class Mission:
                 return False, err.code
 
             np.seterr(over="raise")
-            times = np.append(self.profile.Breaks, self.profile.MissionTime2)
-            self.integral_solution = []
             self.Max_FC_Thermal_Pwr = -1.0
             y0 = [0, 0, self.beta0, 0, self.startT + 273.15]
-            for i in range(len(times) - 1):
-                try:
-                    sol = integrate.solve_ivp(model, [times[i], times[i + 1]], y0,
-                                              method="BDF", rtol=1e-6)
-                    self.integral_solution.append(sol)
-                except BatteryError as err:
-                    if not self.size_battery_pack:
-                        print(err)
-                    return False, err.code
-                self.Ef = sol.y[0]
-                self.EBat = sol.y[1]
-                self.Beta = sol.y[2]
-                y0 = [sol.y[0][-1], sol.y[1][-1], sol.y[2][-1], sol.y[3][-1], sol.y[4][-1]]
+            fc_points.reset()
+            try:
+                for sol in self.integrate_segments(model, y0, rtol=1e-6):
+                    fc_points.close_segment()
+                    self.Ef = sol.y[0]
+                    self.EBat = sol.y[1]
+                    self.Beta = sol.y[2]
+            except BatteryError as err:
+                if not self.size_battery_pack:
+                    print(err)
+                return False, err.code
             return True, None
 
         def find_P_nr(n_guess, wto_ratio):
@@ -566,37 +758,27 @@ class Mission:
             beta = np.concatenate([beta, arr.y[2]])
             it_arr = np.concatenate([it_arr, arr.y[3]])
             T_arr = np.concatenate([T_arr, arr.y[4]])
-        self.MissionTimes = times
-        PP = np.array([WTO * self.aircraft.performance.PoWTO(
-            self.aircraft.DesignWTOoS, beta[i], self.profile.PowerExcess(times[i]), 1,
-            self.profile.Altitude(times[i]), self.DISA, self.profile.Velocity(times[i]), 'TAS')
-            for i in range(len(times))])
-        phis = np.array([float(self.profile.SuppliedPowerRatio(times[i])) for i in range(len(times))])
+        PP = WTO * self.aircraft.performance.PoWTO_batch(
+            self.aircraft.DesignWTOoS, beta, self.profile.PowerExcess(times), 1,
+            self.profile.Altitude(times), self.DISA, self.profile.Velocity(times), 'TAS')
+        phis = np.asarray(self.profile.SuppliedPowerRatio(times), dtype=float)
         p_fc, p_bat = (1.0 - phis) * PP, phis * PP
+        alts, vels = self.profile.Altitude(times), self.profile.Velocity(times)
+        P_terminal = np.array([p / eta_elec_at(alt, vel, p) for alt, vel, p in zip(alts, vels, p_bat)])
+        trajectory = self._fuel_cell_trajectory(beta, PP, p_fc, fc_points, phi=phis,
+                                                battery_power=P_terminal,
+                                                battery_propulsive_power=p_bat)
         self.Max_PEng = float(np.max(p_fc)) if len(p_fc) else 0.0
-        self.Max_PEng_alt = self.profile.Altitude(times[int(np.argmax(p_fc))]) if len(p_fc) else 0.0
+        self.Max_PEng_alt = trajectory.altitude[int(np.argmax(p_fc))] if len(p_fc) else 0.0
         self.Max_PBat = max(float(np.max(p_bat)) if len(p_bat) else 0.0, self.TO_PBat)
 
         ceiling = 273.15 + self.T_battery_limit
         b = self.aircraft.battery
-        q_pack_peak = 0.0
-        for i in range(len(times)):
-            if T_arr[i] < ceiling - 0.5:                   # cooling acts only at the ceiling
-                continue
-            try:
-                b.T = T_arr[i]
-                b.it = it_arr[i] / 3600
-                alt = self.profile.Altitude(times[i])
-                vel = self.profile.Velocity(times[i])
-                b.i = b.Power_2_current(p_bat[i] / eta_elec_at(alt, vel, p_bat[i]))
-                Mach = Speed.TAS2Mach(vel, alt, DISA=self.DISA)
-                Tamb = ISA.atmosphere.T0std(alt, Mach)
-                rho = ISA.atmosphere.RHO0std(alt, Mach, self.DISA)
-                _, q_cell = b.heatLoss(Tamb, rho)
-                q_pack_peak = max(q_pack_peak, q_cell * b.cells_total)
-            except Exception:
-                continue
-        self.Max_Bat_Thermal_Pwr = q_pack_peak
+        state = b.cell_kernel(P_terminal, it_arr / 3600, T_arr)
+        trajectory.battery_heat = np.where(state.feasible, state.heat * b.cells_total, np.nan)
+        hot = T_arr >= ceiling - 0.5                       # cooling acts only at the ceiling
+        q_pack = trajectory.battery_heat[hot & state.feasible]
+        self.Max_Bat_Thermal_Pwr = max(0.0, float(np.max(q_pack))) if q_pack.size else 0.0
 
         return self.Ef[-1], self.EBat[-1]
 
@@ -627,7 +809,7 @@ class Mission:
         def PowerPropulsive(Beta,t):
             """Return required propulsive power = PP/WTO · WTO."""
 
-            PPoWTO = self.aircraft.performance.PoWTO(
+            PPoWTO = self.aircraft.performance.PoWTO_batch(
                 self.aircraft.DesignWTOoS,
                 Beta,
                 self.profile.PowerExcess(t),
@@ -681,18 +863,13 @@ class Mission:
         y0 = [0,self.beta0]  #here y0[0] should be the TakeOff energy consumed: WTO * self.TO_PFoW * deltat 
 
         rtol = 1e-5
-        method= 'BDF'
 
         # integrate all phases together
         # sol = integrate.solve_ivp(model,[0, self.profile.MissionTime2],y0,method='BDF',rtol=1e-6)
         
         # integrate sequentially
-        self.integral_solution = []
-        times = np.append(self.profile.Breaks,self.profile.MissionTime2)
-        for i in range(len(times)-1):
-            sol = integrate.solve_ivp(model,[times[i], times[i+1]],y0,method=method,rtol=rtol) 
-            self.integral_solution.append(sol) 
-            y0 = [sol.y[0][-1],sol.y[1][-1]]
+        for sol in self.integrate_segments(model, y0, rtol=rtol, fixed_step=True):
+            pass  # segments are collected in self.integral_solution
         
         self.Ef = sol.y[0]
         self.Beta = sol.y[1]
@@ -706,19 +883,22 @@ class Mission:
 
     
 
-        PP = [WTO * self.aircraft.performance.PoWTO(
+        PP = WTO * self.aircraft.performance.PoWTO_batch(
             self.aircraft.DesignWTOoS,
-            beta[i],
-            self.profile.PowerExcess(times[i]),
+            beta,
+            self.profile.PowerExcess(times),
             1,
-            self.profile.Altitude(times[i]),
+            self.profile.Altitude(times),
             self.DISA,
-            self.profile.Velocity(times[i]),
-            'TAS') for i in range(len(times))]
+            self.profile.Velocity(times),
+            'TAS')
 
-        PRatio = np.array([self.aircraft.powertrain.Traditional(self.profile.Altitude(times[i]),self.profile.Velocity(times[i]),PP[i]) for i in range(len(times))] )
-        self.Max_PEng = np.max(np.multiply(PP,PRatio[:,1])) #shaft power
-        self.Max_PEng_alt = self.profile.Altitude(times[np.argmax(np.multiply(PP,PRatio[:,1]))]) #altitude at which peak power occurs 
+        alt, vel = self.profile.Altitude(times), self.profile.Velocity(times)
+        PRatio = np.array([self.aircraft.powertrain.Traditional(alt[i], vel[i], PP[i]) for i in range(len(times))])
+        trajectory = self._record_trajectory(beta, PP, PP * PRatio[:, 0], PRatio=PRatio,
+                                             gt_power=PP * PRatio[:, 1])
+        self.Max_PEng = np.max(trajectory.gt_power) #shaft power
+        self.Max_PEng_alt = trajectory.altitude[np.argmax(trajectory.gt_power)] #altitude at which peak power occurs
 
         return self.Ef[-1]
     
@@ -753,7 +933,7 @@ class Mission:
             def PowerPropulsive(Beta,t):
                 """Return required propulsive power = PP/WTO · WTO."""
 
-                PPoWTO = self.aircraft.performance.PoWTO(
+                PPoWTO = self.aircraft.performance.PoWTO_batch(
                     self.aircraft.DesignWTOoS,
                     Beta,
                     self.profile.PowerExcess(t),
@@ -812,19 +992,15 @@ class Mission:
             
             rtol = 1e-5
             atol = 1e-7
-            method= 'BDF'
 
             # integrate all phases together
             # sol = integrate.solve_ivp(model,[0, self.profile.MissionTime2],y0,method='BDF',rtol=1e-6)
             # print(sol)
 
             # integrate sequentially
-            self.integral_solution = []
             times = np.append(self.profile.Breaks,self.profile.MissionTime2)
-            for i in range(len(times)-1):
-                sol = integrate.solve_ivp(model,[times[i], times[i+1]],y0,method=method,rtol=rtol, dense_output=True)
-                self.integral_solution.append(sol) 
-                y0 = [sol.y[0][-1],sol.y[1][-1],sol.y[2][-1]]
+            segments = self.integrate_segments(model, y0, rtol=rtol, dense_output=True, fixed_step=True)
+            for i, sol in enumerate(segments):
                 if times[i+1] == self.aircraft.mission.profile.BreaksDescent:
                     self.Ef_mission = sol.y[0][-1]
     
@@ -843,13 +1019,13 @@ class Mission:
 
             self.MissionTimes = times 
             
-            PP = np.array([WTO * self.aircraft.performance.PoWTO(self.aircraft.DesignWTOoS,beta[i],self.profile.PowerExcess(times[i]),1,self.profile.Altitude(times[i]),self.DISA,self.profile.Velocity(times[i]),'TAS') for i in range(len(times))])
-            PRatio = np.array([self.aircraft.powertrain.Hybrid(self.aircraft.mission.profile.SuppliedPowerRatio(times[i]),self.profile.Altitude(times[i]),self.profile.Velocity(times[i]),PP[i]) for i in range(len(times))] )
+            PP = WTO * self.aircraft.performance.PoWTO_batch(self.aircraft.DesignWTOoS,beta,self.profile.PowerExcess(times),1,self.profile.Altitude(times),self.DISA,self.profile.Velocity(times),'TAS')
+            trajectory = self._hybrid_trajectory(beta, PP)
 
-            self.Max_PEng = np.max(np.multiply(PP,PRatio[:,1]))
-            self.Max_PEng_alt = self.profile.Altitude(times[np.argmax(np.multiply(PP,PRatio[:,1]))]) #altitude at which peak power occurs 
+            self.Max_PEng = np.max(trajectory.gt_power)
+            self.Max_PEng_alt = trajectory.altitude[np.argmax(trajectory.gt_power)] #altitude at which peak power occurs
 
-            self.Max_PBat = np.max(np.multiply(PP,PRatio[:,5]))
+            self.Max_PBat = np.max(trajectory.battery_power)
 
             return self.Ef[-1], self.EBat[-1]
 
@@ -887,7 +1063,7 @@ class Mission:
             return min(P_gt_rated, available)
 
         def PowerPropulsive(Beta, t):
-            return WTO * self.aircraft.performance.PoWTO(
+            return WTO * self.aircraft.performance.PoWTO_batch(
                 self.aircraft.DesignWTOoS, Beta, self.profile.PowerExcess(t), 1,
                 self.profile.Altitude(t), self.DISA, self.profile.Velocity(t), 'TAS')
 
@@ -931,14 +1107,9 @@ class Mission:
 
         # Integrate sequentially over the profile breakpoints.
         y0 = [0.0, 0.0, self.beta0]
-        self.integral_solution = []
-        times = np.append(self.profile.Breaks, self.profile.MissionTime2)
         self.Ef_mission = None
-        for i in range(len(times) - 1):
-            sol = integrate.solve_ivp(model, [times[i], times[i + 1]], y0,
-                                      method='BDF', rtol=1e-5, dense_output=True)
-            self.integral_solution.append(sol)
-            y0 = [sol.y[0][-1], sol.y[1][-1], sol.y[2][-1]]
+        times = np.append(self.profile.Breaks, self.profile.MissionTime2)
+        for i, sol in enumerate(self.integrate_segments(model, y0, rtol=1e-5, dense_output=True)):
             if times[i + 1] == self.profile.BreaksDescent:
                 self.Ef_mission = sol.y[0][-1]
 
@@ -955,7 +1126,11 @@ class Mission:
         self.MissionTimes = t_all
         self.EBat = erem_all                                          # signed cumulative (for plots)
         swing = float(erem_all.max() - erem_all.min())               # usable buffer energy [J]
-        pbat_all = np.array([flows(t_all[k], beta_all[k])[1] for k in range(len(t_all))])
+        flows_all = np.array([flows(t_all[k], beta_all[k]) for k in range(len(t_all))]).reshape(-1, 2)
+        pbat_all = flows_all[:, 1]
+        self._record_trajectory(beta_all, PowerPropulsive(beta_all, t_all), flows_all[:, 0],
+                                gt_power=[gt_shaft_power(alt) for alt in self.profile.Altitude(t_all)],
+                                battery_power=pbat_all)
         self.Max_PBat = max(float(pbat_all.max()) if len(pbat_all) else 0.0, self.TO_PBat)
         self.Max_PEng = P_gt_rated                                    # turbine sized for its rated power
         self.Max_PEng_alt = 0.0
@@ -1005,7 +1180,7 @@ class Mission:
         self.WTO = WTO
 
         def PowerPropulsive(Beta,t):
-            PPoWTO = self.aircraft.performance.PoWTO(
+            PPoWTO = self.aircraft.performance.PoWTO_batch(
                 self.aircraft.DesignWTOoS,
                 Beta,
                 self.profile.PowerExcess(t),
@@ -1018,6 +1193,49 @@ class Mission:
           
             return PPoWTO * WTO
 
+        def cooling_air(t):
+            """Ambient (total) temperature and density of the battery cooling air at time t."""
+            alt = self.profile.Altitude(t)
+            Mach = Speed.TAS2Mach(self.profile.Velocity(t), alt, DISA=self.DISA)
+            return ISA.atmosphere.T0std(alt, Mach), ISA.atmosphere.RHO0std(alt, Mach, self.DISA)
+
+        def cell_rates(phi, PElectric, it, T, Tamb, rho):
+            """
+            Battery state rates for the electric power drawn from the pack.
+
+            Returns (dEdt_bat, i, dTdt). The battery class raises an exception if any of
+            its parameters exceed the allowed limits or there are unphysical values. This is
+            taken as a sign that the P number is invalid. The exception may be caught into a
+            global variable so that the last constraint driving the battery sizing may be
+            printed to the user. Temperature limits are not validated because T depends on
+            the cooling sizing, not the P number.
+            """
+            battery = self.aircraft.battery
+            # assign a temperature, battery class validates temp
+            battery.T = T
+            battery.phi = phi
+
+            # assign spent charge, battery validates SOC
+            battery.it = it / 3600
+
+            # assign current, also validated here by the class
+            battery.i = battery.Power_2_current(PElectric)
+
+            # calculate power, this causes Vout to be generated and validated
+            dEdt_bat = battery.i * battery.Vout
+
+            dTdt, _ = battery.heatLoss(Tamb, rho)
+
+            if phi > 0.:
+                if T < 273.15 + self.T_battery_limit:
+                    dTdt = max(dTdt,0.)
+                else:
+                    dTdt = 0.
+            else:
+                dTdt = min(dTdt,0)
+
+            return dEdt_bat, battery.i, dTdt
+
         def model(t, y):
             """
             Governing ODEs. State vector:
@@ -1032,9 +1250,10 @@ class Mission:
             # aircraft mass fraction
             Beta = y[2]
             Ppropulsive = PowerPropulsive(Beta, t)
+            phi = self.profile.SuppliedPowerRatio(t)
             # takes in all the mission segments and finds the required power ratio for the current time of the mission
             PRatio = self.aircraft.powertrain.Hybrid(
-                self.aircraft.mission.profile.SuppliedPowerRatio(t),
+                phi,
                 self.profile.Altitude(t),
                 self.profile.Velocity(t),
                 Ppropulsive,
@@ -1043,52 +1262,30 @@ class Mission:
             dbetadt = -dEFdt / (self.ef * self.WTO)  # change in mass due to fuel consumption
             PElectric = Ppropulsive * PRatio[5]  # propulsive power required for the electric motors
 
-            # Finds the battery state for the requested power. The battery class raises an
-            # exception if any of its parameters exceed the allowed limits or there are
-            # unphysical values. This is taken as a sign that the P number is invalid. The
-            # exception may be caught into a global variable so that the last constraint
-            # driving the battery sizing may be printed to the user. Temperature limits
-            # are not validated because T depends on the cooling sizing, not the P number.
-
-            # assign a temperature, battery class validates temp
-            self.aircraft.battery.T = y[4]
-            self.aircraft.battery.phi = self.aircraft.mission.profile.SuppliedPowerRatio(t) 
-
-            # assign spent charge, battery validates SOC
-            self.aircraft.battery.it = y[3] / 3600
-
-            # assign current, also validated here by the class
-            self.aircraft.battery.i = self.aircraft.battery.Power_2_current(PElectric)
+            Tamb, rho = cooling_air(t)
+            dEdt_bat, i, dTdt = cell_rates(phi, PElectric, y[3], y[4], Tamb, rho)
 
-            # calculate power, this causes Vout to be generated and validated
-            dEdt_bat = self.aircraft.battery.i * self.aircraft.battery.Vout
+            return [dEFdt, dEdt_bat, dbetadt, i, dTdt]
 
-            alt = self.profile.Altitude(t)
-            Mach = Speed.TAS2Mach(self.profile.Velocity(t), alt, DISA=self.DISA)
-            Tamb = ISA.atmosphere.T0std(alt, Mach)
-            rho = ISA.atmosphere.RHO0std(alt, Mach, self.DISA)
-
-            dTdt, _ = self.aircraft.battery.heatLoss(Tamb, rho)
-
-            if self.aircraft.mission.profile.SuppliedPowerRatio(t) > 0.:
-                if y[4] < 273.15 + self.aircraft.mission.T_battery_limit: 
-                    dTdt = max(dTdt,0.)
-                else:
-                    dTdt = 0.
-            else:
-                dTdt = min(dTdt,0)
-
-
-            # print('Altitude: ', alt)
-            # print('Time: ', t)
-            # print('dTdt: ', dTdt)
-            # print([dEFdt, dEdt_bat, dbetadt, self.aircraft.battery.i, dTdt])
-
-            return [dEFdt, dEdt_bat, dbetadt, self.aircraft.battery.i, dTdt]
+        def trajectory_model(t, y):
+            """
+            Battery-independent part of ``model``: y = [Ef, Beta]. The fuel burn and the
+            mass fraction do not depend on the P number, so this is flown once per WTO.
+            """
+            Ppropulsive = PowerPropulsive(y[1], t)
+            PRatio = self.aircraft.powertrain.Hybrid(
+                self.profile.SuppliedPowerRatio(t),
+                self.profile.Altitude(t),
+                self.profile.Velocity(t),
+                Ppropulsive,
+            )
+            dEFdt = Ppropulsive * PRatio[0]
+            return [dEFdt, -dEFdt / (self.ef * self.WTO)]
 
-        def evaluate_mission_given_P(P_number):
+        def start_pack(P_number):
             """
-            Evaluate the full mission for a given battery discretization P-number.
+            Configure a pack of ``P_number`` parallel cells and check it at the take-off /
+            OEI-climb worst case, which does not depend on the battery size.
 
             Returns
             -------
@@ -1096,13 +1293,9 @@ class Mission:
                 (True, None) if feasible
                 (False, error_code) if battery constraint failed
             """
-            # print(f"evaluating pnumber {P_number}")
-            self.P_n_arr.append(P_number)
-            # no maths needed to know nothing will work without a battery
-            if P_number == 0:
-                # print(f"{P_number} is False")
-                return False
-
+            # Configure at the take-off temperature, so the nominal pack values do not
+            # depend on the state left behind by the previously probed pack
+            self.aircraft.battery.T = self.startT + 273.15
             self.aircraft.battery.Configure(P_number)
 
             # Takeoff condition, calculated before anything else as
@@ -1138,77 +1331,176 @@ class Mission:
             except Exception as err:
                 print(f"Unexpected error: {err}")
                 raise
+            return True, None
+
+        def evaluate_mission_given_P(P_number):
+            """
+            Evaluate the full mission for a given battery discretization P-number.
+
+            Returns
+            -------
+            bool, int or None
+                (True, None) if feasible
+                (False, error_code) if battery constraint failed
+            """
+            # print(f"evaluating pnumber {P_number}")
+            self.P_n_arr.append(P_number)
+            # no maths needed to know nothing will work without a battery
+            if P_number == 0:
+                # print(f"{P_number} is False")
+                return False, None
+
+            ok, code = start_pack(P_number)
+            if not ok:
+                return False, code
 
             # integrate the rest of the flight sequentially
             np.seterr(over="raise")
-            times = np.append(self.profile.Breaks, self.profile.MissionTime2)
             rtol = 1e-6
-            method = "BDF"
-            self.integral_solution = []
             self.plottingVars = []
             # initial fuel energy, battery energy, mass fraction, spent charge, and battery T
             y0 = [0, 0, self.beta0, 0, self.startT + 273.15]
-            for i in range(len(times) - 1):
-                try:
-                    sol = integrate.solve_ivp(
-                        model, [times[i], times[i + 1]], y0, method=method, rtol=rtol
-                    )
-                    self.integral_solution.append(sol)
-                except BatteryError as err:
-                    # print(f"P num at error: {self.aircraft.battery.P_number}")
-                    if not self.size_battery_pack: print(err)
-                    # print(f"{P_number} is False")
-                    return False, err.code
-                except Exception as e:
-                    print(f"Unexpected error:\n{e}")
-                    raise
-
-                # The solution given by solve ivp isnt actually valid for all cases when you
-                # try it on every point. This is because of the tolerance that it allows itself.
-                # It will accurately solve the problem for the time it was given but if you
-                # actually try to calculate the outputs at every time point, some of them cause
-                # the model to fail. To avoid having to use a super small rtol to make the
-                # time step of the integration smaller and therefore taking forever to
-                # integrate, the better solution is to simply ignore any battery errors that
-                # the model throws during plotting of the full flight profile. Its already
-                # been validated in the integration, whatever deviations happen at this
-                # stage are minuscule errors of fractions of percent
-                for k in range(len(sol.t) - 0):
-                    try:
-                        yy0 = [sol.y[0][k], sol.y[1][k], sol.y[2][k], sol.y[3][k], sol.y[4][k]]
-                        model(sol.t[k], yy0)
-                        alt = self.profile.Altitude(sol.t[k])
-                        Mach = Speed.TAS2Mach(self.profile.Velocity(sol.t[k]), alt, DISA=self.DISA)
-                        Tamb = ISA.atmosphere.T0std(alt, Mach)
-                        self.plottingVars.append(
-                            [
-                                sol.t[k],
-                                self.aircraft.battery.SOC,
-                                self.aircraft.battery.Voc,
-                                self.aircraft.battery.Vout,
-                                self.aircraft.battery.i,
-                                self.aircraft.battery.T,
-                                Tamb,
-                                alt,
-                                self.aircraft.battery.mdot,
-                            ],
-                        )
-                    except BatteryError:
-                        # Print warning and just keep saving the data, this sometimes happens if rtol is too loose
-                        print(
-                            "WARNING: evaluate_P_number integration rtol may be too loose, consider lowering it"
-                        )
-                self.Ef = sol.y[0]
-                self.EBat = sol.y[1]
-                self.Beta = sol.y[2]
-                y0 = [sol.y[0][-1], sol.y[1][-1], sol.y[2][-1], sol.y[3][-1], sol.y[4][-1]]
+            try:
+                for sol in self.integrate_segments(model, y0, rtol=rtol):
+                    # The solution given by solve ivp isnt actually valid for all cases when you
+                    # try it on every point. This is because of the tolerance that it allows itself.
+                    # It will accurately solve the problem for the time it was given but if you
+                    # actually try to calculate the outputs at every time point, some of them cause
+                    # the model to fail. To avoid having to use a super small rtol to make the
+                    # time step of the integration smaller and therefore taking forever to
+                    # integrate, the better solution is to simply ignore any battery errors that
+                    # the model throws during plotting of the full flight profile. Its already
+                    # been validated in the integration, whatever deviations happen at this
+                    # stage are minuscule errors of fractions of percent
+                    for k in range(len(sol.t) - 0):
+                        try:
+                            yy0 = [sol.y[0][k], sol.y[1][k], sol.y[2][k], sol.y[3][k], sol.y[4][k]]
+                            model(sol.t[k], yy0)
+                            alt = self.profile.Altitude(sol.t[k])
+                            Mach = Speed.TAS2Mach(self.profile.Velocity(sol.t[k]), alt, DISA=self.DISA)
+                            Tamb = ISA.atmosphere.T0std(alt, Mach)
+                            self.plottingVars.append(
+                                [
+                                    sol.t[k],
+                                    self.aircraft.battery.SOC,
+                                    self.aircraft.battery.Voc,
+                                    self.aircraft.battery.Vout,
+                                    self.aircraft.battery.i,
+                                    self.aircraft.battery.T,
+                                    Tamb,
+                                    alt,
+                                    self.aircraft.battery.mdot,
+                                ],
+                            )
+                        except BatteryError:
+                            # Print warning and just keep saving the data, this sometimes happens if rtol is too loose
+                            print(
+                                "WARNING: evaluate_P_number integration rtol may be too loose, consider lowering it"
+                            )
+                    self.Ef = sol.y[0]
+                    self.EBat = sol.y[1]
+                    self.Beta = sol.y[2]
+            except BatteryError as err:
+                # print(f"P num at error: {self.aircraft.battery.P_number}")
+                if not self.size_battery_pack: print(err)
+                # print(f"{P_number} is False")
+                return False, err.code
+            except Exception as e:
+                print(f"Unexpected error:\n{e}")
+                raise
             # print(f"{P_number} is True")
             return True, None
 
-        def find_P_nr(n_guess, wto_ratio,bypass=True):
+        def power_history():
+            """
+            Fly the battery-independent trajectory once at this WTO and sample, segment by
+            segment, the electric power, phi and cooling air the pack has to cope with (see
+            ``PhlyGreen.Mission.battery_sizing``). Cached per WTO and integrator settings.
+            """
+            key = (self.WTO, self.integrator, self.integrator_rtol, self.integrator_max_step)
+            if self._power_history is not None and self._power_history[0] == key:
+                return self._power_history[1]
+
+            np.seterr(over="raise")
+            history = PowerHistory()
+            # initial fuel energy and mass fraction
+            for sol in self.integrate_segments(trajectory_model, [0, self.beta0], rtol=1e-6):
+                # Sampled while the segment is marched, so the profile lookups (pinned or
+                # time-based, depending on the backend) are the ones the mission sees.
+                t0, t1 = sol.t[0], sol.t[-1]
+                t = np.unique(np.concatenate([
+                    sol.t, 0.5 * (sol.t[1:] + sol.t[:-1]),
+                    [np.nextafter(t0, t1), np.nextafter(t1, t0)]]))
+                Beta = np.interp(t, sol.t, sol.y[1])
+                PP = PowerPropulsive(Beta, t)
+                phi = np.asarray(self.profile.SuppliedPowerRatio(t), dtype=float)
+                alt = self.profile.Altitude(t)
+                vel = self.profile.Velocity(t)
+                PElectric = np.array([PP[k] * self.aircraft.powertrain.Hybrid(phi[k], alt[k], vel[k], PP[k])[5]
+                                      for k in range(len(t))])
+                Tamb, rho = np.array([cooling_air(tk) for tk in t]).T
+                history.add_segment(t, PElectric, phi, Tamb, rho, sol.t)
+                history.trajectory.append(sol)
+            self._power_history = (key, history)
+            return history
+
+        def probe_P(P_number):
+            """
+            Cell-only feasibility of a P-number against the power history of this WTO
+            (cached per P-number).
+
+            Returns
+            -------
+            bool, int or None
+                (True, None) if feasible
+                (False, error_code) if battery constraint failed
+            """
+            history = power_history()
+            if P_number not in history.flights:
+                self.P_n_arr.append(P_number)
+            ok, code, _ = history.fly(P_number, start_pack, cell_rates,
+                                      [0, 0, self.startT + 273.15], rtol=1e-6)
+            return ok, code
+
+        def install_P(P_number):
+            """
+            Leave the mission and the battery in the state of the flight of ``P_number``
+            through the power history, as ``evaluate_mission_given_P`` would.
+            """
+            history = power_history()
+            ok, code, cells = history.fly(P_number, start_pack, cell_rates,
+                                          [0, 0, self.startT + 273.15], rtol=1e-6)
+            if not ok:
+                return False, code
+            start_pack(P_number)
+            self.integral_solution = []
+            self.plottingVars = []
+            for i, (traj, cell) in enumerate(zip(history.trajectory, cells)):
+                t, inputs, _ = history.segments[i]
+                y = np.vstack([traj.y[0], cell.y[0], traj.y[1], cell.y[1], cell.y[2]])
+                self.integral_solution.append(OptimizeResult(t=traj.t, y=y, nfev=traj.nfev + cell.nfev))
+                # battery state along the flight, for plotting (see evaluate_mission_given_P)
+                PElectric, _, Tamb, _ = (np.interp(traj.t, t, row) for row in inputs)
+                state = self.aircraft.battery.cell_kernel(PElectric, y[3] / 3600, y[4])
+                ok = state.feasible
+                if not np.all(ok):
+                    print(
+                        "WARNING: evaluate_P_number integration rtol may be too loose, consider lowering it"
+                    )
+                # heatLoss estimates the cooling mass flow as 1e-4 kg/s per W of waste heat
+                self.plottingVars.extend(np.column_stack([
+                    traj.t, state.SOC, state.Voc, state.Vout, state.i, y[4], Tamb,
+                    self.profile.Altitude(traj.t), 0.0001 * state.heat])[ok].tolist())
+            self.Ef, self.EBat, self.Beta = y[0], y[1], y[2]
+            self.nfev = sum(sol.nfev for sol in self.integral_solution)
+            return True, None
+
+        def find_P_nr(n_guess, wto_ratio, evaluate, bypass=True):
             """
             Find the feasible P-number using a bounded search (bisection-like).
-            Efficient and robust for large battery discretizations.
+            Efficient and robust for large battery discretizations. ``evaluate(P)`` returns
+            (feasible, error_code): the cell-only ``probe_P`` or the full-mission
+            ``evaluate_mission_given_P``.
 
             Returns
             -------
@@ -1222,9 +1514,9 @@ class Mission:
                 if wto_ratio is not None:
                     n = round(n_guess * wto_ratio)
                     # check that the value below the initial guess is invalid
-                    if not evaluate_mission_given_P(n - 1)[0]:
+                    if not evaluate(n - 1)[0]:
                         n_min = n - 1
-                        if evaluate_mission_given_P(n)[0]:  # check that the guess is valid
+                        if evaluate(n)[0]:  # check that the guess is valid
                             # print(f"max={n} and min={n_min}")
                             # print(f"Optimal n {n}")
                             return n  # Optimal found
@@ -1255,14 +1547,14 @@ class Mission:
 
             # lower the min p number until it is invalid
             if not nmin_is_bounded:
-                while evaluate_mission_given_P(n_min)[0]:
+                while evaluate(n_min)[0]:
                     n_max = n_min  # if the n_min guess is too large it can be the new n_max to save iterations since it has already been tried
                     n_min = math.floor(n_min / 2)  # halve n_min until it fails
                     nmax_is_bounded = True  # nmax is set to a known valid value and does not need to be reevaluated
 
             # raise the max p number until its valid
             if not nmax_is_bounded:
-                while not evaluate_mission_given_P(n_max)[0]:
+                while not evaluate(n_max)[0]:
                     n_min = n_max  # if the nmax guess is too small it can be the new nmin to save iterations since it has already been tried
                     n_max = n_max * 2  # double n_max until it works
 
@@ -1272,7 +1564,7 @@ class Mission:
             # find optimal P number using bisection search
             optimal = False
             while not optimal:
-                valid_result = evaluate_mission_given_P(n)[0]
+                valid_result = evaluate(n)[0]
 
                 if valid_result and (n - n_min) == 1:
                     optimal = True
@@ -1303,7 +1595,11 @@ class Mission:
                 P_n_guess = self.optimal_n
 
 
-            self.optimal_n = find_P_nr(P_n_guess, ratio, bypass=True)  # algorithm D
+            if self.battery_sizing == 'Incremental':
+                self.optimal_n = find_P_nr(P_n_guess, ratio, probe_P, bypass=True)
+                install_P(self.optimal_n)
+            else:
+                self.optimal_n = find_P_nr(P_n_guess, ratio, evaluate_mission_given_P, bypass=True)  # algorithm D
             # alg = "D"
             # if alg == "D":
             #     self.optimal_n = find_P_nr(P_n_guess, ratio, bypass=False)  # algorithm D
@@ -1324,7 +1620,8 @@ class Mission:
             self.P_n_arr = []
         
         else:
-            success, code = evaluate_mission_given_P(self.aircraft.battery.P_number) 
+            evaluate = install_P if self.battery_sizing == 'Incremental' else evaluate_mission_given_P
+            success, code = evaluate(self.aircraft.battery.P_number)
             if not success:
                 return 0, code
 
@@ -1342,37 +1639,26 @@ class Mission:
 
         self.MissionTimes = times
 
-        PP = np.array([WTO * self.aircraft.performance.PoWTO(self.aircraft.DesignWTOoS,beta[i],self.profile.PowerExcess(times[i]),1,self.profile.Altitude(times[i]),self.DISA,self.profile.Velocity(times[i]),'TAS') for i in range(len(times))])
-        PRatio = np.array([self.aircraft.powertrain.Hybrid(self.aircraft.mission.profile.SuppliedPowerRatio(times[i]),self.profile.Altitude(times[i]),self.profile.Velocity(times[i]),PP[i]) for i in range(len(times))] )
-        self.Max_PEng = np.max(np.multiply(PP,PRatio[:,1]))
-        self.Max_PEng_alt = self.profile.Altitude(times[np.argmax(np.multiply(PP,PRatio[:,1]))]) #altitude at which peak power occurs
-        self.Max_PBat = np.max(np.multiply(PP,PRatio[:,5]))
+        PP = WTO * self.aircraft.performance.PoWTO_batch(self.aircraft.DesignWTOoS,beta,self.profile.PowerExcess(times),1,self.profile.Altitude(times),self.DISA,self.profile.Velocity(times),'TAS')
+        trajectory = self._hybrid_trajectory(beta, PP)
+        self.Max_PEng = np.max(trajectory.gt_power)
+        self.Max_PEng_alt = trajectory.altitude[np.argmax(trajectory.gt_power)] #altitude at which peak power occurs
+        self.Max_PBat = np.max(trajectory.battery_power)
 
         # Peak battery heat the thermal-management system actually has to reject, for TMS
         # sizing. With the bang-bang thermostat the cooling only acts when the pack is held at
         # its maximum operating temperature (T = ceiling, dT/dt = 0); below the ceiling the
         # heat is absorbed adiabatically by the thermal mass and nothing is rejected. So we
-        # take the peak generated heat *only over the points clamped at the ceiling* (reusing
-        # the propulsive-power split computed above). If the pack never reaches the ceiling,
-        # no cooling is required and the TMS heat is zero.
+        # take the peak generated heat *only over the points clamped at the ceiling* (the
+        # pack heat is recorded along the whole trajectory). If the pack never reaches the
+        # ceiling, no cooling is required and the TMS heat is zero.
+        # Points where the pack breaks a limit (within the integration tolerance) are skipped.
         ceiling = 273.15 + self.T_battery_limit
         b = self.aircraft.battery
-        q_pack_peak = 0.0
-        for i in range(len(times)):
-            if T_arr[i] < ceiling - 0.5:        # cooling is active only at the ceiling
-                continue
-            try:
-                b.T = T_arr[i]
-                b.it = it_arr[i] / 3600
-                b.i = b.Power_2_current(PP[i] * PRatio[i, 5])
-                alt = self.profile.Altitude(times[i])
-                Mach = Speed.TAS2Mach(self.profile.Velocity(times[i]), alt, DISA=self.DISA)
-                Tamb = ISA.atmosphere.T0std(alt, Mach)
-                rho = ISA.atmosphere.RHO0std(alt, Mach, self.DISA)
-                _, q_cell = b.heatLoss(Tamb, rho)
-                q_pack_peak = max(q_pack_peak, q_cell * b.cells_total)
-            except Exception:
-                continue
-        self.Max_Bat_Thermal_Pwr = q_pack_peak
+        state = b.cell_kernel(trajectory.battery_power, it_arr / 3600, T_arr)
+        trajectory.battery_heat = np.where(state.feasible, state.heat * b.cells_total, np.nan)
+        hot = T_arr >= ceiling - 0.5        # cooling is active only at the ceiling
+        q_pack = trajectory.battery_heat[hot & state.feasible]
+        self.Max_Bat_Thermal_Pwr = max(0.0, float(np.max(q_pack))) if q_pack.size else 0.0
 
         return self.Ef[-1], self.EBat[-1]
\ No newline at end of file
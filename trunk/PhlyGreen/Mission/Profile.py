@@ -12,8 +12,9 @@ segment computes its own geometry; this class only:
 1. instantiates segments from the stage dicts (via the segment registry),
 2. orders them within each phase (climbs, then cruise, then descents),
 3. lays them on a common timeline (``Breaks`` = the segment start-times), and
-4. exposes piecewise lookups :meth:`Altitude`, :meth:`Velocity`, :meth:`PowerExcess`,
-   :meth:`SuppliedPowerRatio`.
+4. compiles the timeline into sorted breakpoint arrays plus per-segment coefficient arrays,
+   and exposes the lookups :meth:`Altitude`, :meth:`Velocity`, :meth:`PowerExcess`,
+   :meth:`SuppliedPowerRatio` on top of them (``np.searchsorted``; scalars or time arrays).
 
 This replaces the legacy ``getattr`` dispatch, manual counters, and offset-indexed
 altitude closures of the original monolithic profile (kept only as a numerical baseline at
@@ -75,6 +76,7 @@ class Profile:
         self.Breaks = None
         self.Velocities = None
         self.HTMission = None
+        self.Categories = None
         self.MissionTime = None
         self.MissionTime2 = None
         self.SPW = None
@@ -86,7 +88,17 @@ class Profile:
         self.BreaksDescent = []
         self.BreaksClimbDiversion = []
 
-        self._alt_funcs = []
+        # compiled timeline (filled in by _compile): segment start-times and per-segment
+        # coefficients, so every lookup is one searchsorted + one fused expression.
+        self._t_breaks = np.zeros(1)
+        self._alt0 = np.zeros(1)
+        self._rate = np.zeros(1)
+        self._vel = np.zeros(1)
+        self._phi_times = None
+        self._phi0 = None
+        self._phi1 = None
+        # segment every lookup is pinned to while an integrator marches that segment
+        self._pinned = None
 
     # --- properties (preserve legacy validation) ----------------------------
 
@@ -164,6 +176,7 @@ class Profile:
         self.Breaks = [seg.start_time for seg in merged]
         self.Velocities = [seg.velocity for seg in merged]
         self.HTMission = [seg.vertical_rate for seg in merged]
+        self.Categories = [seg.category for seg in merged]   # CLIMB / CRUISE / DESCENT
         self.MissionTime2 = merged[-1].end_time if merged else 0.0
 
         # End of the mission phase (used by some downstream consumers).
@@ -175,12 +188,6 @@ class Profile:
         self.BreaksDescent = [s.end_time for s in merged if s.phase == "Mission" and s.category == DESCENT]
         self.BreaksClimbDiversion = [s.end_time for s in merged if s.phase == "Diversion" and s.category == CLIMB]
 
-        # Altitude lookup functions (default-arg binding avoids the late-binding bug).
-        self._alt_funcs = [
-            (lambda t, a=seg.start_altitude, h=seg.vertical_rate, b=seg.start_time: a + h * (t - b))
-            for seg in merged
-        ]
-
         if hybrid:
             spw = [[phi_takeoff, phi_takeoff]]
             spw += [[seg.phi_start, seg.phi_end] for seg in merged]
@@ -191,6 +198,19 @@ class Profile:
                 for i in range(len(self.times) - 1)
             ]
 
+        self._compile(merged, hybrid)
+
+    def _compile(self, merged, hybrid):
+        """Pack the merged timeline into the arrays used by the lookups."""
+        self._t_breaks = np.array([seg.start_time for seg in merged], dtype=float)
+        self._alt0 = np.array([seg.start_altitude for seg in merged], dtype=float)
+        self._rate = np.array([seg.vertical_rate for seg in merged], dtype=float)
+        self._vel = np.array([seg.velocity for seg in merged], dtype=float)
+        if hybrid:
+            self._phi_times = np.asarray(self.times, dtype=float)
+            self._phi0 = self.SPW[1:, 0].copy()
+            self._phi1 = self.SPW[1:, 1].copy()
+
     def _build_phase(self, stages, phase_range, phase, hybrid, want_takeoff=False):
         """Build the ordered merged segments for one phase.
 
@@ -246,24 +266,56 @@ class Profile:
         return (spr.get('phi_start', 0), spr.get('phi_end', 0))
 
     # --- piecewise lookups --------------------------------------------------
+    # A time t belongs to the last segment whose start-time is <= t (times before the first
+    # break fall in the first segment). All lookups accept a scalar or an array of times.
+
+    def pin_segment(self, index=None):
+        """Evaluate every lookup on segment ``index`` regardless of t (None unpins).
+
+        A solver marching segment i evaluates the right-hand side at the closing break,
+        which the time-based lookup assigns to segment i+1; pinning keeps the segment's
+        own velocity, vertical rate and phi ramp on the closed interval.
+        """
+        self._pinned = index
+
+    def segment_index(self, t):
+        """Index of the segment flown at time t (int for a scalar t, int array otherwise)."""
+        if self._pinned is not None:
+            return np.full(np.shape(t), self._pinned)
+        idx = np.searchsorted(self._t_breaks, t, side='right') - 1
+        return np.maximum(idx, 0)
 
     def Altitude(self, t):
         """Altitude at time t [m]."""
-        return np.piecewise(t, [t >= ti for ti in self.Breaks], self._alt_funcs)
+        t = np.asarray(t, dtype=float)
+        i = self.segment_index(t)
+        return self._alt0[i] + self._rate[i] * (t - self._t_breaks[i])
 
     def PowerExcess(self, t):
         """Vertical rate dh/dt at time t [m/s]."""
-        return np.piecewise(t, [t >= ti for ti in self.Breaks], self.HTMission)
+        return self._rate[self.segment_index(t)]
 
     def Velocity(self, t):
         """True airspeed at time t [m/s]."""
-        return np.piecewise(t, [t >= ti for ti in self.Breaks], self.Velocities)
+        return self._vel[self.segment_index(t)]
 
     def SuppliedPowerRatio(self, t):
-        """Hybrid supplied-power ratio phi(t) via per-segment linear interpolation."""
-        idx = np.piecewise(
-            t,
-            [self.times[i] < t <= self.times[i + 1] for i in range(len(self.times) - 1)],
-            [i for i in range(len(self.times) - 1)],
-        )
-        return self.SPWinterp[int(idx)](t)
+        """Hybrid supplied-power ratio phi(t) via per-segment linear interpolation.
+
+        Segment i covers ``(times[i], times[i+1]]``; times outside the mission fall back to
+        the first segment (as in the legacy lookup) and are clamped to its end values.
+        """
+        t = np.asarray(t, dtype=float)
+        tb = self._phi_times
+        if self._pinned is not None:
+            i = np.full(t.shape, self._pinned)
+        else:
+            i = np.searchsorted(tb, t, side='left') - 1
+            i = np.where((i < 0) | (i >= len(tb) - 1), 0, i)
+        t0, t1 = tb[i], tb[i + 1]
+        phi0, phi1 = self._phi0[i], self._phi1[i]
+        span = t1 - t0
+        # same operation order as np.interp, so results are bit-for-bit identical
+        slope = (phi1 - phi0) / np.where(span > 0, span, 1.0)
+        phi = np.where(t >= t1, phi1, slope * (t - t0) + phi0)
+        return np.where(t < t0, phi0, phi)
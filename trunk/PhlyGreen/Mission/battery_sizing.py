@@ -0,0 +1,96 @@
+"""Cell-only flights for the Class-II battery P-number search.
+
+The number of parallel cells P only enters a Class-II hybrid mission through the battery:
+the propulsive power, the phi split and hence the electric power asked of the pack, the fuel
+burn and the mass fraction are the same for every P. The pack feeds back only into its own
+states (delivered energy, charge throughput and temperature).
+
+:class:`PowerHistory` records the battery-side inputs once per take-off weight, sampled
+segment by segment from a mission flown without the battery states: electric power, phi and
+the cooling-air temperature and density. :meth:`PowerHistory.fly` then flies a candidate
+pack through that history by integrating only the cell states, so a probe costs a small
+fraction of a full mission, and keeps every flight per P so repeated probes are free.
+
+Between samples the inputs are interpolated linearly. Each segment also carries the values
+the mission right-hand side sees exactly at its own start and end times (where the
+time-based profile lookups may already belong to the neighbouring segment), so a limit hit
+only at a segment break fails the cell-only flight just as it fails the full mission.
+"""
+
+import numpy as np
+import scipy.integrate as integrate
+from scipy.optimize import OptimizeResult
+
+from PhlyGreen.Systems.Battery.Battery import BatteryError
+
+
+class PowerHistory:
+    """Battery-side inputs of one flown mission, per segment, and the packs flown through it.
+
+    Attributes:
+        segments: one ``(t, inputs, t_out)`` tuple per mission segment: increasing sample
+            times, the ``(power, phi, Tamb, rho)`` rows sampled there, and the output times of
+            the flown trajectory (the times of its ``integral_solution``).
+        trajectory: the per-segment ``[Ef, Beta]`` solutions of the flown mission.
+        flights: ``{P_number: (ok, code, solutions)}`` for every pack flown so far.
+        nfev: cell right-hand-side evaluations over all flights.
+    """
+
+    def __init__(self):
+        self.segments = []
+        self.trajectory = []
+        self.flights = {}
+        self.nfev = 0
+
+    def add_segment(self, t, power, phi, Tamb, rho, t_out):
+        """Append a segment sampled at times ``t`` (sorted, without repeats)."""
+        self.segments.append((np.asarray(t, dtype=float),
+                              np.vstack([power, phi, Tamb, rho]).astype(float),
+                              np.asarray(t_out, dtype=float)))
+
+    def fly(self, P_number, start, rates, y0, rtol=1e-6, atol=1e-6):
+        """Fly a pack of ``P_number`` parallel cells through the history (cached per P).
+
+        Args:
+            P_number: parallel cells of the candidate pack.
+            start: ``start(P_number)`` configures the pack and checks the take-off point;
+                returns ``(True, None)`` or ``(False, error code)``.
+            rates: ``rates(phi, power, it, T, Tamb, rho)`` returning ``(dEdt_bat, i, dTdt)``
+                of the configured pack; raises ``BatteryError`` when a limit is violated.
+            y0: initial ``[EBat, it, T]`` (J, ampere-seconds, K).
+            rtol, atol: BDF tolerances of the cell integration.
+
+        Returns:
+            ``(ok, code, solutions)``: ``solutions`` holds one result per segment with ``t``
+            (the trajectory output times) and ``y`` (``[EBat, it, T]`` x points), and is
+            empty when the pack fails.
+        """
+        if P_number not in self.flights:
+            self.flights[P_number] = self._fly(P_number, start, rates, y0, rtol, atol)
+        return self.flights[P_number]
+
+    def _fly(self, P_number, start, rates, y0, rtol, atol):
+        if P_number <= 0:
+            return False, None, []
+        ok, code = start(P_number)
+        if not ok:
+            return False, code, []
+
+        y = np.asarray(y0, dtype=float)
+        solutions = []
+        try:
+            for t, inputs, t_out in self.segments:
+                def fun(time, state, t=t, inputs=inputs):
+                    power, phi, Tamb, rho = (np.interp(time, t, row) for row in inputs)
+                    return rates(phi, power, state[1], state[2], Tamb, rho)
+
+                sol = integrate.solve_ivp(fun, (t[0], t[-1]), y, method='BDF', rtol=rtol,
+                                          atol=atol, t_eval=t_out)
+                self.nfev += sol.nfev
+                if sol.status < 0:
+                    raise RuntimeError(f"Cell-only battery integration failed: {sol.message}")
+                solutions.append(OptimizeResult(t=sol.t, y=sol.y, nfev=sol.nfev))
+                y = sol.y[:, -1]
+        except BatteryError as err:
+            return False, err.code, []
+        return True, None, solutions
@@ -0,0 +1,171 @@
+"""LH2 tank states integrated inside the mission ODE.
+
+The micro-step tank tracking advances ``LH2_Tank.time_step`` with explicit Euler over the
+output steps the mission solver happened to take. :func:`integrate_with_tank` instead
+appends the tank pressure, the stored mass per tank and the cumulative vented mass to the
+mission states and integrates all of them together, so the tank state is as accurate as the
+solver tolerances and independent of the step sizes.
+
+The pressure regulation is a switched system, handled with state events:
+
+- 'free': the pressure follows the tank energy balance; the mode ends when it reaches
+  ``P_max`` (rising) or ``P_min`` (falling), or when the tank runs empty;
+- 'vent': the pressure is held at ``P_max`` and the excess boil-off is vented; the mode ends
+  when the energy balance would no longer raise the pressure;
+- 'heater': the pressure is held at ``P_min`` by heater power; the mode ends when the energy
+  balance would raise the pressure on its own;
+- 'empty': nothing is drawn any more.
+
+Each segment starts in the mode the tank state selects (``LH2_Tank.regulation_mode``), and
+at every event the integration is restarted in the mode that event switches to. The tank
+does not feed back into the mission states.
+"""
+
+import numpy as np
+import scipy.integrate as integrate
+from scipy.optimize import OptimizeResult
+
+# free-mode pressure events fire this far outside [P_min, P_max] [Pa], so a restart exactly
+# on a limit is not caught again by the event it just left
+P_EVENT_MARGIN = 1e-2
+
+# relative distance from the segment end within which an event ends the segment
+SEGMENT_END_TOL = 1e-9
+
+# restarts allowed in one segment before the regulation is declared chattering
+MAX_RESTARTS = 1000
+
+
+def integrate_with_tank(model, tank, breaks, y0, mass_flow, altitude, rtol, atol=1e-6,
+                        max_step=np.inf):
+    """Integrate the mission ``model`` with the states of ``tank`` appended.
+
+    The tank history is reset and filled at every solver output point; ``tank.P_curr``,
+    ``m_curr`` and ``cum_vented_mass`` are left at the end-of-mission values.
+
+    Args:
+        model: mission right-hand side ``model(t, y)``.
+        tank: the ``LH2_Tank``, reset to full at ``P_min`` before the first segment.
+        breaks: segment boundaries ``[t0, t1, ..., tN]``.
+        y0: initial mission state.
+        mass_flow: ``mass_flow(t, y, dydt)``, hydrogen mass flow drawn from all tanks [kg/s].
+        altitude: ``altitude(t)`` [m].
+        rtol, atol, max_step: BDF tolerances and step cap.
+
+    Yields:
+        One solution per segment with ``t``, ``y`` (mission states only) and ``nfev``.
+    """
+    tank.reset_state()
+    n = len(y0)
+    iP, im, iv = n, n + 1, n + 2
+    y = np.concatenate([np.asarray(y0, dtype=float), [tank.P_curr, tank.m_curr, 0.0]])
+
+    # The perturbed tank columns of the finite-difference Jacobian reuse the mission rates;
+    # the regulation events and the history reuse the mass flow last evaluated at each
+    # solver time, as ``trajectory.SolverPointRecorder`` does for the mission columns.
+    last = [None, None, None]
+    flow_at = {}
+
+    def mission_rates(t, y):
+        key = (t, tuple(y[:n]))
+        if last[0] != key:
+            dydt = np.asarray(model(t, y[:n]), dtype=float)
+            last[:] = key, dydt, max(mass_flow(t, y[:n], dydt), 0.0)
+            flow_at[t] = last[2]
+        return last[1], last[2]
+
+    def flow(t, y):
+        return flow_at[t] if t in flow_at else mission_rates(t, y)[1]
+
+    def rhs(t, y, mode):
+        dydt, m_dot = mission_rates(t, y)
+        dP, dm, m_dot_g, _, _, _ = tank.regulation_rates(y[iP], y[im], m_dot, altitude(t), mode)
+        return np.concatenate([dydt, [dP, dm, m_dot_g * tank.n_tanks]])
+
+    def switch(t, y, mode):
+        m_dot = flow(t, y)
+        return tank.regulation_rates(y[iP], y[im], m_dot, altitude(t), mode)[5]
+
+    def empty(t, y):
+        return y[im] - 1e-3
+
+    def upper(t, y):
+        return y[iP] - tank.P_max - P_EVENT_MARGIN
+
+    def lower(t, y):
+        return y[iP] - tank.P_min + P_EVENT_MARGIN
+
+    def events(mode):
+        """Terminal events of ``mode`` and the mode each one switches to."""
+        if mode == 'empty':
+            return [], []
+        found, following = [_event(empty, -1)], ['empty']
+        if mode == 'free':
+            found += [_event(upper, 1), _event(lower, -1)]
+            following += ['vent', 'heater']
+        else:
+            # venting stops as the balance falls through zero, the heater as it rises
+            found.append(_event(lambda t, y: switch(t, y, mode), -1 if mode == 'vent' else 1))
+            following.append('free')
+        return found, following
+
+    for i in range(len(breaks) - 1):
+        t0, t1 = float(breaks[i]), float(breaks[i + 1])
+        flow_at.clear()
+        # the mission rates may jump at the breaks, so each segment starts in the mode its
+        # initial state selects; inside the segment the mode follows the events
+        mode = tank.regulation_mode(y[iP], y[im], mission_rates(t0, y)[1], altitude(t0))
+        pieces, nfev = [], 0
+        for _ in range(MAX_RESTARTS):
+            if mode == 'vent':
+                y[iP] = tank.P_max
+            elif mode == 'heater':
+                y[iP] = tank.P_min
+            found, following = events(mode)
+            sol = integrate.solve_ivp(lambda t, y: rhs(t, y, mode), (t0, t1), y,
+                                      method='BDF', rtol=rtol, atol=atol, max_step=max_step,
+                                      events=found)
+            if sol.status < 0:
+                raise RuntimeError(f"Coupled tank integration failed: {sol.message}")
+            nfev += sol.nfev
+            pieces.append((sol, mode))
+            t0, y = sol.t[-1], sol.y[:, -1].copy()
+            # an event on the segment end (the switching function jumping with the mission
+            # rates at the break) is left to the mode selection of the next segment
+            if sol.status == 0 or t1 - t0 <= SEGMENT_END_TOL * max(1.0, abs(t1)):
+                break
+            mode = following[next(j for j, te in enumerate(sol.t_events) if len(te))]
+        else:
+            raise RuntimeError(f"LH2 tank regulation switched more than {MAX_RESTARTS} times "
+                               f"in mission segment {i}")
+
+        t = np.concatenate([p.t if k == 0 else p.t[1:] for k, (p, _) in enumerate(pieces)])
+        Y = np.hstack([p.y if k == 0 else p.y[:, 1:] for k, (p, _) in enumerate(pieces)])
+        modes = [mode for k, (p, mode) in enumerate(pieces)
+                 for _ in range(len(p.t) if k == 0 else len(p.t) - 1)]
+        _record(tank, t, Y, modes, flow, altitude, iP, im, iv)
+        yield OptimizeResult(t=t, y=Y[:n], nfev=nfev)
+
+    tank.P_curr, tank.m_curr, tank.cum_vented_mass = float(y[iP]), float(y[im]), float(y[iv])
+
+
+def _event(fun, direction):
+    def event(t, y):
+        return fun(t, y)
+    event.terminal, event.direction = True, direction
+    return event
+
+
+def _record(tank, t, Y, modes, flow, altitude, iP, im, iv):
+    """Append the tank outputs at the solver points ``t`` to ``tank.history``."""
+    rows = np.empty((9, len(t)))
+    for k, (time, mode) in enumerate(zip(t, modes)):
+        m_dot = flow(time, Y[:, k])
+        alt = float(altitude(time))
+        _, _, m_dot_g, Q_heater, Q_mli, _ = tank.regulation_rates(Y[iP, k], Y[im, k], m_dot,
+                                                                   alt, mode)
+        if mode == 'empty':
+            m_dot = 0.0
+        rows[:, k] = (time, Y[iP, k] / 1e5, Y[im, k] * tank.n_tanks, m_dot_g * tank.n_tanks,
+                      Q_mli * tank.n_tanks, alt, Q_heater * tank.n_tanks, Y[iv, k], m_dot)
+    tank.history.extend(rows)
@@ -0,0 +1,125 @@
+"""Canonical record of the flown mission at the accepted solver points.
+
+Every mission configuration ends with a pass over the points of ``integral_solution``: the
+propulsive power and its power split there give the peak powers for sizing and the fuel
+flow for the emissions. :class:`MissionTrajectory` keeps what that pass computes, so the
+post-processing (``postprocess.power_timeseries``, the Class-II sizing report, the NOx
+integration in ``ClimateImpact``) reads arrays instead of solving ``PoWTO`` and the
+power-ratio graph again point by point.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class MissionTrajectory:
+    """The flown mission at the solver output points (``Mission.trajectory``).
+
+    All arrays have one entry per point of the concatenated ``integral_solution``; columns a
+    configuration does not have are ``None``.
+
+    Attributes:
+        t: time [s].
+        segment: index of the mission segment each point belongs to.
+        altitude: altitude [m].
+        velocity: true airspeed [m/s].
+        beta: mass fraction ``W/W_TO``.
+        PP: propulsive power [W] (total).
+        fuel_flow: fuel (or hydrogen) mass flow [kg/s].
+        phi: supplied power ratio (hybrid and fuel-cell + battery configurations).
+        PRatio: ``(points x columns)`` power ratios of the configuration's power-split solve,
+            in its own column order: ``Powertrain.Traditional`` / ``Powertrain.Hybrid``
+            (relative to ``PP``) or ``FuelCell.ComputePRatio`` (relative to the fuel-cell
+            share of ``PP``).
+        gt_power: gas-turbine shaft power [W].
+        battery_power: electrical power at the battery terminals [W] (positive when
+            discharging), in every configuration with a battery: the ``Pbat`` column of the
+            hybrid graphs, the battery share of ``PP`` over the motor, PMAD and gearbox
+            efficiencies in the fuel-cell + battery configurations, the bus balance of the
+            range extender.
+        battery_propulsive_power: share of ``PP`` the battery covers [W] (``phi * PP``), in the
+            fuel-cell + battery configurations, where ``phi`` splits the propulsive power
+            rather than the supplied power.
+        fc_heat: fuel-cell waste heat [W].
+        battery_heat: battery pack heat generation [W] (Class-II battery; ``nan`` where the
+            cell model rejects the operating point).
+    """
+
+    t: np.ndarray
+    segment: np.ndarray
+    altitude: np.ndarray
+    velocity: np.ndarray
+    beta: np.ndarray
+    PP: np.ndarray
+    fuel_flow: np.ndarray
+    phi: np.ndarray = None
+    PRatio: np.ndarray = None
+    gt_power: np.ndarray = None
+    battery_power: np.ndarray = None
+    battery_propulsive_power: np.ndarray = None
+    fc_heat: np.ndarray = None
+    battery_heat: np.ndarray = None
+
+    @classmethod
+    def from_solution(cls, solutions, profile, beta, PP, fuel_flow, **columns):
+        """Record built on the points of the per-segment ``solutions``.
+
+        ``beta``, ``PP`` and ``fuel_flow`` (and the optional ``columns``) are given at the
+        concatenated solution points; time, segment, altitude and velocity are filled here.
+        """
+        t = np.concatenate([sol.t for sol in solutions])
+        segment = np.repeat(np.arange(len(solutions)), [len(sol.t) for sol in solutions])
+        arrays = {key: None if value is None else np.asarray(value, dtype=float)
+                  for key, value in columns.items()}
+        return cls(t=t, segment=segment,
+                   altitude=np.asarray(profile.Altitude(t), dtype=float),
+                   velocity=np.asarray(profile.Velocity(t), dtype=float),
+                   beta=np.asarray(beta, dtype=float), PP=np.asarray(PP, dtype=float),
+                   fuel_flow=np.asarray(fuel_flow, dtype=float), **arrays)
+
+    def __len__(self):
+        return len(self.t)
+
+    def to_dict(self):
+        """``{name: array}`` of the recorded columns, ``PRatio`` split into ``PRatio_<j>``."""
+        out = {}
+        for key, value in vars(self).items():
+            if value is None:
+                continue
+            if key == 'PRatio':
+                out.update({f'PRatio_{j}': value[:, j] for j in range(value.shape[1])})
+            else:
+                out[key] = value
+        return out
+
+
+class SolverPointRecorder:
+    """Values the mission right-hand side computed, by solver time, one dict per segment.
+
+    The right-hand side calls :meth:`record` at every evaluation, so after a segment is
+    integrated the entry at each of its output times holds the last evaluation there (the
+    final Newton iterate of the step ending at that time, within the solver tolerances of
+    the state). Segments are closed as the integration yields them, since the rates may
+    jump at the shared break times.
+    """
+
+    def __init__(self):
+        self.segments = []
+        self._open = {}
+
+    def reset(self):
+        self.segments = []
+        self._open = {}
+
+    def record(self, t, value):
+        self._open[t] = value
+
+    def close_segment(self):
+        self.segments.append(self._open)
+        self._open = {}
+
+    def get(self, segment, t):
+        """The value recorded at time ``t`` of ``segment``, or ``None``."""
+        return self.segments[segment].get(t) if segment < len(self.segments) else None
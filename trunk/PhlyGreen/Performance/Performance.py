@@ -213,6 +213,27 @@ class Performance:
         PW = self.g_acc * ( 1.0/WTOoS * q * self.TAS * Cd  + beta * Ps )
         return PW
 
+    def PoWTO_batch(self,WTOoS,beta,Ps,n,altitude,DISA,speed,speedtype):      # W/Kg
+        """
+        Stateless, array-capable version of :meth:`PoWTO`.
+
+        Takes N-length arrays (or scalars, broadcast together) of beta, Ps, altitude and
+        speed and returns the N-length required P/W in one vectorized pass. Unlike
+        :meth:`PoWTO` it does not touch the stored speed state (``self.TAS``, ``self.Mach``,
+        ...) and skips the unused CAS/knots conversions, so it is also the cheaper choice
+        for a single point inside the mission right-hand side.
+
+        Returns
+        -------
+        PW : float or ndarray
+            Required P/W [W/kg], same shape as the broadcast inputs
+        """
+        Mach, TAS = Speed.MachTAS(speed,speedtype,altitude,DISA)
+        q = 0.5 * ISA.atmosphere.RHOstd(altitude,DISA) * TAS**2
+        Cl = n * beta * WTOoS / q
+        Cd = self.aircraft.aerodynamics.Cd(Cl, Mach)
+        return self.g_acc * ( 1.0/WTOoS * q * TAS * Cd  + beta * Ps )
+
     def OEIClimb(self,WTOoS,beta,Ps,n,altitude,DISA,speed,speedtype):
         """
         One-engine-inoperative (OEI) climb P/W requirement.
@@ -101,7 +101,7 @@ class Aerodynamics:
             raise ValueError("Polar model unset")
         
     def Cd0(self,Mach):
-        return np.piecewise(Mach,[Mach <= 0.8, Mach > 0.8],[self.Cd_0,0.035*Mach-0.011])
+        return np.where(Mach <= 0.8, self.Cd_0, 0.035*Mach - 0.011)
     
     def k1(self):
         return self.kv + self.ki()
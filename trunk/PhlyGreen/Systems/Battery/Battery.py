@@ -1,7 +1,14 @@
 
+from dataclasses import dataclass
+
 import numpy as np
 from PhlyGreen.Systems.Battery import Cell_Models
 
+# BatteryError codes flagged by Battery.cell_kernel, in the order the validating properties
+# raise them for a single point
+CELL_LIMITS = ("NEG_BATT_TEMP", "SOC_OUTSIDE_LIMITS", "BATT_UNDERPOWERED",
+               "CURR_OUTSIDE_LIMITS", "VOLTAGE_OUTSIDE_LIMITS")
+
 
 class BatteryError(Exception):
     """Custom exception to be caught when the battery violates physical or model constraints."""
@@ -10,6 +17,44 @@ class BatteryError(Exception):
         self.code = code
 
 
+@dataclass
+class CellState:
+    """Pack state at a batch of points, as returned by :meth:`Battery.cell_kernel`.
+
+    Every array has one entry per point. ``violations`` maps each code of
+    :data:`CELL_LIMITS` to a boolean mask of the points that break that limit; at those points
+    the other arrays may be NaN.
+    """
+    i: np.ndarray        # pack current [A]
+    Vout: np.ndarray     # pack terminal voltage [V]
+    Voc: np.ndarray      # pack open-circuit voltage [V]
+    SOC: np.ndarray      # state of charge [-]
+    heat: np.ndarray     # waste heat generated per cell [W]
+    violations: dict
+
+    @property
+    def feasible(self):
+        """Mask of the points that respect every limit."""
+        bad = np.zeros(np.shape(self.i), dtype=bool)
+        for mask in self.violations.values():
+            bad |= mask
+        return ~bad
+
+    def first_violation(self):
+        """``(index, code)`` of the earliest violating point, or None if all points are valid.
+
+        At a point that breaks several limits, the code is the one the scalar battery
+        properties would raise first.
+        """
+        feasible = self.feasible
+        if np.all(feasible):
+            return None
+        k = int(np.argmin(np.ravel(feasible)))
+        for code in CELL_LIMITS:
+            if np.ravel(self.violations[code])[k]:
+                return k, code
+
+
 class Battery:
     """
     Battery electro-thermal model with safety checks.
@@ -469,6 +514,61 @@ class Battery:
 
         return I_out * self.P_number
 
+    def cell_kernel(self, P, it, T):
+        """Vectorized, stateless evaluation of the configured pack.
+
+        Same equations as ``Power_2_current``, ``cell_Vout``/``Vout`` and the waste heat of
+        ``heatLoss``, evaluated over whole arrays at once. The Arrhenius/thermal corrections
+        are computed once per point, and limit violations are returned as flags instead of
+        raising ``BatteryError``. The battery state (``i``, ``it``, ``T``) is neither read
+        nor changed.
+
+        Receives:
+            - P  - pack power demanded [W]
+            - it - spent pack charge [Ah] (same units as ``Battery.it``)
+            - T  - cell temperature [K]
+        Returns:
+            - CellState with pack current, terminal and open-circuit voltage, SOC, waste
+              heat per cell and the limit-violation masks
+        """
+        P, it, T = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (P, it, T)))
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            E0 = self.voltage_ctt + self.E_slope * (T - self.Tref)
+            Q = self.cell_capacity + self.Q_slope * (T - self.Tref)
+            K = self.polarization_ctt * np.exp(self.K_arrhenius * (1 / T - 1 / self.Tref))
+            R = self.cell_resistance * np.exp(self.R_arrhenius * (1 / T - 1 / self.Tref))
+            A, B = self.exp_amplitude, self.exp_time_ctt
+
+            cell_it = it / self.P_number
+            SOC = 1 - cell_it / self.cell_capacity
+
+            # Power_2_current: quadratic in the cell current for the per-cell power
+            Qr = K * Q / (Q - cell_it)
+            ee = A * np.exp(-B * cell_it)
+            a = -R - Qr
+            b = E0 + ee - cell_it * Qr
+            c = -(P / self.cells_total)
+            Disc = b**2 - 4 * a * c
+            cell_i = np.where(P == 0, 0.0, (-b + np.sqrt(Disc)) / (2 * a))
+            cell_i = np.where((P != 0) & (Disc < 0), np.nan, cell_i)
+            i = cell_i * self.P_number
+
+            # _voltageModel at the load and at open circuit
+            V = E0 - (cell_i + cell_it) * K * (Q / (Q - cell_it)) + A * np.exp(-B * cell_it) - cell_i * R
+            Voc = E0 - (0 + cell_it) * K * (Q / (Q - cell_it)) + A * np.exp(-B * cell_it) - 0 * R
+            heat = (Voc - V) * cell_i + self.E_slope * cell_i * T
+
+            underpowered = np.isnan(cell_i)
+            violations = {
+                "NEG_BATT_TEMP": T < 0,
+                "SOC_OUTSIDE_LIMITS": ~((self.SOC_min <= SOC) & (SOC <= 1)),
+                "BATT_UNDERPOWERED": underpowered,
+                "CURR_OUTSIDE_LIMITS": ~underpowered & (cell_i > self.cell_max_current),
+                "VOLTAGE_OUTSIDE_LIMITS": ~underpowered & ~(self.cell_Vmin <= V),
+            }
+        return CellState(i=i, Vout=V * self.S_number, Voc=Voc * self.S_number, SOC=SOC,
+                         heat=heat, violations=violations)
+
     def heatLoss(self, Ta, rho):
         """ Simple differential equation describing a
             simplified lumped element thermal model of the cells
@@ -26,7 +26,7 @@ class FuelCell:
     """
     Fuel Cell System (FCS) - Physics-Based Model (Massaro et al. / Kulikovsky).
     Sizing Margin: Optimized for TO Peak (AIAA 2025 Compliant).
-    Solver: Hybrid (Brentq + Grid Search Fallback).
+    Solver: Tabulated inversion (grid bracket + one Newton polish) with Grid Search Fallback.
     """
 
     # --- PHYSICAL CONSTANTS ---
@@ -102,6 +102,10 @@ class FuelCell:
         self.EtaEM = None
         self.EtaGB = None
 
+        # Gross-power-vs-current-density table used by ComputePRatio; rebuilt whenever the
+        # stack geometry or the cell model changes (see _inversion_table).
+        self._pratio_table = None
+
 
     def SetInput(self):
         """Loads FC parameters strictly from the aircraft dictionary and FC_Database (Fail-Fast)."""
@@ -172,13 +176,17 @@ class FuelCell:
         # Assigned from Database strictly
         self.T_op = params['T_op']
         self.Target_Press = params['Target_Press']
+        self._pratio_table = None
 
 
     def PolarizationCurve(self, i_dens, P_internal_Pa, T_amb=None):
-        """Computes the cell voltage (Kulikovsky analytical model)."""
+        """Computes the cell voltage (Kulikovsky analytical model).
+
+        ``i_dens`` may be a scalar (returns a float) or an array of current densities.
+        """
         if self.Voc is None: self.SetInput()
         
-        j0 = max(1e-5, i_dens) 
+        j0 = np.maximum(1e-5, i_dens)
         p_bar = P_internal_Pa / 1e5
         c_h = self.c_h_ref * p_bar
         
@@ -192,7 +200,7 @@ class FuelCell:
         
         j_lim_star = (4 * self.FARADAY_CONST * self.D_b * c_h) / self.l_b
         
-        ratio_lim = min(j0 / j_lim_star, 0.999) 
+        ratio_lim = np.minimum(j0 / j_lim_star, 0.999)
             
         beta = (np.sqrt(2 * j0_tilde) / (1 + np.sqrt(1.12 * j0_tilde) * np.exp(np.sqrt(2 * j0_tilde)))) + \
                (np.pi * j0_tilde / (2 + j0_tilde))
@@ -206,13 +214,13 @@ class FuelCell:
         
         V_conc = 0.0
         if self.j_lim is not None and self.B_conc is not None:
-            if j0 >= self.j_lim:
-                V_conc = 2.5 # Heavy penalty to simulate physical limit
-            else:
-                V_conc = -self.B_conc * np.log(1 - j0 / self.j_lim)
+            # Heavy penalty (2.5 V) beyond j_lim to simulate the physical limit
+            with np.errstate(divide='ignore', invalid='ignore'):
+                V_conc = np.where(j0 >= self.j_lim, 2.5,
+                                  -self.B_conc * np.log(1 - np.minimum(j0 / self.j_lim, 1.0)))
             
-        V_cell = self.Voc - (self.R_ohm * j0) - eta_0 - V_conc
-        return max(1e-3, V_cell)
+        V_cell = np.maximum(1e-3, self.Voc - (self.R_ohm * j0) - eta_0 - V_conc)
+        return float(V_cell) if np.ndim(V_cell) == 0 else V_cell
 
     def _compute_air_system_power(self, P_amb, T_amb, I_tot):
         """
@@ -378,6 +386,32 @@ class FuelCell:
         P = 101325.0 * (1 - 0.0065 * alt / 288.15)**5.255
         return P, T
 
+    # ComputePRatio brackets the operating current density on PRATIO_GRID_POINTS equally spaced
+    # points (the adequacy check and the grid-search fallback also read this grid); the
+    # inversion table refines every interval PRATIO_TABLE_REFINE times.
+    PRATIO_GRID_POINTS = 50
+    PRATIO_TABLE_REFINE = 16
+
+    def _inversion_table(self):
+        """Return ``(i_dens, P_stack, usable)`` on the refined current-density grid.
+
+        ``P_stack = N_cells * A_cell_reale * i * V_cell(i)`` is the gross stack power, which
+        only depends on the stack geometry (the cathode runs at the fixed ``Target_Press``);
+        ``usable`` masks out points with ``V_cell <= 0.1``. The air-system draw is linear in
+        the stack current, so the net power at any altitude is
+        ``P_stack - c(alt) * i - P_fixed`` and one table serves the whole flight envelope.
+        The table is keyed on the geometry and rebuilt after every (re)sizing.
+        """
+        limit = self.j_lim if self.j_lim is not None else 2.5
+        key = (self.N_cells, self.A_cell_reale, limit, self.Target_Press)
+        if self._pratio_table is None or self._pratio_table[0] != key:
+            n = (self.PRATIO_GRID_POINTS - 1) * self.PRATIO_TABLE_REFINE + 1
+            i_dens = np.linspace(0.0001, limit * 0.95, n)
+            v_cell = self.PolarizationCurve(i_dens, self.Target_Press)
+            P_stack = self.N_cells * v_cell * i_dens * self.A_cell_reale
+            self._pratio_table = (key, (i_dens, P_stack, v_cell > 0.1))
+        return self._pratio_table[1]
+
     def ComputePRatio(self, alt, vel, P_req_net):
         """Computes operational state given altitude, velocity and required net power."""
         if not self.Sizing_Done: self.ComputeAndStoreWeights(1000.0)
@@ -398,7 +432,7 @@ class FuelCell:
             eta_mech *= self.EtaProp
 
         P_elec_target = P_req_net / max(eta_mech, 0.01)
-        limit = self.j_lim if self.j_lim is not None else 2.5 
+        P_fixed = self.P_fc_rated * self.Fixed_Aux_Load
 
         def residual(i_guess):
             v_cell = self.PolarizationCurve(i_guess, self.Target_Press)
@@ -408,15 +442,20 @@ class FuelCell:
             P_gross = self.N_cells * v_cell * I_tot
             
             P_comp_net, _, _ = self._compute_air_system_power(P_amb, T_amb, I_tot)
-            P_fixed = self.P_fc_rated * self.Fixed_Aux_Load
-            
             return (P_gross - P_comp_net - P_fixed) - P_elec_target
 
         valid_solution = False
         i_op = 0.0
 
-        test_points = np.linspace(0.0001, limit * 0.95, 50)
-        res_values = np.array([residual(x) for x in test_points])
+        # Residual on the refined grid from the cached gross-power table: the air-system draw
+        # per unit current density is the air-system power at 1 A times the cell area.
+        i_table, P_stack, usable = self._inversion_table()
+        c_air = self._compute_air_system_power(P_amb, T_amb, 1.0)[0] * self.A_cell_reale
+        res_table = np.where(usable, P_stack - c_air * i_table - P_fixed - P_elec_target,
+                             -P_elec_target * 2.0)
+        refine = self.PRATIO_TABLE_REFINE
+        test_points = i_table[::refine]
+        res_values = res_table[::refine]
         idx_change = np.where(np.diff(np.sign(res_values)))[0]
 
         # --- Adequacy tracking ---------------------------------------------------------
@@ -436,12 +475,19 @@ class FuelCell:
             self._power_limited = True
 
         if len(idx_change) > 0:
-            idx = idx_change[0]
-            try:
-                i_op = brentq(residual, test_points[idx], test_points[idx+1], xtol=1e-4)
-                valid_solution = True
-            except ValueError:
-                valid_solution = False
+            # First sign change of the refined residual inside the bracketing grid interval,
+            # linear interpolation there, then one Newton step on the exact residual with the
+            # table slope.
+            lo = idx_change[0] * refine
+            window = res_table[lo:lo + refine + 1]
+            k = lo + np.where(np.diff(np.sign(window)))[0][0]
+            r0, r1 = res_table[k], res_table[k + 1]
+            i0, i1 = i_table[k], i_table[k + 1]
+            slope = (r1 - r0) / (i1 - i0)
+            i_op = i0 - r0 / slope if slope != 0.0 else i0
+            if slope != 0.0:
+                i_op = min(max(i_op - residual(i_op) / slope, i0), i1)
+            valid_solution = True
 
         if not valid_solution:
             # Grid search fallback if root finding fails
@@ -62,7 +62,7 @@ class Powertrain:
       
     @EtaGTmodelType.setter
     def EtaGTmodelType(self,value):
-        if value in ('constant', 'ResponseSurface'):
+        if value in ('constant', 'ResponseSurface', 'ResponseSurfaceTable'):
             self._EtaGTmodelType = value
         else:
             raise ValueError("Error: %s Eta GT model not implemented. Exiting" %value)
@@ -369,7 +369,8 @@ class Powertrain:
         Each component's efficiency is either Class-I (a constant, the default) or Class-II
         (a model that depends on the operating point). The choice is driven by the
         ``Eta <component> Model`` keys in ``EnergyInput`` (``'constant'`` |
-        ``'ResponseSurface'`` for the gas turbine, ``'constant'`` | ``'Hamilton'`` |
+        ``'ResponseSurface'`` | ``'ResponseSurfaceTable'`` for the gas turbine (the latter reads
+        the same surface from a pre-tabulated grid), ``'constant'`` | ``'Hamilton'`` |
         ``'Surrogate'`` for the propeller, ``'constant'`` | ``'Smart'`` for the motor).
         The result is stored in ``self.efficiency`` and read through :meth:`eta`.
         """
@@ -397,7 +398,7 @@ class Powertrain:
         eff['pmad'] = ConstantEfficiency(const('EtaPM', 1.0))
 
         # Gas turbine: Class-I constant or Class-II response surface (needs a nominal power).
-        if self.EtaGTmodelType == 'ResponseSurface':
+        if self.EtaGTmodelType in ('ResponseSurface', 'ResponseSurfaceTable'):
             from .efficiency import GasTurbineEfficiencyModel
             if not self.gt_design_power:
                 raise ValueError(
@@ -405,7 +406,8 @@ class Powertrain:
                     "Size the engine before the mission (e.g. DesignPW * WTO) and pass it "
                     "in EnergyInput as 'GT Design Power'.")
             eff['gas_turbine'] = GasTurbineEfficiencyModel(
-                design_power=self.gt_design_power, n_engines=n_eng)
+                design_power=self.gt_design_power, n_engines=n_eng,
+                tabulated=self.EtaGTmodelType == 'ResponseSurfaceTable')
         else:
             eff['gas_turbine'] = ConstantEfficiency(const('EtaGT', 0.30))
 
@@ -440,30 +442,13 @@ class Powertrain:
     def _thermal_power_timeline(self):
         """Return (altitude[m], velocity[m/s], gas-turbine shaft power[W]) along the mission."""
         import numpy as np
-        m = self.aircraft.mission
-        sols = getattr(m, "integral_solution", None)
-        if not sols:
+        trajectory = getattr(self.aircraft.mission, "trajectory", None)
+        if trajectory is None:
             return None
-        prof, perf = m.profile, self.aircraft.performance
-        WTO, WS, DISA = self.aircraft.weight.WTO, self.aircraft.DesignWTOoS, m.DISA
-        t = np.concatenate([s.t for s in sols])
-        beta = np.concatenate([s.y[-1] for s in sols])
-        alt = np.array([float(prof.Altitude(x)) for x in t])
-        vel = np.array([float(prof.Velocity(x)) for x in t])
-        pe = np.array([float(prof.PowerExcess(x)) for x in t])
-        PP = np.array([WTO * perf.PoWTO(WS, beta[i], pe[i], 1, alt[i], DISA, vel[i], 'TAS')
-                       for i in range(len(t))])
-        cfg = self.aircraft.Configuration
-        if cfg == 'Traditional':
-            p_th = np.array([self.Traditional(alt[i], vel[i], PP[i])[1] * PP[i]
-                             for i in range(len(t))])
-        elif cfg == 'Hybrid':
-            phi = np.array([float(prof.SuppliedPowerRatio(x)) for x in t])
-            p_th = np.array([self.Hybrid(float(phi[i]), alt[i], vel[i], PP[i])[1] * PP[i]
-                             for i in range(len(t))])
-        else:
-            p_th = np.zeros(len(t))
-        return alt, vel, p_th
+        p_th = trajectory.gt_power
+        if p_th is None:
+            p_th = np.zeros(len(trajectory))
+        return trajectory.altitude, trajectory.velocity, p_th
 
     def report_class_ii_sizing(self, raise_on_undersize=False):
         """Check the Class-II GT/EM nominal power against what the mission demands.
@@ -1,11 +1,31 @@
+import os
+import sys
+import argparse
 import numpy as np
 import pandas as pd
 import itertools
 from Propeller_System import PropellerSystem  # Import your physics class
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from adaptive_sampling import adaptive_sample
+
+# Columns of propeller_data_rbf.csv, as PropellerSurrogate reads them (power is stored in W;
+# the surrogate detects it and converts to kW).
+COLUMNS = ["Altitude_m", "Airspeed_m_s", "EM_Power_kW", "RPM", "Pitch", "Efficiency", "ViscousLoss"]
+
+
+def solve_point(prop_system, alt, vel, pwr, failed=0):
+    """One operating point -> CSV row. Failed (physically impossible) points get ``failed``."""
+    res = prop_system.solve_operating_point(alt, vel, pwr, flight_phase="FLIGHT")
+    if res:
+        return [alt, vel, pwr, res['rpm'], res['pitch'], res['eta_real'], res['power_loss_viscous']]
+    # Not every combination is physically possible in a real mission (e.g. huge power at 0 speed):
+    # zeros mark the "bad" zone for the interpolator without making the run crash.
+    return [alt, vel, pwr] + [failed] * 4
+
 # This script generates a comprehensive CSV map of propeller performance across a wide range of altitudes, speeds, and power levels.
 # The CVS map will later be used to train a surrogate model like it was done for the GT engine.
-def generate_propeller_map():
+def generate_propeller_map(adaptive=False, tol=0.01, n_max=400):
     # SETUP THE PHYSICS MODEL
     specs = {
         'diameter': 3.93,
@@ -28,6 +48,22 @@ def generate_propeller_map():
     # Power: 50kW (idle) to 2.5MW (max takeoff)
     powers = np.linspace(50000, 2500000, 10)
 
+    if adaptive:
+        # Error-driven sampling of the same box: coarse Latin hypercube, then points where the
+        # RBF leave-one-out error of RPM/pitch/efficiency/loss is largest. Failed points go to
+        # the sampler as NaN (left out of the fit, so the zero plateau does not attract samples)
+        # and to the CSV as zeros, like in the grid.
+        print(f"Generating Map adaptively (target {tol:.1%}, at most {n_max} points).")
+        evaluate = lambda X: [solve_point(prop_system, *x, failed=np.nan)[3:] for x in X]
+        sample = adaptive_sample(evaluate, [(alts[0], alts[-1]), (vels[0], vels[-1]),
+                                            (powers[0], powers[-1])], tol=tol, n_max=n_max,
+                                 verbose=True)
+        df = pd.DataFrame(np.column_stack([sample.X, np.nan_to_num(sample.Y, nan=0.0)]),
+                          columns=COLUMNS)
+        df.to_csv("propeller_data_rbf.csv", index=False)
+        print(f"✅ Database generated: propeller_data_rbf.csv ({len(df)} points)")
+        return
+
     print(f"Generating Map: {len(alts)} x {len(vels)} x {len(powers)} = {len(alts)*len(vels)*len(powers)} points.")
 
     data_rows = []
@@ -45,39 +81,18 @@ def generate_propeller_map():
             print(f"Processing point {counter}/{total_points}...")
 
         # Run the solver
-        res = prop_system.solve_operating_point(alt, vel, pwr, flight_phase="FLIGHT")
-
-        if res:
-            # Success
-            row = {
-                "Altitude": alt,
-                "Velocity": vel,
-                "Power": pwr,
-                "RPM": res['rpm'],
-                "Pitch": res['pitch'],
-                "Efficiency": res['eta_real'],
-                "ViscousLoss": res['power_loss_viscous']
-            }
-        else:
-            #Not every combination on the grid is physically possible in a real mission.
-            # When thesolver failes (physically impossible state, e.g., huge power at 0 speed)
-            # records zeros/NaNs so the interpolator knows it's a "bad" zone. This was done without making the run crash...
-            row = {
-                "Altitude": alt,
-                "Velocity": vel,
-                "Power": pwr,
-                "RPM": 0,
-                "Pitch": 0,
-                "Efficiency": 0.0, # Zero efficiency in failure zones
-                "ViscousLoss": 0
-            }
-        
-        data_rows.append(row)
+        data_rows.append(solve_point(prop_system, alt, vel, pwr))
 
     # 4. SAVE TO CSV to create a dataset that will be used to train a surorgate model for the propeller.
-    df = pd.DataFrame(data_rows)
+    df = pd.DataFrame(data_rows, columns=COLUMNS)
     df.to_csv("propeller_data_rbf.csv", index=False)
     print("✅ Database generated: propeller_data_rbf.csv")
 
 if __name__ == "__main__":
-    generate_propeller_map()
\ No newline at end of file
+    ap = argparse.ArgumentParser(description="Generate propeller_data_rbf.csv")
+    ap.add_argument("--adaptive", action="store_true",
+                    help="error-driven sampling instead of the 10x10x10 grid (../adaptive_sampling.py)")
+    ap.add_argument("--tol", type=float, default=0.01, help="adaptive: target RMS LOO error (fraction of range)")
+    ap.add_argument("--n-max", type=int, default=400, help="adaptive: maximum number of physics solves")
+    args = ap.parse_args()
+    generate_propeller_map(adaptive=args.adaptive, tol=args.tol, n_max=args.n_max)
\ No newline at end of file
@@ -278,10 +278,41 @@ class EngineWeightCalculator:
         w_dry_engine = w_comp + w_burner + w_hpt + w_pt + w_shafts + w_acc
         return w_dry_engine * 1.10
 
+# Off-design efficiency of one (altitude, Mach, power fraction) point, for the adaptive map
+def od_efficiency(prob, od, alt, mach, frac, des_pwr, base_mass_flow):
+    """Thermal efficiency at power fraction `frac` of the power available at `alt`; NaN if the
+    point does not converge or is unphysical (same filter as the grid)."""
+    P_std_sl, T_std_sl = 14.696, 518.67
+    T_amb = max(T_std_sl - 3.566e-3 * alt, 390.0)
+    delta = (P_std_sl * (T_amb / T_std_sl)**5.2561) / P_std_sl
+    pwr = frac * des_pwr * delta
+
+    # Reset guesses: the adaptive points come in no particular order
+    prob.set_val(f'{od}.balance.W', base_mass_flow * delta)
+    prob.set_val(f'{od}.balance.FAR', 0.017)
+    prob.set_val(f'{od}.balance.HP_Nmech', 5000.0)
+    prob.set_val(f'{od}.fc.alt', alt, units='ft')
+    prob.set_val(f'{od}.fc.MN', mach)
+    prob.set_val(f'{od}.balance.pwr_target', pwr, units='hp')
+    try:
+        prob.run_model()
+        Wfuel = prob.get_val(f'{od}.perf.Wfuel')[0]
+    except Exception:
+        return np.nan
+    eta = pwr * 745.7 / (max(Wfuel, 1e-6) * 0.45359237 * 43e6)
+    return eta if 0.05 < eta < 0.6 else np.nan
+
 # ==============================================================================
 # 3. MAIN EXECUTION
 # ==============================================================================
 if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Generate the universal turboshaft map GT_Universal_Map.csv")
+    ap.add_argument("--adaptive", action="store_true",
+                    help="error-driven sampling instead of the 4x4x5 grid (../adaptive_sampling.py)")
+    ap.add_argument("--tol", type=float, default=0.01, help="adaptive: target RMS LOO error (fraction of range)")
+    ap.add_argument("--n-max", type=int, default=80, help="adaptive: maximum number of pycycle points")
+    args = ap.parse_args()
 
     # ------------------------------------------------------------------
     # STEP 1: SETUP PYCYCLE
@@ -357,6 +388,22 @@ if __name__ == "__main__":
 
         # D. OFF-DESIGN MAPPING
         od = mp_single_spool.od_pts[0]
+
+        if args.adaptive:
+            # Coarse Latin hypercube + points where the RBF leave-one-out error is largest,
+            # over the same box as the grid below; same CSV columns.
+            sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+            from adaptive_sampling import adaptive_sample
+
+            def evaluate(X):
+                return [[od_efficiency(prob, od, alt, mach, frac, des_pwr, base_mass_flow)]
+                        for alt, mach, frac in X]
+
+            print(f"  > Mapping performance (adaptive, target {args.tol:.1%}, max {args.n_max} points)...")
+            sample = adaptive_sample(evaluate, [(0.0, 30000.0), (0.0, 0.6), (0.3, 1.0)],
+                                     tol=args.tol, n_max=args.n_max, verbose=True)
+            training_data.extend(np.column_stack([sample.X[sample.ok], sample.Y[sample.ok]]).tolist())
+            continue
         
         # Grid: 4 Altitudes, 4 Machs. The user can change those ranges and densities as they wish to create a custom map for their specific use case.
         alts = np.linspace(0, 30000, 4)   
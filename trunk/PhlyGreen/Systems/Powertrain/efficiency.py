@@ -161,18 +161,21 @@ class GasTurbineEfficiencyModel(EfficiencyModel):
     Args:
         design_power: nominal (rated) shaft power of the whole installation [W] — typically
             ``DesignPW * WTO``. Required.
-        surrogate: a :class:`GasTurbineResponseSurface` (loaded by default).
+        surrogate: a :class:`GasTurbineResponseSurface` (default: the packaged one, shared
+            through :mod:`.surrogate_registry`).
         n_engines: number of engines the installation is split over.
+        tabulated: read the surface from its pre-tabulated trilinear grid
+            (:meth:`GasTurbineResponseSurface.tabulate`) instead of evaluating the RBF.
     """
 
-    def __init__(self, design_power, surrogate=None, n_engines=1):
+    def __init__(self, design_power, surrogate=None, n_engines=1, tabulated=False):
         if design_power is None or design_power <= 0:
             raise ValueError(
                 "GasTurbineEfficiencyModel needs a positive nominal 'design_power' [W] "
                 "(size the engine before the mission, e.g. DesignPW * WTO).")
         if surrogate is None:
-            from .gas_turbine_surrogate import GasTurbineResponseSurface
-            surrogate = GasTurbineResponseSurface()
+            from . import surrogate_registry
+            surrogate = surrogate_registry.gas_turbine(tabulated=tabulated)
         self.surrogate = surrogate
         self.design_power = design_power
         self.n_engines = max(int(n_engines), 1)
@@ -203,15 +206,14 @@ class HamiltonPropellerEfficiency(EfficiencyModel):
 class PropellerSurrogateEfficiency(EfficiencyModel):
     """Class-II propeller efficiency from the RBF surrogate (:class:`.propeller_surrogate.PropellerSurrogate`).
 
-    Solves the pitch governor for the target rpm, then evaluates the efficiency map.
+    Solves the pitch governor for the target rpm, then evaluates the efficiency map. The
+    default surrogate is trained once per process and shared (:mod:`.surrogate_registry`).
     """
 
     def __init__(self, surrogate=None, rpm=1200.0, n_engines=1):
         if surrogate is None:
-            import os
-            from .propeller_surrogate import PropellerSurrogate
-            csv = os.path.join(os.path.dirname(__file__), "data", "propeller_data_rbf.csv")
-            surrogate = PropellerSurrogate(csv)
+            from . import surrogate_registry
+            surrogate = surrogate_registry.propeller()
         self.surrogate = surrogate
         self.rpm = rpm
         self.n_engines = max(int(n_engines), 1)
@@ -6,18 +6,45 @@
 3. NOx: keep the CRN's altitude/Mach/power *shape* but RESCALE to the PW127 ICAO NOx at the SLS
    LTO modes (certification anchor): EINOx = EINOx_crn * k(PF), k(PF) = NOx_cert(PF)/NOx_crn_SLS(PF).
 4. Write the PW127 EI dataset and refit the response surface.
+
+The CRN points run through `crn_batch`: each finished point is committed to `_crn_results.sqlite`
+at once, and a re-run (after a crash, or after changing a calibration constant) only runs the
+points whose inputs or calibration changed. `--workers N`, `--solver steady`, `--retry-failed`.
+
+`--warm-start` runs the points along a Hilbert path over (alt, Mach, PC), in waves of `WARM_WAVE`
+consecutive points, and starts each CRN zone from the converged state of the nearest point (in
+combustor inlet state) of the earlier waves, read back from the store; a zone whose seeded solve
+fails restarts cold. The seed depends only on the envelope rows, never on the worker scheduling,
+and its key is part of the point's key. EIs agree with the cold start to the solver tolerance, at
+a fraction of the reactor integration time.
+
+`--adaptive` runs the CRN only on an error-driven subset of the envelope rows
+(`../adaptive_sampling.py`: coarse Latin hypercube snapped to the rows plus the SLS anchor slice,
+then batches where the RBF leave-one-out error of EINOx/log EICO/log EIUHC is largest, until
+`--tol`); the dataset keeps the same columns, with fewer rows. The default targets sit just
+above the CRN's own point-to-point noise (LOO error with all 100 rows: 1.1 / 6.7 / 1.8 %).
 """
-import os, sys, io, contextlib
-import multiprocessing as mp
+import os, sys, io, contextlib, argparse
 import numpy as np
 import pandas as pd
 from scipy.interpolate import PchipInterpolator
 
 HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+sys.path.insert(0, os.path.join(HERE, ".."))
+import crn_batch  # noqa: E402
+from adaptive_sampling import adaptive_sample  # noqa: E402
+
 CRN_DIR = os.path.join(HERE, "crn")
+STORE = os.path.join(HERE, "_crn_results.sqlite")
+INLET = ["T3_K", "P3_Pa", "FAR", "mdot_air3_kg_s"]
 ARPZ_PW127 = 0.24
 # certification NOx vs useful power fraction (To/Cl/App; idle is below the flight envelope)
 PF_CERT = np.array([0.30, 0.90, 1.00]); NOX_CERT = np.array([10.0, 16.0, 19.0])
+# --adaptive: RMS LOO targets (fraction of range) of EINOx, log10 EICO, log10 EIUHC
+ADAPTIVE_TOL = (0.015, 0.08, 0.025)
+# --warm-start: consecutive Hilbert-path points per wave (the default pool size)
+WARM_WAVE = 6
 
 
 def _init():
@@ -29,30 +56,126 @@ def _init():
     evap.ARPZ, evap.ARSZ, evap.ARDZ = ARPZ_PW127, evap.ARSZ * sc, evap.ARDZ * sc
 
 
-def _run_point(row):
-    T3, P3, FAR, mdot = row
+def _point_params(row):
+    T3, P3, FAR, mdot = (float(v) for v in row)
     order = ["ID", "AP", "CL", "TO"]
     Tm = np.array([evap.MODE_DATA[k]["T_in"] for k in order])
     chm = np.array([evap.MODE_DATA[k]["chi_mixer_scale"] for k in order])
     chi = max(float(np.interp(np.clip(T3, Tm[0], Tm[-1]), Tm, chm)), 1.20)
-    params = {"label": "PW127", "power": 0., "T_in": T3, "p_in_bar": P3 / 1e5, "mdot_air": mdot,
-              "FAR": FAR, "dPqP": 0.95, "chi_mixer_scale": chi, "EIUHC_ICAO": 0.0}
-    try:
-        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
-            r = evap.run_crn_evap_mode("GRID", params)
-        return (float(r.get("EI_NOx", np.nan)), float(r.get("EI_CO", np.nan)),
-                float(r.get("EI_UHC_total", np.nan)))
-    except Exception:
-        return (np.nan, np.nan, np.nan)
-
-
-def main():
+    return {"label": "PW127", "power": 0., "T_in": T3, "p_in_bar": P3 / 1e5, "mdot_air": mdot,
+            "FAR": FAR, "dPqP": 0.95, "chi_mixer_scale": chi, "EIUHC_ICAO": 0.0}
+
+
+def _run_point(job):
+    seed = job.get("seed")
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        r = evap.run_crn_evap_mode("GRID", job["params"], solver=job["solver"], seed=seed)
+    stats = r["solve_stats"].items()
+    out = {"EI_NOx": float(r["EI_NOx"]), "EI_CO": float(r["EI_CO"]),
+           "EI_UHC_total": float(r["EI_UHC_total"]),
+           "fallback_zones": [z for z, st in stats if st["fallback"]],
+           "seeded_zones": [z for z, st in stats if st["seeded"]],
+           "seed_fallback_zones": [z for z, st in stats if st["seed_fallback"]]}
+    if job["warm_start"]:
+        # the seed actually used (None: cold) and the converged zones, to seed later waves
+        out["seed_key"] = job["seed_key"] if seed is not None else None
+        out["zone_states"] = {z: [float(T), np.asarray(Y).tolist()]
+                              for z, (T, Y) in r["zone_states"].items()}
+    return out
+
+
+def warm_start_plan(points, x, wave=WARM_WAVE):
+    """Waves of the warm-started run and the seed of every point.
+
+    The points are taken along a Hilbert path over ``points`` (alt, Mach, PC) in waves of
+    ``wave``; a point of a later wave is seeded from the nearest point in ``x`` (scaled inlet
+    state) of the earlier waves, a point of the first wave starts cold (seed ``None``).
+    """
+    order = crn_batch.hilbert_order(points)
+    waves = [order[i:i + wave] for i in range(0, len(order), wave)]
+    seeds = {i: None for i in waves[0]} if waves else {}
+    for w in range(1, len(waves)):
+        earlier = np.concatenate(waves[:w])
+        for i in waves[w]:
+            seeds[i] = int(earlier[np.argmin(np.sum((x[earlier] - x[i]) ** 2, axis=1))])
+    return waves, seeds
+
+
+def run_crn_envelope(df, workers=None, solver=None, store=STORE, retry_failed=False,
+                     warm_start=False):
+    """EINOx_crn/EICO/EIUHC at the rows of ``df`` (NaN where the CRN failed), via the store."""
+    _init()   # PW127 calibration of the evap module in this process too (signature, chi schedule)
+    solver = solver or evap.SOLVER
+    sig = crn_batch.crn_signature(evap, solver)
+    rows = df[INLET].to_numpy(float)
+    jobs = [{"params": _point_params(row), "solver": solver, "warm_start": warm_start}
+            for row in rows]
+    results = crn_batch.CRNResultStore(store)
+    run = dict(workers=workers, initializer=_init, retry_failed=retry_failed)
+    if not warm_start:
+        keys = [crn_batch.job_key(job, sig) for job in jobs]
+        crn_batch.run_batch(list(zip(keys, jobs)), _run_point, results, **run)
+    else:
+        # inlet state scaled to the envelope, for the nearest-neighbour seed
+        span = np.ptp(rows, axis=0)
+        x = (rows - rows.min(axis=0)) / np.where(span > 0, span, 1.0)
+        waves, seeds = warm_start_plan(df[["alt_ft", "Mach", "PC"]].to_numpy(float), x)
+        keys = [None] * len(df)
+        for i in (i for wave in waves for i in wave):     # a seed's key comes first
+            seed_key = keys[seeds[i]] if seeds[i] is not None else None
+            keys[i] = crn_batch.job_key(jobs[i], sig, seed_key)
+            jobs[i] = dict(jobs[i], seed_key=seed_key)
+        for wave in waves:
+            seed_keys = [jobs[i]["seed_key"] for i in wave]
+            # a failed seed point leaves its neighbours to the cold start
+            states = {k: rec["result"]["zone_states"]
+                      for k, rec in zip(seed_keys, results.lookup(seed_keys))
+                      if rec is not None and rec["error_type"] is None}
+            batch = [(keys[i], dict(jobs[i], seed=states.get(jobs[i]["seed_key"])))
+                     for i in wave]
+            crn_batch.run_batch(batch, _run_point, results, **run)
+    out = np.full((len(df), 3), np.nan)
+    for i, rec in enumerate(results.lookup(keys)):
+        if rec is None or rec["error_type"] is not None:
+            if rec is not None:
+                print(f"  point {i}: CRN failed: {rec['error_type']}: {rec['message']}")
+            continue
+        res = rec["result"]
+        out[i] = res["EI_NOx"], res["EI_CO"], res["EI_UHC_total"]
+    return out
+
+
+def run_crn_adaptive(df, tol=ADAPTIVE_TOL, n_max=None, batch=6, **crn_kw):
+    """``run_crn_envelope`` on an error-driven subset of the rows of ``df`` (NaN elsewhere)."""
+    pool = df[["alt_ft", "Mach", "PC"]].to_numpy(float)
+    row_of = {tuple(x): i for i, x in enumerate(pool)}
+    out = np.full((len(df), 3), np.nan)
+
+    def evaluate(X):
+        idx = [row_of[tuple(x)] for x in X]
+        out[idx] = run_crn_envelope(df.iloc[idx], **crn_kw)
+        return out[idx]
+
+    def fitted(Y):   # the outputs as the EI trainer fits them (CO/UHC in log10)
+        return np.column_stack([Y[:, 0], np.log10(np.clip(Y[:, 1:], 1e-9, None))])
+
+    adaptive_sample(evaluate, list(zip(pool.min(axis=0), pool.max(axis=0))), candidates=pool,
+                    x_fixed=pool[pool[:, 0] < 1.0], transform=fitted, tol=tol, batch=batch,
+                    n_max=n_max or len(df), verbose=True)
+    return out
+
+
+def main(workers=None, solver=None, store=STORE, retry_failed=False, warm_start=False,
+         adaptive=False, tol=ADAPTIVE_TOL, n_max=None):
     df = pd.read_csv(os.path.join(HERE, "pw127_crn_inputs_corrected.csv"))
-    rows = df[["T3_K", "P3_Pa", "FAR", "mdot_air3_kg_s"]].to_numpy(float)
-    print(f"Running PW127 CRN (ARPZ={ARPZ_PW127}) over {len(rows)} envelope points ...")
-    with mp.Pool(processes=min(6, mp.cpu_count()), initializer=_init) as pool:
-        out = pool.map(_run_point, rows)
-    out = np.array(out)
+    print(f"Running PW127 CRN (ARPZ={ARPZ_PW127}) over {len(df)} envelope points"
+          f"{' (adaptive subset)' if adaptive else ''} ...")
+    crn_kw = dict(workers=workers, solver=solver, store=store, retry_failed=retry_failed,
+                  warm_start=warm_start)
+    if adaptive:
+        out = run_crn_adaptive(df, tol=tol, n_max=n_max, **crn_kw)
+    else:
+        out = run_crn_envelope(df, **crn_kw)
     df["EINOX_crn"], df["EICO"], df["EIUHC"] = out[:, 0], out[:, 1], out[:, 2]
     good = df.dropna(subset=["EINOX_crn", "EICO", "EIUHC"])
     print(f"  {len(good)}/{len(df)} CRN points converged")
@@ -91,4 +214,20 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--workers", type=int, default=None, help="CRN processes (default min(6, cpus))")
+    ap.add_argument("--solver", choices=("stepwise", "steady"), default=None,
+                    help="CRN zone solver (default: evap_model_ottimizzato.SOLVER)")
+    ap.add_argument("--store", default=STORE, help="results store (SQLite)")
+    ap.add_argument("--retry-failed", action="store_true", help="re-run points that failed before")
+    ap.add_argument("--warm-start", action="store_true",
+                    help="seed each point's CRN zones from the nearest solved point")
+    ap.add_argument("--adaptive", action="store_true",
+                    help="run the CRN on an error-driven subset of the envelope")
+    ap.add_argument("--tol", type=float, nargs=3, default=ADAPTIVE_TOL,
+                    help="adaptive: target RMS LOO error of EINOx, EICO, EIUHC (fraction of range)")
+    ap.add_argument("--n-max", type=int, default=None,
+                    help="adaptive: maximum CRN points (default: all envelope rows)")
+    a = ap.parse_args()
+    main(workers=a.workers, solver=a.solver, store=a.store, retry_failed=a.retry_failed,
+         warm_start=a.warm_start, adaptive=a.adaptive, tol=a.tol, n_max=a.n_max)
@@ -18,10 +18,15 @@ Alla fine:
 Cantera 3.1
 """
 
+import time
+from functools import lru_cache
+
 import cantera as ct
 import numpy as np
 import matplotlib.pyplot as plt
 
+from solution_pool import new_solution, scratch, species_index
+
 # ---------------------------------------------------------
 # Config meccanismo
 # ---------------------------------------------------------
@@ -104,6 +109,26 @@ V1_i = V1_total / N_PZ
 
 T_ign = 1800.0  # K
 
+# ---------------------------------------------------------
+# Soluzione delle zone (PSR)
+#   "stepwise": marcia nel tempo con rampa d'ingresso fino a T/P stazionari
+#               (riferimento della calibrazione, opzione di validazione)
+#   "steady"  : soluzione diretta dello stato stazionario a portate nominali
+#               (ReactorNet.solve_steady, Cantera >= 3.2); se non converge
+#               la zona ripiega sulla marcia stepwise
+# ---------------------------------------------------------
+SOLVER = "stepwise"
+SOLVERS = ("stepwise", "steady")
+
+# ---------------------------------------------------------
+# Partenza a caldo (warm start)
+#   run_crn_evap_mode(..., seed=res_vicino["zone_states"]) parte in ogni zona
+#   dallo stato convergente (T, Y) di un punto vicino già risolto, a portate
+#   nominali costanti (niente rampa); se la soluzione con seed fallisce la zona
+#   riparte a freddo (inerte a T_ign per le PZ, miscela d'ingresso per SZ/DZ)
+# ---------------------------------------------------------
+N_TAU_SEED = 10.0   # marcia minima con seed (stepwise) [tempi di residenza della zona]
+
 # ---------------------------------------------------------
 # Utility varie
 # ---------------------------------------------------------
@@ -149,9 +174,104 @@ def integrate_stage_stepwise(sim, reactor, t0,
         T_prev, P_prev = T_now, P_now
     return np.array(t_list), np.array(T_list), np.array(P_list), t_final
 
+def seed_zone(reactor, seed, name):
+    """
+    Stato iniziale della zona `name` dal seed (T, Y) di un punto vicino, alla
+    pressione attuale del reattore. Restituisce lo stato freddo da ripristinare
+    se la soluzione con seed fallisce, None se la zona non ha seed.
+    """
+    if not seed or name not in seed:
+        return None
+    cold_state = reactor.thermo.state
+    T_seed, Y_seed = seed[name]
+    reactor.thermo.TPY = T_seed, reactor.thermo.P, Y_seed
+    reactor.syncState()
+    return cold_state
+
+def restart_stage(sim, reactor, state, inflows=None, ramp=None):
+    """Riporta la zona allo stato `state` a t=0; con `inflows` le portate tornano in rampa."""
+    reactor.thermo.state = state
+    reactor.syncState()
+    if inflows is not None:
+        for mfc, mdot in inflows:
+            mfc.mass_flow_coeff = 1.0
+            mfc.mass_flow_rate = ct.Func1(lambda t, m=mdot: m * ramp(t))
+    sim.initial_time = 0.0
+
+def _error_line(err):
+    lines = str(err).strip().splitlines()
+    return lines[-1] if lines else type(err).__name__
+
+def solve_stage(sim, reactor, inflows, ramp, t0, solver, cold_state=None, **stepwise_kw):
+    """
+    Porta a regime una zona del CRN.
+
+    inflows : lista di (MassFlowController, portata nominale [kg/s]); con
+              solver="stepwise" le portate seguono ramp(t), con "steady" sono
+              costanti (lo stato stazionario non dipende dalla rampa e il
+              Newton non accetta Func1 Python).
+    cold_state : se dato, il reattore contiene il seed di un punto vicino e le
+              portate sono costanti; se la soluzione con seed fallisce la zona
+              riparte da cold_state come senza seed.
+    Restituisce (t, T, P, t_final, stats) come integrate_stage_stepwise più le
+    statistiche della zona: solver usato, seed, fallback, passi, T finale,
+    tempo [s].
+    """
+    wall0 = time.perf_counter()
+    stats = {"solver": solver, "seeded": cold_state is not None, "seed_fallback": False,
+             "fallback": False, "n_steps": 0, "error": None}
+    if cold_state is not None:
+        try:
+            if solver == "steady":
+                sim.solve_steady()
+                t, T, P, t_final = (np.array([sim.time]), np.array([reactor.T]),
+                                    np.array([reactor.thermo.P]), sim.time)
+            else:
+                # il criterio sui passi quieti scatta subito vicino al seed:
+                # prima si lascia rilassare la zona per N_TAU_SEED tempi di residenza
+                tau = reactor.mass / max(sum(m for _, m in inflows), 1e-30)
+                sim.advance(N_TAU_SEED * tau)
+                t, T, P, t_final = integrate_stage_stepwise(sim, reactor, t0, **stepwise_kw)
+            if not np.isfinite(reactor.T):
+                raise ct.CanteraError("non-finite seeded state")
+        except (ct.CanteraError, AttributeError) as err:
+            # seed non valido: partenza a freddo (in rampa per la marcia nel tempo)
+            stats["error"] = _error_line(err)
+            stats["seed_fallback"] = True
+            stats["seeded"] = False
+            restart_stage(sim, reactor, cold_state,
+                          inflows if solver == "stepwise" else None, ramp)
+        else:
+            stats["n_steps"] = len(t) if solver == "stepwise" else 0
+            stats["T"] = reactor.T
+            stats["wall_time"] = time.perf_counter() - wall0
+            return t, T, P, t_final, stats
+    if solver == "steady":
+        state0 = reactor.thermo.state
+        try:
+            sim.solve_steady()
+            if not np.isfinite(reactor.T):
+                raise ct.CanteraError("non-finite steady state")
+        except (ct.CanteraError, AttributeError) as err:
+            # ripristino dello stato iniziale e marcia nel tempo con la rampa
+            stats["error"] = _error_line(err)
+            stats["fallback"] = True
+            stats["solver"] = "stepwise"
+            restart_stage(sim, reactor, state0, inflows, ramp)
+        else:
+            stats["T"] = reactor.T
+            stats["wall_time"] = time.perf_counter() - wall0
+            return (np.array([sim.time]), np.array([reactor.T]),
+                    np.array([reactor.thermo.P]), sim.time, stats)
+    t, T, P, t_final = integrate_stage_stepwise(sim, reactor, t0, **stepwise_kw)
+    stats["n_steps"] = len(t)
+    stats["T"] = reactor.T
+    stats["wall_time"] = time.perf_counter() - wall0
+    return t, T, P, t_final, stats
+
 def mix_streams_mass(gas_prev_out, mdot_prev, gas_add_like_air, mdot_add,
                      p_target, T_air_for_h):
-    gmix = ct.Solution(mech, phase)
+    gmix = new_solution(mech, phase)   # contenuto del reattore a valle
     Y_prev = np.zeros(gmix.n_species)
     Y_add  = np.zeros(gmix.n_species)
     smap_prev = {s: i for i, s in enumerate(gas_prev_out.species_names)}
@@ -165,7 +285,7 @@ def mix_streams_mass(gas_prev_out, mdot_prev, gas_add_like_air, mdot_add,
     Y_mix = (mdot_prev*Y_prev + mdot_add*Y_add) / max(mdot_tot, 1e-30)
 
     h_prev = gas_prev_out.enthalpy_mass
-    g_air  = ct.Solution(mech, phase)
+    g_air  = scratch(mech, phase, "mix_air")
     g_air.TPX = T_air_for_h, p_target, "O2:0.21, N2:0.79"
     h_add = g_air.enthalpy_mass
     h_mix = (mdot_prev*h_prev + mdot_add*h_add) / max(mdot_tot, 1e-30)
@@ -176,10 +296,11 @@ def mix_streams_mass(gas_prev_out, mdot_prev, gas_add_like_air, mdot_add,
 # ---------------------------------------------------------
 # LHV, EI e efficienza (uguali a prima)
 # ---------------------------------------------------------
+@lru_cache(maxsize=None)   # dipende solo dal combustibile: un equilibrio per processo
 def compute_LHV_villette(mech, phase, fuel_comp_str,
                           T_ref=298.15, T_prod=423.15,
                           P_ref=ct.one_atm, oxidizer="O2:1"):
-    gas_R = ct.Solution(mech, phase)
+    gas_R = scratch(mech, phase, "lhv_R")
     gas_R.TP = T_ref, P_ref
     gas_R.set_equivalence_ratio(phi=1.0,
                                 fuel=fuel_comp_str,
@@ -189,7 +310,7 @@ def compute_LHV_villette(mech, phase, fuel_comp_str,
                     for sp in fuel_comp_str.split(',')]
     Y_fuel = sum(gas_R[sp].Y[0] for sp in fuel_species
                  if sp in gas_R.species_names)
-    gas_P = ct.Solution(mech, phase)
+    gas_P = scratch(mech, phase, "lhv_P")
     gas_P.TPX = T_prod, P_ref, gas_R.X
     gas_P.equilibrate("TP")
     h_P = gas_P.enthalpy_mass
@@ -204,6 +325,12 @@ def is_hydrocarbon(spec, gas):
         n_el(spec, e) == 0 for e in ['O', 'N', 'S', 'He', 'Ar']
     )
 
+@lru_cache(maxsize=None)
+def hydrocarbon_indices(mech, phase):
+    gas = scratch(mech, phase)
+    return np.array([i for i, s in enumerate(gas.species_names)
+                     if is_hydrocarbon(s, gas)], dtype=int)
+
 def EI_from_mass_fraction(Yk, FAR):
     return ((1.0 + FAR) / FAR) * Yk * 1e3  # g/kg_fuel
 
@@ -226,7 +353,10 @@ def vap_after_decomp_from_T(T_in):
 # ---------------------------------------------------------
 # Funzione principale: esegue il CRN per UN modo operativi
 # ---------------------------------------------------------
-def run_crn_evap_mode(mode_key, params):
+def run_crn_evap_mode(mode_key, params, solver=None, seed=None):
+    solver = SOLVER if solver is None else solver
+    if solver not in SOLVERS:
+        raise ValueError(f"solver {solver!r} non valido, usare uno di {SOLVERS}")
     print("="*60)
     print(f"=== RUN CRN evaporativo – Mode: {mode_key} ({params['label']}) ===")
 
@@ -242,9 +372,9 @@ def run_crn_evap_mode(mode_key, params):
     mdot_pz_nom = mdot_air * ARPZ + mdot_fuel
 
     # ------- stream di base -------
-    air_stream  = ct.Solution(mech, phase)
+    air_stream  = new_solution(mech, phase)
     air_stream.TPX  = T_in, p_in, "O2:0.21, N2:0.79"
-    fuel_stream = ct.Solution(mech, phase)
+    fuel_stream = new_solution(mech, phase)
     fuel_stream.TPX = T_in, p_in, "NC10H22:0.74, PHC3H7:0.15, CYC9H18:0.11"
     fuel_comp_str = get_comp_string(fuel_stream)
 
@@ -264,18 +394,25 @@ def run_crn_evap_mode(mode_key, params):
 
     # ------- back pressure -------
     P_exhaust = dPqP * p_in
-    exh = ct.Solution(mech, phase)
+    exh = new_solution(mech, phase)
     exh.TP = T_in, P_exhaust
     exhaust = ct.Reservoir(exh)
 
     # ------- tempi caratteristici / ramp -------
-    rho1_0 = ct.Solution(mech, phase)
+    rho1_0 = scratch(mech, phase, "rho1_0")
     rho1_0.TPX = T_ign, p_in, "N2:1.0"
     tau_res_PZ = (rho1_0.density * V1_total) / max(mdot_pz_nom, 1e-12)
 
     TRAMP_IN = np.clip(0.05 * tau_res_PZ, 1e-4, 1e-2)
     scale_in = lambda t: ramp01_exp(t, TRAMP_IN)
 
+    def inflow_mdot(m, zone):
+        # portata d'ingresso: rampa nel tempo, costante per la soluzione
+        # stazionaria e per le zone che partono da un seed
+        if solver == "steady" or (seed and zone in seed):
+            return m
+        return ct.Func1(lambda t: m * scale_in(t))
+
     # controller pressione
     eps_dp = 0.01
     K_SZ = mdot_sz_nom / (eps_dp * p_in)
@@ -285,11 +422,11 @@ def run_crn_evap_mode(mode_key, params):
     air_tank  = ct.Reservoir(air_stream)
     fuel_tank = ct.Reservoir(fuel_stream)
 
-    link_PZ_SZ_mix = ct.Reservoir(ct.Solution(mech, phase))
+    link_PZ_SZ_mix = ct.Reservoir(new_solution(mech, phase))
     link_PZ_SZ_mix.thermo.TPX = T_in, p_in, "O2:0.21, N2:0.79"
     link_PZ_SZ_mix.syncState()
 
-    link_SZ_DZ = ct.Reservoir(ct.Solution(mech, phase))
+    link_SZ_DZ = ct.Reservoir(new_solution(mech, phase))
     link_SZ_DZ.thermo.TPX = T_in, p_in, "O2:0.21, N2:0.79"
     link_SZ_DZ.syncState()
 
@@ -306,7 +443,7 @@ def run_crn_evap_mode(mode_key, params):
     # =====================================================
     #      EVAPORAZIONE (Saboohi/Lefebvre) – f_vap_model
     # =====================================================
-    gas_prop = ct.Solution(mech, phase)
+    gas_prop = scratch(mech, phase, "prop")
     gas_prop.TPX = T_in, p_in, "O2:0.21, N2:0.79"
     rho_g = gas_prop.density
     try:
@@ -409,7 +546,7 @@ def run_crn_evap_mode(mode_key, params):
     #          COSTRUZIONE & INTEGRAZIONE dei 9 sub-PZ
     # =====================================================
     def make_branch(i):
-        gas_inerte = ct.Solution(mech, phase)
+        gas_inerte = new_solution(mech, phase)
         gas_inerte.TPX = T_ign, p_in, "N2:1.0"
         rPZ_i = ct.IdealGasReactor(gas_inerte, name=f"PZ_{i}", volume=V1_i)
         rPZ_i.energy_enabled = True
@@ -417,15 +554,13 @@ def run_crn_evap_mode(mode_key, params):
 
         m_air_i = ct.MassFlowController(
             air_tank, rPZ_i,
-            mdot=ct.Func1(lambda t, mdot_air_branch=mdot_air_PZ_i[i]:
-                          mdot_air_branch * scale_in(t))
+            mdot=inflow_mdot(mdot_air_PZ_i[i], f"PZ_{i}")
         )
         m_fuel_i = ct.MassFlowController(
             fuel_tank, rPZ_i,
-            mdot=ct.Func1(lambda t, mdot_fuel_branch=mdot_fuel_gas_injected[i]:
-                          mdot_fuel_branch * scale_in(t))
+            mdot=inflow_mdot(mdot_fuel_gas_injected[i], f"PZ_{i}")
         )
-        res_out_i = ct.Reservoir(ct.Solution(mech, phase))
+        res_out_i = ct.Reservoir(new_solution(mech, phase))
         res_out_i.thermo.TPX = T_in, p_in, "O2:0.21, N2:0.79"
         res_out_i.syncState()
 
@@ -433,17 +568,21 @@ def run_crn_evap_mode(mode_key, params):
             eps_dp * p_in + 1e-30
         )
         _ = ct.PressureController(rPZ_i, res_out_i, primary=m_air_i, K=K_i)
+        cold_i = seed_zone(rPZ_i, seed, f"PZ_{i}")
         sim_i = ct.ReactorNet([rPZ_i])
-        return rPZ_i, sim_i, res_out_i
+        inflows_i = [(m_air_i, mdot_air_PZ_i[i]),
+                     (m_fuel_i, mdot_fuel_gas_injected[i])]
+        return rPZ_i, sim_i, res_out_i, inflows_i, cold_i
 
     pz_reactors = []
     pz_sims     = []
     pz_time_hist = []
+    solve_stats = {}
 
     for i in range(N_PZ):
-        rPZ_i, sim_i, _ = make_branch(i)
-        t_i, T_i, P_i, _ = integrate_stage_stepwise(
-            sim_i, rPZ_i, t0=0.0,
+        rPZ_i, sim_i, _, inflows_i, cold_i = make_branch(i)
+        t_i, T_i, P_i, _, solve_stats[f"PZ_{i}"] = solve_stage(
+            sim_i, rPZ_i, inflows_i, scale_in, t0=0.0, solver=solver, cold_state=cold_i,
             tol_T_rel=1e-7, tol_P_rel=1e-7,
             n_consec_ok=80, t_cap=0.8
         )
@@ -453,13 +592,13 @@ def run_crn_evap_mode(mode_key, params):
 
     # mixer PZ -> SZ
     def build_mixed_reservoir_from_branches(reactors, mdot_branches, p_target):
-        gmix = ct.Solution(mech, phase)
+        gmix = scratch(mech, phase, "pz_mix")
         w = np.array(mdot_branches)
         w /= max(w.sum(), 1e-30)
         Y_mix = np.zeros(gmix.n_species)
         h_mix = 0.0
         for k, rloc in enumerate(reactors):
-            gk = ct.Solution(mech, phase)
+            gk = scratch(mech, phase, "pz_branch")
             gk.TPX = rloc.T, rloc.thermo.P, rloc.thermo.X
             Y_mix += w[k] * gk.Y
             h_mix += w[k] * gk.enthalpy_mass
@@ -503,23 +642,25 @@ def run_crn_evap_mode(mode_key, params):
 
     m_SZ_pz  = ct.MassFlowController(
         link_PZ_SZ_mix, r2,
-        mdot=ct.Func1(lambda t: mdot_pz_nom * scale_in(t))
+        mdot=inflow_mdot(mdot_pz_nom, "SZ")
     )
     m_SZ_air = ct.MassFlowController(
         air_tank, r2,
-        mdot=ct.Func1(lambda t: mdot_air_SZa * scale_in(t))
+        mdot=inflow_mdot(mdot_air_SZa, "SZ")
     )
     _ = ct.PressureController(r2, link_SZ_DZ, primary=m_SZ_pz, K=K_SZ)
 
+    cold_SZ = seed_zone(r2, seed, "SZ")
     sim2 = ct.ReactorNet([r2])
-    t2, T2, P2, _ = integrate_stage_stepwise(
-        sim2, r2, t0=t1[-1],
+    t2, T2, P2, _, solve_stats["SZ"] = solve_stage(
+        sim2, r2, [(m_SZ_pz, mdot_pz_nom), (m_SZ_air, mdot_air_SZa)],
+        scale_in, t0=t1[-1], solver=solver, cold_state=cold_SZ,
         tol_T_rel=1e-7, tol_P_rel=1e-7,
         n_consec_ok=60, t_cap=t1[-1] + 0.5
     )
 
     # ===================== STADIO DZ =====================
-    gas_out_SZ = ct.Solution(mech, phase)
+    gas_out_SZ = scratch(mech, phase, "sz_out")
     gas_out_SZ.TPX = r2.T, r2.thermo.P, r2.thermo.X
 
     gas_up_DZ_init = mix_streams_mass(
@@ -536,17 +677,19 @@ def run_crn_evap_mode(mode_key, params):
 
     m_DZ_core = ct.MassFlowController(
         link_SZ_DZ, r3,
-        mdot=ct.Func1(lambda t: mdot_sz_nom * scale_in(t))
+        mdot=inflow_mdot(mdot_sz_nom, "DZ")
     )
     m_DZ_air  = ct.MassFlowController(
         air_tank, r3,
-        mdot=ct.Func1(lambda t: mdot_air_DZa * scale_in(t))
+        mdot=inflow_mdot(mdot_air_DZa, "DZ")
     )
     _ = ct.PressureController(r3, exhaust, primary=m_DZ_core, K=K_DZ)
 
+    cold_DZ = seed_zone(r3, seed, "DZ")
     sim3 = ct.ReactorNet([r3])
-    t3, T3, P3, _ = integrate_stage_stepwise(
-        sim3, r3, t0=t2[-1],
+    t3, T3, P3, _, solve_stats["DZ"] = solve_stage(
+        sim3, r3, [(m_DZ_core, mdot_sz_nom), (m_DZ_air, mdot_air_DZa)],
+        scale_in, t0=t2[-1], solver=solver, cold_state=cold_DZ,
         tol_T_rel=1e-7, tol_P_rel=1e-7,
         n_consec_ok=60, t_cap=t2[-1] + 0.5
     )
@@ -558,19 +701,18 @@ def run_crn_evap_mode(mode_key, params):
     LHV = compute_LHV_villette(mech, phase, fuel_comp_str, oxidizer="O2:1")
     print(f"\nLHV = {LHV/1e6:.3f} MJ/kg_fuel")
 
-    gas_out = ct.Solution(mech, phase)
+    gas_out = scratch(mech, phase, "out")
     gas_out.TPX = r3.T, r3.thermo.P, r3.thermo.X
     Y_out = gas_out.Y
-    smap = {s: i for i, s in enumerate(gas_out.species_names)}
+    smap = species_index(mech, phase)
+    i_HC = hydrocarbon_indices(mech, phase)
 
     Y_NO  = Y_out[smap["NO"]]  if "NO"  in smap else 0.0
     Y_NO2 = Y_out[smap["NO2"]] if "NO2" in smap else 0.0
     Y_CO  = Y_out[smap["CO"]]  if "CO"  in smap else 0.0
 
-    Y_UHC_gas = 0.0
-    for s, i_sp in smap.items():
-        if Y_out[i_sp] > 0.0 and is_hydrocarbon(s, gas_out):
-            Y_UHC_gas += Y_out[i_sp]
+    Y_HC = Y_out[i_HC]
+    Y_UHC_gas = float(np.sum(Y_HC[Y_HC > 0.0]))
 
     Y_NOx = Y_NO + Y_NO2
     EI_NOx = EI_from_mass_fraction(Y_NOx, FAR)
@@ -589,12 +731,12 @@ def run_crn_evap_mode(mode_key, params):
     # ===================== Efficienza (Eq.6) =====================
     T_ref = 288.15
     h_out = gas_out.enthalpy_mass
-    gas_out_ref = ct.Solution(mech, phase)
+    gas_out_ref = scratch(mech, phase, "out_ref")
     gas_out_ref.TPX = T_ref, r3.thermo.P, r3.thermo.X
     dh_t_out = h_out - gas_out_ref.enthalpy_mass
 
     phi_global = FAR / FAR_st
-    gas_in_mix = ct.Solution(mech, phase)
+    gas_in_mix = scratch(mech, phase, "in_mix")
     gas_in_mix.TP = T_in, p_in
     gas_in_mix.set_equivalence_ratio(phi=phi_global,
                                      fuel=fuel_comp_str,
@@ -602,13 +744,13 @@ def run_crn_evap_mode(mode_key, params):
     h_in_mix = gas_in_mix.enthalpy_mass
     X_in_mix = gas_in_mix.X
 
-    gas_in_mix_ref = ct.Solution(mech, phase)
+    gas_in_mix_ref = scratch(mech, phase, "in_mix_ref")
     gas_in_mix_ref.TPX = T_ref, p_in, X_in_mix
     dh_t_in = h_in_mix - gas_in_mix_ref.enthalpy_mass
 
-    gas_fuel_Tin  = ct.Solution(mech, phase)
+    gas_fuel_Tin  = scratch(mech, phase, "fuel_Tin")
     gas_fuel_Tin.TPX  = T_in, p_in, fuel_comp_str
-    gas_fuel_Tref = ct.Solution(mech, phase)
+    gas_fuel_Tref = scratch(mech, phase, "fuel_Tref")
     gas_fuel_Tref.TPX = T_ref, p_in, fuel_comp_str
     dh_f = gas_fuel_Tin.enthalpy_mass - gas_fuel_Tref.enthalpy_mass
 
@@ -617,18 +759,14 @@ def run_crn_evap_mode(mode_key, params):
     Ngas = mass_products_per_kg_fuel / MW_mix_out
 
     X_out = gas_out.X
-    specs = gas_out.species_names
-    idx = {s: i for i, s in enumerate(specs)}
+    idx = smap
 
     def safe_X(spec):
         return X_out[idx[spec]] if spec in idx else 0.0
 
     X_CO = safe_X("CO")
 
-    X_UHC = 0.0
-    for s in specs:
-        if s in idx and is_hydrocarbon(s, gas_out):
-            X_UHC += X_out[idx[s]]
+    X_UHC = float(np.sum(X_out[i_HC]))
 
     Ngas_CO  = X_CO  * Ngas
     Ngas_UHC = X_UHC * Ngas
@@ -659,6 +797,14 @@ def run_crn_evap_mode(mode_key, params):
         "phi_i_eff": phi_i_eff.copy(),
         "mdot_air_PZ_i": mdot_air_PZ_i.copy(),
         "mdot_fuel_gas_injected": mdot_fuel_gas_injected.copy(),
+        # --- statistiche di soluzione per zona (PZ_0..PZ_8, SZ, DZ) ---
+        "solve_stats": solve_stats,
+        # --- stati convergenti (T, Y) per zona: seed dei punti vicini ---
+        "zone_states": {
+            **{f"PZ_{i}": (r.T, r.thermo.Y.copy()) for i, r in enumerate(pz_reactors)},
+            "SZ": (r2.T, r2.thermo.Y.copy()),
+            "DZ": (r3.T, r3.thermo.Y.copy()),
+        },
     }
 
 
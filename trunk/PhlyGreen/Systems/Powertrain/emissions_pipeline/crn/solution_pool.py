@@ -0,0 +1,73 @@
+"""Per-process pool of Cantera ``Solution`` objects — the mechanism is parsed once per file.
+
+``ct.Solution(mech, phase)`` rebuilds every species and reaction of the mechanism on each call
+(~40 ms for the kerosene surrogate), and one CRN operating point used to make ~30 of them. Here
+the mechanism is loaded once per process and then:
+
+* :func:`new_solution` builds an independent object from the already-parsed species and
+  reactions, for anything handed to a reactor or reservoir (Cantera keeps a reference to it, so
+  it must not be shared);
+* :func:`scratch` returns a reusable object per ``role`` for property evaluations (mixing
+  enthalpies, densities, the outlet EI), so a CRN point only sets the thermodynamic state. It
+  is handed out in the initial state of a fresh object, so results do not depend on the
+  previous point. Anything the caller still reads after the next ``scratch(..., role)`` call
+  must use its own role;
+* :func:`species_index` is the ``{species: column}`` map of the mechanism.
+
+Worker processes (``multiprocessing`` in ``build_pw127_surrogate.py``) each fill their own pool.
+"""
+
+import os
+
+import cantera as ct
+
+_MECHANISMS = {}
+_SCRATCH = {}
+
+
+def _key(mech, phase):
+    # relative mechanism paths are resolved against the cwd, as ct.Solution does
+    path = os.path.abspath(mech) if os.path.exists(mech) else mech
+    return path, phase
+
+
+def _mechanism(mech, phase):
+    key = _key(mech, phase)
+    entry = _MECHANISMS.get(key)
+    if entry is None:
+        gas = ct.Solution(mech, phase)
+        entry = _MECHANISMS[key] = {
+            "thermo": gas.thermo_model,
+            "kinetics": gas.kinetics_model,
+            "transport": gas.transport_model,
+            "species": gas.species(),
+            "reactions": gas.reactions(),
+            "index": {s: i for i, s in enumerate(gas.species_names)},
+        }
+    return entry
+
+
+def new_solution(mech, phase):
+    """A fresh ``ct.Solution`` of ``mech``/``phase`` built without re-parsing the mechanism."""
+    m = _mechanism(mech, phase)
+    return ct.Solution(thermo=m["thermo"], kinetics=m["kinetics"],
+                       transport_model=m["transport"],
+                       species=m["species"], reactions=m["reactions"])
+
+
+def scratch(mech, phase, role="default"):
+    """The pooled ``ct.Solution`` for ``role``: set its state before use, never give it to a reactor."""
+    key = _key(mech, phase) + (role,)
+    entry = _SCRATCH.get(key)
+    if entry is None:
+        gas = new_solution(mech, phase)
+        entry = _SCRATCH[key] = (gas, gas.state)
+    gas, state0 = entry
+    # back to the state of a fresh object: HPY/equilibrate iterate from the current state
+    gas.state = state0
+    return gas
+
+
+def species_index(mech, phase):
+    """``{species name: index}`` of the mechanism (shared; do not modify)."""
+    return _mechanism(mech, phase)["index"]
@@ -0,0 +1,224 @@
+"""Checkpointed, resumable batch runner for CRN jobs (used by `build_pw127_surrogate.py`).
+
+Every finished job is committed to a local SQLite results store as soon as it completes
+(result or error with traceback, wall time), so a crash or Ctrl-C loses at most the jobs in
+flight. On restart the jobs whose key is already stored are skipped. A job key is the SHA-256
+of the canonical JSON of everything the result depends on — the point's CRN inputs and the
+CRN module (`crn_signature`: its source, mechanism and calibration constants) — so a re-run
+redoes exactly the points whose inputs or CRN module changed. `hilbert_order` sorts the points
+along a space-filling path, so that consecutive jobs are neighbours (used by the CRN warm
+start).
+
+    store = CRNResultStore("_crn_results.sqlite")
+    run_batch(jobs, worker, store, workers=6, initializer=_init)   # jobs: [(key, payload)]
+    records = store.lookup(keys)
+"""
+import contextlib
+import hashlib
+import json
+import multiprocessing as mp
+import os
+import sqlite3
+import time
+import traceback
+
+import numpy as np
+
+
+def job_key(*parts):
+    """SHA-256 of the canonical JSON of ``parts`` (the point inputs, the calibration signature)."""
+    text = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=float)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+# module-level constants of the evaporative CRN module that enter a point's result (the
+# caller may recalibrate them after import, as build_pw127_surrogate does for ARPZ/ARSZ/ARDZ)
+EVAP_CONSTANTS = ("MODE_DATA", "Aref", "L", "ARPZ", "ARSZ", "ARDZ", "LRPZ", "LRSZ", "LRDZ",
+                  "V1_total", "V2", "V3", "N_PZ", "V1_i", "T_ign", "N_TAU_SEED")
+
+
+def _file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def crn_signature(evap, solver):
+    """Everything of the evaporative CRN module that every point's result depends on.
+
+    The module source (its in-function constants: evaporation, mixing, soot split, ...), the
+    mechanism file, and the current values of the module constants ``EVAP_CONSTANTS``.
+    """
+    module_path = os.path.abspath(evap.__file__)
+    mech_path = os.path.join(os.path.dirname(module_path), evap.mech)
+    sig = {n: getattr(evap, n) for n in EVAP_CONSTANTS}
+    sig.update(source_hash=_file_hash(module_path), mech=evap.mech,
+               mech_hash=_file_hash(mech_path), phase=evap.phase, solver=solver)
+    return sig
+
+
+def _hilbert_index(x, bits):
+    """Hilbert-curve index of the integer point ``x`` (Skilling's transpose algorithm)."""
+    x = [int(v) for v in x]
+    n = len(x)
+    top = 1 << (bits - 1)
+    q = top
+    while q > 1:   # inverse undo of the excess work
+        p = q - 1
+        for i in range(n):
+            if x[i] & q:
+                x[0] ^= p
+            else:
+                t = (x[0] ^ x[i]) & p
+                x[0] ^= t
+                x[i] ^= t
+        q >>= 1
+    for i in range(1, n):   # Gray encode
+        x[i] ^= x[i - 1]
+    t = 0
+    q = top
+    while q > 1:
+        if x[n - 1] & q:
+            t ^= q - 1
+        q >>= 1
+    for i in range(n):
+        x[i] ^= t
+    h = 0
+    for b in range(bits - 1, -1, -1):   # interleave the transposed bits
+        for i in range(n):
+            h = (h << 1) | ((x[i] >> b) & 1)
+    return h
+
+
+def hilbert_order(points, bits=10):
+    """Indices that sort ``points`` (n, d) along a Hilbert curve over their bounding box.
+
+    Unlike a row-major sweep the path has no jumps: consecutive points are close in every
+    coordinate.
+    """
+    X = np.asarray(points, float)
+    span = np.ptp(X, axis=0)
+    q = np.rint((X - X.min(axis=0)) / np.where(span > 0, span, 1.0) * ((1 << bits) - 1))
+    keys = [_hilbert_index(row, bits) for row in q.astype(np.int64)]
+    return sorted(range(len(X)), key=keys.__getitem__)
+
+
+class CRNResultStore:
+    """SQLite store of CRN job records, one row per key (the last run of a key wins).
+
+    A record is ``{"key", "result", "error_type", "message", "traceback", "wall_time",
+    "finished"}``; ``result`` is the worker's JSON-serialisable return value, or ``None``
+    when it raised.
+    """
+
+    _COLUMNS = ("key", "result", "error_type", "message", "traceback", "wall_time", "finished")
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        with self._connect() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS points ("
+                       "key TEXT PRIMARY KEY, result TEXT, error_type TEXT, message TEXT, "
+                       "traceback TEXT, wall_time REAL NOT NULL, finished REAL NOT NULL)")
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """One connection per operation, committed on success and always closed."""
+        db = sqlite3.connect(self.path, timeout=60.0)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def put(self, rec):
+        with self._connect() as db:
+            db.execute("INSERT OR REPLACE INTO points VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       (rec["key"], json.dumps(rec["result"]), rec["error_type"],
+                        rec["message"], rec["traceback"], rec["wall_time"], rec["finished"]))
+
+    def done_keys(self, retry_failed=False):
+        """Keys already stored (only the successful ones with ``retry_failed``)."""
+        query = "SELECT key FROM points" + (" WHERE error_type IS NULL" if retry_failed else "")
+        with self._connect() as db:
+            return {row[0] for row in db.execute(query)}
+
+    def lookup(self, keys):
+        """Records of ``keys`` in order (``None`` where missing)."""
+        with self._connect() as db:
+            rows = {row[0]: row for row in db.execute("SELECT * FROM points")}
+        out = []
+        for key in keys:
+            row = rows.get(key)
+            if row is None:
+                out.append(None)
+                continue
+            rec = dict(zip(self._COLUMNS, row))
+            rec["result"] = json.loads(rec["result"])
+            out.append(rec)
+        return out
+
+    def __len__(self):
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM points").fetchone()[0]
+
+
+def _run_job(job):
+    """Run one job; an exception becomes an error record instead of stopping the batch."""
+    worker, key, payload = job
+    t0 = time.perf_counter()
+    rec = {"key": key, "result": None, "error_type": None, "message": None, "traceback": None}
+    try:
+        rec["result"] = worker(payload)
+    except Exception as exc:
+        rec.update(error_type=type(exc).__name__, message=str(exc),
+                   traceback=traceback.format_exc())
+    rec.update(wall_time=time.perf_counter() - t0, finished=time.time())
+    return rec
+
+
+def run_batch(jobs, worker, store, workers=None, initializer=None, retry_failed=False):
+    """Run the jobs not yet in ``store``, committing each record as it completes.
+
+    Args:
+        jobs: iterable of ``(key, payload)``.
+        worker: module-level function, ``worker(payload)`` -> JSON-serialisable result.
+        store (CRNResultStore): the results store.
+        workers (int): pool size, default ``min(6, cpu_count)``; ``workers=1`` runs serially
+            in this process.
+        initializer: per-worker start-up hook (run here too when ``workers=1``).
+        retry_failed (bool): run again the jobs whose stored record is an error.
+
+    Returns:
+        int: number of jobs run.
+    """
+    jobs = list(jobs)
+    done = store.done_keys(retry_failed)
+    todo = [(worker, key, payload) for key, payload in jobs if key not in done]
+    n_todo = len(todo)
+    print(f"CRN batch: {len(jobs)} jobs, {len(jobs) - n_todo} already in {store.path}, "
+          f"{n_todo} to run")
+    if not todo:
+        return 0
+    workers = max(1, min(int(workers or min(6, mp.cpu_count())), n_todo))
+    n_done = n_failed = 0
+    t0 = time.perf_counter()
+
+    def record(rec):
+        nonlocal n_done, n_failed
+        store.put(rec)
+        n_done += 1
+        n_failed += rec["error_type"] is not None
+        rate = n_done / max(time.perf_counter() - t0, 1e-9)
+        print(f"  {n_done}/{n_todo} done ({n_failed} failed)  {60 * rate:.1f} jobs/min  "
+              f"ETA {(n_todo - n_done) / rate / 60:.1f} min", flush=True)
+
+    if workers == 1:
+        if initializer is not None:
+            initializer()
+        for job in todo:
+            record(_run_job(job))
+    else:
+        with mp.Pool(processes=workers, initializer=initializer) as pool:
+            for rec in pool.imap_unordered(_run_job, todo):
+                record(rec)
+    return n_done
@@ -20,14 +20,15 @@ def chi_from_T(T_in):
     return max(float(np.interp(np.clip(T_in, Tm[0], Tm[-1]), Tm, chi)), 1.20)
 
 
-def run_crn(T_in, p_in_pa, FAR, mdot_air, dPqP=0.95):
+def run_crn(T_in, p_in_pa, FAR, mdot_air, dPqP=0.95, solver=None):
     params = {"label": "PW127", "power": 0.0, "T_in": T_in, "p_in_bar": p_in_pa / 1e5,
               "mdot_air": mdot_air, "FAR": FAR, "dPqP": dPqP,
               "chi_mixer_scale": chi_from_T(T_in), "EIUHC_ICAO": 0.0}
     with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
-        res = evap.run_crn_evap_mode("GRID", params)
+        res = evap.run_crn_evap_mode("GRID", params, solver=solver)
     return {"EINOx": res.get("EI_NOx"), "EICO": res.get("EI_CO"),
-            "EIUHC": res.get("EI_UHC_total"), "eta_b": res.get("eta_b6"), "T_DZ": res.get("T_DZ")}
+            "EIUHC": res.get("EI_UHC_total"), "eta_b": res.get("eta_b6"), "T_DZ": res.get("T_DZ"),
+            "solve_stats": res.get("solve_stats")}
 
 
 if __name__ == "__main__":
@@ -36,9 +37,16 @@ if __name__ == "__main__":
     row = df.sort_values("FAR").iloc[-1]
     print(f"PW127 state: T3={row.T3_K:.1f} K, P3={row.P3_Pa/1e6:.3f} MPa, FAR={row.FAR:.4f}, "
           f"mdot={row.mdot_air3_kg_s:.2f} kg/s  (PC={row.PC:.2f}, alt={row.alt_ft:.0f} ft)")
-    t0 = time.time()
-    out = run_crn(row.T3_K, row.P3_Pa, row.FAR, row.mdot_air3_kg_s)
-    print(f"CRN ran in {time.time()-t0:.1f} s under Cantera {__import__('cantera').__version__}")
-    for k, v in out.items():
-        print(f"  {k:7s} = {v}")
+    for solver in evap.SOLVERS:
+        t0 = time.time()
+        out = run_crn(row.T3_K, row.P3_Pa, row.FAR, row.mdot_air3_kg_s, solver=solver)
+        print(f"CRN ({solver}) ran in {time.time()-t0:.1f} s under Cantera "
+              f"{__import__('cantera').__version__}")
+        stats = out.pop("solve_stats")
+        for k, v in out.items():
+            print(f"  {k:7s} = {v}")
+        for zone, st in stats.items():
+            print(f"  {zone:5s} {st['solver']:8s} T={st['T']:7.1f} K  steps={st['n_steps']:5d}  "
+                  f"{1e3*st['wall_time']:6.0f} ms" + ("  (fallback: " + st["error"] + ")"
+                                                     if st["fallback"] else ""))
     print("\nPW127 ICAO take-off targets (Excel): EINOx=19, EICO=2, EIUHC~0 g/kg")
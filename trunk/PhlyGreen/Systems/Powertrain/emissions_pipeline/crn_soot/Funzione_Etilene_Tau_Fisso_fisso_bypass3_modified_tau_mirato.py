@@ -1,10 +1,15 @@
 from tabnanny import verbose
+import os
+import sys
 import cantera as ct
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 from omnisoot import PerfectlyStirredReactor, PlugFlowReactor, SootGas
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "crn"))
+from solution_pool import new_solution, scratch  # noqa: E402
+
 def CFM_engine_omnisoot(
     T_in,
     p_in,
@@ -93,7 +98,7 @@ def CFM_engine_omnisoot(
                           if gas.X[i] > 0])
                           
     def mix_streams_mass(gas_prev_out, mdot_prev, gas_add_like_air, mdot_add, p_target, T_air_for_h):
-        gmix = ct.Solution(mech, phase)
+        gmix = new_solution(mech, phase)
         Y_prev = np.zeros(gmix.n_species); Y_add  = np.zeros(gmix.n_species)
         smap_prev = {s: i for i, s in enumerate(gas_prev_out.species_names)}
         smap_add  = {s: i for i, s in enumerate(gas_add_like_air.species_names)}
@@ -103,7 +108,7 @@ def CFM_engine_omnisoot(
         mdot_tot = mdot_prev + mdot_add
         Y_mix = (mdot_prev * Y_prev + mdot_add * Y_add) / max(mdot_tot, 1e-30)
         h_prev = gas_prev_out.enthalpy_mass
-        g_air  = ct.Solution(mech, phase); g_air.TPX = T_air_for_h, p_target, "O2:0.21, N2:0.79"
+        g_air  = scratch(mech, phase, "mix_air"); g_air.TPX = T_air_for_h, p_target, "O2:0.21, N2:0.79"
         h_add = g_air.enthalpy_mass
         h_mix = (mdot_prev * h_prev + mdot_add * h_add) / max(mdot_tot, 1e-30)
         gmix.HPY = h_mix, p_target, Y_mix
@@ -137,8 +142,8 @@ def CFM_engine_omnisoot(
     # --------------------
     # Stream di base
     # --------------------
-    air_stream  = ct.Solution(mech, phase); air_stream.TPX  = T_in, p_in, "O2:0.21, N2:0.79"
-    fuel_stream = ct.Solution(mech, phase); fuel_stream.TPX = T_in, p_in,  "C2H4:1.0"
+    air_stream  = new_solution(mech, phase); air_stream.TPX  = T_in, p_in, "O2:0.21, N2:0.79"
+    fuel_stream = new_solution(mech, phase); fuel_stream.TPX = T_in, p_in,  "C2H4:1.0"
     fuel_comp_str = get_comp_string(fuel_stream)
     
     # --------------------
@@ -158,10 +163,10 @@ def CFM_engine_omnisoot(
     mdot_dz_nom  = mdot_sz_nom + mdot_air_DZa
     
     P_exhaust = dPqP * p_in
-    exh = ct.Solution(mech, phase); exh.TP = T_in, P_exhaust
+    exh = new_solution(mech, phase); exh.TP = T_in, P_exhaust
     exhaust = ct.Reservoir(exh)
     
-    rho1_0 = ct.Solution(mech, phase); rho1_0.TPX = T_ign, p_in, "N2:1.0"
+    rho1_0 = new_solution(mech, phase); rho1_0.TPX = T_ign, p_in, "N2:1.0"
     tau_res_PZ = (rho1_0.density * V1_total) / max(mdot_pz_nom, 1e-12)
     TRAMP_IN = np.clip(0.05 * tau_res_PZ, 1e-4, 1e-2)
     scale_in = lambda t: ramp01_exp(t, TRAMP_IN)
@@ -190,7 +195,7 @@ def CFM_engine_omnisoot(
     # =========================================================
     #  EVAPORAZIONE: modello SABOOHI/LEFEBVRE (Invariato)
     # =========================================================
-    gas_prop = ct.Solution(mech, phase); gas_prop.TPX = T_in, p_in, "O2:0.21, N2:0.79"
+    gas_prop = new_solution(mech, phase); gas_prop.TPX = T_in, p_in, "O2:0.21, N2:0.79"
     rho_g = gas_prop.density
     try: mu_g = gas_prop.viscosity
     except Exception: mu_g = mu_air_sutherland(T_in)
@@ -386,13 +391,13 @@ def CFM_engine_omnisoot(
         mdot_gas_tot = mdot_air + mdot_fuel_gas
         # Se non c'è gas combustibile, passa solo aria
         if mdot_fuel_gas <= 0.0:
-            gas_out = ct.Solution(mech, phase)
+            gas_out = new_solution(mech, phase)
             gas_out.TPX = T_in, p_in, "O2:0.21, N2:0.79"
             return gas_out, T_in, 0.0, None, mdot_fuel_unvap
         # Termodinamica dei reagenti
-        air = ct.Solution(mech, phase)
+        air = new_solution(mech, phase)
         air.TPX = T_in, p_in, "O2:0.21, N2:0.79"
-        fuel = ct.Solution(mech, phase)
+        fuel = new_solution(mech, phase)
         fuel.TPX = T_in, p_in, fuel_comp_str
         # Bilancio Entalpico (solo fase gas)
         h_air = air.enthalpy_mass
@@ -405,7 +410,7 @@ def CFM_engine_omnisoot(
         # Composizione di massa della fase gassosa
         Y_mix = (mdot_air * air.Y + mdot_fuel_gas * fuel.Y) / mdot_gas_tot
         # Stato di uscita da 9A
-        gas_9A_out = ct.Solution(mech, phase)
+        gas_9A_out = new_solution(mech, phase)
         #gas_9A_out.HPY = h_mix_evap, p_in, Y_mix
         # Calcola energia relativa del PSR rispetto al take-off
         
@@ -565,7 +570,7 @@ def CFM_engine_omnisoot(
     # =========================================================
     pz_reactors = []; pz_sims = []; pz_out_res = []; pz_time_hist = []; pz_K_list = []
     def make_branch(i):
-        gas_inerte = ct.Solution(mech, phase); gas_inerte.TPX = T_ign, p_in, "N2:1.0"
+        gas_inerte = new_solution(mech, phase); gas_inerte.TPX = T_ign, p_in, "N2:1.0"
         rPZ_i = ct.IdealGasReactor(gas_inerte, name=f'PZ_{i}', volume=V1_i_array[i])
         rPZ_i.energy_enabled = True; rPZ_i.chemistry_enabled = True
         m_air_i = ct.MassFlowController(
@@ -576,7 +581,7 @@ def CFM_engine_omnisoot(
             fuel_tank, rPZ_i,
             mdot=ct.Func1(lambda t, mdot_fuel_branch=mdot_fuel_gas_injected[i]: mdot_fuel_branch * scale_in(t))
         )
-        res_out_i = ct.Reservoir(ct.Solution(mech, phase))
+        res_out_i = ct.Reservoir(new_solution(mech, phase))
         res_out_i.thermo.TPX = T_in, p_in, "O2:0.21, N2:0.79"; res_out_i.syncState()
         K_i = (mdot_air_PZ_i[i] + mdot_fuel_gas_injected[i]) / (eps_dp * p_in + 1e-30)
         v_i = ct.PressureController(rPZ_i, res_out_i, primary=m_air_i, K=K_i)
@@ -639,7 +644,7 @@ def CFM_engine_omnisoot(
     # 4. Interfacciamento con il resto dello script (Mixing per la Zona Secondaria)
     # Siccome il codice successivo si aspetta dei ct.Reservoir in pz_out_res per fare il mixing,
     # copiamo lo stato termodinamico di Omnisoot in un gas puro di Cantera per il reservoir di scarico.
-    gas_for_reservoir = ct.Solution(mech, phase)
+    gas_for_reservoir = new_solution(mech, phase)
     gas_for_reservoir.TPY = gas_9B_out.T, gas_9B_out.P, gas_9B_out.Y
     # 1. Estraiamo i nomi delle specie e le frazioni di massa
     nomi_specie = gas_for_reservoir.species_names
@@ -685,7 +690,7 @@ def CFM_engine_omnisoot(
     ####rPZ_i, sim_i, res_out_i, K_i = make_branch(i)
     ####def phi_eff_proxy_from_state(rct, FAR_st):
     ####    # stima φ dal contenuto di specie "fuel-like" (idrocarburi puri) rispetto all'aria; proxy semplificato
-    ####    gas = ct.Solution(mech, phase); gas.TPX = rct.T, rct.thermo.P, rct.thermo.X
+    ####    gas = new_solution(mech, phase); gas.TPX = rct.T, rct.thermo.P, rct.thermo.X
     ####    # massa "fuel-like"
     ####    Y = gas.Y; names = gas.species_names
     ####    def is_hc(s):
@@ -737,12 +742,12 @@ def CFM_engine_omnisoot(
     ####
     # ---- Mixer PZ -> SZ (pesato sulle portate) ----
     def build_mixed_reservoir_from_branches(reactors, mdot_branches, p_target):
-        gmix = ct.Solution(mech, phase)
+        gmix = new_solution(mech, phase)
         w = np.array(mdot_branches); w /= max(w.sum(), 1e-30)
         Y_mix = np.zeros(gmix.n_species); h_mix = 0.0
         for k, rloc in enumerate(reactors):
             # Ora rloc è un ct.IdealGasReactor per tutti e 9 i rami! Funzionerà perfettamente.
-            gk = ct.Solution(mech, phase); gk.TPX = rloc.T, rloc.thermo.P, rloc.thermo.X
+            gk = scratch(mech, phase, "pz_branch"); gk.TPX = rloc.T, rloc.thermo.P, rloc.thermo.X
             Y_mix += w[k] * gk.Y; h_mix += w[k] * gk.enthalpy_mass
         gmix.HPY = h_mix, p_target, Y_mix
         return gmix
@@ -896,7 +901,7 @@ def CFM_engine_omnisoot(
         Restituisce un oggetto compatibile con il post-processing (plot_* e soot_array zero)
         e il gas di uscita come ct.Solution.
         """
-        gas = ct.Solution(mech, phase)
+        gas = new_solution(mech, phase)
         gas.TPX = gas_in.T, gas_in.P, gas_in.X
 
         r   = ct.IdealGasConstPressureReactor(gas)
@@ -955,7 +960,7 @@ def CFM_engine_omnisoot(
         res.soot = _FakeSoot()
 
         # Restituiamo anche il gas Cantera aggiornato
-        gas_out = ct.Solution(mech, phase)
+        gas_out = new_solution(mech, phase)
         gas_out.TPX = gas.T, gas.P, gas.X
         return res, gas_out
 
@@ -999,7 +1004,7 @@ def CFM_engine_omnisoot(
 
             if mdot_unvap_sz > 1e-12:
                 # Mescoliamo entalpicamente gas_for_reservoir + fuel puro in vapore
-                gas_unvap = ct.Solution(mech, phase)
+                gas_unvap = new_solution(mech, phase)
                 gas_unvap.TPX = T_in, p_in, fuel_comp_str   # fuel a T_in (vapore freddo)
                 mdot_sz_k  = mdot_9B_gas + mdot_unvap_sz
                 # Bilancio massa
@@ -1010,7 +1015,7 @@ def CFM_engine_omnisoot(
                 h_9B  = gas_for_reservoir.enthalpy_mass
                 h_fv  = gas_unvap.enthalpy_mass
                 h_mix_sz1 = (mdot_9B_gas * h_9B + mdot_unvap_sz * h_fv) / mdot_sz_k
-                gas_in_k = ct.Solution(mech, phase)
+                gas_in_k = new_solution(mech, phase)
                 gas_in_k.HPY = h_mix_sz1, p_in, Y_mix_sz1
                 print(f"[SZ Ramo 1] Fuel non evaporato iniettato come vapore: "
                       f"mdot_unvap={mdot_unvap_sz*1e3:.3f} g/s | "
@@ -1055,7 +1060,7 @@ def CFM_engine_omnisoot(
                 soot_params   = soot_params,
                 zone_name     = "SZ RAMO 2 (omnisoot - bypass 9B)"
             )
-            gas_out_k = ct.Solution(mech, phase)
+            gas_out_k = new_solution(mech, phase)
             gas_out_k.TPX = soot_gas_k.T, soot_gas_k.P, soot_gas_k.X
             sz_gases_out.append(gas_out_k)
             sz_soot_arrays_out.append(pfr_k.soot_array)
@@ -1107,7 +1112,7 @@ def CFM_engine_omnisoot(
     Y_mix_sz = (sz_mdots[0]     * sz_gases_out[0].Y
               + mdot_SZ1_in_mix * sz_gases_out[1].Y) / max(mdot_sz_to_mix, 1e-30)
 
-    gas_out_SZ_mixed = ct.Solution(mech, phase)
+    gas_out_SZ_mixed = new_solution(mech, phase)
     gas_out_SZ_mixed.HPY = h_mix_sz, p_in, Y_mix_sz
     rho_out_SZ_mixed = gas_out_SZ_mixed.density
 
@@ -1196,7 +1201,7 @@ def CFM_engine_omnisoot(
                 soot_params   = soot_params,
                 zone_name     = "DZ RAMO 2 (omnisoot - bypass 9B da SZ)"
             )
-            gas_out_k = ct.Solution(mech, phase)
+            gas_out_k = new_solution(mech, phase)
             gas_out_k.TPX = soot_gas_k.T, soot_gas_k.P, soot_gas_k.X
             dz_gases_out.append(gas_out_k)
             dz_soot_arrays_out.append(pfr_k.soot_array)
@@ -1222,7 +1227,7 @@ def CFM_engine_omnisoot(
     h_mix_dz /= max(mdot_dz_nom_eff, 1e-30)
     Y_mix_dz /= max(mdot_dz_nom_eff, 1e-30)
     
-    gas_out_DZ_mixed = ct.Solution(mech, phase)
+    gas_out_DZ_mixed = new_solution(mech, phase)
     gas_out_DZ_mixed.HPY = h_mix_dz, p_in, Y_mix_dz
     rho_out_DZ_mixed = gas_out_DZ_mixed.density
     
@@ -24,6 +24,7 @@ Meccanismo Cantera
 ------------------
     mech  = "kerosene_surrogate_luche.yaml"
     phase = "gas"
+    caricato una volta per processo tramite ../crn/solution_pool.py
 
 Valori anchor calibrati (MODE_DATA nel vecchio script)
 ------------------------------------------------------
@@ -33,9 +34,16 @@ Valori anchor calibrati (MODE_DATA nel vecchio script)
     TO  (Take-Off) : chi_mixer_scale = 1.0
 """
 
+import os
+import sys
+from functools import lru_cache
+
 import cantera as ct
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "crn"))
+from solution_pool import new_solution, scratch, species_index  # noqa: E402
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Configurazione meccanismo
 # ─────────────────────────────────────────────────────────────────────────────
@@ -113,7 +121,7 @@ def _integrate_stage_stepwise(sim, reactor, t0,
 def _mix_streams_mass(gas_prev_out, mdot_prev, gas_add_like_air, mdot_add,
                       p_target, T_air_for_h):
     """Miscela due portate (entalpia + composizione) e restituisce un ct.Solution."""
-    gmix  = ct.Solution(_MECH, _PHASE)
+    gmix  = new_solution(_MECH, _PHASE)   # contenuto del reattore a valle
     Y_prev = np.zeros(gmix.n_species)
     Y_add  = np.zeros(gmix.n_species)
     smap_prev = {s: i for i, s in enumerate(gas_prev_out.species_names)}
@@ -127,7 +135,7 @@ def _mix_streams_mass(gas_prev_out, mdot_prev, gas_add_like_air, mdot_add,
     Y_mix    = (mdot_prev * Y_prev + mdot_add * Y_add) / max(mdot_tot, 1e-30)
 
     h_prev = gas_prev_out.enthalpy_mass
-    g_air  = ct.Solution(_MECH, _PHASE)
+    g_air  = scratch(_MECH, _PHASE, "mix_air")
     g_air.TPX = T_air_for_h, p_target, "O2:0.21, N2:0.79"
     h_add  = g_air.enthalpy_mass
     h_mix  = (mdot_prev * h_prev + mdot_add * h_add) / max(mdot_tot, 1e-30)
@@ -135,17 +143,18 @@ def _mix_streams_mass(gas_prev_out, mdot_prev, gas_add_like_air, mdot_add,
     gmix.HPY = h_mix, p_target, Y_mix
     return gmix
 
+@lru_cache(maxsize=None)
 def _compute_LHV(fuel_comp_str,
                  T_ref=298.15, T_prod=423.15,
                  P_ref=ct.one_atm, oxidizer="O2:1"):
-    gas_R = ct.Solution(_MECH, _PHASE)
+    gas_R = scratch(_MECH, _PHASE, "lhv_R")
     gas_R.TP = T_ref, P_ref
     gas_R.set_equivalence_ratio(phi=1.0, fuel=fuel_comp_str, oxidizer=oxidizer)
     h_R = gas_R.enthalpy_mass
     fuel_species = [sp.split(':')[0].strip() for sp in fuel_comp_str.split(',')]
     Y_fuel = sum(gas_R[sp].Y[0] for sp in fuel_species
                  if sp in gas_R.species_names)
-    gas_P = ct.Solution(_MECH, _PHASE)
+    gas_P = scratch(_MECH, _PHASE, "lhv_P")
     gas_P.TPX = T_prod, P_ref, gas_R.X
     gas_P.equilibrate("TP")
     h_P = gas_P.enthalpy_mass
@@ -212,21 +221,21 @@ def compute_emissions(T_in: float,
     mdot_dz_nom  = mdot_sz_nom + mdot_air_DZa
 
     # ── stream di base ───────────────────────────────────────────────────────
-    air_stream = ct.Solution(_MECH, _PHASE)
+    air_stream = new_solution(_MECH, _PHASE)
     air_stream.TPX = T_in, p_in, "O2:0.21, N2:0.79"
 
-    fuel_stream = ct.Solution(_MECH, _PHASE)
+    fuel_stream = new_solution(_MECH, _PHASE)
     fuel_stream.TPX = T_in, p_in, "NC10H22:0.74, PHC3H7:0.15, CYC9H18:0.11"
     fuel_comp_str = _get_comp_string(fuel_stream)
 
     # ── back pressure ────────────────────────────────────────────────────────
     P_exhaust = dPqP * p_in
-    exh = ct.Solution(_MECH, _PHASE)
+    exh = new_solution(_MECH, _PHASE)
     exh.TP = T_in, P_exhaust
     exhaust = ct.Reservoir(exh)
 
     # ── tempo caratteristico PZ e rampa ──────────────────────────────────────
-    rho1_0 = ct.Solution(_MECH, _PHASE)
+    rho1_0 = scratch(_MECH, _PHASE, "rho1_0")
     rho1_0.TPX = _T_ign, p_in, "N2:1.0"
     tau_res_PZ = (rho1_0.density * _V1_total) / max(mdot_pz_nom, 1e-12)
 
@@ -242,11 +251,11 @@ def compute_emissions(T_in: float,
     air_tank  = ct.Reservoir(air_stream)
     fuel_tank = ct.Reservoir(fuel_stream)
 
-    link_PZ_SZ_mix = ct.Reservoir(ct.Solution(_MECH, _PHASE))
+    link_PZ_SZ_mix = ct.Reservoir(new_solution(_MECH, _PHASE))
     link_PZ_SZ_mix.thermo.TPX = T_in, p_in, "O2:0.21, N2:0.79"
     link_PZ_SZ_mix.syncState()
 
-    link_SZ_DZ = ct.Reservoir(ct.Solution(_MECH, _PHASE))
+    link_SZ_DZ = ct.Reservoir(new_solution(_MECH, _PHASE))
     link_SZ_DZ.thermo.TPX = T_in, p_in, "O2:0.21, N2:0.79"
     link_SZ_DZ.syncState()
 
@@ -262,7 +271,7 @@ def compute_emissions(T_in: float,
     air_i_vap   = mdot_air_PZ_i[vap_indices]
 
     # ── modello evaporazione (Saboohi/Lefebvre) ───────────────────────────────
-    gas_prop = ct.Solution(_MECH, _PHASE)
+    gas_prop = scratch(_MECH, _PHASE, "prop")
     gas_prop.TPX = T_in, p_in, "O2:0.21, N2:0.79"
     rho_g = gas_prop.density
     try:
@@ -333,7 +342,7 @@ def compute_emissions(T_in: float,
     #  STADIO PZ: 9 sub-PSR in parallelo
     # ══════════════════════════════════════════════════════════════════════════
     def _make_branch(i):
-        gas_inerte = ct.Solution(_MECH, _PHASE)
+        gas_inerte = new_solution(_MECH, _PHASE)
         gas_inerte.TPX = _T_ign, p_in, "N2:1.0"
         rPZ = ct.IdealGasReactor(gas_inerte, name=f"PZ_{i}", volume=_V1_i)
         rPZ.energy_enabled   = True
@@ -347,7 +356,7 @@ def compute_emissions(T_in: float,
             fuel_tank, rPZ,
             mdot=ct.Func1(lambda t, m=mdot_fuel_gas_injected[i]: m * scale_in(t))
         )
-        res_out = ct.Reservoir(ct.Solution(_MECH, _PHASE))
+        res_out = ct.Reservoir(new_solution(_MECH, _PHASE))
         res_out.thermo.TPX = T_in, p_in, "O2:0.21, N2:0.79"
         res_out.syncState()
 
@@ -363,7 +372,7 @@ def compute_emissions(T_in: float,
     pz_time_hist = []
 
     for i in range(_N_PZ):
-        gas_i = ct.Solution(_MECH, _PHASE)
+        gas_i = new_solution(_MECH, _PHASE)
         gas_i.TPX = _T_ign, p_in, "N2:1.0"
         rPZ_i = ct.IdealGasReactor(gas_i, name=f"PZ_{i}", volume=_V1_i)
         rPZ_i.energy_enabled    = True
@@ -377,7 +386,7 @@ def compute_emissions(T_in: float,
             fuel_tank, rPZ_i,
             mdot=ct.Func1(lambda t, m=mdot_fuel_gas_injected[i]: m * scale_in(t))
         )
-        res_out_i = ct.Reservoir(ct.Solution(_MECH, _PHASE))
+        res_out_i = ct.Reservoir(new_solution(_MECH, _PHASE))
         res_out_i.thermo.TPX = T_in, p_in, "O2:0.21, N2:0.79"
         res_out_i.syncState()
 
@@ -395,13 +404,13 @@ def compute_emissions(T_in: float,
 
     # ── mixer PZ → SZ ────────────────────────────────────────────────────────
     def _build_mixed_reservoir(reactors, mdot_branches, p_target):
-        gmix = ct.Solution(_MECH, _PHASE)
+        gmix = scratch(_MECH, _PHASE, "pz_mix")
         w    = np.array(mdot_branches, dtype=float)
         w   /= max(w.sum(), 1e-30)
         Y_mix = np.zeros(gmix.n_species)
         h_mix = 0.0
         for k, rloc in enumerate(reactors):
-            gk = ct.Solution(_MECH, _PHASE)
+            gk = scratch(_MECH, _PHASE, "pz_branch")
             gk.TPX = rloc.T, rloc.thermo.P, rloc.thermo.X
             Y_mix += w[k] * gk.Y
             h_mix += w[k] * gk.enthalpy_mass
@@ -450,7 +459,7 @@ def compute_emissions(T_in: float,
     # ══════════════════════════════════════════════════════════════════════════
     #  STADIO DZ
     # ══════════════════════════════════════════════════════════════════════════
-    gas_out_SZ = ct.Solution(_MECH, _PHASE)
+    gas_out_SZ = scratch(_MECH, _PHASE, "sz_out")
     gas_out_SZ.TPX = r2.T, r2.thermo.P, r2.thermo.X
 
     gas_up_DZ = _mix_streams_mass(
@@ -488,10 +497,10 @@ def compute_emissions(T_in: float,
     # ══════════════════════════════════════════════════════════════════════════
     #  CALCOLO EI_NOx e EI_CO
     # ══════════════════════════════════════════════════════════════════════════
-    gas_out = ct.Solution(_MECH, _PHASE)
+    gas_out = scratch(_MECH, _PHASE, "out")
     gas_out.TPX = r3.T, r3.thermo.P, r3.thermo.X
     Y_out = gas_out.Y
-    smap  = {s: i for i, s in enumerate(gas_out.species_names)}
+    smap  = species_index(_MECH, _PHASE)
 
     Y_NO  = Y_out[smap["NO"]]  if "NO"  in smap else 0.0
     Y_NO2 = Y_out[smap["NO2"]] if "NO2" in smap else 0.0
@@ -10,6 +10,10 @@ import pw127_partpower as pp         # noqa
 import crn_smoke_test as crn         # noqa
 evap = crn.evap
 
+# direct steady-state PSR solve (falls back to the time march per zone); "stepwise" reproduces
+# the time-marched calibration exactly
+SOLVER = "steady"
+
 # remember CRN defaults
 ARPZ0, ARSZ0, ARDZ0 = evap.ARPZ, evap.ARSZ, evap.ARDZ
 V1_0 = evap.V1_total
@@ -42,7 +46,7 @@ def crn_eval(state, chi=None, arpz=None, V1_mult=1.0):
               "mdot_air": state["mdot"], "FAR": state["FAR"], "dPqP": 0.95,
               "chi_mixer_scale": chi_used, "EIUHC_ICAO": 0.0}
     with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
-        r = evap.run_crn_evap_mode("GRID", params)
+        r = evap.run_crn_evap_mode("GRID", params, solver=SOLVER)
     reset()
     return r.get("EI_NOx"), r.get("EI_CO")
 
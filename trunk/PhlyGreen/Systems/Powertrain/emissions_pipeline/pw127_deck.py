@@ -7,8 +7,11 @@ power set so the sea-level-static take-off fuel flow matches the Excel ``FF_To``
 
 Outputs (same schema as Pietrosanto's pyCycle->CRN CSV, so the CRN batch can consume it):
     op_id, Mach, alt_ft, PC, time_s, dist_nm, T3_K, P3_Pa, FAR, mdot_air3_kg_s
+
+`--adaptive` samples the envelope with ``../adaptive_sampling.py`` instead of the tensor grid
+(same box, same schema, at most as many deck runs as the grid).
 """
-import os, sys, io, contextlib
+import os, sys, io, contextlib, itertools, argparse
 import numpy as np
 import openmdao.api as om
 
@@ -17,8 +20,13 @@ DECK_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data")
 sys.path.insert(0, DECK_DIR)
 import Single_spool_GT as deck   # noqa: E402
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from adaptive_sampling import adaptive_sample   # noqa: E402
+
 DEGR_TO_K, PSI_TO_PA, LBM_S_TO_KG_S = 1.0 / 1.8, 6894.757, 0.45359237
 HERE = os.path.dirname(os.path.abspath(__file__))
+ENVELOPE_HDR = "op_id,Mach,alt_ft,PC,time_s,dist_nm,T3_K,P3_Pa,FAR,mdot_air3_kg_s"
+STATE_KEYS = ("T3_K", "P3_Pa", "FAR", "mdot")
 
 # --- PW127 design targets ---
 OPR_PW127 = 14.7
@@ -130,30 +138,59 @@ def validate_lto(prob, rated, des):
               f"{s['T3_K']:7.1f} {s['P3_Pa']/1e6:7.3f} {s['FAR']:7.4f}")
 
 
-def generate_envelope(prob, rated, des, n_alt=5, n_mach=4, n_pwr=5):
+def sample_envelope(state_at, alts, machs, fracs, adaptive=False, tol=0.01, n_max=None):
+    """Combustor states over the (alt, Mach, PC) envelope -> (CSV rows, number failed).
+
+    ``state_at(alt, mach, frac)`` is the deck state dict (or None). The grid mode runs
+    ``alts x machs x fracs``; the adaptive mode samples the same box (at most ``n_max`` points,
+    default the grid size) until the RBF LOO error of T3/P3/FAR/mdot is below ``tol``, always
+    including the sea-level slice ``alts[0] x machs x fracs`` the NOx anchor of
+    ``build_pw127_surrogate.py`` is taken on.
+    """
+    rows, fail = [], 0
+    if not adaptive:
+        for op_id, (alt, mach, frac) in enumerate(itertools.product(alts, machs, fracs), 1):
+            s = state_at(alt, mach, frac)
+            if s is None:
+                fail += 1
+                continue
+            rows.append([op_id, mach, alt, frac, 0.0, 0.0] + [s[k] for k in STATE_KEYS])
+        return rows, fail
+
+    def evaluate(X):
+        out = []
+        for alt, mach, frac in X:
+            s = state_at(alt, mach, frac)
+            out.append([np.nan] * len(STATE_KEYS) if s is None else [s[k] for k in STATE_KEYS])
+        return out
+
+    bounds = [(min(v), max(v)) for v in (alts, machs, fracs)]
+    sls = list(itertools.product(alts[:1], machs, fracs))
+    sample = adaptive_sample(evaluate, bounds, tol=tol, x_fixed=sls,
+                             n_max=n_max or len(alts) * len(machs) * len(fracs), verbose=True)
+    for op_id, ((alt, mach, frac), y, ok) in enumerate(zip(sample.X, sample.Y, sample.ok), 1):
+        if ok:
+            rows.append([op_id, mach, alt, frac, 0.0, 0.0] + list(y))
+    return rows, int((~sample.ok).sum())
+
+
+def generate_envelope(prob, rated, des, n_alt=5, n_mach=4, n_pwr=5, adaptive=False,
+                      tol=0.01, n_max=None):
     """Off-design grid over (alt, Mach, power 30-100%) -> CRN-input CSV (Pietrosanto schema)."""
     od = prob.model.od_pts[0]
-    alts = np.linspace(0, 30000, n_alt)
-    machs = np.linspace(0.0, 0.55, n_mach)
-    rows, op_id, ok, fail = [], 0, 0, 0
-    for alt in alts:
+
+    def state_at(alt, mach, frac):
         P_std_sl, T_std_sl = 14.696, 518.67
         T_amb = max(T_std_sl - 3.566e-3 * alt, 390.0)
         delta = (P_std_sl * (T_amb / T_std_sl) ** 5.2561) / P_std_sl
-        for mach in machs:
-            for frac in np.linspace(0.30, 1.00, n_pwr):
-                s = _od_state(prob, od, alt, mach, frac * rated * delta, des["base_W"])
-                op_id += 1
-                if s is None:
-                    fail += 1
-                    continue
-                ok += 1
-                rows.append([op_id, mach, alt, frac, 0.0, 0.0,
-                             s["T3_K"], s["P3_Pa"], s["FAR"], s["mdot"]])
-    hdr = "op_id,Mach,alt_ft,PC,time_s,dist_nm,T3_K,P3_Pa,FAR,mdot_air3_kg_s"
+        return _od_state(prob, od, alt, mach, frac * rated * delta, des["base_W"])
+
+    rows, fail = sample_envelope(state_at, np.linspace(0, 30000, n_alt),
+                                 np.linspace(0.0, 0.55, n_mach), np.linspace(0.30, 1.00, n_pwr),
+                                 adaptive=adaptive, tol=tol, n_max=n_max)
     out = os.path.join(HERE, "pw127_crn_inputs.csv")
-    np.savetxt(out, np.array(rows), delimiter=",", header=hdr, comments="")
-    print(f"\nenvelope dataset: {ok} converged / {fail} failed -> {out}")
+    np.savetxt(out, np.array(rows), delimiter=",", header=ENVELOPE_HDR, comments="")
+    print(f"\nenvelope dataset: {len(rows)} converged / {fail} failed -> {out}")
     arr = np.array(rows)
     print(f"  T3_K   [{arr[:,6].min():.0f}, {arr[:,6].max():.0f}] K")
     print(f"  P3     [{arr[:,7].min()/1e6:.2f}, {arr[:,7].max()/1e6:.2f}] MPa")
@@ -162,15 +199,22 @@ def generate_envelope(prob, rated, des, n_alt=5, n_mach=4, n_pwr=5):
     return out
 
 
-def main():
+def main(adaptive=False, tol=0.01, n_max=None):
     print("Tuning PW127 rated power (OPR=%.1f) to take-off FF=%.2f kg/s ..." % (OPR_PW127, FF_TO_TARGET))
     prob, rated, des = tune_rated_power()
     print(f"  rated power = {rated:.0f} hp  ({rated*0.7457:.0f} kW) | "
           f"take-off: Wfuel={des['Wfuel']:.4f} kg/s, T3={des['T3_K']:.1f} K, "
           f"P3={des['P3_Pa']/1e6:.3f} MPa, FAR={des['FAR']:.4f}, mdot={des['mdot']:.2f} kg/s")
     validate_lto(prob, rated, des)
-    generate_envelope(prob, rated, des)
+    generate_envelope(prob, rated, des, adaptive=adaptive, tol=tol, n_max=n_max)
 
 
 if __name__ == "__main__":
-    main()
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--adaptive", action="store_true", help="error-driven envelope sampling")
+    ap.add_argument("--tol", type=float, default=0.01,
+                    help="adaptive: target RMS LOO error (fraction of range)")
+    ap.add_argument("--n-max", type=int, default=None,
+                    help="adaptive: maximum deck runs (default: the grid size)")
+    a = ap.parse_args()
+    main(adaptive=a.adaptive, tol=a.tol, n_max=a.n_max)
@@ -12,9 +12,10 @@ For the flight envelope, gross = G(f) * delta(alt) (the correction lapses with t
 useful-fraction range the surrogate uses (0.3..1.0, approach..take-off) is exactly the
 well-constrained part of the schedule; idle (f=0.07) sits below it and is only an LTO point.
 
-Outputs the corrected combustor-state dataset `pw127_crn_inputs_corrected.csv`.
+Outputs the corrected combustor-state dataset `pw127_crn_inputs_corrected.csv` (`--adaptive`:
+error-driven sampling of the same envelope, see `pw127_deck.sample_envelope`).
 """
-import os, sys
+import os, sys, argparse
 import numpy as np
 from scipy.interpolate import interp1d, PchipInterpolator
 
@@ -54,7 +55,7 @@ def calibrate_schedule(ff_curve):
     return PchipInterpolator(fracs, req_gross), fracs, req_gross
 
 
-def main():
+def main(adaptive=False, tol=0.01, n_max=None):
     prob = deck._build()
     deck._set_design(prob, TO_GROSS_HP)
     with deck._quiet():
@@ -88,27 +89,25 @@ def main():
     # Avoid Mach=0 (static): the deck's static off-design point converges to a spurious low-T3
     # state; from ~M0.1 up the combustor state is well-behaved (T3 ~ flat with Mach).
     alts = np.linspace(0, 30000, 5); machs = np.linspace(0.10, 0.55, 4)
-    rows, op_id, ok, fail = [], 0, 0, 0
-    for alt in alts:
-        d = _delta(alt)
-        for mach in machs:
-            for f in np.linspace(0.30, 1.00, 5):
-                gross = float(G(f)) * d
-                s = deck._od_state(prob, od, alt, mach, gross, des["base_W"])
-                op_id += 1
-                if s is None:
-                    fail += 1; continue
-                ok += 1
-                rows.append([op_id, mach, alt, f, 0.0, 0.0, s["T3_K"], s["P3_Pa"], s["FAR"], s["mdot"]])
-    hdr = "op_id,Mach,alt_ft,PC,time_s,dist_nm,T3_K,P3_Pa,FAR,mdot_air3_kg_s"
+    state_at = lambda alt, mach, f: deck._od_state(prob, od, alt, mach, float(G(f)) * _delta(alt),
+                                                   des["base_W"])
+    rows, fail = deck.sample_envelope(state_at, alts, machs, np.linspace(0.30, 1.00, 5),
+                                      adaptive=adaptive, tol=tol, n_max=n_max)
     out = os.path.join(HERE, "pw127_crn_inputs_corrected.csv")
-    np.savetxt(out, np.array(rows), delimiter=",", header=hdr, comments="")
+    np.savetxt(out, np.array(rows), delimiter=",", header=deck.ENVELOPE_HDR, comments="")
     arr = np.array(rows)
-    print(f"  {ok} converged / {fail} failed -> {out}")
+    print(f"  {len(rows)} converged / {fail} failed -> {out}")
     print(f"  FAR  [{arr[:,8].min():.4f}, {arr[:,8].max():.4f}]  (was [0.0077, 0.0172])")
     print(f"  T3_K [{arr[:,6].min():.0f}, {arr[:,6].max():.0f}]  (was [447, 664])")
     np.save(os.path.join(HERE, "_schedule.npy"), np.column_stack([fracs, req_gross]))
 
 
 if __name__ == "__main__":
-    main()
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--adaptive", action="store_true", help="error-driven envelope sampling")
+    ap.add_argument("--tol", type=float, default=0.01,
+                    help="adaptive: target RMS LOO error (fraction of range)")
+    ap.add_argument("--n-max", type=int, default=None,
+                    help="adaptive: maximum deck runs (default: the grid size)")
+    a = ap.parse_args()
+    main(adaptive=a.adaptive, tol=a.tol, n_max=a.n_max)
@@ -21,6 +21,10 @@ import pickle
 
 import numpy as np
 
+from PhlyGreen.Utilities.Interpolation import UniformGridTable
+
+from PhlyGreen.Systems.Powertrain import surrogate_registry
+
 _DEFAULT_PKL = os.path.join(os.path.dirname(__file__), "data", "GT_Engine_Model_Complete.pkl")
 
 # Reference engine the universal map was generated for (must match Single_spool_GT.py /
@@ -78,6 +82,11 @@ def calibrate_scaling_exponent():
     return _CALIBRATED_N
 
 
+# Default grid of the tabulated efficiency map (GasTurbineResponseSurface.tabulate): uniform
+# steps of 500 ft, Mach 0.01 and power fraction 0.0125 over a box enclosing the mission envelope.
+TABLE_GRID = ((0.0, 40000.0, 81), (0.0, 0.8, 81), (0.05, 1.0, 77))
+
+
 def _isa_pressure_ratio(altitude_ft):
     """ISA pressure ratio delta = p/p_SL (troposphere), matching the map generator."""
     P_std_sl, T_std_sl = 14.696, 518.67     # psia, degR
@@ -96,9 +105,10 @@ class GasTurbineResponseSurface:
             ``model_eff`` over ``[altitude_ft, mach, power_fraction]``, plus optional
             ``scaler_wt``/``model_wt`` for dry mass and ``ref_hp``/``scaling_n``). Defaults to
             the packaged ``GT_Engine_Model_Complete.pkl``.
+        tabulate: pre-tabulate the efficiency map at load time (see :meth:`tabulate`).
     """
 
-    def __init__(self, model_path=None):
+    def __init__(self, model_path=None, tabulate=False):
         path = model_path or _DEFAULT_PKL
         with open(path, "rb") as f:
             pkg = pickle.load(f)
@@ -109,7 +119,31 @@ class GasTurbineResponseSurface:
         self.ref_hp = pkg.get("ref_hp", REF_HP)
         # Scaling exponent: stored with the model if present, else calibrated on demand.
         self._n = pkg.get("scaling_n")
+        self.table = None
+        self._artifact = surrogate_registry.artifact_key(path)   # keys the dry-mass memo
         self.loaded = True
+        if tabulate:
+            self.tabulate()
+
+    def tabulate(self, grid=TABLE_GRID):
+        """Sample the universal efficiency RBF on a uniform ``(altitude_ft, mach, fraction)`` grid.
+
+        Afterwards :meth:`predict` reads the reference efficiency from the table by trilinear
+        interpolation (:class:`UniformGridTable`) instead of a ``StandardScaler`` transform
+        and an RBF call per point. On the default :data:`TABLE_GRID` (0.5 M points, built in
+        ~0.2 s) the interpolation differs from the RBF by at most ~7e-4 in efficiency (99th
+        percentile ~1e-4), because the linear RBF has kinks at its 80 centers. Operating
+        points outside the grid box are clamped to it instead of being extrapolated.
+        """
+        axes = [np.linspace(lo, hi, n) for lo, hi, n in grid]
+        A, M, F = np.meshgrid(*axes, indexing="ij")
+        values = np.empty(A.size)
+        X = self.scaler_eff.transform(np.column_stack([A.ravel(), M.ravel(), F.ravel()]))
+        for start in range(0, len(X), 65536):
+            chunk = X[start:start + 65536]
+            values[start:start + 65536] = self.model_eff(chunk[:, 0], chunk[:, 1], chunk[:, 2])
+        self.table = UniformGridTable(grid, values.reshape(A.shape))
+        return self.table
 
     @property
     def scaling_n(self):
@@ -167,19 +201,29 @@ class GasTurbineResponseSurface:
             frac = float(np.clip(frac, 0.05, 1.0))
 
             # 3. Universal (reference-engine) efficiency at [altitude, mach, fraction].
-            eff_scaled = self.scaler_eff.transform(np.array([[altitude_ft, mach, frac]]))
-            eff_ref = float(self.model_eff(eff_scaled[0, 0], eff_scaled[0, 1], eff_scaled[0, 2]))
+            if self.table is not None:
+                eff_ref = self.table(altitude_ft, mach, frac)
+            else:
+                eff_scaled = self.scaler_eff.transform(np.array([[altitude_ft, mach, frac]]))
+                eff_ref = float(self.model_eff(eff_scaled[0, 0], eff_scaled[0, 1],
+                                               eff_scaled[0, 2]))
 
             # 4. Scale for engine size (smaller design power ⇒ lower efficiency).
             eff_sized = get_scaled_efficiency(design_hp, self.ref_hp, eff_ref, self.scaling_n)
             efficiency = float(np.clip(eff_sized, 0.01, 0.45))
 
-            # 5. Dry engine mass.
-            if self.model_wt is not None and self.scaler_wt is not None:
-                wt_scaled = self.scaler_wt.transform(np.array([[design_hp]]))
-                weight_lb = float(self.model_wt(wt_scaled[0, 0]))
-            else:
-                weight_lb = self.calculate_physics_weight(design_hp)
+            # 5. Dry engine mass (depends on the design power only).
+            weights = surrogate_registry.memo("gas_turbine_weight_lb", self._artifact)
+            weight_lb = weights.get(design_hp)   # fixed per design power
+            if weight_lb is None:
+                if self.model_wt is not None and self.scaler_wt is not None:
+                    wt_scaled = self.scaler_wt.transform(np.array([[design_hp]]))
+                    weight_lb = float(self.model_wt(wt_scaled[0, 0]))
+                else:
+                    weight_lb = self.calculate_physics_weight(design_hp)
+                if len(weights) > 1024:
+                    weights.clear()
+                weights[design_hp] = weight_lb
 
             return efficiency, weight_lb, max_power_avail, is_limited
         except Exception:
@@ -6,18 +6,83 @@ data and interpolation primitives live in :mod:`.propeller_hamilton_tables`.
 
 This is the *physics/empirical* propeller model (class :class:`Propeller`). For the
 data-trained alternative, see :mod:`.propeller_surrogate`.
+
+:meth:`Propeller.ComputePropEfficiency` is the scalar reference port of the chart logic;
+:meth:`Propeller.ComputePropEfficiencyBatch` evaluates whole arrays of operating points in one
+vectorized pass. The geometry-only lookups of the latter (activity-factor adjustments, design
+lift-coefficient and blade-count interpolation weights, padded blade-angle tables) are
+prepared once by :meth:`Propeller.SetInput`, and again after a geometry input is reassigned.
+
+For a given geometry (blade count, activity factor, design lift coefficient) the efficiency
+only depends on advance ratio, power coefficient and tip Mach number (the flight Mach number
+is ``J * Mtip / pi``). :meth:`Propeller.TabulateEfficiency` samples it once on a
+``(J, CP, Mtip)`` grid so the mission reads a trilinear table instead of rerunning the chart
+logic; enable it with ``PropellerInput['Efficiency Table'] = True``.
 """
 
 import numpy as np
 import PhlyGreen.Utilities.Atmosphere as ISA
 import PhlyGreen.Utilities.Units as Units
 import PhlyGreen.Utilities.Speed as Speed
-from .propeller_hamilton_tables import _unint, _biquad, Act_Factor_arr, AFCPC, AFCTC, CL_arr, CPEC, CTEC, BL_P_corr_table, PF_CLI_arr, CP_CLi_table, cli_arr_len, ang_arr_len, XPCLI, XTCLI, CP_Angle_table, Blade_angle_table, CT_Angle_table, advance_ratio_array, BL_T_corr_table, TF_CLI_arr, CT_CLi_table, advance_ratio_array2, mach_corr_table, mach_tip_corr_arr, num_blades_arr, comp_mach_CT_arr
+from PhlyGreen.Utilities.Interpolation import UniformGridTable
+from .propeller_hamilton_tables import _unint, _biquad, _unint_vec, _biquad_vec, _unint_weights, Act_Factor_arr, AFCPC, AFCTC, CL_arr, CPEC, CTEC, BL_P_corr_table, PF_CLI_arr, CP_CLi_table, cli_arr_len, ang_arr_len, XPCLI, XTCLI, CP_Angle_table, Blade_angle_table, CT_Angle_table, advance_ratio_array, BL_T_corr_table, TF_CLI_arr, CT_CLi_table, advance_ratio_array2, mach_corr_table, mach_tip_corr_arr, num_blades_arr, comp_mach_CT_arr
+
+# Defaults of Propeller.TabulateEfficiency: grid points along (J, CP, Mtip), the largest
+# estimated interpolation error [-] a table cell may have before it falls back to the exact
+# model, and the tabulated ranges (the tip Mach range follows from the altitude range).
+TABLE_POINTS = (61, 100, 6)
+TABLE_TOLERANCE = 2e-3
+TABLE_ADVANCE_RATIO = (0.0, 3.0)
+TABLE_POWER_COEFFICIENT = (0.01, 1.0)
+TABLE_ALTITUDE = (0.0, 12000.0)
+
+# Efficiency tables per (chart geometry, grid, tolerance), least recently used first: designs
+# sharing a propeller reuse one.
+_TABLES = {}
+_TABLES_MAX = 16
+
 
 class Propeller:
 
     def __init__(self, aircraft):
         self.aircraft = aircraft
+        self.eta_table = None
+        self.eta_table_report = None
+        self._batch = None
+
+    # Geometry inputs: the lookups derived from them (:meth:`_prepare_batch_tables`) and the
+    # efficiency table are dropped when one is set, and rebuilt lazily by the next evaluation.
+    @property
+    def n_blades(self):
+        return self._n_blades
+
+    @n_blades.setter
+    def n_blades(self, value):
+        self._n_blades = value
+        self._geometry_changed()
+
+    @property
+    def activity_factor(self):
+        return self._activity_factor
+
+    @activity_factor.setter
+    def activity_factor(self, value):
+        self._activity_factor = value
+        self._geometry_changed()
+
+    @property
+    def cli(self):
+        return self._cli
+
+    @cli.setter
+    def cli(self, value):
+        self._cli = value
+        self._geometry_changed()
+
+    def _geometry_changed(self):
+        self._batch = None
+        self.eta_table = None
+        self.eta_table_report = None
 
     def SetInput(self):
 
@@ -28,8 +93,147 @@ class Propeller:
         self.n_blades = self.aircraft.PropellerInput['N_BLADES']
         self.activity_factor = self.aircraft.PropellerInput['ACTIVITY_FACTOR']
         self.cli = self.aircraft.PropellerInput['INTEGRATED_LIFT_COEFFICIENT']
+        self._prepare_batch_tables()
+
+        self.eta_table = None
+        self.eta_table_report = None
+        if self.aircraft.PropellerInput.get('Efficiency Table', False):
+            self.TabulateEfficiency(
+                points=self.aircraft.PropellerInput.get('Efficiency Table Points', TABLE_POINTS),
+                tolerance=self.aircraft.PropellerInput.get('Efficiency Table Tolerance', TABLE_TOLERANCE))
 
         return None
+
+    def TabulateEfficiency(self, points=TABLE_POINTS, tolerance=TABLE_TOLERANCE,
+                           advance_ratio=TABLE_ADVANCE_RATIO,
+                           power_coefficient=TABLE_POWER_COEFFICIENT, altitude=TABLE_ALTITUDE):
+        """Pre-tabulate the efficiency on a uniform ``(J, CP, Mtip)`` grid.
+
+        ``points`` is the number of grid points along each axis (the resolution knob). The
+        exact model is evaluated at the grid nodes and at every cell centre. The error of a
+        cell is estimated as the larger of its centre error and the trilinear error bound of
+        its curvature, ``sum_k |D_k| / 8`` with ``D_k`` the second differences of the node
+        values along each axis (largest over the cell's corners); the curvature term catches
+        cells whose error peaks away from the centre. A cell whose estimate exceeds
+        ``tolerance`` (or that touches a point where the thrust iteration fails) is left to
+        the exact model, as is anything outside the tabulated ranges. Afterwards
+        :meth:`ComputePropEfficiency` reads the table first.
+
+        The estimate is not a strict bound. On the default grid, over 1e6 random points of
+        the kept cells the error stays below 1.1x the tolerance (5 points above it, p99 at
+        0.7x); checking the cell centres alone let it reach 9x.
+
+        Returns (and stores as ``eta_table_report``) the estimated error statistics of the
+        cells kept in the table (``max_error``, ``p99_error``) and the fraction of cells
+        that fall back to the exact model (``fallback_cells``).
+        """
+        a_lo, a_hi = (Units.mToft(ISA.atmosphere.astd(h)) for h in altitude)
+        grid = ((advance_ratio[0], advance_ratio[1], int(points[0])),
+                (power_coefficient[0], power_coefficient[1], int(points[1])),
+                (self.V_tip / a_lo, self.V_tip / a_hi, int(points[2])))
+        num_blades = self.n_blades
+        try:
+            num_blades = int(num_blades[0])
+        except TypeError:
+            num_blades = int(num_blades)
+        key = (num_blades, float(self.activity_factor), float(self.cli),
+               tuple(round(g, 9) if isinstance(g, float) else g for axis in grid for g in axis),
+               float(tolerance))
+        entry = _TABLES.pop(key, None)
+        if entry is None:
+            entry = self._build_efficiency_table(grid, tolerance)
+            while len(_TABLES) >= _TABLES_MAX:
+                del _TABLES[next(iter(_TABLES))]   # least recently used
+        _TABLES[key] = entry
+        self.eta_table, self.eta_table_report = entry
+        return self.eta_table_report
+
+    def _build_efficiency_table(self, grid, tolerance):
+        """Sample the exact model on ``grid`` and at the cell centres; return (table, report)."""
+        def exact(J, CP, Mtip):
+            J, CP, Mtip = (np.ravel(v) for v in np.broadcast_arrays(J, CP, Mtip))
+            return self._efficiency_batch(J, CP, Mtip, J*Mtip/np.pi, strict=False)
+
+        axes = [np.linspace(lo, hi, n) for lo, hi, n in grid]
+        shape = tuple(len(ax) for ax in axes)
+        values = exact(*np.meshgrid(*axes, indexing='ij')).reshape(shape)
+        centres = [0.5*(ax[1:] + ax[:-1]) for ax in axes]
+        mid = np.meshgrid(*centres, indexing='ij')
+        table = UniformGridTable(grid, values, clamp=False)
+        with np.errstate(invalid='ignore'):
+            error = np.abs(table(*mid) - exact(*mid).reshape(mid[0].shape))
+            # curvature bound sum_k |D_k| / 8 at each node (end nodes take their neighbour's)
+            curvature = np.zeros(shape)
+            for k in range(3):
+                v = np.moveaxis(values, k, 0)
+                d = np.abs(v[:-2] - 2.0*v[1:-1] + v[2:])
+                curvature += np.moveaxis(np.concatenate([d[:1], d, d[-1:]]), 0, k) / 8.0
+            n0, n1, n2 = error.shape
+            error = np.max([error] + [curvature[a:a + n0, b:b + n1, c:c + n2]
+                                      for a in (0, 1) for b in (0, 1) for c in (0, 1)], axis=0)
+            cells = error <= tolerance          # NaN (failed or undefined corner) -> False
+        report = {
+            'points': shape,
+            'tolerance': tolerance,
+            'max_error': float(np.max(error[cells])) if cells.any() else float('nan'),
+            'p99_error': float(np.percentile(error[cells], 99)) if cells.any() else float('nan'),
+            'fallback_cells': float(1.0 - cells.mean()),
+        }
+        return UniformGridTable(grid, values, cells=cells, clamp=False), report
+
+    def _batch_tables(self):
+        """Geometry-only lookups of the current geometry (prepared on first use)."""
+        if self._batch is None:
+            self._prepare_batch_tables()
+        return self._batch
+
+    def _prepare_batch_tables(self):
+        """Precompute the geometry-only lookups used by :meth:`ComputePropEfficiencyBatch`."""
+        num_blades = self.n_blades
+        try:
+            num_blades = int(num_blades[0])
+        except TypeError:
+            num_blades = int(num_blades)
+        act_factor, cli = self.activity_factor, self.cli
+
+        # Activity-factor adjustments of CP and CT, indexed by advance-ratio node (7).
+        af_cp = np.empty(7)
+        af_ct = np.empty(7)
+        for k in range(2):
+            af_cp[k] = _unint(Act_Factor_arr, AFCPC[k], act_factor)[0]
+            af_ct[k] = _unint(Act_Factor_arr, AFCTC[k], act_factor)[0]
+        af_cp[2:] = af_cp[1]
+        af_ct[2:] = af_ct[1]
+
+        # Design-lift-coefficient tables and their interpolation weights: a node of CL_arr
+        # uses that table alone, otherwise four tables are blended at cli.
+        node = [ii for ii in range(6) if abs(cli - CL_arr[ii]) <= 0.0009]
+        if node:
+            cl_rows, cl_w = [node[0]], np.ones(1)
+        else:
+            start = 0 if cli <= 0.6 else (1 if cli <= 0.7 else 2)
+            cl_rows = list(range(start, start + 4))
+            cl_w = _unint_weights(CL_arr[start:start + 4], cli)
+
+        # Blade tables: an even count reads one, an odd count blends the 2/4/6/8-blade tables.
+        if num_blades % 2 == 0:
+            blades, blade_w = [num_blades // 2 - 1], np.ones(1)
+        else:
+            blades, blade_w = [0, 1, 2, 3], _unint_weights(num_blades_arr, num_blades)
+
+        # Blade-angle charts per advance-ratio node, padded past their length with +inf.
+        cols = np.arange(Blade_angle_table.shape[1])
+        pad = cols[None, :] >= ang_arr_len[:, None]
+        self._batch = {
+            'af_cp': af_cp, 'af_ct': af_ct,
+            'cl_rows': cl_rows, 'cl_w': cl_w, 'blades': blades, 'blade_w': blade_w,
+            'cp_angle': [np.where(pad, np.inf, CP_Angle_table[b]) for b in range(4)],
+            'blade_angle': np.where(pad, np.inf, Blade_angle_table),
+            'j_windows': np.array([advance_ratio_array[j:j + 4] for j in range(4)]),
+            'cp_cli': [(CP_CLi_table[c][:cli_arr_len[c]], XPCLI[c]) for c in range(6)],
+            'ct_cli': [(CT_CLi_table[c][:cli_arr_len[c]], XTCLI[c][:cli_arr_len[c]])
+                       for c in range(6)],
+        }
     
     def ComputePropEfficiency(self,Altitude,Velocity,ShaftPower):
 
@@ -43,6 +247,11 @@ class Propeller:
         PowerCoeff = Units.wTohp(ShaftPower/self.n_engines)*10e10/(2*6966) / DensityRatio / (self.V_tip**3 * self.diam_prop**2)
         TipMach = self.V_tip/Units.mToft(ISA.atmosphere.astd(Altitude))
 
+        if self.eta_table is not None:
+            eta_prop = self.eta_table(AdvanceRatio, PowerCoeff, TipMach)
+            if eta_prop == eta_prop:   # NaN outside the table or in a fallback cell
+                return eta_prop
+
         num_blades = self.n_blades
 
         act_factor = self.activity_factor
@@ -61,8 +270,9 @@ class Propeller:
         ichck = 0
         run_flag = 0
         xft = 1.0
-        AF_adj_CP = np.zeros(7)  # AFCP: an AF adjustment of CP to be assigned
-        AF_adj_CT = np.zeros(7)  # AFCT: an AF adjustment of CT to be assigned
+        # AFCP/AFCT: AF adjustments of CP and CT, fixed by the geometry (see _batch_tables)
+        AF_adj_CP = self._batch_tables()['af_cp']
+        AF_adj_CT = self._batch_tables()['af_ct']
         CTT = np.zeros(7)
         BLL = np.zeros(7)
         BLLL = np.zeros(7)
@@ -74,12 +284,6 @@ class Propeller:
         CTTT = np.zeros(4)
         XXXFT = np.zeros(4)
 
-        for k in range(2):
-            AF_adj_CP[k], run_flag = _unint(Act_Factor_arr, AFCPC[k], act_factor)
-            AF_adj_CT[k], run_flag = _unint(Act_Factor_arr, AFCTC[k], act_factor)
-        for k in range(2, 7):
-            AF_adj_CP[k] = AF_adj_CP[1]
-            AF_adj_CT[k] = AF_adj_CT[1]
         if (AdvanceRatio <= 0.5):
             AFCTE = 2.*AdvanceRatio * \
                 (AF_adj_CT[1] - AF_adj_CT[0]) + AF_adj_CT[0]
@@ -317,4 +521,114 @@ class Propeller:
         # print('--'*20) 
 
 
-        return eta_prop
\ No newline at end of file
+        return eta_prop
+
+    def ComputePropEfficiencyBatch(self, Altitude, Velocity, ShaftPower):
+        """Array-in/array-out version of :meth:`ComputePropEfficiency`.
+
+        Same inputs (altitude [m], TAS [m/s], total shaft power [W]), broadcast against each
+        other; returns a float for scalar inputs and an array otherwise. Every chart lookup
+        is a vectorized 4-point interpolation (:func:`_unint_vec`, :func:`_biquad_vec`) and the
+        thrust-coefficient iteration runs on all points at once, each point freezing as soon
+        as it converges. Agrees with the scalar routine to round-off; the out-of-table
+        diagnostics it prints are not repeated. Meant for many points (mission time series):
+        a single point is cheaper through the scalar routine.
+        """
+        scalar = all(np.ndim(v) == 0 for v in (Altitude, Velocity, ShaftPower))
+        shape = np.broadcast(Altitude, Velocity, ShaftPower).shape
+        alt, vel, power = (np.ravel(v) for v in np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in (Altitude, Velocity, ShaftPower))))
+
+        Velocity = Units.mToft(vel)
+        AdvanceRatio = np.pi * Velocity / self.V_tip
+        DensityRatio = ISA.atmosphere.RHOstd(alt, self.aircraft.constraint.DISA) / ISA.atmosphere.Rho_sls
+        PowerCoeff = Units.wTohp(power/self.n_engines)*10e10/(2*6966) / DensityRatio / (self.V_tip**3 * self.diam_prop**2)
+        TipMach = self.V_tip / Units.mToft(ISA.atmosphere.astd(alt))
+        FlightMach = Speed.TAS2Mach(Units.ftTom(Velocity), alt)
+        eta_prop = self._efficiency_batch(AdvanceRatio, PowerCoeff, TipMach, FlightMach)
+        return float(eta_prop[0]) if scalar else eta_prop.reshape(shape)
+
+    def _efficiency_batch(self, AdvanceRatio, PowerCoeff, TipMach, FlightMach, strict=True):
+        """Chart logic of :meth:`ComputePropEfficiencyBatch` on non-dimensional 1-D arrays.
+
+        With ``strict=False`` points whose thrust-coefficient iteration does not converge
+        return NaN instead of raising.
+        """
+        tab = self._batch_tables()
+        n_pts = len(AdvanceRatio)
+        af_cp, af_ct = tab['af_cp'], tab['af_ct']
+        AFCTE = np.where(AdvanceRatio <= 0.5,
+                         2.*AdvanceRatio*(af_ct[1] - af_ct[0]) + af_ct[0], af_ct[1])
+        J_begin = np.searchsorted([1.0, 1.5, 2.0], AdvanceRatio)
+        J_windows = tab['j_windows'][J_begin]
+        TFCLII = _unint_vec(advance_ratio_array, TF_CLI_arr, AdvanceRatio)
+        cl_rows, cl_w = tab['cl_rows'], tab['cl_w']
+
+        # Compressibility margin per design-lift-coefficient table (independent of CT).
+        DMN = [np.where(AdvanceRatio != 0.0,
+                        FlightMach - _unint_vec(advance_ratio_array2, mach_corr_table[c], AdvanceRatio),
+                        TipMach - mach_tip_corr_arr[c]) for c in cl_rows]
+
+        ct_blades, xft_blades = [], []
+        for b in tab['blades']:
+            # Baseline blade angle -> thrust coefficient at the four J nodes around each point.
+            CTT = np.empty((n_pts, 4))
+            for m in range(4):
+                kdx = J_begin + m
+                CP_Eff = PowerCoeff*af_cp[kdx]
+                PBL = _unint_vec(CPEC, BL_P_corr_table[b], CP_Eff)
+                CPE1 = CP_Eff*PBL*PF_CLI_arr[kdx]
+                PCLI = 0.0
+                for w, c in zip(cl_w, cl_rows):
+                    xa, ya = tab['cp_cli'][c]
+                    PCLI = PCLI + w*_unint_vec(xa, ya, np.maximum(CPE1, xa[0]))
+                CP_Eff = CP_Eff*PCLI
+                n = ang_arr_len[kdx]
+                BLL = _unint_vec(tab['cp_angle'][b][kdx], Blade_angle_table[kdx], CP_Eff, n)
+                CTT[:, m] = _unint_vec(tab['blade_angle'][kdx], CT_Angle_table[b][kdx], BLL, n)
+            CTTT = _unint_vec(J_windows, CTT, AdvanceRatio, 4)
+
+            # Secant iteration on CT (see the scalar routine), all points together.
+            CTG = np.zeros((11, n_pts))
+            CTG1 = np.zeros((11, n_pts))
+            CTG[0], CTG[1] = .100, .200
+            ct = np.zeros(n_pts)
+            xft = np.ones(n_pts)
+            done = np.zeros(n_pts, dtype=bool)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                for il in range(10):
+                    CT_Eff = CTG[il]*AFCTE
+                    TBL = _unint_vec(CTEC, BL_T_corr_table[b], CT_Eff)
+                    CTE1 = CT_Eff*TBL*TFCLII
+                    TCLII, xft_il = 0.0, 0.0
+                    for w, c, dmn in zip(cl_w, cl_rows, DMN):
+                        xa, ya = tab['ct_cli'][c]
+                        TX = _unint_vec(xa, ya, np.maximum(CTE1, xa[0]))
+                        XF = np.where(dmn > 0.0, _biquad_vec(comp_mach_CT_arr, 1, dmn, CT_Eff*TX*TBL), 1.0)
+                        TCLII = TCLII + w*TX
+                        xft_il = xft_il + w*XF
+                    CTG1[il] = CTG[il]*AFCTE*TCLII - CTTT
+                    hit = ~done & (np.abs(CTG1[il]/CTTT) < 0.001)
+                    ct[hit] = CTG[il][hit]
+                    xft[hit] = xft_il[hit]
+                    done |= hit
+                    if il > 0:
+                        CTG[il+1] = -CTG1[il-1]*(CTG[il] - CTG[il-1])/(CTG1[il] - CTG1[il-1]) + CTG[il-1]
+                        stop = ~done & (CTG[il+1] <= 0)
+                        ct[stop] = 0.0
+                        xft[stop] = xft_il[stop]
+                        done |= stop
+                    if done.all():
+                        break
+            if strict and not done.all():
+                raise ValueError(
+                    "Integrated design cl adjustment not working properly for ct "
+                    f"definition (blade table {b})"
+                )
+            ct[~done] = np.nan
+            ct_blades.append(ct)
+            xft_blades.append(xft)
+
+        ThrustCoeff = sum(w*ct for w, ct in zip(tab['blade_w'], ct_blades))
+        comp_tip_loss_factor = sum(w*x for w, x in zip(tab['blade_w'], xft_blades))
+        return AdvanceRatio*ThrustCoeff*comp_tip_loss_factor/PowerCoeff
@@ -1,8 +1,9 @@
 """Hamilton-Standard propeller chart data + interpolation primitives.
 
 Lookup tables (activity factor, blade-angle, power/thrust-coefficient maps, Mach and
-blade-count corrections) and the 1-D/2-D interpolation helpers (``_unint``, ``_biquad``)
-used by the Hamilton-Standard propeller model in :mod:`.propeller_hamilton`. Pure data +
+blade-count corrections) and the 1-D/2-D interpolation helpers (``_unint``, ``_biquad`` and
+their array versions ``_unint_vec``, ``_biquad_vec``) used by the Hamilton-Standard propeller
+model in :mod:`.propeller_hamilton`. Pure data +
 numpy; not used by the data-trained :mod:`.propeller_surrogate`.
 """
 
@@ -247,6 +248,109 @@ def _biquad(T, i, xi, yi):
     return z, lmt
 
 
+def _unint_weights(xa, x):
+    """Weights ``w`` such that ``_unint(xa, ya, x)[0] == w @ ya`` for a fixed ``xa`` and ``x``.
+
+    :func:`_unint` is linear in ``ya``, so a lookup whose abscissa and query are both fixed
+    (e.g. the design lift coefficient or the blade count) reduces to a dot product.
+    """
+    eye = np.eye(len(xa))
+    return np.array([_unint(xa, eye[j], x)[0] for j in range(len(xa))])
+
+
+def _gather(a, k):
+    """``a[k]`` for one shared table row ``a`` (1-D) or ``a[p, k[p]]`` for per-point rows (2-D)."""
+    if a.ndim == 1:
+        return a[k]
+    return np.take_along_axis(a, k[:, None], axis=1)[:, 0]
+
+
+def _four_point(x0, x1, x2, x3, x, ra):
+    """Coefficients of the 4-point slope-continuous interpolation shared by _unint and _biquad."""
+    rb = 1.0 - ra
+    p1 = x1 - x0
+    p2 = x2 - x1
+    p3 = x3 - x2
+    p4 = p1 + p2
+    p5 = p2 + p3
+    d1 = x - x0
+    d2 = x - x1
+    d3 = x - x2
+    d4 = x - x3
+    c1 = ra / p1 * d2 / p4 * d3
+    c2 = -ra / p1 * d1 / p2 * d3 + rb / p2 * d3 / p5 * d4
+    c3 = ra / p2 * d1 / p4 * d2 - rb / p2 * d2 / p3 * d4
+    c4 = rb / p5 * d2 / p3 * d3
+    return c1, c2, c3, c4
+
+
+def _unint_vec(xa, ya, x, n=None):
+    """Vectorized :func:`_unint` (value only) at the points ``x`` (1-D array).
+
+    ``xa`` and ``ya`` are either one table shared by all points (1-D) or one table row per
+    point (2-D). Per-point rows may be padded past their length ``n`` (int or per-point
+    ints); the padding of ``xa`` must be ``+inf``. The interval is located by counting the
+    nodes below ``x`` (a broadcast ``searchsorted``) instead of a linear scan.
+    """
+    xa, ya = np.asarray(xa, dtype=float), np.asarray(ya, dtype=float)
+    if n is None:
+        n = xa.shape[-1]
+    idx = np.sum(xa < x[:, None], axis=-1)           # first node >= x
+    i = np.clip(idx, 1, n - 1)
+    first, last = idx == 1, i == n - 1
+    jx1 = np.where(first, 0, np.where(last, n - 4, i - 2))
+    xi, xim1 = _gather(xa, i), _gather(xa, i - 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ra = np.where(first, 1.0, np.where(last, 0.0, (xi - x) / (xi - xim1)))
+        c1, c2, c3, c4 = _four_point(_gather(xa, jx1), _gather(xa, jx1 + 1),
+                                     _gather(xa, jx1 + 2), _gather(xa, jx1 + 3), x, ra)
+        y = (_gather(ya, jx1) * c1 + _gather(ya, jx1 + 1) * c2
+             + _gather(ya, jx1 + 2) * c3 + _gather(ya, jx1 + 3) * c4)
+    y = np.where(xi == x, _gather(ya, i), y)          # at a node
+    y = np.where(idx == 0, _gather(ya, np.zeros_like(idx)), y)    # at / off the low end
+    return np.where(idx >= n, _gather(ya, np.broadcast_to(n - 1, idx.shape)), y)   # off high end
+
+
+def _biquad_vec(T, i, xi, yi):
+    """Vectorized :func:`_biquad` (value only) at the points ``(xi, yi)`` (1-D arrays).
+
+    Reproduces the scalar routine, including its clamping of ``x`` at the low end and of
+    ``y`` at both ends, and its zero result for ``x`` past the last tabulated value.
+    """
+    nx, ny = int(T[i]), int(T[i + 1])
+    xs = np.asarray(T[i + 2:i + 2 + nx], dtype=float)
+
+    def bracket(nodes, v, count):
+        jn = np.sum(nodes < v[:, None], axis=-1)       # first node >= v
+        high = jn == count
+        v = np.where(high, nodes[-1], np.where((jn == 0) & (nodes[np.minimum(jn, count - 1)] != v),
+                                                nodes[0], v))
+        j = np.minimum(jn, count - 1)
+        lo = (jn <= 1) & ~high
+        end = (j == count - 1) | high
+        j1 = np.where(lo, 0, np.where(end, count - 4, j - 2))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ra = np.where(lo, 1.0, np.where(end, 0.0,
+                                            (nodes[j] - v) / (nodes[j] - nodes[np.maximum(j - 1, 0)])))
+        c = _four_point(nodes[j1], nodes[j1 + 1], nodes[j1 + 2], nodes[j1 + 3], v, ra)
+        return j1, c, high
+
+    jx1, cx, off_high = bracket(xs, np.asarray(xi, dtype=float), nx)
+    if ny == 0:
+        vals = np.asarray(T[i + 2 + nx:i + 2 + 2 * nx], dtype=float)
+        z = sum(cx[k] * vals[jx1 + k] for k in range(4))
+    else:
+        ys = np.asarray(T[i + 2 + nx:i + 2 + nx + ny], dtype=float)
+        Z = np.asarray(T[i + 2 + nx + ny:i + 2 + nx + ny + nx * ny], dtype=float).reshape(nx, ny)
+        jy1, cy, _ = bracket(ys, np.asarray(yi, dtype=float), ny)
+        z = 0.0
+        for m in range(4):
+            yt = (cx[0] * Z[jx1, jy1 + m] + cx[1] * Z[jx1 + 1, jy1 + m]
+                  + cx[2] * Z[jx1 + 2, jy1 + m] + cx[3] * Z[jx1 + 3, jy1 + m])
+            z = z + cy[m] * yt
+    return np.where(off_high, 0.0, z)
+
+
 # block auto-formatting of tables
 # autopep8: off
 # fmt: off
@@ -3,18 +3,60 @@
 ``PropellerSurrogate`` reads a CSV of propeller performance
 (``data/propeller_data_rbf.csv``: power, altitude, airspeed, rpm, pitch, efficiency) and fits
 radial-basis-function maps for (a) the pitch governor — the pitch needed to hold a target
-rpm — and (b) the efficiency. This is the *data-driven* propeller model (needs pandas); for
-the analytic Hamilton-Standard model see :mod:`.propeller_hamilton`.
+rpm — and (b) the efficiency. This is the *data-driven* propeller model (training needs
+pandas); for the analytic Hamilton-Standard model see :mod:`.propeller_hamilton`.
+
+The fitted maps are evaluated by :class:`RBFKernel` (centers, weights and shape parameter of
+the multiquadric ``Rbf``), which takes whole arrays of query points at once. The offline step
+:mod:`.train_propeller_surrogate` writes them, with the normalization, to
+``data/propeller_rbf.npz``; :meth:`PropellerSurrogate.load_npz` restores the surrogate from it
+without pandas and without re-fitting.
 """
 
 import sys
 import os
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
 from scipy.interpolate import Rbf
 import pickle
 
+_NPZ_PATH = os.path.join(os.path.dirname(__file__), "data", "propeller_rbf.npz")
+_PARAM_KEYS = ('p_min', 'p_max', 'a_min', 'a_max', 'v_min', 'v_max',
+               'r_min', 'r_max', 'b_min', 'b_max')
+
+
+class RBFKernel:
+    """Batched evaluation of a fitted multiquadric RBF, ``sum_i w_i sqrt((|x - c_i|/eps)^2 + 1)``.
+
+    Reproduces ``scipy.interpolate.Rbf(..., function='multiquadric')`` (Euclidean norm) for M
+    query points as one ``(M, N)`` distance matrix built with a matrix product, instead of the
+    legacy per-call overhead of ``Rbf.__call__``. There is deliberately no nearest-centers
+    truncation: the multiquadric basis grows with distance and the fitted weights alternate in
+    sign, so dropping far centers is not a small error (tens of degrees of pitch on the
+    packaged data).
+    """
+
+    def __init__(self, centers, weights, epsilon):
+        self.centers = np.ascontiguousarray(centers, dtype=float)   # (N, ndim)
+        self.weights = np.asarray(weights, dtype=float)               # (N,)
+        self.epsilon = float(epsilon)
+        self._c2 = np.einsum('ij,ij->i', self.centers, self.centers)
+
+    @classmethod
+    def from_rbf(cls, rbf):
+        """Extract the kernel of a fitted multiquadric ``scipy.interpolate.Rbf``."""
+        if rbf.function != 'multiquadric' or rbf.norm != 'euclidean':
+            raise ValueError("RBFKernel supports Euclidean multiquadric Rbf models only, got "
+                             f"function={rbf.function!r}, norm={rbf.norm!r}")
+        return cls(rbf.xi.T, rbf.nodes, rbf.epsilon)
+
+    def __call__(self, *coords):
+        coords = np.broadcast_arrays(*[np.asarray(c, dtype=float) for c in coords])
+        shape = coords[0].shape
+        X = np.stack([c.ravel() for c in coords], axis=1)             # (M, ndim)
+        r2 = np.einsum('ij,ij->i', X, X)[:, None] + self._c2[None, :] - 2.0 * X @ self.centers.T
+        phi = np.sqrt(np.maximum(r2, 0.0) / self.epsilon ** 2 + 1.0)
+        return (phi @ self.weights).reshape(shape)
+
 # ==========================================
 # 1. FAST SURROGATE MODEL
 # ==========================================
@@ -23,6 +65,7 @@ class PropellerSurrogate:
         if not os.path.exists(csv_filename):
             raise FileNotFoundError(f"CRITICAL: Data file not found at {csv_filename}")
 
+        import pandas as pd
         print(f"Loading surrogate data from: {csv_filename} ...")
         df = pd.read_csv(csv_filename)
 
@@ -67,20 +110,23 @@ class PropellerSurrogate:
 
         # Train Models
         print("Training Pitch Solver (Governor)...")
-        self.pitch_model = Rbf(p_n, a_n, v_n, r_n, b_n, function='multiquadric', smooth=0.1)
+        self.pitch_model = RBFKernel.from_rbf(
+            Rbf(p_n, a_n, v_n, r_n, b_n, function='multiquadric', smooth=0.1))
 
         print("Training Efficiency Model...")
-        self.eff_model = Rbf(p_n, a_n, v_n, b_n, r_n, e, function='multiquadric', smooth=0.1)
+        self.eff_model = RBFKernel.from_rbf(
+            Rbf(p_n, a_n, v_n, b_n, r_n, e, function='multiquadric', smooth=0.1))
         print("Surrogate models ready.\n")
 
     def _norm(self, val, key):
         denom = self.params[f'{key}_max'] - self.params[f'{key}_min']
-        if denom == 0: return 0.0 
-        norm = (val - self.params[f'{key}_min']) / denom
+        if denom == 0: return np.zeros_like(np.asarray(val, dtype=float))
+        norm = (np.asarray(val, dtype=float) - self.params[f'{key}_min']) / denom
         return np.clip(norm, 0.0, 1.0) 
 
     # PITCH GOVERNOR LOGIC: As inputs user gives Power, Altitude, Speed, and a target RPM.
     # It learns to predict the exact blade Pitch required to maintain that RPM.
+    # Inputs may be scalars (float returned) or arrays (broadcast, ndarray returned).
     def solve_pitch(self, power_kw, alt_m, speed_ms, target_rpm):
         p_n = self._norm(power_kw, 'p')
         a_n = self._norm(alt_m, 'a')
@@ -89,7 +135,7 @@ class PropellerSurrogate:
 
         b_n_pred = self.pitch_model(p_n, a_n, v_n, r_n)
         pitch_deg = b_n_pred * (self.params['b_max'] - self.params['b_min']) + self.params['b_min']
-        return float(pitch_deg)
+        return _scalar_or_array(pitch_deg)
 
     # Function that predicts efficiency given all inputs.
     # This is used to create the efficiency map and to evaluate the performance at the end.
@@ -101,7 +147,31 @@ class PropellerSurrogate:
         r_n = self._norm(rpm, 'r')
 
         eff = self.eff_model(p_n, a_n, v_n, b_n, r_n)
-        return float(np.clip(eff, 0.01, 0.99)) 
+        return _scalar_or_array(np.clip(eff, 0.01, 0.99))
+
+    # COMPACT ARTIFACT: kernels + normalization in one .npz (see train_propeller_surrogate.py)
+    def save_npz(self, filename=_NPZ_PATH):
+        """Write the fitted kernels and the normalization to a compact ``.npz``."""
+        np.savez_compressed(
+            filename,
+            params=np.array([self.params[k] for k in _PARAM_KEYS], dtype=float),
+            pitch_centers=self.pitch_model.centers, pitch_weights=self.pitch_model.weights,
+            pitch_epsilon=self.pitch_model.epsilon,
+            eff_centers=self.eff_model.centers, eff_weights=self.eff_model.weights,
+            eff_epsilon=self.eff_model.epsilon)
+        return filename
+
+    @classmethod
+    def load_npz(cls, filename=_NPZ_PATH):
+        """Restore a surrogate from :meth:`save_npz` output (no pandas, no re-fitting)."""
+        self = cls.__new__(cls)
+        with np.load(filename) as npz:
+            self.params = dict(zip(_PARAM_KEYS, npz['params'].tolist()))
+            self.pitch_model = RBFKernel(npz['pitch_centers'], npz['pitch_weights'],
+                                         npz['pitch_epsilon'])
+            self.eff_model = RBFKernel(npz['eff_centers'], npz['eff_weights'],
+                                       npz['eff_epsilon'])
+        return self
 
     # SAVE / LOAD METHODS
     def save_model(self, filename="prop_model.pkl"):
@@ -117,10 +187,16 @@ class PropellerSurrogate:
             print(f"Loading model from {filename}...")
             return pickle.load(f)
 
+def _scalar_or_array(value):
+    value = np.asarray(value, dtype=float)
+    return float(value) if value.ndim == 0 else value
+
+
 # ==========================================
 # 2. MAIN EXECUTION
 # ==========================================
 def main():
+    import matplotlib.pyplot as plt
     filename = r"C:\Phlygreen\propeller_data_rbf.csv"
     
     try:
@@ -0,0 +1,130 @@
+"""Process-wide registry of loaded surrogate artifacts.
+
+Every Class-II efficiency model used to load its surrogate in its constructor: the gas-turbine
+response surface unpickles ``GT_Engine_Model_Complete.pkl`` and the propeller surrogate reads
+``propeller_data_rbf.csv`` with pandas and re-fits two ``Rbf`` maps. The powertrain builds its
+models once per design, so a sweep paid that start-up for every point.
+
+The registry loads each artifact once per process and hands the same object to every aircraft.
+Entries are keyed by ``(kind, absolute path, SHA-256 of the file)``: an artifact regenerated on
+disk is picked up on the next request, while an unchanged one is never re-read (the hash itself
+is only recomputed when the file's size or mtime changes). The objects are shared **read-only**;
+callers must not mutate them.
+
+:func:`prewarm` loads the packaged defaults up front, e.g. in the worker initializer of
+:func:`PhlyGreen.run_designs`.
+"""
+
+import hashlib
+import os
+import threading
+
+_LOCK = threading.RLock()
+_LOADED = {}    # (kind, path, sha256) -> loaded surrogate
+_HASHES = {}    # path -> (mtime_ns, size, sha256)
+_MEMOS = {}     # (name, (path, sha256)) -> memo dict of values derived from that artifact
+
+
+def file_hash(path):
+    """SHA-256 of the file at ``path``, cached while its size and mtime are unchanged."""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    cached = _HASHES.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    _HASHES[path] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+def artifact_key(path):
+    """``(absolute path, SHA-256)`` identifying the artifact at ``path``, for :func:`memo`."""
+    path = os.path.abspath(path)
+    return path, file_hash(path)
+
+
+def memo(name, artifact):
+    """Registry-level memo dict ``name`` of the artifact ``artifact`` (see :func:`artifact_key`).
+
+    Values cached there depend only on the artifact, so every model loaded from it shares
+    them; the shared surrogate objects themselves stay read-only.
+    """
+    key = (name, artifact)
+    table = _MEMOS.get(key)
+    if table is None:
+        with _LOCK:
+            table = _MEMOS.setdefault(key, {})
+    return table
+
+
+def get(kind, path, loader):
+    """Return ``loader(path)``, loaded once per ``(kind, path, file hash)`` in this process."""
+    path = os.path.abspath(path)
+    with _LOCK:
+        key = (kind, path, file_hash(path))
+        surrogate = _LOADED.get(key)
+        if surrogate is None:
+            surrogate = _LOADED[key] = loader(path)
+        return surrogate
+
+
+def gas_turbine(path=None, tabulated=False):
+    """Shared :class:`.gas_turbine_surrogate.GasTurbineResponseSurface` (packaged pkl by default).
+
+    ``tabulated=True`` returns a separate instance whose efficiency map has been pre-tabulated.
+    """
+    from .gas_turbine_surrogate import GasTurbineResponseSurface, _DEFAULT_PKL
+    if tabulated:
+        return get("gas_turbine_table", path or _DEFAULT_PKL,
+                   lambda p: GasTurbineResponseSurface(p, tabulate=True))
+    return get("gas_turbine", path or _DEFAULT_PKL, GasTurbineResponseSurface)
+
+
+def propeller(path=None):
+    """Shared :class:`.propeller_surrogate.PropellerSurrogate`.
+
+    Loads the packaged pre-fitted ``propeller_rbf.npz`` by default; a ``.csv`` path is trained.
+    """
+    from .propeller_surrogate import PropellerSurrogate, _NPZ_PATH
+    path = str(path or _NPZ_PATH)
+    loader = PropellerSurrogate.load_npz if path.endswith(".npz") else PropellerSurrogate
+    return get("propeller", path, loader)
+
+
+def emissions(path=None):
+    """Shared :class:`.emissions_surrogate.EmissionSurrogate` (packaged PW127 pkl by default)."""
+    from .emissions_surrogate import EmissionSurrogate, _DEFAULT_PKL
+    path = path or _DEFAULT_PKL
+    if not os.path.isfile(path):
+        return EmissionSurrogate(path)   # raises its explanatory FileNotFoundError
+    return get("emissions", path, EmissionSurrogate)
+
+
+_DEFAULTS = {"gas_turbine": gas_turbine, "propeller": propeller, "emissions": emissions}
+
+
+def prewarm(kinds=None):
+    """Load the packaged surrogates (all by default) into the registry.
+
+    Surrogates whose optional dependency or artifact is missing are skipped. Returns the
+    kinds that were loaded.
+    """
+    loaded = []
+    for kind in kinds or _DEFAULTS:
+        try:
+            surrogate = _DEFAULTS[kind]()
+        except (ImportError, FileNotFoundError):
+            continue
+        if kind == "gas_turbine":
+            surrogate.scaling_n   # calibrate the size-scaling exponent now, not mid-mission
+        loaded.append(kind)
+    return loaded
+
+
+def clear():
+    """Drop every loaded surrogate (the next request reloads from disk)."""
+    with _LOCK:
+        _LOADED.clear()
+        _HASHES.clear()
+        _MEMOS.clear()
@@ -9,8 +9,10 @@ Provenance of the CSV (offline, heavy/optional deps — see ``WIP/phase3_pw127/`
 PW127 cycle maps each operating point to the combustor inlet state, a Cantera Chemical Reactor
 Network (CRN) calibrated to ICAO LTO data turns that state into emission indices, the CO/UHC are
 taken directly from the (PW127-recalibrated) CRN and the NOx keeps the CRN's altitude/Mach/power
-*shape* but is rescaled (anchored) to the PW127 ICAO NOx at the sea-level LTO modes. This trainer
-itself needs only pandas + scipy + scikit-learn.
+*shape* but is rescaled (anchored) to the PW127 ICAO NOx at the sea-level LTO modes. The rows are
+the envelope grid, or an error-driven subset of it (``build_pw127_surrogate.py --adaptive``, see
+:mod:`.adaptive_sampling`); the RBF leave-one-out error printed per output compares the two. This
+trainer itself needs only pandas + scipy + scikit-learn.
 
 Run it:
     cd trunk/PhlyGreen/Systems/Powertrain && python train_emission_surrogate.py
@@ -24,6 +26,13 @@ import pandas as pd
 from scipy.interpolate import Rbf
 from sklearn.preprocessing import StandardScaler
 
+try:
+    from .adaptive_sampling import loo_errors
+except ImportError:  # run as a plain script (no package context)
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from adaptive_sampling import loo_errors
+
 _HERE = os.path.dirname(os.path.abspath(__file__))
 CSV_PATH = os.path.join(_HERE, "data", "PW127_Emission_Map.csv")
 PKL_PATH = os.path.join(_HERE, "data", "Emission_Model_PW127.pkl")
@@ -53,8 +62,13 @@ def main(csv=CSV_PATH, pkl=PKL_PATH, tag="PW127"):
     with open(pkl, "wb") as f:
         pickle.dump(package, f)
     print(f"fitted EI surrogate from {len(df)} points -> {pkl}")
-    for o in OUTPUTS:
-        print(f"  {o}: range [{df[o].min():.3g}, {df[o].max():.3g}] g/kg")
+    fitted = np.column_stack([np.log10(np.clip(df[o], 1e-9, None)) if o in LOG_OUTPUTS else df[o]
+                              for o in OUTPUTS])
+    loo = np.sqrt(np.mean(loo_errors(X, fitted) ** 2, axis=0))
+    for o, e in zip(OUTPUTS, loo):
+        print(f"  {o}: range [{df[o].min():.3g}, {df[o].max():.3g}] g/kg, "
+              f"dataset (interpolating RBF) leave-one-out error {e:.2%} of range"
+              f"{' (log10)' if o in LOG_OUTPUTS else ''}")
     return package
 
 
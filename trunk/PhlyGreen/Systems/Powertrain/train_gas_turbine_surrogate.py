@@ -11,8 +11,10 @@ time (keyed on the nominal power chosen before sizing) by
 altitude analytically (ISA pressure ratio), so no power-limit surrogate is stored. The dry
 engine mass remains a physics correlation of the design power.
 
-The CSV itself comes from the pycycle engine cycle in ``data/Single_spool_GT.py``. Re-run
-this script to regenerate the pkl after regenerating the CSV. Requires pandas + scikit-learn.
+The CSV itself comes from the pycycle engine cycle in ``data/Single_spool_GT.py`` (a grid,
+or ``--adaptive`` error-driven sampling with :mod:`.adaptive_sampling`); the RBF
+leave-one-out error printed here compares the two. Re-run this script to regenerate the pkl
+after regenerating the CSV. Requires pandas + scikit-learn.
 
 Run it:
     cd trunk/PhlyGreen/Systems/Powertrain && python train_gas_turbine_surrogate.py
@@ -27,10 +29,12 @@ from scipy.interpolate import Rbf
 from sklearn.preprocessing import StandardScaler
 
 try:
+    from .adaptive_sampling import loo_errors
     from .gas_turbine_surrogate import calibrate_scaling_exponent
 except ImportError:  # run as a plain script (no package context)
     import sys
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from adaptive_sampling import loo_errors
     from gas_turbine_surrogate import calibrate_scaling_exponent
 
 _HERE = os.path.dirname(os.path.abspath(__file__))
@@ -69,6 +73,8 @@ def main():
     print("Training universal efficiency model...")
     X_raw = df[["Altitude_ft", "Mach", "Power"]].values
     y_eff = df["Efficiency"].values
+    loo = np.sqrt(np.mean(loo_errors(X_raw, y_eff) ** 2))
+    print(f"  dataset (interpolating RBF) leave-one-out error: {loo:.2%} of the efficiency range")
     scaler_eff = StandardScaler()
     X_scaled = scaler_eff.fit_transform(X_raw)
     rbf_efficiency = Rbf(X_scaled[:, 0], X_scaled[:, 1], X_scaled[:, 2], y_eff,
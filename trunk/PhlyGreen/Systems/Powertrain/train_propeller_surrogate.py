@@ -0,0 +1,56 @@
+"""Offline builder for the propeller RBF artifact (not used at run time).
+
+Fits the pitch-governor and efficiency RBF maps of :class:`.propeller_surrogate.PropellerSurrogate`
+from ``data/propeller_data_rbf.csv`` and writes their centers, weights and shape parameters,
+plus the min-max normalization, to ``data/propeller_rbf.npz``. The runtime loads that file with
+:meth:`PropellerSurrogate.load_npz` — no pandas and no re-fitting. Re-run this script after
+regenerating the CSV (``data/PropellerGenerationCSV.py``, a grid or ``--adaptive``; the RBF
+leave-one-out error printed here compares the two). Requires pandas.
+
+Run it:
+    cd trunk/PhlyGreen/Systems/Powertrain && python train_propeller_surrogate.py
+"""
+
+import os
+
+import numpy as np
+
+try:
+    from .adaptive_sampling import loo_errors
+    from .propeller_surrogate import PropellerSurrogate
+except ImportError:  # run as a plain script (no package context)
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from adaptive_sampling import loo_errors
+    from propeller_surrogate import PropellerSurrogate
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+CSV_PATH = os.path.join(_HERE, "data", "propeller_data_rbf.csv")
+NPZ_PATH = os.path.join(_HERE, "data", "propeller_rbf.npz")
+
+
+def main():
+    import pandas as pd
+    df = pd.read_csv(CSV_PATH)
+    loo = np.sqrt(np.mean(loo_errors(df[["EM_Power_kW", "Altitude_m", "Airspeed_m_s"]],
+                                     df[["RPM", "Pitch", "Efficiency"]]) ** 2, axis=0))
+    print("dataset (interpolating RBF) leave-one-out error (RPM, pitch, efficiency): "
+          + ", ".join(f"{e:.2%}" for e in loo) + " of range")
+
+    surrogate = PropellerSurrogate(CSV_PATH)
+    surrogate.save_npz(NPZ_PATH)
+
+    # Round-trip check on a spread of operating points.
+    loaded = PropellerSurrogate.load_npz(NPZ_PATH)
+    rng = np.random.default_rng(0)
+    p = rng.uniform(100.0, 2500.0, 200)
+    a = rng.uniform(0.0, 9000.0, 200)
+    v = rng.uniform(30.0, 170.0, 200)
+    pitch = loaded.solve_pitch(p, a, v, 1200.0)
+    diff = np.max(np.abs(pitch - surrogate.solve_pitch(p, a, v, 1200.0)))
+    print(f"SUCCESS: propeller artifact saved to {NPZ_PATH} "
+          f"({os.path.getsize(NPZ_PATH) / 1024:.0f} kB, max pitch round-trip error {diff:.1e} deg)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,12 @@ import numpy as np
 import CoolProp.CoolProp as CP
 import warnings
 
+from .saturation import DP_EPS, saturation_table
+
+# Para-hydrogen property backends of time_step: spline tables of the saturation curves
+# (default) or the exact CoolProp PropsSI calls.
+PROPERTY_BACKENDS = ('Table', 'PropsSI')
+
 # --- DATABASE IMPORT MANAGEMENT (Strict Fail-Fast) ---
 try:
     from PhlyGreen.Systems.Serbatoio_H2.TANK_Database import TANK_Database
@@ -26,6 +32,61 @@ def get_isa_atmosphere(altitude_m):
     return T_amb, P_amb
 
 
+# ==========================================
+# 0b. TANK HISTORY (preallocated arrays)
+# ==========================================
+class TankHistory:
+    """Tank time history stored in preallocated NumPy arrays.
+
+    Reads like the former dict of lists: ``history['P']`` returns the filled part of that
+    channel as an array (a view, valid until the next append). Rows are appended one at a
+    time by ``LH2_Tank.time_step`` or as blocks by the coupled mission integration; the
+    storage doubles when full.
+    """
+
+    FIELDS = ('t', 'P', 'm_tot', 'Vent', 'Q_in', 'Alt', 'Q_heater', 'm_vent_cum', 'Consumption')
+
+    def __init__(self, capacity=512):
+        self._index = {key: j for j, key in enumerate(self.FIELDS)}
+        self._data = np.empty((len(self.FIELDS), capacity))
+        self.size = 0
+
+    def _reserve(self, n):
+        if self.size + n > self._data.shape[1]:
+            grown = np.empty((len(self.FIELDS), max(2 * self._data.shape[1], self.size + n)))
+            grown[:, :self.size] = self._data[:, :self.size]
+            self._data = grown
+
+    def append(self, *row):
+        """Append one row, values in ``FIELDS`` order."""
+        self._reserve(1)
+        self._data[:, self.size] = row
+        self.size += 1
+
+    def extend(self, rows):
+        """Append a block of rows given as a (fields x points) array, in ``FIELDS`` order."""
+        rows = np.asarray(rows, dtype=float)
+        self._reserve(rows.shape[1])
+        self._data[:, self.size:self.size + rows.shape[1]] = rows
+        self.size += rows.shape[1]
+
+    def __getitem__(self, key):
+        return self._data[self._index[key], :self.size]
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __len__(self):
+        return self.size
+
+    def keys(self):
+        return self.FIELDS
+
+    def to_dict(self):
+        """Copy of the history as ``{field: array}``."""
+        return {key: self[key].copy() for key in self.FIELDS}
+
+
 # ==========================================
 # 1. LH2 TANK CLASS (Data-Driven)
 # ==========================================
@@ -48,6 +109,10 @@ class LH2_Tank:
         self.max_diameter_limit = TankInput['Max Diameter']
         self.n_tanks = int(TankInput['Number of Tanks'])
         model_key = TankInput['Tank Model']
+        self.property_backend = TankInput.get('Property Backend') or 'Table'
+        if self.property_backend not in PROPERTY_BACKENDS:
+            raise ValueError(f"CRITICAL ERROR: Unknown tank property backend '{self.property_backend}' "
+                             f"(expected one of {PROPERTY_BACKENDS}).")
 
         self.m_tot_capacity = capacity_kg
         self.fluid = 'ParaHydrogen'
@@ -106,9 +171,17 @@ class LH2_Tank:
         self.Nt = params['Nt']
         self.eps = params['eps']
 
+        # Saturation tables over the regulated pressure window, shared by all tanks
+        self.saturation = None
+        if self.property_backend == 'Table':
+            self.saturation = saturation_table(self.fluid, self.P_min, self.P_max)
+
         # --- 3. GEOMETRIC SIZING & SPLITTING LOGIC ---
         try:
-            rho_liq = CP.PropsSI('D', 'P', self.P_min, 'Q', 0, self.fluid)
+            if self.saturation is not None:
+                rho_liq = self.saturation.properties(self.P_min)[3]
+            else:
+                rho_liq = CP.PropsSI('D', 'P', self.P_min, 'Q', 0, self.fluid)
         except Exception:
             rho_liq = 70.0 # Fallback liquid density if CoolProp fails at initialization
 
@@ -200,11 +273,13 @@ class LH2_Tank:
         self.D_outer = 2 * self.r_outer
         
         # Initialize Mission State
+        self.reset_state()
+
+    def reset_state(self):
+        """Full tank at the minimum pressure, with an empty history."""
         self.m_curr = self.capacity_single
         self.P_curr = self.P_min
-        
-        self.history = {'t':[], 'P':[], 'm_tot':[], 'Vent':[], 'Q_in':[], 'Alt':[],
-                        'Q_heater':[], 'm_vent_cum':[], 'Consumption':[]}
+        self.history = TankHistory()
         self.cum_vented_mass = 0.0
 
     def _calculate_structure(self):
@@ -275,6 +350,92 @@ class LH2_Tank:
         
         return (term_cond + term_rad + term_gas) * self.area_inner_tot
 
+    def _saturation_state_exact(self, P, rho_bulk):
+        """Saturation state at pressure ``P`` from CoolProp PropsSI calls.
+
+        Returns (T_sat, h_liq, h_gas, rho_l, rho_g, du_dp_rho), the derivative being a forward
+        difference at constant bulk density.
+        """
+        T_sat = CP.PropsSI('T', 'P', P, 'Q', 0, self.fluid)
+        h_liq = CP.PropsSI('H', 'P', P, 'Q', 0, self.fluid)
+        h_gas = CP.PropsSI('H', 'P', P, 'Q', 1, self.fluid)
+        rho_l = CP.PropsSI('D', 'P', P, 'Q', 0, self.fluid)
+        rho_g = CP.PropsSI('D', 'P', P, 'Q', 1, self.fluid)
+
+        u_bulk = CP.PropsSI('U', 'P', P, 'D', rho_bulk, self.fluid)
+        u_plus = CP.PropsSI('U', 'P', P + DP_EPS, 'D', rho_bulk, self.fluid)
+        du_dp_rho = (u_plus - u_bulk) / DP_EPS
+        return T_sat, h_liq, h_gas, rho_l, rho_g, du_dp_rho
+
+    def _thermo_state(self, P, rho_bulk):
+        """(T_sat, delta_h, rho_star, phi) at pressure ``P`` and bulk density ``rho_bulk``."""
+        try:
+            state = None
+            if self.saturation is not None:
+                state = self.saturation.state(P, rho_bulk)
+            if state is None:
+                # exact backend, or a bulk state outside the tabulated two-phase window
+                state = self._saturation_state_exact(P, rho_bulk)
+            T_sat, h_liq, h_gas, rho_l, rho_g, du_dp_rho = state
+            
+            delta_h = h_gas - h_liq
+            rho_star = rho_g / (rho_l - rho_g)
+            phi = 1.0 / (rho_bulk * du_dp_rho)
+            
+        except Exception:
+            # Fallback values if CoolProp numerical solver fails for a single timestep
+            phi, T_sat = 0.5, 20.0
+            delta_h, rho_star = 445000, 0.05
+        return T_sat, delta_h, rho_star, phi
+
+    def _balance(self, P, m, m_dot_req_total, altitude):
+        """Free-pressure energy balance of one tank.
+
+        Returns (term_heat, term_mass, delta_h, rho_star, phi, Q_mli): the pressure rises
+        when term_heat > term_mass.
+        """
+        T_amb, _ = get_isa_atmosphere(altitude)
+        T_sat, delta_h, rho_star, phi = self._thermo_state(P, m / self.V_internal)
+        Q_mli = self.get_heat_leak(T_sat, T_amb)
+        term_mass = delta_h * (rho_star * m_dot_req_total / self.n_tanks)
+        return 1.3 * Q_mli, term_mass, delta_h, rho_star, phi, Q_mli
+
+    def regulation_mode(self, P, m, m_dot_req_total, altitude):
+        """Pressure regulation mode of a tank at pressure ``P`` holding ``m`` kg.
+
+        'empty' below 1 g of hydrogen; 'vent' at P_max while the free pressure would rise;
+        'heater' at P_min while it would fall; 'free' otherwise.
+        """
+        if m <= 1e-3:
+            return 'empty'
+        term_heat, term_mass = self._balance(P, m, m_dot_req_total, altitude)[:2]
+        if P >= self.P_max and term_heat > term_mass:
+            return 'vent'
+        if P <= self.P_min and term_heat < term_mass:
+            return 'heater'
+        return 'free'
+
+    def regulation_rates(self, P, m, m_dot_req_total, altitude, mode):
+        """Continuous-time form of ``time_step`` for one tank in regulation ``mode``.
+
+        Returns (dP_dt, dm_dt, m_dot_g, Q_heater, Q_mli, switch): the rates of pressure and
+        stored mass, the vent flow and heater power, the heat leak, and the switching
+        function whose zero ends the 'vent' (falling) or 'heater' (rising) mode.
+        """
+        if mode == 'empty':
+            return 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+        term_heat, term_mass, delta_h, rho_star, phi, Q_mli = self._balance(
+            P, m, m_dot_req_total, altitude)
+        m_dot_l = m_dot_req_total / self.n_tanks
+        switch = term_heat - term_mass
+        if mode == 'vent':
+            m_dot_g = max(switch / (delta_h * (1.0 + rho_star)), 0.0)
+            return 0.0, -(m_dot_l + m_dot_g), m_dot_g, 0.0, Q_mli, switch
+        if mode == 'heater':
+            return 0.0, -m_dot_l, 0.0, max(-switch, 0.0), Q_mli, switch
+        dP_dt = (2.0 * phi / self.V_internal) * switch
+        return dP_dt, -m_dot_l, 0.0, 0.0, Q_mli, switch
+
     def time_step(self, dt, m_dot_req_total, altitude):
         """
         Advances the thermodynamic state of the tank by one time step (dt).
@@ -282,16 +443,10 @@ class LH2_Tank:
         """
         if self.m_curr <= 1e-3:
             self.m_curr = 0.0
-            t_now = self.history['t'][-1] + dt if self.history['t'] else 0
-            self.history['t'].append(t_now)
-            self.history['P'].append(self.P_curr/1e5)
-            self.history['m_tot'].append(0.0)
-            self.history['Vent'].append(0.0)
-            self.history['Alt'].append(altitude)
-            self.history['Q_in'].append(0.0)
-            self.history['Q_heater'].append(0.0)
-            self.history['m_vent_cum'].append(self.cum_vented_mass)
-            self.history['Consumption'].append(0.0)   # tank empty: no feed to the fuel cell
+            t_now = self.history['t'][-1] + dt if len(self.history) else 0
+            # tank empty: no feed to the fuel cell
+            self.history.append(t_now, self.P_curr/1e5, 0.0, 0.0, 0.0, altitude, 0.0,
+                                self.cum_vented_mass, 0.0)
             return self.P_curr, 0.0, 0.0
 
         m_dot_fuel = m_dot_req_total / self.n_tanks
@@ -299,27 +454,7 @@ class LH2_Tank:
         T_amb, P_amb = get_isa_atmosphere(altitude)
         
         # --- THERMODYNAMIC STATE EVALUATION ---
-        try:
-            T_sat = CP.PropsSI('T', 'P', self.P_curr, 'Q', 0, self.fluid)
-            h_liq = CP.PropsSI('H', 'P', self.P_curr, 'Q', 0, self.fluid)
-            h_gas = CP.PropsSI('H', 'P', self.P_curr, 'Q', 1, self.fluid)
-            rho_l = CP.PropsSI('D', 'P', self.P_curr, 'Q', 0, self.fluid)
-            rho_g = CP.PropsSI('D', 'P', self.P_curr, 'Q', 1, self.fluid)
-            
-            delta_h = h_gas - h_liq
-            rho_star = rho_g / (rho_l - rho_g)
-            
-            u_bulk = CP.PropsSI('U', 'P', self.P_curr, 'D', rho_bulk, self.fluid)
-            dP_eps = 100.0
-            u_plus = CP.PropsSI('U', 'P', self.P_curr + dP_eps, 'D', rho_bulk, self.fluid)
-            du_dp_rho = (u_plus - u_bulk) / dP_eps
-            phi = 1.0 / (rho_bulk * du_dp_rho)
-            
-        except Exception:
-            # Fallback values if CoolProp numerical solver fails for a single timestep
-            phi, T_sat = 0.5, 20.0
-            h_liq, h_gas = 0, 445000
-            delta_h, rho_star = 445000, 0.05
+        T_sat, delta_h, rho_star, phi = self._thermo_state(self.P_curr, rho_bulk)
 
         Q_mli = self.get_heat_leak(T_sat, T_amb)
         
@@ -359,17 +494,10 @@ class LH2_Tank:
         
         self.cum_vented_mass += (m_dot_g * dt * self.n_tanks)
         
-        # Log History
-        t_now = self.history['t'][-1] + dt if self.history['t'] else 0
-        self.history['t'].append(t_now)
-        self.history['P'].append(self.P_curr/1e5)
-        self.history['m_tot'].append(self.m_curr * self.n_tanks)
-        self.history['Vent'].append(m_dot_g * self.n_tanks)
-        self.history['Alt'].append(altitude)
-        self.history['Q_in'].append(Q_mli * self.n_tanks)
-        self.history['Q_heater'].append(Q_heater * self.n_tanks)
-        self.history['m_vent_cum'].append(self.cum_vented_mass)
-        # H2 mass flow drawn from the tank to feed the fuel cell (total over all tanks).
-        self.history['Consumption'].append(m_dot_req_total)
+        # Log History (Consumption: H2 mass flow drawn to feed the fuel cell, all tanks)
+        t_now = self.history['t'][-1] + dt if len(self.history) else 0
+        self.history.append(t_now, self.P_curr/1e5, self.m_curr * self.n_tanks,
+                            m_dot_g * self.n_tanks, Q_mli * self.n_tanks, altitude,
+                            Q_heater * self.n_tanks, self.cum_vented_mass, m_dot_req_total)
 
         return self.P_curr, self.m_curr * self.n_tanks, m_dot_g * self.n_tanks
\ No newline at end of file
@@ -10,7 +10,7 @@ back to a simple gravimetric-index tank model when CoolProp is unavailable). Imp
 package without CoolProp raises ImportError by design.
 """
 
-from .Tank import LH2_Tank, get_isa_atmosphere
+from .Tank import LH2_Tank, TankHistory, get_isa_atmosphere
 from .TANK_Database import TANK_Database
 
-__all__ = ["LH2_Tank", "get_isa_atmosphere", "TANK_Database"]
+__all__ = ["LH2_Tank", "TankHistory", "get_isa_atmosphere", "TANK_Database"]
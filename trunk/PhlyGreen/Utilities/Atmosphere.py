@@ -10,21 +10,28 @@ class Atmosphere:
         self.delta = (self.gammaair - 1)/self.gammaair
         self.a_sls = np.sqrt(self.gammaair * self.Rair * self.T_sls) #m/s
 
+        # ISA layers (troposphere, tropopause, lower stratosphere): base geopotential
+        # altitude [m], top [m], base temperature [K], lapse rate [K/km]
+        self._zstd = np.array([0., 11000., 20000.])
+        self._ztop = np.array([11000., 20000., 32000.])
+        self._T0 = np.array([288.15, 216.65, 216.65])
+        self._Lstd = np.array([-6.5, 0., 1.])
+
 
     def Tstd(self,h):
-        def z(h):
-            r0 = 6356577
-            return r0*h/(r0+h)
-        
-        def i(z):
-            return np.piecewise(z,[z <= 11000, 11000 < z <= 20000, 20000 < z <= 32000], [0,1,2])
-        
-        Lstd = [-6.5, 0 , 1]
-        zstd = [0, 11000, 20000]
-        T_0 = [288.15,216.65,216.65]
-        j=int(i(z(h)))
-
-        return T_0[j] + Lstd[j] * (z(h)-zstd[j]) / 1000
+        """Standard temperature [K] at geometric altitude h [m] (scalar or array).
+
+        The layer index comes from one ``searchsorted`` on the layer tops instead of a
+        ``np.piecewise`` + ``int()`` cast, so whole altitude arrays are evaluated at once.
+        Altitudes outside the tabulated layers (z <= 0 or z > 32 km) use the troposphere
+        lapse, as before.
+        """
+        r0 = 6356577
+        h = np.asarray(h, dtype=float)
+        z = r0*h/(r0+h)
+        j = np.searchsorted(self._ztop, z, side='left')
+        j = np.where(j > 2, 0, j)
+        return self._T0[j] + self._Lstd[j] * (z - self._zstd[j]) / 1000
     
     def Pstd(self,h):
         return 100*((44331.514-h)/11880.516)**(1/0.1902632)
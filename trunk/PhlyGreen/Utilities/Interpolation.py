@@ -0,0 +1,79 @@
+"""Fast lookup tables for pre-tabulated models.
+
+:class:`UniformGridTable` interpolates a 3-D table sampled on a uniform grid. It backs the
+tabulated gas-turbine efficiency map (``GasTurbineResponseSurface.tabulate``) and the
+Hamilton-Standard propeller efficiency table (``Propeller.TabulateEfficiency``).
+"""
+
+import numpy as np
+
+
+class UniformGridTable:
+    """Trilinear interpolation of a 3-D table on a uniform grid.
+
+    ``grid`` is ``((lo, hi, n), ...)`` per axis and ``values`` the ``(n0, n1, n2)`` table.
+    Calling with scalars takes a pure-Python path (a few microseconds); arrays are broadcast
+    and interpolated in one vectorized pass.
+
+    By default queries outside the grid box are clamped to it. With ``clamp=False`` they
+    return NaN instead, and so do queries falling in a cell that the optional boolean
+    ``cells`` mask (shape ``(n0-1, n1-1, n2-1)``) marks as unusable, so the caller can fall
+    back to the exact model there.
+    """
+
+    def __init__(self, grid, values, cells=None, clamp=True):
+        self.grid = tuple((float(lo), float(hi), int(n)) for lo, hi, n in grid)
+        self.values = np.asarray(values, dtype=float)
+        self.cells = None if cells is None else np.asarray(cells, dtype=bool)
+        self.clamp = clamp
+        self._lo = np.array([g[0] for g in self.grid])
+        self._step = np.array([(hi - lo) / (n - 1) for lo, hi, n in self.grid])
+        self._n = np.array([g[2] for g in self.grid])
+        self._nested = self.values.tolist()
+        self._nested_cells = None if cells is None else self.cells.tolist()
+
+    def __call__(self, x0, x1, x2):
+        if np.ndim(x0) == 0 and np.ndim(x1) == 0 and np.ndim(x2) == 0:
+            return self._scalar(float(x0), float(x1), float(x2))
+        X = np.stack(np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (x0, x1, x2)]),
+                     axis=-1)
+        u = (X - self._lo) / self._step
+        outside = np.any((u < 0.0) | (u > self._n - 1), axis=-1)
+        u = np.clip(u, 0.0, self._n - 1)
+        i = np.minimum(u.astype(int), self._n - 2)
+        t = u - i
+        i0, i1, i2 = i[..., 0], i[..., 1], i[..., 2]
+        t0, t1, t2 = t[..., 0], t[..., 1], t[..., 2]
+        v = self.values
+        c00 = v[i0, i1, i2] * (1 - t0) + v[i0 + 1, i1, i2] * t0
+        c01 = v[i0, i1, i2 + 1] * (1 - t0) + v[i0 + 1, i1, i2 + 1] * t0
+        c10 = v[i0, i1 + 1, i2] * (1 - t0) + v[i0 + 1, i1 + 1, i2] * t0
+        c11 = v[i0, i1 + 1, i2 + 1] * (1 - t0) + v[i0 + 1, i1 + 1, i2 + 1] * t0
+        out = ((c00 * (1 - t1) + c10 * t1) * (1 - t2) + (c01 * (1 - t1) + c11 * t1) * t2)
+        if not self.clamp:
+            out = np.where(outside, np.nan, out)
+        if self.cells is not None:
+            out = np.where(self.cells[i0, i1, i2], out, np.nan)
+        return out
+
+    def _scalar(self, *x):
+        idx, frac = [], []
+        for xk, (lo, hi, n) in zip(x, self.grid):
+            u = (xk - lo) / (hi - lo) * (n - 1)
+            if u < 0.0 or u > n - 1.0:
+                if not self.clamp:
+                    return float('nan')
+                u = 0.0 if u < 0.0 else n - 1.0
+            i = min(int(u), n - 2)
+            idx.append(i)
+            frac.append(u - i)
+        (i, j, k), (a, b, c) = idx, frac
+        if self._nested_cells is not None and not self._nested_cells[i][j][k]:
+            return float('nan')
+        v = self._nested
+        p, q = v[i], v[i + 1]
+        c00 = p[j][k] * (1 - a) + q[j][k] * a
+        c01 = p[j][k + 1] * (1 - a) + q[j][k + 1] * a
+        c10 = p[j + 1][k] * (1 - a) + q[j + 1][k] * a
+        c11 = p[j + 1][k + 1] * (1 - a) + q[j + 1][k + 1] * a
+        return (c00 * (1 - b) + c10 * b) * (1 - c) + (c01 * (1 - b) + c11 * b) * c
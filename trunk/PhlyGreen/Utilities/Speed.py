@@ -1,5 +1,6 @@
 import numpy as np
 import PhlyGreen.Utilities.Atmosphere as ISA
+import PhlyGreen.Utilities.Units as Units
 # ISA = PhlyGreen.Utilities.Atmosphere()
 
 
@@ -36,4 +37,25 @@ def EAS2TAS(EAS,h,DISA=0.):
 
 def TAS2EAS(TAS,h,DISA=0.):
     # EAS = TAS * sqrt(rho / rho0)
-    return TAS * np.sqrt(ISA.atmosphere.RHOstd(h,DISA) / ISA.atmosphere.Rho_sls)
\ No newline at end of file
+    return TAS * np.sqrt(ISA.atmosphere.RHOstd(h,DISA) / ISA.atmosphere.Rho_sls)
+
+def MachTAS(speed, speedtype, h, DISA=0.):
+    """Stateless (Mach, TAS [m/s]) for a speed of the given type at altitude h.
+
+    Same conversions as ``Performance.set_speed`` but without storing anything, so
+    ``speed`` and ``h`` may be arrays of operating points. ``speedtype`` is one of
+    'Mach', 'TAS', 'CAS', 'KTAS', 'KCAS'.
+    """
+    if speedtype == 'Mach':
+        return speed, Mach2TAS(speed, h, DISA)
+    if speedtype == 'TAS':
+        TAS = speed
+    elif speedtype == 'CAS':
+        TAS = CAS2TAS(speed, h, DISA)
+    elif speedtype == 'KTAS':
+        TAS = Units.KNtoM(speed)
+    elif speedtype == 'KCAS':
+        TAS = CAS2TAS(Units.KNtoM(speed), h, DISA)
+    else:
+        raise ValueError("Speedtype not supported")
+    return TAS2Mach(TAS, h, DISA), TAS
@@ -6,6 +6,21 @@ from scipy.optimize import brentq, brenth, ridder, newton
 from pprint import pprint
 from .FLOPS_model import FLOPS_model
 
+# Warm-started WTO solve (Weight._warm_wto)
+WARM_MAXITER = 8      # secant/Newton steps before falling back to the bracketed solve
+WARM_TRUST = 0.05     # initial step cap, as a fraction of the guess (doubles when hit)
+WARM_SLOPE = -0.5     # dR/dWTO used when no slope is supplied (R = sum of masses - WTO)
+WARM_SLOPE_SPAN = 0.05  # evaluations within this fraction of the root define the reported slope
+
+
+def _local_slope(history, root, xtol):
+    """Secant dR/dWTO across the most widely spaced evaluations near ``root`` (or None)."""
+    near = sorted((x, f) for x, f in history if abs(x - root) <= WARM_SLOPE_SPAN * abs(root))
+    if len(near) < 2 or near[-1][0] - near[0][0] <= xtol:
+        return None
+    (x0, f0), (x1, f1) = near[0], near[-1]
+    return (f1 - f0) / (x1 - x0)
+
 # Max inner passes of the fuel-cell "size -> fly -> resize -> re-fly" loop (the fuel-cell
 # rated power converges in 2-3 passes since efficiency depends only weakly on stack size).
 _FC_RESIZE_ITERS = 3
@@ -91,6 +106,16 @@ class Weight:
 
         ``lower``/``upper`` can be overridden per design via the ``MissionInput`` keys
         ``'Brenth Lower Limit'`` / ``'Brenth Upper Limit'``.
+
+        Warm start: if ``MissionInput['WTO Guess']`` is set (typically the converged WTO of a
+        neighbouring design in a sweep), a safeguarded secant/Newton iteration is run from it
+        first, seeded with ``MissionInput['WTO Residual Slope']`` (dR/dWTO, see
+        :meth:`_warm_wto`). Only if it does not converge is the cold path above used.
+
+        Every call records ``self.residual_evaluations`` (calls to ``func``),
+        ``self.mission_evaluations`` (``EvaluateMission`` calls, including the inner resize
+        loops of the hydrogen configurations) and ``self.residual_slope`` (local dR/dWTO at
+        the root, to warm-start the next design).
         """
         if xtol is None:
             xtol = self.tol
@@ -98,6 +123,32 @@ class Weight:
         lower = mi.get('Brenth Lower Limit', lower)
         upper = mi.get('Brenth Upper Limit', upper)
 
+        history = []
+
+        def residual(WTO):
+            value = func(WTO)
+            history.append((float(WTO), float(value)))
+            return value
+
+        mission = getattr(self.aircraft, 'mission', None)
+        evaluations = getattr(mission, 'evaluations', 0)
+        self.residual_slope = None
+        try:
+            root = None
+            if mi.get('WTO Guess') is not None:
+                root = self._warm_wto(residual, mi['WTO Guess'], mi.get('WTO Residual Slope'),
+                                      lower, upper, xtol)
+            if root is None:
+                root = self._bracketed_wto(residual, lower, upper, step, xtol)
+            self.residual_slope = _local_slope(history, root, xtol)
+            return root
+        finally:
+            self.residual_evaluations = len(history)
+            self.mission_evaluations = (getattr(mission, 'evaluations', 0) - evaluations
+                                        if mission is not None else len(history))
+
+    def _bracketed_wto(self, func, lower, upper, step, xtol):
+        """Cold WTO solve: Brent on ``[lower, upper]``, grid-scan fallback (see ``_solve_wto``)."""
         try:
             return brenth(func, lower, upper, xtol=xtol)
         except Exception as exc_full:
@@ -119,6 +170,62 @@ class Weight:
             # No valid bracket found anywhere — surface the original failure.
             raise exc_full
 
+    def _warm_wto(self, func, guess, slope, lower, upper, xtol):
+        """Safeguarded secant/Newton iteration for the WTO root from a nearby guess.
+
+        Starts at ``guess`` with the Newton step ``-R/slope`` (``slope`` defaults to
+        :data:`WARM_SLOPE`). Steps are capped by a trust length of :data:`WARM_TRUST` x guess
+        that doubles every time it is hit, and clipped to ``[lower, upper]``; the slope is
+        updated by secant from the last two iterates. Once the residual has changed sign the
+        root is kept bracketed and a step leaving the bracket is replaced by bisection.
+
+        Converges when a step is shorter than ``xtol`` and returns the *last evaluated*
+        WTO, so the aircraft state left behind by ``func`` belongs to the returned root
+        (as with ``brenth``). Returns ``None`` (caller falls back to the cold solve) if
+        ``func`` errors or is not finite, the iterate is stuck on a limit, or
+        :data:`WARM_MAXITER` evaluations are not enough.
+        """
+        try:
+            x = min(max(float(guess), lower), upper)
+            f = func(x)
+            s = float(slope) if slope is not None else WARM_SLOPE
+            if not np.isfinite(s) or s == 0.0:
+                s = WARM_SLOPE
+            trust = WARM_TRUST * x
+            bracket = None  # (a, fa, b, fb) with fa * fb < 0
+            for _ in range(WARM_MAXITER):
+                if not np.isfinite(f):
+                    return None
+                if f == 0.0:
+                    return x
+                dx = -f / s
+                if abs(dx) > trust:
+                    dx = np.copysign(trust, dx)
+                    trust *= 2.0
+                x_new = min(max(x + dx, lower), upper)
+                if bracket is not None and not bracket[0] < x_new < bracket[2]:
+                    x_new = 0.5 * (bracket[0] + bracket[2])
+                if x_new == x:
+                    return None
+                f_new = func(x_new)
+                if not np.isfinite(f_new):
+                    return None
+                if f * f_new < 0.0:
+                    bracket = (x, f, x_new, f_new) if x < x_new else (x_new, f_new, x, f)
+                elif bracket is not None:
+                    a, fa, b, fb = bracket
+                    bracket = (x_new, f_new, b, fb) if f_new * fa > 0.0 else (a, fa, x_new, f_new)
+                secant = (f_new - f) / (x_new - x)
+                if np.isfinite(secant) and secant != 0.0:
+                    s = secant
+                converged = abs(x_new - x) <= xtol
+                x, f = x_new, f_new
+                if converged or (bracket is not None and bracket[2] - bracket[0] <= xtol):
+                    return x
+        except Exception:
+            return None
+        return None
+
     def WeightEstimation(self):
         """
          Perform full aircraft weight estimation for the selected configuration.
@@ -17,14 +17,17 @@ from .Aircraft import Aircraft
 from .factory import build_aircraft
 
 #structured results
-from .results import AircraftResults
+from .results import AircraftResults, DesignFailure
 
 #typed configuration objects
 from . import config
 from .config import AircraftConfig
 
 #stateless API for outer loops (optimization, UQ, sweeps)
-from .api import run_design, evaluate
+from .api import run_design, run_designs, evaluate
+
+#persistent design-result cache
+from .result_store import ResultStore, design_key
 
 #post-processing / plotting helpers
 from . import postprocess
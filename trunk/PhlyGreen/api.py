@@ -7,14 +7,30 @@ calls so it is safe to run in a loop (or in parallel). That is :func:`run_design
 :func:`evaluate` adds the usual outer-loop pattern: take a baseline config, apply some
 parameters to a fresh copy of it, design, and return the results — without ever mutating
 the baseline.
+
+Both accept ``warm_start``: the results of a neighbouring design (the previous point of a
+sweep, the previous iterate of an optimizer). Its converged take-off weight and residual
+slope seed the WTO solver (``MissionConfig.wto_guess`` / ``wto_slope``), which then needs
+a handful of mission evaluations instead of a full bracketed Brent solve. The result is
+the same design to within the solver tolerance; ``AircraftResults.mission_evaluations``
+reports the cost.
+
+:func:`run_designs` is the batch form: it fans a list of designs out over a process pool and
+returns the results in input order, with failed designs as :class:`DesignFailure` records.
 """
 
 import copy
+import math
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 
 from .factory import build_aircraft
+from .results import AircraftResults, DesignFailure
+from .result_store import design_key
 
 
-def run_design(config, design=True):
+def run_design(config, design=True, warm_start=None, store=None):
     """Build, configure and (by default) size an aircraft from a typed config.
 
     This is a pure function: it works on a deep copy of ``config`` and builds a fresh
@@ -24,17 +40,18 @@ def run_design(config, design=True):
         config (AircraftConfig): the design specification.
         design (bool): run the full ``DesignAircraft`` sizing loop (True) or only
             ``ReadInput`` (False).
+        warm_start (AircraftResults): optional nearby design to warm-start the WTO solve.
+        store (ResultStore): optional persistent cache; a design already in it is read
+            back instead of being sized again (``results.from_cache`` is then True), a new
+            one is added.
 
     Returns:
         AircraftResults: the structured design outcome.
     """
-    cfg = copy.deepcopy(config)
-    aircraft = build_aircraft()
-    aircraft.configure(cfg, design=design)
-    return aircraft.results()
+    return _design(copy.deepcopy(config), design, warm_start, store)
 
 
-def evaluate(base_config, apply, x, design=True):
+def evaluate(base_config, apply, x, design=True, warm_start=None, store=None):
     """Evaluate the design for parameter set ``x`` applied to a copy of ``base_config``.
 
     Args:
@@ -43,12 +60,110 @@ def evaluate(base_config, apply, x, design=True):
             set a cruise altitude, a hybridization ratio, a wing aspect ratio, ...).
         x: the parameter(s) for this evaluation (scalar, array, dict — your choice).
         design (bool): forwarded to :func:`run_design` semantics.
+        warm_start (AircraftResults): optional nearby design to warm-start the WTO solve.
+        store (ResultStore): optional persistent cache (keyed on the config *after*
+            ``apply``), see :func:`run_design`.
 
     Returns:
         AircraftResults: results for this parameter set.
     """
     cfg = copy.deepcopy(base_config)
     apply(cfg, x)
+    return _design(cfg, design, warm_start, store)
+
+
+def _design(cfg, design, warm_start, store):
+    """Size ``cfg`` (a private copy), going through ``store`` when one is given."""
+    if store is not None:
+        key = design_key(cfg, design)   # before sizing, which may fill in the config
+        cached = store.get(key)
+        if cached is not None:
+            return cached
+    _warm_start(cfg, warm_start)
     aircraft = build_aircraft()
     aircraft.configure(cfg, design=design)
-    return aircraft.results()
+    results = aircraft.results()
+    if store is not None:
+        store.put(key, results)
+    return results
+
+
+def _warm_start(cfg, warm_start):
+    """Seed the WTO solver of ``cfg`` with the converged WTO/slope of ``warm_start``."""
+    if warm_start is None or warm_start.WTO is None:
+        return
+    cfg.mission.wto_guess = warm_start.WTO
+    cfg.mission.wto_slope = warm_start.wto_residual_slope
+
+
+def run_designs(items, workers=None, chunksize=None, design=True, warm_start=None,
+                store=None, initializer=None, initargs=()):
+    """Design a batch of aircraft over a process pool; results come back in input order.
+
+    Each item is either an :class:`AircraftConfig` (as in :func:`run_design`) or a
+    ``(base_config, apply, x)`` tuple (as in :func:`evaluate`). ``apply`` must be
+    picklable, i.e. a module-level function. A design that raises does not stop the
+    batch: its slot holds a :class:`DesignFailure` with the exception type, message and
+    traceback (``result.ok`` tells the two apart).
+
+    Items are sent to the workers in chunks of ``chunksize`` (default: about four chunks
+    per worker), so the per-task overhead is amortized over many designs. Every worker
+    loads the shared surrogate state once when it starts, then runs ``initializer(*initargs)``
+    if given. Results are detached from their aircraft (``write_timeseries`` is not
+    available on them) so they travel back cheaply.
+
+    Args:
+        items: iterable of configs or ``(base_config, apply, x)`` tuples.
+        workers (int): pool size; default ``os.cpu_count()``. ``workers=1`` runs serially
+            in this process (no pool), which is handy for debugging.
+        chunksize (int): items per task sent to a worker.
+        design (bool): forwarded to :func:`run_design` semantics.
+        warm_start (AircraftResults): optional nearby design warm-starting every WTO solve
+            (e.g. the nominal design of a Monte Carlo study).
+        store (ResultStore): optional persistent cache shared by the workers; re-running
+            a batch only sizes the designs not already stored.
+        initializer, initargs: optional extra per-worker start-up hook.
+
+    Returns:
+        list: one :class:`AircraftResults` or :class:`DesignFailure` per item.
+    """
+    if warm_start is not None:
+        warm_start = AircraftResults(WTO=warm_start.WTO,
+                                     wto_residual_slope=warm_start.wto_residual_slope)
+    tasks = [(i, item, design, warm_start, store) for i, item in enumerate(items)]
+    if not tasks:
+        return []
+    workers = max(1, min(int(workers or os.cpu_count() or 1), len(tasks)))
+    if workers == 1:
+        _init_worker(initializer, initargs)
+        return [_run_task(task) for task in tasks]
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(tasks) / (4 * workers)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(initializer, initargs)) as pool:
+        return list(pool.map(_run_task, tasks, chunksize=chunksize))
+
+
+def _init_worker(initializer, initargs):
+    """Pool-worker start-up: load the packaged surrogates once, then the user hook."""
+    from .Systems.Powertrain import surrogate_registry
+    surrogate_registry.prewarm()
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _run_task(task):
+    """Design one batch item; exceptions become a :class:`DesignFailure`."""
+    index, item, design, warm_start, store = task
+    try:
+        if isinstance(item, tuple):
+            base_config, apply, x = item
+            results = evaluate(base_config, apply, x, design=design, warm_start=warm_start,
+                               store=store)
+        else:
+            results = run_design(item, design=design, warm_start=warm_start, store=store)
+    except Exception as exc:
+        return DesignFailure(index=index, error_type=type(exc).__name__, message=str(exc),
+                             traceback=traceback.format_exc())
+    results._aircraft = None
+    return results
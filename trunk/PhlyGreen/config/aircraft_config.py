@@ -5,7 +5,7 @@ This is the single typed entry point that replaces the loose pile of dicts plus
 ``aircraft.configure(config)`` (see :meth:`PhlyGreen.Aircraft.Aircraft.configure`).
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Optional
 
 from ._base import ConfigError
@@ -53,6 +53,23 @@ class AircraftConfig:
         if self.weight_class not in ("I", "II"):
             raise ConfigError(f"weight_class must be 'I' or 'II', got {self.weight_class!r}")
 
+    def to_dict(self):
+        """Return the flags plus every section's legacy dict (``None`` for unset sections)."""
+        out = {
+            "configuration": self.configuration,
+            "hybrid_type": self.hybrid_type,
+            "aircraft_type": self.aircraft_type,
+            "weight_class": self.weight_class,
+            "design_wing_loading": self.design_wing_loading,
+        }
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if hasattr(value, "to_dict"):
+                out[f.name] = value.to_dict()
+            elif f.name not in out:
+                out[f.name] = value
+        return out
+
     def read_input_args(self):
         """Return ``(positional, kwargs)`` matching ``Aircraft.ReadInput``'s signature."""
         positional = [
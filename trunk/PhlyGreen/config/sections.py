@@ -41,6 +41,15 @@ class MissionConfig(DictConfig):
     crew_weight: float = None         # kg
     range_loiter: Optional[float] = None   # nautical miles (optional)
     time_loiter: Optional[float] = None    # minutes (optional)
+    # --- mission ODE integration backend (optional; see PhlyGreen.Mission.integrators) ---
+    integrator: Optional[str] = None           # 'BDF' (default) | 'BDF-single' | 'RK4-fixed'
+    integrator_rtol: Optional[float] = None    # overrides the configuration's default rtol
+    integrator_max_step: Optional[float] = None  # s; step cap (the fixed step for 'RK4-fixed')
+    battery_sizing: Optional[str] = None       # Class-II P-number search: 'Incremental' (default) | 'Full'
+    tank_tracking: Optional[str] = None        # LH2 tank states: 'Coupled' (default) | 'Micro-step'
+    # --- warm-started WTO solve (optional; see Weight._solve_wto) ---
+    wto_guess: Optional[float] = None          # kg; start the WTO iteration here
+    wto_slope: Optional[float] = None          # dR/dWTO at the guess (seeds the secant)
 
     _KEY_MAP = {
         "range_mission": "Range Mission",
@@ -50,12 +59,29 @@ class MissionConfig(DictConfig):
         "crew_weight": "Crew Weight",
         "range_loiter": "Range Loiter",
         "time_loiter": "Time Loiter",
+        "integrator": "Integrator",
+        "integrator_rtol": "Integrator rtol",
+        "integrator_max_step": "Integrator Max Step",
+        "battery_sizing": "Battery Sizing",
+        "tank_tracking": "Tank Tracking",
+        "wto_guess": "WTO Guess",
+        "wto_slope": "WTO Residual Slope",
     }
 
     def __post_init__(self):
         _check_fraction("beta_start", self.beta_start)
-        for n in ("range_mission", "range_diversion", "payload_weight", "crew_weight"):
+        for n in ("range_mission", "range_diversion", "payload_weight", "crew_weight",
+                  "integrator_rtol", "integrator_max_step", "wto_guess"):
             _check_positive(n, getattr(self, n))
+        if self.integrator not in (None, "BDF", "BDF-single", "RK4-fixed"):
+            raise ConfigError("integrator must be 'BDF', 'BDF-single' or 'RK4-fixed', "
+                              f"got {self.integrator!r}")
+        if self.battery_sizing not in (None, "Incremental", "Full"):
+            raise ConfigError("battery_sizing must be 'Incremental' or 'Full', "
+                              f"got {self.battery_sizing!r}")
+        if self.tank_tracking not in (None, "Coupled", "Micro-step"):
+            raise ConfigError("tank_tracking must be 'Coupled' or 'Micro-step', "
+                              f"got {self.tank_tracking!r}")
 
 
 # ---------------------------------------------------------------------------
@@ -250,6 +276,7 @@ class ClimateImpactConfig(DictConfig):
     einox_model: Optional[str] = None
     wtw_co2: Optional[float] = None
     grid_co2: Optional[float] = None
+    atr_method: Optional[str] = None   # 'Grid' (default) | 'Quadrature' (reference)
 
     _KEY_MAP = {
         "H": "H",
@@ -258,8 +285,13 @@ class ClimateImpactConfig(DictConfig):
         "einox_model": "EINOx_model",
         "wtw_co2": "WTW_CO2",
         "grid_co2": "Grid_CO2",
+        "atr_method": "ATR Method",
     }
 
+    def __post_init__(self):
+        if self.atr_method not in (None, "Grid", "Quadrature"):
+            raise ConfigError(f"atr_method must be 'Grid' or 'Quadrature', got {self.atr_method!r}")
+
 
 # ---------------------------------------------------------------------------
 # Aerodynamics (structured polar + Cl/Cd values)
@@ -314,18 +346,23 @@ class TankConfig(DictConfig):
     number_of_tanks: int = 1
     tank_model: str = "Svensson_Default"  # key into TANK_Database
     fuselage_diameter: Optional[float] = None
+    property_backend: Optional[str] = None  # time_step para-H2 properties: 'Table' (default) | 'PropsSI'
 
     _KEY_MAP = {
         "max_diameter": "Max Diameter",
         "number_of_tanks": "Number of Tanks",
         "tank_model": "Tank Model",
         "fuselage_diameter": "Fuselage Diameter",
+        "property_backend": "Property Backend",
     }
 
     def __post_init__(self):
         _check_positive("max_diameter", self.max_diameter)
         if self.number_of_tanks is not None and self.number_of_tanks < 1:
             raise ConfigError(f"number_of_tanks must be >= 1, got {self.number_of_tanks!r}")
+        if self.property_backend not in (None, "Table", "PropsSI"):
+            raise ConfigError("property_backend must be 'Table' or 'PropsSI', "
+                              f"got {self.property_backend!r}")
 
 
 @dataclass
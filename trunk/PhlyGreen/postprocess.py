@@ -37,16 +37,16 @@ def mission_timeseries(aircraft):
 
     out = {
         "time": time,
-        "altitude": np.array([float(profile.Altitude(t)) for t in time]),
-        "velocity": np.array([float(profile.Velocity(t)) for t in time]),
-        "power_excess": np.array([float(profile.PowerExcess(t)) for t in time]),
+        "altitude": np.asarray(profile.Altitude(time), dtype=float),
+        "velocity": np.asarray(profile.Velocity(time), dtype=float),
+        "power_excess": np.asarray(profile.PowerExcess(time), dtype=float),
         "mass_fraction": beta,
         "fuel_energy": y_fuel,
     }
 
     config = getattr(aircraft, "Configuration", None)
     if config in ("Hybrid", "FuelCellBattery"):
-        out["phi"] = np.array([float(profile.SuppliedPowerRatio(t)) for t in time])
+        out["phi"] = np.asarray(profile.SuppliedPowerRatio(time), dtype=float)
 
     # Battery energy / SOC / temperature time-series exist as ODE states for the Hybrid and the
     # Class-II fuel-cell+battery configurations (the battery energy is the 2nd state). The Class-I
@@ -79,33 +79,24 @@ def power_timeseries(aircraft):
 
     Returns equal-length arrays ``time`` [s], ``propulsive_power`` [W] (total shaft power the
     propellers must deliver), ``gt_power`` [W] (gas-turbine shaft power) and ``em_power`` [W]
-    (electric-motor / battery power). These come straight from the powertrain power-ratio solve
-    (``Powertrain.Traditional`` / ``Powertrain.Hybrid``) at every mission time point, so they
-    are correct for both Class-I (constant) and Class-II efficiencies and need no surrogates.
+    (electric-motor / battery power). These are read from the record the mission keeps of its
+    own power-ratio solve (``mission.trajectory``, see
+    :class:`~PhlyGreen.Mission.trajectory.MissionTrajectory`), so they are correct for both
+    Class-I (constant) and Class-II efficiencies and cost no model evaluations.
 
     All powers are **totals for the whole aircraft** (summed over the engines). For a fuel-only
     aircraft ``em_power`` is zero; for configurations without a gas turbine
     (Hydrogen / FuelCellBattery) ``gt_power``/``em_power`` are returned as ``NaN``.
     """
-    ts = mission_timeseries(aircraft)
-    t, alt, vel = ts["time"], ts["altitude"], ts["velocity"]
-    pe, beta = ts["power_excess"], ts["mass_fraction"]
-    phi = ts.get("phi", np.zeros_like(t))
-
-    perf, pt = aircraft.performance, aircraft.powertrain
-    WTO, WS, DISA = aircraft.weight.WTO, aircraft.DesignWTOoS, aircraft.mission.DISA
+    trajectory = _trajectory(aircraft)
+    t, PP = trajectory.t, trajectory.PP
+    phi = trajectory.phi if trajectory.phi is not None else np.zeros_like(t)
 
-    PP = np.array([WTO * perf.PoWTO(WS, beta[i], pe[i], 1, alt[i], DISA, vel[i], 'TAS')
-                   for i in range(len(t))])
     config = getattr(aircraft, "Configuration", None)
-    if config == "Hybrid":
-        PR = np.array([pt.Hybrid(float(phi[i]), alt[i], vel[i], PP[i]) for i in range(len(t))])
-        gt_power = PR[:, 1] * PP     # gas-turbine shaft power
-        em_power = PR[:, 5] * PP     # battery / electric-motor power
-    elif config == "Traditional":
-        PR = np.array([pt.Traditional(alt[i], vel[i], PP[i]) for i in range(len(t))])
-        gt_power = PR[:, 1] * PP     # all propulsion is thermal
-        em_power = np.zeros_like(PP)
+    if config in ("Traditional", "Hybrid"):
+        gt_power = trajectory.gt_power
+        em_power = (trajectory.battery_power if trajectory.battery_power is not None
+                    else np.zeros_like(PP))
     else:                            # Hydrogen / FuelCellBattery: no gas turbine
         gt_power = np.full_like(PP, np.nan)
         em_power = np.full_like(PP, np.nan)
@@ -116,16 +107,27 @@ def power_timeseries(aircraft):
     # share ``phi`` of the propulsive power and the fuel cell the rest; the tank empties as the
     # cumulative hydrogen chemical energy is drawn.
     if config in ("Hydrogen", "FuelCellBattery"):
-        result["fc_power"] = (1.0 - phi) * PP        # fuel-cell propulsive share [W]
-        result["battery_power"] = phi * PP           # battery propulsive share [W]
+        p_bat = (trajectory.battery_propulsive_power
+                 if trajectory.battery_propulsive_power is not None else phi * PP)
+        result["fc_power"] = PP - p_bat              # fuel-cell propulsive share [W]
+        result["battery_power"] = p_bat              # battery propulsive share [W]
         ef = getattr(aircraft.mission, "ef", None)   # H2 lower heating value [J/kg]
         WH2 = getattr(aircraft.weight, "WH2_Fuel", None)
         if ef and WH2:
-            result["h2_remaining"] = np.clip(WH2 - ts["fuel_energy"] / ef, 0.0, None)  # [kg]
+            fuel_energy = mission_timeseries(aircraft)["fuel_energy"]
+            result["h2_remaining"] = np.clip(WH2 - fuel_energy / ef, 0.0, None)  # [kg]
 
     return result
 
 
+def _trajectory(aircraft):
+    """The mission record at the solver points (``mission.trajectory``)."""
+    trajectory = getattr(aircraft.mission, "trajectory", None)
+    if trajectory is None:
+        raise ValueError("No mission solution found — design the aircraft first.")
+    return trajectory
+
+
 def class_ii_components(aircraft):
     """Return the set of powertrain components that used a **Class-II** (operating-point
     dependent) efficiency model in this design.
@@ -155,9 +157,9 @@ def component_timeseries(aircraft, components=None, n_engines=None, gt_design_hp
                          em_design=None, propeller_rpm=1200.0):
     """Evaluate the Class-II propulsion models along the flown mission.
 
-    Walks the converged mission timeline and computes the power flow
-    (``propulsive_power``/``gt_power``/``em_power`` [W], also available cheaply via
-    :func:`power_timeseries`) plus, for each requested component, its Class-II model outputs:
+    Reads the power flow of the converged mission from ``mission.trajectory``
+    (``propulsive_power``/``gt_power``/``em_power`` [W], as in :func:`power_timeseries`) and
+    evaluates, for each requested component, its Class-II model outputs:
     gas-turbine efficiency & throttle, electric-motor efficiency & throttle (+ rpm), and
     propeller efficiency & pitch.
 
@@ -176,43 +178,33 @@ def component_timeseries(aircraft, components=None, n_engines=None, gt_design_hp
     requested = ({'gas_turbine', 'electric_motor', 'propeller'}
                  if components is None else set(components))
 
-    ts = mission_timeseries(aircraft)
-    t, alt, vel = ts["time"], ts["altitude"], ts["velocity"]
-    pe, beta = ts["power_excess"], ts["mass_fraction"]
-    phi = ts.get("phi", np.zeros_like(t))
+    trajectory = _trajectory(aircraft)
+    t, alt, vel, PP = trajectory.t, trajectory.altitude, trajectory.velocity, trajectory.PP
 
-    perf, pt = aircraft.performance, aircraft.powertrain
-    WTO, WS, DISA = aircraft.weight.WTO, aircraft.DesignWTOoS, aircraft.mission.DISA
+    pt = aircraft.powertrain
     if n_engines is None:
         n_engines = getattr(pt, "n_engines", 1) or 1
 
-    # Propulsive power and its thermal(Pgt)/electric(Pbat) split. Use the hybrid graph for a
-    # Hybrid configuration, else the traditional (gas-turbine-only) chain so the function also
-    # works for a Class-II gas turbine on a conventional aircraft (no battery).
-    PP = np.array([WTO * perf.PoWTO(WS, beta[i], pe[i], 1, alt[i], DISA, vel[i], 'TAS')
-                   for i in range(len(t))])
-    if getattr(aircraft, "Configuration", None) == "Hybrid":
-        PR = np.array([pt.Hybrid(float(phi[i]), alt[i], vel[i], PP[i]) for i in range(len(t))])
-        p_thermal = PR[:, 1] * PP    # gas-turbine shaft power
-        p_electric = PR[:, 5] * PP   # battery (electric) power
-    else:
-        PR = np.array([pt.Traditional(alt[i], vel[i], PP[i]) for i in range(len(t))])
-        p_thermal = PR[:, 1] * PP    # gas-turbine shaft power (all propulsion is thermal)
-        p_electric = np.zeros_like(PP)
+    # Propulsive power and its thermal(Pgt)/electric(Pbat) split, as the mission solved it
+    # (zero for a configuration without a gas turbine or a battery).
+    zeros = np.zeros_like(PP)
+    p_thermal = trajectory.gt_power if trajectory.gt_power is not None else zeros
+    p_electric = trajectory.battery_power if trajectory.battery_power is not None else zeros
 
     out = {"time": t, "propulsive_power": PP, "gt_power": p_thermal, "em_power": p_electric}
 
     # --- Gas turbine (Class-II response surface) ---
     if 'gas_turbine' in requested:
         try:
-            from .Systems.Powertrain.gas_turbine_surrogate import GasTurbineResponseSurface
+            from .Systems.Powertrain import surrogate_registry
             if gt_design_hp is None:
                 if getattr(pt, "gt_design_power", None):
                     gt_design_hp = Units.wTohp(pt.gt_design_power) / n_engines
                 else:
                     rating = getattr(pt, "engineRating", None) or float(np.max(p_thermal)) or 1.0
                     gt_design_hp = 1.5 * Units.wTohp(rating) / n_engines
-            gt = GasTurbineResponseSurface()
+            gt = surrogate_registry.gas_turbine(
+                tabulated=getattr(pt, "EtaGTmodelType", None) == "ResponseSurfaceTable")
             eta_gt, gt_throttle = [], []
             for i in range(len(t)):
                 a = Speed.soundspeed(alt[i], 0.0)
@@ -256,18 +248,14 @@ def component_timeseries(aircraft, components=None, n_engines=None, gt_design_hp
     # --- Propeller (Class-II RBF surrogate) ---
     if 'propeller' in requested:
         try:
-            import os
-            from .Systems.Powertrain import propeller_surrogate as _prbf
-            csv = os.path.join(os.path.dirname(_prbf.__file__), "data", "propeller_data_rbf.csv")
-            prop = _prbf.PropellerSurrogate(csv)
-            eta_pp, pitch = [], []
-            for i in range(len(t)):
-                pk = (PP[i] / n_engines) / 1000.0
-                pit = prop.solve_pitch(pk, alt[i], vel[i], propeller_rpm)
-                eta_pp.append(prop.get_efficiency(pk, alt[i], vel[i], pit, propeller_rpm))
-                pitch.append(pit)
-            out["eta_propeller"] = np.array(eta_pp)
-            out["propeller_pitch"] = np.array(pitch)
+            from .Systems.Powertrain import surrogate_registry
+            prop = surrogate_registry.propeller()
+            # whole mission in one batched evaluation of the pitch governor and efficiency map
+            pk = (np.asarray(PP, dtype=float) / n_engines) / 1000.0
+            pitch = np.atleast_1d(prop.solve_pitch(pk, alt, vel, propeller_rpm))
+            out["eta_propeller"] = np.atleast_1d(
+                prop.get_efficiency(pk, alt, vel, pitch, propeller_rpm))
+            out["propeller_pitch"] = pitch
         except Exception:
             pass
 
@@ -288,6 +276,8 @@ def timeseries_table(aircraft, include_components="auto"):
       power excess, SOC, phi, …);
     * the power flow from :func:`power_timeseries` (``propulsive_power``, ``gt_power``,
       ``em_power`` [W]);
+    * the rest of the mission record ``mission.trajectory`` (``fuel_flow``, ``segment``,
+      ``PRatio_<j>`` and, where present, ``phi``, ``fc_heat``, ``battery_heat``);
     * the Class-II component quantities from :func:`component_timeseries`
       (gas-turbine / electric-motor / propeller efficiencies, throttles, pitch).
 
@@ -324,6 +314,13 @@ def timeseries_table(aircraft, include_components="auto"):
     except Exception:
         pass
 
+    # The rest of the mission record: fuel flow, power ratios, fuel-cell / battery heat.
+    trajectory = getattr(aircraft.mission, "trajectory", None)
+    if trajectory is not None and len(trajectory) == n:
+        for k, v in trajectory.to_dict().items():
+            if k not in ("t", "altitude", "velocity", "beta", "PP", "gt_power", "battery_power"):
+                data.setdefault(k, v)
+
     # Class-II component columns. In "auto" mode include only the components that the design
     # actually used as Class-II (so no surrogate is loaded for a constant-efficiency design).
     propulsion = {"gas_turbine", "electric_motor", "propeller"}
@@ -591,11 +588,15 @@ def compute_tank_history(aircraft):
     """Advance the LH2 tank thermodynamic state along the converged mission, filling
     ``aircraft.tank.history``.
 
-    Works for any hydrogen architecture (``Hydrogen`` and ``FuelCellBattery``): it walks the
-    flown mission solution and drives the tank with the hydrogen mass flow recovered from the
-    cumulative hydrogen chemical energy (ODE state ``y[0]``). Unlike setting
-    ``mission.track_tank`` and re-flying, this is a cheap post-processing pass and needs no
-    re-integration. Requires a physics LH2 tank (a ``TankConfig`` + CoolProp) and a flown mission.
+    Works for any hydrogen architecture (``Hydrogen`` and ``FuelCellBattery``): it drives the
+    tank with the hydrogen mass flow recovered from the cumulative hydrogen chemical energy
+    (ODE state ``y[0]``) of the flown mission solution, without re-flying the mission (the tank
+    does not feed back into it). The tank is advanced the way ``MissionInput['Tank Tracking']``
+    selects: with ``'Coupled'`` (default) the tank states are integrated by
+    :func:`PhlyGreen.Mission.tank_coupling.integrate_with_tank` against a monotone (PCHIP)
+    fit of the flown energy per segment, and a history the last flight already tracked that way
+    is returned as is; ``'Micro-step'`` advances ``time_step`` over the solver steps. Requires a
+    physics LH2 tank (a ``TankConfig`` + CoolProp) and a flown mission.
     """
     tank = getattr(aircraft, "tank", None)
     m = getattr(aircraft, "mission", None)
@@ -603,18 +604,37 @@ def compute_tank_history(aircraft):
         raise ValueError("No physics LH2 tank — attach a TankConfig (needs CoolProp).")
     if m is None or not getattr(m, "integral_solution", None):
         raise ValueError("No mission solution — design the aircraft first.")
-    tank.m_curr = tank.capacity_single        # start full
-    tank.P_curr = tank.P_min
-    tank.history = {'t': [], 'P': [], 'm_tot': [], 'Vent': [], 'Q_in': [],
-                    'Alt': [], 'Q_heater': [], 'm_vent_cum': [], 'Consumption': []}
-    tank.cum_vented_mass = 0.0
-    for arr in m.integral_solution:
-        for k in range(1, len(arr.t)):
-            dt = arr.t[k] - arr.t[k - 1]
-            dE = max(float(arr.y[0][k] - arr.y[0][k - 1]), 0.0)   # hydrogen chemical energy used
-            m_dot = (dE / m.ef) / dt if dt > 0 else 0.0
-            t_mid = 0.5 * (arr.t[k] + arr.t[k - 1])
-            tank.time_step(dt, m_dot, float(m.profile.Altitude(t_mid)))
+    solutions = m.integral_solution
+    if getattr(m, "tank_tracking", "Coupled") == "Micro-step":
+        tank.reset_state()                        # start full, at P_min
+        for arr in solutions:
+            for k in range(1, len(arr.t)):
+                dt = arr.t[k] - arr.t[k - 1]
+                dE = max(float(arr.y[0][k] - arr.y[0][k - 1]), 0.0)   # hydrogen chemical energy used
+                m_dot = (dE / m.ef) / dt if dt > 0 else 0.0
+                t_mid = 0.5 * (arr.t[k] + arr.t[k - 1])
+                tank.time_step(dt, m_dot, float(m.profile.Altitude(t_mid)))
+        return tank.history
+
+    h = tank.history
+    if m.track_tank and len(h) and h["t"][-1] == solutions[-1].t[-1]:
+        return h                                  # filled by the flight itself
+    from scipy.interpolate import PchipInterpolator
+    from .Mission.tank_coupling import integrate_with_tank
+    breaks = np.array([arr.t[0] for arr in solutions] + [solutions[-1].t[-1]])
+    rates = [PchipInterpolator(arr.t, arr.y[0]).derivative() if len(arr.t) > 1 else None
+             for arr in solutions]
+
+    def energy_rate(t, y):
+        k = min(max(int(np.searchsorted(breaks, t, side="right")) - 1, 0), len(rates) - 1)
+        return [max(float(rates[k](t)), 0.0) if rates[k] is not None else 0.0]
+
+    for _ in integrate_with_tank(
+            energy_rate, tank, breaks, [0.0], lambda t, y, dydt: dydt[0] / m.ef,
+            lambda t: float(m.profile.Altitude(t)),
+            rtol=m.integrator_rtol if m.integrator_rtol is not None else 1e-5,
+            max_step=m.integrator_max_step if m.integrator_max_step is not None else 60.0):
+        pass
     return tank.history
 
 
@@ -629,7 +649,7 @@ def plot_tank_state(aircraft, axes=None):
     """
     import matplotlib.pyplot as plt
     tank = getattr(aircraft, "tank", None)
-    if tank is None or not getattr(tank, "history", None) or not tank.history["t"]:
+    if tank is None or not getattr(tank, "history", None):
         raise ValueError("No tank history — set mission.track_tank=True and re-run EvaluateMission.")
     h = tank.history
     t_min = np.array(h["t"]) / 60.0
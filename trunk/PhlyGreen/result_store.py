@@ -0,0 +1,193 @@
+"""Persistent on-disk store of designed aircraft results.
+
+Sizing a design takes seconds (minutes for Class-II hydrogen designs); a DOE, a Monte Carlo
+study or the dashboard keep asking for the same designs again, across processes and
+sessions. :class:`ResultStore` keeps ``AircraftResults.to_dict()`` (and, optionally, the
+mission time series) in a local SQLite file keyed by :func:`design_key`:
+
+* a SHA-256 of the canonical JSON of the :class:`AircraftConfig` (sorted keys, warm-start
+  hints removed — they change the solver cost, not the design),
+* the package version, and
+* the hashes of the packaged surrogate artifacts (``Systems/Powertrain/data``), so results
+  produced by an older model are never served after the artifacts change.
+
+The file is opened per operation in WAL mode with a busy timeout, so one store can be shared
+by the workers of :func:`PhlyGreen.run_designs` (the object only holds its path and limits
+and pickles cheaply). Entries are evicted least-recently-used when the store exceeds
+``max_entries`` or ``max_bytes``.
+
+Usage::
+
+    store = pg.ResultStore("doe.sqlite")
+    results = pg.run_design(config, store=store)     # sized once, then read back
+    out = pg.run_designs(items, workers=8, store=store)
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+from ._version import __version__
+
+_DATA_DIR = os.path.join(os.path.dirname(__file__), "Systems", "Powertrain", "data")
+_ARTIFACT_SUFFIXES = (".pkl", ".csv", ".npz", ".npy")
+
+# MissionConfig fields that only seed the WTO solver (see Weight._solve_wto).
+_WARM_START_FIELDS = ("WTO Guess", "WTO Residual Slope")
+
+_ARTIFACT_HASH = None   # process-level cache of the surrogate artifact digest
+
+
+def default_path():
+    """Default store location: ``$PHLYGREEN_CACHE_DIR`` or ``~/.cache/phlygreen``."""
+    root = os.environ.get("PHLYGREEN_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "phlygreen")
+    return os.path.join(root, "results.sqlite")
+
+
+def artifact_hash():
+    """SHA-256 over the names and contents of the packaged surrogate artifacts (cached)."""
+    global _ARTIFACT_HASH
+    if _ARTIFACT_HASH is None:
+        h = hashlib.sha256()
+        for name in sorted(os.listdir(_DATA_DIR)):
+            if name.endswith(_ARTIFACT_SUFFIXES):
+                h.update(name.encode())
+                with open(os.path.join(_DATA_DIR, name), "rb") as f:
+                    h.update(hashlib.sha256(f.read()).digest())
+        _ARTIFACT_HASH = h.hexdigest()
+    return _ARTIFACT_HASH
+
+
+def design_key(config, design=True):
+    """Canonical hash of ``config`` (+ package version and surrogate artifacts)."""
+    data = config.to_dict()
+    mission = dict(data.get("mission") or {})
+    for key in _WARM_START_FIELDS:
+        mission.pop(key, None)
+    data["mission"] = mission
+    payload = {"config": data, "design": bool(design), "version": __version__,
+               "artifacts": artifact_hash()}
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=_json_default)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _key(config, design):
+    return config if isinstance(config, str) else design_key(config, design)
+
+
+def _json_default(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return repr(value)
+
+
+class ResultStore:
+    """SQLite-backed, LRU-bounded store of design results (see the module docstring).
+
+    Args:
+        path: SQLite file; default :func:`default_path`. Parent directories are created.
+        max_entries: keep at most this many designs (``None``: unbounded).
+        max_bytes: keep at most this many bytes of payload (``None``: unbounded).
+        timeseries: also store :func:`PhlyGreen.postprocess.mission_timeseries` of each
+            design put, retrievable with :meth:`get_timeseries`.
+    """
+
+    def __init__(self, path=None, max_entries=None, max_bytes=256 * 2**20, timeseries=False):
+        self.path = os.path.abspath(path or default_path())
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeseries = timeseries
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS results ("
+                       "key TEXT PRIMARY KEY, results TEXT NOT NULL, timeseries BLOB, "
+                       "size INTEGER NOT NULL, accessed REAL NOT NULL)")
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """One connection per operation, committed on success and always closed."""
+        db = sqlite3.connect(self.path, timeout=60.0)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def get(self, config, design=True):
+        """Return the stored :class:`AircraftResults` for ``config``, or ``None``.
+
+        ``config`` is an :class:`AircraftConfig` or a key from :func:`design_key`. The
+        results are marked ``from_cache``: their ``mission_evaluations`` and ``inputs`` are
+        those of the solve that stored them.
+        """
+        from .results import AircraftResults
+        key = _key(config, design)
+        with self._connect() as db:
+            row = db.execute("SELECT results FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+        results = AircraftResults.from_dict(json.loads(row[0]))
+        results.from_cache = True
+        return results
+
+    def get_timeseries(self, config, design=True):
+        """Return the stored mission time series (dict of arrays) for ``config``, or ``None``."""
+        key = _key(config, design)
+        with self._connect() as db:
+            row = db.execute("SELECT timeseries FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        with np.load(io.BytesIO(row[0])) as npz:
+            return {name: npz[name] for name in npz.files}
+
+    def put(self, config, results, design=True):
+        """Store ``results`` for ``config``, then evict least-recently-used entries."""
+        text = json.dumps(results.to_dict(), default=_json_default)
+        blob = None
+        if self.timeseries and results._aircraft is not None:
+            from .postprocess import mission_timeseries
+            buffer = io.BytesIO()
+            np.savez_compressed(buffer, **mission_timeseries(results._aircraft))
+            blob = buffer.getvalue()
+        size = len(text) + (len(blob) if blob is not None else 0)
+        key = _key(config, design)
+        with self._connect() as db:
+            db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                       (key, text, blob, size, time.time()))
+            self._evict(db, keep=key)
+
+    def _evict(self, db, keep):
+        """Drop least-recently-used entries beyond the limits (never the entry ``keep``)."""
+        if self.max_entries is not None:
+            db.execute("DELETE FROM results WHERE key IN (SELECT key FROM results "
+                       "ORDER BY accessed DESC LIMIT -1 OFFSET ?)", (int(self.max_entries),))
+        if self.max_bytes is not None:
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            if total > self.max_bytes:
+                for key, size in db.execute(
+                        "SELECT key, size FROM results WHERE key != ? ORDER BY accessed ASC",
+                        (keep,)).fetchall():
+                    db.execute("DELETE FROM results WHERE key = ?", (key,))
+                    total -= size
+                    if total <= self.max_bytes:
+                        break
+
+    def __len__(self):
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def clear(self):
+        """Remove every stored design."""
+        with self._connect() as db:
+            db.execute("DELETE FROM results")
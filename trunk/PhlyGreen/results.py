@@ -6,7 +6,7 @@ same scalar quantities into a dataclass so callers (tests, optimization/UQ outer
 serialization) can consume them programmatically instead of parsing stdout.
 """
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, fields
 from typing import Optional, Dict, Any
 
 import numpy as np
@@ -53,6 +53,10 @@ class AircraftResults:
     S_number: Optional[float] = None
     P_number: Optional[float] = None
 
+    # --- WTO sizing loop -----------------------------------------------------
+    mission_evaluations: Optional[int] = None   # EvaluateMission calls spent on the WTO solve
+    wto_residual_slope: Optional[float] = None  # local dR/dWTO at the root (warm-start seed)
+
     # --- provenance ---------------------------------------------------------
     configuration: Optional[str] = None
     hybrid_type: Optional[str] = None
@@ -64,6 +68,13 @@ class AircraftResults:
     # dicts), so you can keep track of *what was actually solved*. See :meth:`input_summary`.
     inputs: Dict[str, Any] = field(default_factory=dict)
 
+    # Successful design (a :class:`DesignFailure` in a batch has ``ok = False``).
+    ok = True
+
+    # Read back from a :class:`~PhlyGreen.result_store.ResultStore` instead of sized by this
+    # call: ``mission_evaluations`` and ``inputs`` then describe the original solve.
+    from_cache = False
+
     # Reference to the source aircraft, set by :meth:`from_aircraft`. Not a dataclass field
     # (no annotation), so it stays out of ``to_dict``/``asdict`` and equality.
     _aircraft = None
@@ -93,6 +104,9 @@ class AircraftResults:
         r.WCrew = _get(w, 'WCrew')
         r.WPayload = _get(w, 'WPayload')
 
+        r.mission_evaluations = _get(w, 'mission_evaluations')
+        r.wto_residual_slope = _get(w, 'residual_slope')
+
         if None not in (r.WPT, r.WStructure, r.WCrew):
             r.empty_weight = r.WPT + r.WStructure + r.WCrew + (r.WBat or 0.0)
             if r.WPayload is not None:
@@ -131,6 +145,15 @@ class AircraftResults:
         r._aircraft = aircraft
         return r
 
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild results from :meth:`to_dict` output (e.g. a cached design).
+
+        Unknown keys are ignored; no source aircraft is attached.
+        """
+        valid = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in valid})
+
     def to_dict(self):
         """Return a plain dict of all fields (suitable for JSON serialization)."""
         return asdict(self)
@@ -169,6 +192,26 @@ class AircraftResults:
         return _write(self._aircraft, path, include_components=include_components)
 
 
+@dataclass
+class DesignFailure:
+    """A design of a :func:`PhlyGreen.run_designs` batch that raised instead of closing.
+
+    Takes the failed design's slot in the returned list, so results stay aligned with the
+    inputs.
+    """
+
+    index: int                  # position of the design in the batch
+    error_type: str             # exception class name, e.g. 'ValueError'
+    message: str
+    traceback: str = ""
+
+    ok = False
+
+    def to_dict(self):
+        """Return a plain dict of all fields (suitable for JSON serialization)."""
+        return asdict(self)
+
+
 def _get(obj, name):
     """Return ``obj.name`` as a plain Python float if present, else ``None``.
 
@@ -4,6 +4,10 @@
 copy of the baseline — it never mutates the baseline, so it is safe to call in a loop.
 Here we sweep the design range and look at how take-off weight and block fuel grow.
 
+Neighbouring points of a sweep have nearly the same take-off weight, so each design is
+warm-started from the previous one (`warm_start=res`): the WTO solver starts from its
+converged weight and residual slope and needs fewer mission evaluations.
+
 Run it:
     cd trunk && python examples/10_parameter_sweep.py
 """
@@ -23,12 +27,15 @@ def main():
     base = traditional_config()
     ranges = np.linspace(400, 1000, 7)
 
-    print(f"{'range [nm]':>11} {'WTO [kg]':>10} {'empty [kg]':>11} {'block fuel [kg]':>16}")
+    print(f"{'range [nm]':>11} {'WTO [kg]':>10} {'empty [kg]':>11} {'block fuel [kg]':>16} "
+          f"{'missions':>9}")
     wto, empty, fuel = [], [], []
+    res = None
     for r in ranges:
-        res = pg.evaluate(base, set_range, r)
+        res = pg.evaluate(base, set_range, r, warm_start=res)
         wto.append(res.WTO); empty.append(res.empty_weight); fuel.append(res.block_fuel)
-        print(f"{r:11.0f} {res.WTO:10.1f} {res.empty_weight:11.1f} {res.block_fuel:16.1f}")
+        print(f"{r:11.0f} {res.WTO:10.1f} {res.empty_weight:11.1f} {res.block_fuel:16.1f} "
+              f"{res.mission_evaluations:9d}")
 
     growth = (wto[-1] - wto[0]) / (ranges[-1] - ranges[0])
     print(f"\nTake-off-weight growth: {growth:.1f} kg per extra nm of design range.")
@@ -3,7 +3,8 @@
 Sweeping two parameters at once maps out the design space. Here we size the aircraft across
 a grid of payloads and ranges and tabulate the block fuel — the kind of study that feeds a
 payload–range diagram. It reuses the same `pg.evaluate` building block as the other outer
-loops, just over two parameters.
+loops, just over two parameters, warm-starting each design's take-off-weight solve from its
+neighbour (the previous range on the row, or the first point of the previous row).
 
 Run it:
     cd trunk && python examples/13_payload_range.py
@@ -30,10 +31,14 @@ def main():
     print("payload\\range " + "".join(f"{r:>10.0f}" for r in ranges))
     fuel = np.zeros((len(payloads), len(ranges)))
     wto = np.zeros_like(fuel)
+    row_start = None
     for i, p in enumerate(payloads):
         row = []
+        res = row_start
         for j, r in enumerate(ranges):
-            res = pg.evaluate(base, apply_payload_range, (p, r))
+            res = pg.evaluate(base, apply_payload_range, (p, r), warm_start=res)
+            if j == 0:
+                row_start = res
             fuel[i, j] = res.block_fuel
             wto[i, j] = res.WTO
             row.append(res.block_fuel)
@@ -124,8 +124,7 @@ def _timeseries(aircraft):
     # common electric motor -> gearbox -> propeller), so read their efficiencies at PP.
     eta_em = np.array([pt.eta('electric_motor', alt[i], vel[i], max(PP[i], 1.0))
                        for i in range(len(t))])
-    eta_prop = np.array([pt.Propeller.ComputePropEfficiency(alt[i], vel[i], max(PP[i], 1.0))
-                         for i in range(len(t))])
+    eta_prop = pt.Propeller.ComputePropEfficiencyBatch(alt, vel, np.maximum(PP, 1.0))
     return dict(t=t / 60.0, alt=alt, vel=vel, p_fc=p_fc, p_bat=p_bat,
                 soc=soc, Tc=T - 273.15, eta_em=eta_em, eta_prop=eta_prop)
 
@@ -61,3 +61,66 @@ def test_results_input_snapshot_records_what_was_solved():
     summary = results.input_summary()
     assert "Design inputs" in summary
     assert "Cruise" in summary
+
+
+@pytest.mark.slow
+def test_warm_start_reproduces_cold_design_with_fewer_missions():
+    base = _traditional_aircraft_config()
+
+    def set_range(cfg, r):
+        cfg.mission.range_mission = r
+
+    neighbour = pg.evaluate(base, set_range, 700)
+    cold = pg.evaluate(base, set_range, 800)
+    warm = pg.evaluate(base, set_range, 800, warm_start=neighbour)
+    assert warm.WTO == pytest.approx(cold.WTO, rel=1e-5)
+    assert warm.block_fuel == pytest.approx(cold.block_fuel, rel=1e-4)
+    assert warm.mission_evaluations < cold.mission_evaluations
+    assert warm.wto_residual_slope == pytest.approx(cold.wto_residual_slope, rel=0.05)
+    assert base.mission.wto_guess is None     # base untouched
+
+
+def _set_range(cfg, r):
+    cfg.mission.range_mission = r
+
+
+def _fail_on_negative(cfg, r):
+    if r < 0:
+        raise ValueError("negative range")
+    _set_range(cfg, r)
+
+
+@pytest.mark.slow
+def test_run_designs_keeps_order_and_records_failures():
+    base = _traditional_aircraft_config()
+    items = [(base, _fail_on_negative, r) for r in (900, -1, 500)]
+    out = pg.run_designs(items, workers=2, chunksize=1)
+    assert [r.ok for r in out] == [True, False, True]
+    assert out[1].index == 1 and out[1].error_type == "ValueError"
+    assert "negative range" in out[1].traceback
+    assert out[0].WTO > out[2].WTO               # input order, not completion order
+    assert out[2].WTO == pytest.approx(pg.evaluate(base, _set_range, 500).WTO, rel=1e-9)
+
+
+@pytest.mark.slow
+def test_run_designs_serial_matches_pool():
+    configs = [_traditional_aircraft_config(), _traditional_aircraft_config()]
+    configs[1].mission.range_mission = 600
+    serial = pg.run_designs(configs, workers=1)
+    pooled = pg.run_designs(configs, workers=2)
+    assert [r.WTO for r in serial] == pytest.approx([r.WTO for r in pooled], rel=1e-12)
+
+
+@pytest.mark.slow
+def test_store_serves_repeated_designs(tmp_path):
+    store = pg.ResultStore(tmp_path / "results.sqlite", timeseries=True)
+    config = _traditional_aircraft_config()
+    first = pg.run_design(config, store=store)
+    again = pg.run_design(config, store=store)
+    assert again._aircraft is None               # read back, not re-sized
+    assert again.from_cache and not first.from_cache
+    assert again.to_dict() == first.to_dict()
+    assert store.get_timeseries(config)["time"][-1] > 0
+    batch = pg.run_designs([config], workers=1, store=store)
+    assert batch[0].WTO == first.WTO
+    assert batch[0].from_cache
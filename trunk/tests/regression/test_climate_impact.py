@@ -0,0 +1,69 @@
+"""Climate metrics of the sample hybrid design: the shared-grid engine against the nested
+quadrature kept as the reference in ClimateImpact."""
+
+import numpy as np
+import pytest
+import scipy.integrate as integrate
+
+import PhlyGreen as pg
+import _sample_configs as sc
+
+
+@pytest.fixture(scope="module")
+def climate():
+    aircraft = pg.build_aircraft()
+    aircraft.configure(sc.hybrid_parallel_aircraft_config())
+    aircraft.MissionType = 'Continue'
+    ci = aircraft.climateimpact
+    ci.calculate_mission_emissions()
+    return ci
+
+
+@pytest.mark.slow
+def test_grid_atr_matches_the_quadrature_reference(climate):
+    climate.ATR_method = 'Grid'
+    grid = climate.ATR()
+    climate.ATR_method = 'Quadrature'
+    try:
+        reference = climate.ATR()
+    finally:
+        climate.ATR_method = 'Grid'
+    assert grid == pytest.approx(reference, rel=1e-3)
+
+
+@pytest.mark.slow
+def test_grid_response_matches_the_reference_forcing_and_temperature(climate):
+    response = climate.climate_response()
+    years = np.array([10.0, 32.5, 50.0, 90.0])
+    for s in ('co2', 'h2o', 'ch4', 'o3l'):
+        reference = [getattr(climate, 'rf_' + s)(y) for y in years]
+        np.testing.assert_allclose(np.interp(years, response.t, response.rf[s]), reference,
+                                   rtol=1e-3)
+    for y in (20.0, 60.0):
+        assert np.interp(y, response.t, response.DeltaT) == pytest.approx(climate.DeltaT(y),
+                                                                          rel=1e-3)
+    # halving the step leaves the metric unchanged
+    assert climate.climate_response(step=0.05).ATR == pytest.approx(response.ATR, rel=1e-6)
+    assert 0 < climate.ATR(species=('co2',)) < response.ATR
+
+
+@pytest.mark.slow
+def test_filippone_nox_matches_the_per_point_powertrain_walk(climate):
+    from PhlyGreen.ClimateImpact.ClimateImpact import EINOx_filippone
+    aircraft = climate.aircraft
+    mission, profile = aircraft.mission, aircraft.mission.profile
+    climate.EINOx_model = 'Filippone'
+    climate.calculate_mission_emissions()
+
+    # reference: re-solve the powertrain at every solver point of every segment
+    nox = 0.0
+    for i, sol in enumerate(mission.integral_solution):
+        t, beta = sol.t, sol.y[2]
+        alt, v0 = profile.Altitude(t), profile.Velocity(t)
+        power = mission.WTO * aircraft.performance.PoWTO_batch(
+            aircraft.DesignWTOoS, beta, profile.PowerExcess(t), 1, alt, mission.DISA, v0, 'TAS')
+        portata = np.array([p * aircraft.powertrain.Hybrid(profile.SuppliedPowerRatio(tk), a, v, p)[0]
+                            for tk, a, v, p in zip(t, alt, v0, power)]) / aircraft.weight.ef
+        EI = EINOx_filippone(portata, np.full(len(t), profile.Categories[i]))
+        nox += integrate.trapezoid(portata * EI, t) * 1e-3
+    assert climate.mission_emissions['nox'] == pytest.approx(nox, rel=1e-9)
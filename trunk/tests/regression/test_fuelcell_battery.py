@@ -2,6 +2,7 @@
 
 import copy
 
+import numpy as np
 import pytest
 
 import PhlyGreen as pg
@@ -54,6 +55,13 @@ def test_fuelcell_battery_design_closes_and_uses_both_sources():
     total = (w.WStructure + w.WPT + w.WBat + w.WH2_Fuel + w.WTank + w.WHeat_Exchanger
              + w.WPayload + w.WCrew + w.final_reserve)
     assert total == pytest.approx(w.WTO, rel=1e-3)
+    # the trajectory keeps the battery terminal power and its propulsive share apart
+    tr = aircraft.mission.trajectory
+    np.testing.assert_allclose(tr.battery_propulsive_power, tr.phi * tr.PP, rtol=1e-12)
+    assert np.all(tr.battery_power >= tr.battery_propulsive_power)
+    assert np.trapezoid(tr.battery_power, tr.t) == pytest.approx(aircraft.mission.EBat, rel=1e-12)
+    ps = pg.postprocess.power_timeseries(aircraft)
+    assert ps["battery_power"] is tr.battery_propulsive_power
 
 
 @pytest.mark.slow
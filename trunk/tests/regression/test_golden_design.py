@@ -8,6 +8,7 @@ Regenerate the baselines with ``python tests/regression/_generate_golden.py`` on
 a change is *meant* to alter results, and review the diff.
 """
 
+import copy
 import json
 import os
 
@@ -60,3 +61,43 @@ def test_hybrid_parallel_matches_golden():
     results = aircraft.results().to_dict()
     golden = _load_golden("hybrid_parallel_atr")
     _compare(results, golden, KEY_FIELDS + HYBRID_FIELDS)
+
+
+@pytest.mark.slow
+def test_single_pass_integrator_matches_golden_with_fewer_rhs_evaluations():
+    flags, kwargs = sc.traditional_config()
+    reference = design_from_config(flags, kwargs)
+    kwargs = copy.deepcopy(kwargs)
+    kwargs['MissionInput']['Integrator'] = 'BDF-single'
+    aircraft = design_from_config(flags, kwargs)
+    _compare(aircraft.results().to_dict(), _load_golden("traditional_atr"), KEY_FIELDS)
+    assert aircraft.mission.nfev < 0.7 * reference.mission.nfev
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("cell_class", [None, "I"], ids=["traditional", "hybrid_class_i"])
+def test_rk4_fixed_integrator_error_against_bdf(cell_class):
+    flags, kwargs = sc.traditional_config() if cell_class is None else sc.hybrid_parallel_config()
+    kwargs = copy.deepcopy(kwargs)
+    kwargs['MissionInput']['Integrator'] = 'RK4-fixed'
+    if cell_class is not None:
+        kwargs['CellInput']['Class'] = cell_class
+    aircraft = design_from_config(flags, kwargs)
+    report = aircraft.mission.integrator_error(aircraft.weight.WTO)
+    assert report['Ef'] < 1e-4
+    assert report.get('EBat', 0.0) < 1e-4
+    assert report['nfev'] < report['nfev_reference'] / 4
+
+
+@pytest.mark.slow
+def test_incremental_battery_sizing_matches_full_mission_search():
+    flags, kwargs = sc.hybrid_parallel_config()
+    kwargs = copy.deepcopy(kwargs)
+    kwargs['MissionInput']['Battery Sizing'] = 'Full'
+    reference = design_from_config(flags, kwargs)
+    aircraft = design_from_config(*sc.hybrid_parallel_config())
+    assert aircraft.battery.P_number == reference.battery.P_number
+    _compare(aircraft.results().to_dict(), reference.results().to_dict(),
+             KEY_FIELDS + HYBRID_FIELDS)
+    # packs already flown at a WTO are not flown again
+    assert sum(map(len, aircraft.mission.Past_P_n)) < sum(map(len, reference.mission.Past_P_n))
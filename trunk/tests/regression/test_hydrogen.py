@@ -68,6 +68,34 @@ def test_system_efficiency_is_a_sensible_fraction():
     assert 0.0 < eta < 1.0
 
 
+def test_polarization_curve_accepts_arrays():
+    fc = _ready_fuelcell()
+    i = np.array([0.05, 0.5, 1.2, 1.7])            # the last point is beyond j_lim
+    v = fc.PolarizationCurve(i, fc.Target_Press)
+    assert v == pytest.approx([fc.PolarizationCurve(x, fc.Target_Press) for x in i])
+
+
+def test_operating_point_solves_the_net_power_balance():
+    """The tabulated inversion lands on the exact root and follows a stack resize."""
+    from scipy.optimize import brentq
+    fc = _ready_fuelcell()
+    fc.aircraft.DesignPW = 200.0
+    for wto in (20000.0, 30000.0):
+        fc.ComputeAndStoreWeights(WTO=wto)
+        alt, power = 4000.0, 0.4 * fc.P_fc_rated
+        fc.ComputePRatio(alt, 120.0, power)
+        P_amb, T_amb = fc._get_env(alt)
+        target = power / (fc.EtaGB * fc.EtaEM * fc.EtaPM * fc.EtaProp)
+
+        def net(i):
+            I_tot = i * fc.A_cell_reale
+            P_gross = fc.N_cells * fc.PolarizationCurve(i, fc.Target_Press) * I_tot
+            P_air = fc._compute_air_system_power(P_amb, T_amb, I_tot)[0]
+            return P_gross - P_air - fc.P_fc_rated * fc.Fixed_Aux_Load - target
+
+        assert fc.i_op_last == pytest.approx(brentq(net, 1e-4, 1.0, xtol=1e-12), rel=1e-6)
+
+
 # --- full hydrogen design ---------------------------------------------------
 
 @pytest.mark.slow
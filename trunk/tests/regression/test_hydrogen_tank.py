@@ -3,7 +3,7 @@
 Requires CoolProp (para-hydrogen properties); skipped automatically if it is not
 installed. Covers tank sizing and the transient time_step physics (self-pressurization,
 venting at P_max, heater at P_min, mass depletion, vent accounting), plus a full hydrogen
-design + tracked mission.
+design + tracked mission (coupled tank states and explicit micro-steps).
 """
 
 import numpy as np
@@ -85,6 +85,35 @@ def test_heater_maintains_minimum_pressure():
     assert max(tank.history['Q_heater']) > 0                      # heater was used
 
 
+def test_tabulated_properties_match_propssi():
+    exact = LH2_Tank(500.0, _FakeAircraft(dict(TANK_INPUT, **{'Property Backend': 'PropsSI'})))
+    table = _make_tank(500.0)
+    assert exact.saturation is None and table.saturation.max_error <= 1e-6
+    for tank in (exact, table):
+        for dt, m_dot, altitude, n in ((10.0, 0.0, 11000.0, 300), (5.0, 0.5, 0.0, 40)):
+            for _ in range(n):
+                tank.time_step(dt=dt, m_dot_req_total=m_dot, altitude=altitude)
+    for key in ('P', 'm_tot', 'Vent', 'Q_in', 'Q_heater'):
+        np.testing.assert_allclose(table.history[key], exact.history[key], rtol=1e-6, atol=1e-12)
+    # a bulk density outside the two-phase dome is left to the exact path
+    assert table.saturation.state(table.P_min, 80.0) is None
+
+
+def test_history_grows_past_its_preallocation():
+    tank = _make_tank(500.0)
+    n = tank.history._data.shape[1] + 10
+    for _ in range(n):
+        tank.time_step(dt=1.0, m_dot_req_total=0.05, altitude=6000.0)
+    assert len(tank.history) == n
+    np.testing.assert_allclose(tank.history['t'], np.arange(n))
+    assert tank.history['m_tot'][-1] == pytest.approx(tank.m_curr * tank.n_tanks)
+
+
+def test_unknown_property_backend_raises():
+    with pytest.raises(ValueError):
+        LH2_Tank(500.0, _FakeAircraft(dict(TANK_INPUT, **{'Property Backend': 'Refprop'})))
+
+
 # --- full hydrogen design with the tank -------------------------------------
 
 def _hydrogen_config_with_tank():
@@ -124,3 +153,56 @@ def test_hydrogen_design_with_tank_and_tracked_mission():
     assert P.max() <= aircraft.tank.P_max / 1e5 + 1e-6
     # hydrogen is consumed over the mission
     assert h['m_tot'][-1] < h['m_tot'][0]
+
+
+@pytest.mark.slow
+def test_coupled_tank_tracking_is_step_size_independent():
+    aircraft = pg.build_aircraft()
+    aircraft.configure(_hydrogen_config_with_tank())
+    mission, tank = aircraft.mission, aircraft.tank
+    mission.track_tank = True
+
+    def fly(tracking, max_step):
+        mission.tank_tracking = tracking
+        mission.integrator_max_step = max_step
+        mission.EvaluateMission(aircraft.weight.WTO)
+        h = tank.history
+        return h['m_tot'][-1], h['m_vent_cum'][-1], h['P'].max()
+
+    coarse = fly('Coupled', 60.0)
+    fine = fly('Coupled', 5.0)
+    # the coupled states do not depend on the solver steps...
+    np.testing.assert_allclose(coarse, fine, rtol=1e-3)
+    assert coarse[2] <= tank.P_max / 1e5 + 1e-6
+    # ... and agree with the explicit micro-step tracking
+    micro = fly('Micro-step', 60.0)
+    assert coarse[0] == pytest.approx(micro[0], rel=1e-3)
+    assert coarse[1] == pytest.approx(micro[1], rel=0.05)
+
+
+@pytest.mark.slow
+def test_tank_history_post_processing_follows_the_tracking_mode():
+    from PhlyGreen import postprocess as pp
+
+    aircraft = pg.build_aircraft()
+    aircraft.configure(_hydrogen_config_with_tank())
+    mission, tank = aircraft.mission, aircraft.tank
+    m0 = tank.m_curr * tank.n_tanks
+
+    # after an untracked flight the coupled states are integrated post hoc...
+    h = pp.compute_tank_history(aircraft)
+    post = h['m_tot'][-1], h['m_vent_cum'][-1]
+    assert h['P'].max() <= tank.P_max / 1e5 + 1e-6
+
+    # ... and agree with the tank tracked in flight, whose history is returned as is
+    mission.track_tank = True
+    mission.EvaluateMission(aircraft.weight.WTO)
+    tracked = tank.history
+    assert pp.compute_tank_history(aircraft) is tracked
+    assert post[0] == pytest.approx(tracked['m_tot'][-1], abs=1e-3 * m0)
+    assert post[1] == pytest.approx(tracked['m_vent_cum'][-1], rel=1e-3)
+
+    # the micro-step mode keeps the explicit loop over the solver steps
+    mission.tank_tracking = 'Micro-step'
+    h = pp.compute_tank_history(aircraft)
+    assert len(h) == sum(len(sol.t) - 1 for sol in mission.integral_solution)
@@ -111,3 +111,44 @@ def test_write_timeseries_requires_aircraft():
     from PhlyGreen.results import AircraftResults
     with pytest.raises(ValueError):
         AircraftResults().write_timeseries("/tmp/should_not_be_written.csv")
+
+
+@pytest.mark.slow
+def test_mission_trajectory_matches_a_per_point_powertrain_walk():
+    aircraft = design_from_config(*sc.hybrid_parallel_config())
+    mission, profile = aircraft.mission, aircraft.mission.profile
+    trajectory = mission.trajectory
+    n = sum(len(sol.t) for sol in mission.integral_solution)
+    assert len(trajectory) == n and trajectory.PRatio.shape[0] == n
+    assert trajectory.segment[-1] == len(mission.integral_solution) - 1
+
+    # reference: the powertrain re-solved at every solver point
+    t = np.concatenate([sol.t for sol in mission.integral_solution])
+    beta = np.concatenate([sol.y[2] for sol in mission.integral_solution])
+    alt, vel = profile.Altitude(t), profile.Velocity(t)
+    PP = mission.WTO * aircraft.performance.PoWTO_batch(
+        aircraft.DesignWTOoS, beta, profile.PowerExcess(t), 1, alt, mission.DISA, vel, 'TAS')
+    PR = np.array([aircraft.powertrain.Hybrid(float(profile.SuppliedPowerRatio(t[i])),
+                                              alt[i], vel[i], PP[i]) for i in range(n)])
+    np.testing.assert_allclose(trajectory.PP, PP, rtol=1e-12)
+    np.testing.assert_allclose(trajectory.PRatio, PR, rtol=1e-12)
+    np.testing.assert_allclose(trajectory.fuel_flow, PP * PR[:, 0] / mission.ef, rtol=1e-12)
+    assert mission.Max_PBat == pytest.approx(np.max(PP * PR[:, 5]))
+
+    # the post-processing reads the record
+    ps = pp.power_timeseries(aircraft)
+    assert ps["gt_power"] is trajectory.gt_power and ps["em_power"] is trajectory.battery_power
+    if aircraft.battery.BatteryClass == 'II':
+        assert np.nanmax(trajectory.battery_heat) > 0.0
+
+
+@pytest.mark.slow
+def test_hydrogen_trajectory_integrates_to_the_mission_hydrogen():
+    aircraft = design_from_config(*sc.hydrogen_config())
+    mission = aircraft.mission
+    trajectory = mission.trajectory
+    burned = np.trapezoid(trajectory.fuel_flow, trajectory.t)
+    assert burned == pytest.approx(mission.Ef[-1] / mission.ef, rel=1e-3)
+    assert np.all(trajectory.fc_heat >= 0.0) and np.max(trajectory.fc_heat) > 0.0
+    assert trajectory.gt_power is None
+    assert np.isnan(pp.power_timeseries(aircraft)["gt_power"]).all()
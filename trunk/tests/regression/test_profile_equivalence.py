@@ -69,3 +69,23 @@ def test_supplied_power_ratio_matches_legacy():
     for t in grid:
         assert float(new.SuppliedPowerRatio(t)) == pytest.approx(
             float(legacy.SuppliedPowerRatio(t)), abs=1e-9)
+
+
+@pytest.mark.parametrize("config_fn", [sc.hybrid_parallel_config, sc.traditional_config],
+                         ids=["hybrid", "traditional"])
+def test_array_lookups_match_scalar_lookups(config_fn):
+    """The compiled lookups evaluate a whole time vector in one call, point-for-point equal
+    to the legacy scalar lookups (including exactly on the segment breaks)."""
+    new, legacy = _build_both(config_fn)
+    grid = np.sort(np.concatenate([np.linspace(0, float(legacy.MissionTime2), 400),
+                                   np.asarray(legacy.Breaks[1:], float)]))
+    for name in ("Altitude", "Velocity", "PowerExcess"):
+        vec = getattr(new, name)(grid)
+        assert vec.shape == grid.shape
+        ref = np.array([float(getattr(legacy, name)(t)) for t in grid])
+        assert np.allclose(vec, ref, atol=1e-6)
+    if new.SPW is not None:
+        inner = grid[(grid > 0) & (grid < float(legacy.MissionTime2))]
+        ref = np.array([float(legacy.SuppliedPowerRatio(t)) for t in inner])
+        # bit-for-bit: the Class-II battery thermostat makes the mission sensitive to ulps
+        assert np.array_equal(new.SuppliedPowerRatio(inner), ref)
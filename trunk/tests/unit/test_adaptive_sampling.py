@@ -0,0 +1,84 @@
+"""Unit tests for the adaptive training-map sampler (Systems/Powertrain/adaptive_sampling.py).
+
+Fast: analytic responses stand in for the physics runs.
+"""
+
+import numpy as np
+import pytest
+from scipy.interpolate import RBFInterpolator
+
+from PhlyGreen.Systems.Powertrain.adaptive_sampling import (
+    adaptive_sample, latin_hypercube, loo_errors)
+
+
+def _response(X):
+    x, y = X[:, 0], X[:, 1]
+    return np.column_stack([np.tanh(8.0 * (x - 0.6)) + 0.3 * y, x * y])
+
+
+def test_latin_hypercube_has_one_point_per_stratum():
+    U = latin_hypercube(12, 3, rng=1)
+    assert U.shape == (12, 3)
+    for j in range(3):
+        assert sorted(np.floor(U[:, j] * 12).astype(int)) == list(range(12))
+
+
+def test_loo_errors_match_refitting_without_each_point():
+    rng = np.random.default_rng(0)
+    X = rng.random((25, 2)) * [30000.0, 0.6]
+    Y = _response(X / [30000.0, 0.6])
+    e = loo_errors(X, Y)
+    U = (X - X.min(axis=0)) / np.ptp(X, axis=0)
+    Z = (Y - Y.min(axis=0)) / np.ptp(Y, axis=0)
+    for i in (0, 7, 24):
+        keep = np.arange(len(X)) != i
+        fit = RBFInterpolator(U[keep], Z[keep], kernel="cubic", degree=1)
+        np.testing.assert_allclose(e[i], Z[i] - fit(U[i:i + 1])[0], atol=1e-8)
+
+
+def test_adaptive_run_reaches_tolerance_and_skips_failed_points():
+    def evaluate(X):
+        Y = _response(X)
+        Y[X[:, 0] > 0.95] = np.nan          # a corner where the "physics" fails
+        return Y
+
+    res = adaptive_sample(evaluate, [(0.0, 1.0), (0.0, 1.0)], tol=0.01, n_max=150,
+                          verbose=False)
+    assert len(res.X) < 150
+    assert np.all(res.error <= 0.01)
+    assert not res.ok[res.X[:, 0] > 0.95].any()
+    assert res.ok.sum() == len(res.X) - (res.X[:, 0] > 0.95).sum()
+    assert res.history[-1][0] == len(res.X)
+
+
+def test_pool_mode_evaluates_caller_rows_and_fixed_points_first():
+    g = np.linspace(0.0, 1.0, 9)
+    pool = np.array(np.meshgrid(g, g, indexing="ij")).reshape(2, -1).T * [1000.0, 2.0]
+    fixed = pool[:3]
+    seen = []
+
+    def evaluate(X):
+        seen.append(X)
+        return _response(X / [1000.0, 2.0])
+
+    res = adaptive_sample(evaluate, [(0.0, 1000.0), (0.0, 2.0)], n_init=6, batch=3, n_max=30,
+                          x_fixed=fixed, candidates=pool, tol=1e-6, verbose=False)
+    assert len(res.X) == 30
+    np.testing.assert_array_equal(res.X[:3], fixed)
+    rows = {tuple(r) for r in pool}
+    assert all(tuple(r) in rows for r in res.X)
+    assert len({tuple(r) for r in res.X}) == len(res.X)
+    np.testing.assert_array_equal(np.vstack(seen), res.X)
+
+
+def test_too_few_successful_points_raises():
+    with pytest.raises(RuntimeError, match="too few"):
+        adaptive_sample(lambda X: np.full((len(X), 1), np.nan), [(0.0, 1.0)], n_max=20,
+                        verbose=False)
+
+
+def test_sampler_is_quiet_unless_asked(capsys):
+    adaptive_sample(lambda X: _response(X), [(0.0, 1.0), (0.0, 1.0)], n_max=30)
+    assert capsys.readouterr().out == ""
+    adaptive_sample(lambda X: _response(X), [(0.0, 1.0), (0.0, 1.0)], n_max=30, verbose=True)
+    assert "adaptive sampling: 20 points" in capsys.readouterr().out
@@ -0,0 +1,80 @@
+"""Unit tests for the vectorized Class-II cell kernel (Battery.cell_kernel).
+
+The kernel must reproduce the validating scalar path (Power_2_current, Vout, Voc, SOC and
+the heatLoss waste heat) and flag exactly the points where that path raises BatteryError,
+with the same error code.
+"""
+
+import types
+
+import numpy as np
+import pytest
+
+from PhlyGreen.Systems.Battery.Battery import Battery, BatteryError
+
+CELL_INPUT = {
+    'Class': 'II', 'Model': 'Finger-Cell-Thermal', 'SpecificPower': 8000,
+    'SpecificEnergy': 1500, 'Minimum SOC': 0.2, 'Pack Voltage': 800,
+    'Initial temperature': 25, 'Max operative temperature': 50,
+}
+
+
+def _pack(P_number=130):
+    aircraft = types.SimpleNamespace(CellInput=CELL_INPUT, mission=types.SimpleNamespace())
+    aircraft.mission.T_battery_limit = 50.
+    battery = Battery(aircraft)
+    battery.SetInput()
+    battery.Configure(P_number)
+    battery.phi = 0.5
+    return battery
+
+
+def _scalar(battery, P, it, T):
+    try:
+        battery.T = T
+        battery.it = it
+        battery.i = battery.Power_2_current(P)
+        Vout, Voc, SOC = battery.Vout, battery.Voc, battery.SOC
+        _, heat = battery.heatLoss(280.0, 1.0)
+    except BatteryError as err:
+        return err.code, None
+    return None, (battery.i, Vout, Voc, SOC, heat)
+
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+def test_cell_kernel_matches_the_validating_scalar_path():
+    battery = _pack()
+    rng = np.random.default_rng(1)
+    n = 400
+    # Stay where the waste heat is positive: heatLoss raises the coolant flow (proportional to
+    # it) to a fractional power. That needs discharge (P >= 0) and a spent charge below the
+    # temperature-derated capacity Q(T), which is above 0.9 of nominal from 295 K.
+    P = rng.uniform(0.0, 1.5e7, n)
+    P[:10] = 0.0
+    it = rng.uniform(0.0, 0.9 * battery.cell_capacity * battery.P_number, n)
+    T = rng.uniform(295.0, 330.0, n)
+    state = battery.cell_kernel(P, it, T)
+    codes = set()
+    for k in range(n):
+        code, values = _scalar(battery, P[k], it[k], T[k])
+        codes.add(code)
+        if code is None:
+            assert state.feasible[k]
+            kernel = (state.i[k], state.Vout[k], state.Voc[k], state.SOC[k], state.heat[k])
+            assert kernel == pytest.approx(values, rel=1e-12)
+        else:
+            assert not state.feasible[k]
+            assert state.first_violation() is not None
+            assert battery.cell_kernel(P[k], it[k], T[k]).first_violation() == (0, code)
+    # the sample exercises the feasible points and several limits
+    assert {None, 'SOC_OUTSIDE_LIMITS', 'BATT_UNDERPOWERED'} <= codes
+
+
+def test_cell_kernel_leaves_the_battery_state_alone():
+    battery = _pack()
+    battery.T, battery.it, battery.i = 300.0, 10.0, 50.0
+    state = battery.cell_kernel([0.0, 1.0e6], [0.0, 20.0], [298.15, 310.0])
+    assert (battery.T, battery.it, battery.i) == (300.0, 10.0, 50.0)
+    assert state.i[0] == 0.0 and state.heat[0] == 0.0
+    assert state.first_violation() is None
+    assert np.shape(battery.cell_kernel(1.0e6, 20.0, 310.0).i) == ()
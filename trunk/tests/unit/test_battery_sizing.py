@@ -0,0 +1,70 @@
+"""Unit tests for the cell-only Class-II battery flights (PhlyGreen.Mission.battery_sizing).
+
+A toy pack stands in for the battery: it draws ``i = P / V`` from a fixed voltage and fails
+when the current per parallel string or the spent charge exceed their limits. That makes the
+minimal feasible P-number known in closed form.
+"""
+
+import numpy as np
+import pytest
+
+from PhlyGreen.Mission.battery_sizing import PowerHistory
+from PhlyGreen.Systems.Battery.Battery import BatteryError
+
+VOLTAGE = 800.0
+CELL_CURRENT_MAX = 2.0   # A per parallel string
+CELL_CHARGE = 3600.0     # A s per parallel string
+
+
+class _ToyPack:
+    def __init__(self):
+        self.P = None
+        self.starts = 0
+
+    def start(self, P_number):
+        self.starts += 1
+        self.P = P_number
+        return True, None
+
+    def rates(self, phi, power, it, T, Tamb, rho):
+        i = phi * power / VOLTAGE
+        if i / self.P > CELL_CURRENT_MAX:
+            raise BatteryError("current", code="CURR_OUTSIDE_LIMITS")
+        if it / self.P > CELL_CHARGE:
+            raise BatteryError("charge", code="SOC_OUTSIDE_LIMITS")
+        return i * VOLTAGE, i, (Tamb - T) / 100.0
+
+
+def _history():
+    history = PowerHistory()
+    # climb at 400 kW with phi 0.5, then a 1200 s cruise at 200 kW with phi ramping 0 -> 1
+    t = np.linspace(0.0, 600.0, 7)
+    history.add_segment(t, np.full(7, 4.0e5), np.full(7, 0.5), np.full(7, 280.0),
+                        np.full(7, 1.0), t[::2])
+    t = np.linspace(600.0, 1800.0, 13)
+    history.add_segment(t, np.full(13, 2.0e5), (t - 600.0) / 1200.0, np.full(13, 260.0),
+                        np.full(13, 0.5), t[::3])
+    return history
+
+
+def test_cell_flight_limits_and_outputs():
+    history, pack = _history(), _ToyPack()
+    y0 = [0.0, 0.0, 298.15]
+    # peak current 250 A -> 125 strings; charge 250*600 + 125*1200 = 3.0e5 A s -> 84 strings
+    assert history.fly(124, pack.start, pack.rates, y0)[:2] == (False, 'CURR_OUTSIDE_LIMITS')
+    ok, code, solutions = history.fly(125, pack.start, pack.rates, y0)
+    assert ok and code is None
+    assert [len(sol.t) for sol in solutions] == [4, 5]
+    it_end = solutions[-1].y[1, -1]
+    assert it_end == pytest.approx(250.0 * 600.0 + 125.0 * 1200.0, rel=1e-6)
+    assert solutions[-1].y[0, -1] == pytest.approx(it_end * VOLTAGE, rel=1e-6)
+    assert solutions[1].y[:, 0] == pytest.approx(solutions[0].y[:, -1])
+
+
+def test_cell_flights_are_cached_per_P():
+    history, pack = _history(), _ToyPack()
+    first = history.fly(130, pack.start, pack.rates, [0.0, 0.0, 298.15])
+    nfev = history.nfev
+    assert history.fly(130, pack.start, pack.rates, [0.0, 0.0, 298.15]) is first
+    assert pack.starts == 1 and history.nfev == nfev
+    assert history.fly(0, pack.start, pack.rates, [0.0, 0.0, 298.15]) == (False, None, [])
@@ -0,0 +1,57 @@
+"""Unit tests for the shared-grid climate engine (PhlyGreen.ClimateImpact.climate_engine)."""
+
+import numpy as np
+import pytest
+
+from PhlyGreen.ClimateImpact import climate_engine as ce
+
+
+def test_grid_holds_the_schedule_kinks():
+    t = ce.grid(100, step=0.3, kinks=(0, 30, 35, 65, 120))
+    assert t[0] == 0.0 and t[-1] == 100.0
+    for kink in (30, 35, 65):
+        assert kink in t
+    assert np.all(np.diff(t) > 0) and np.max(np.diff(t)) <= 0.3 + 1e-12
+
+
+def test_exp_convolution_is_exact_for_linear_signals():
+    # int_0^t exp(-(t-k)/tau) k dk = tau*t - tau^2 (1 - exp(-t/tau))
+    tau = 12.0
+    t = ce.grid(50, step=5.0)
+    exact = tau * t - tau**2 * (1 - np.exp(-t / tau))
+    np.testing.assert_allclose(ce.exp_convolution(t, t, tau), exact, rtol=1e-12, atol=1e-12)
+    # an infinite time scale is the cumulative integral
+    np.testing.assert_allclose(ce.exp_convolution(t, t, np.inf), 0.5 * t**2, rtol=1e-12)
+
+
+def test_short_steps_keep_the_convolution_accurate():
+    t = ce.grid(1e-3, step=1e-9)
+    f = np.ones_like(t)
+    assert ce.exp_convolution(t, f, 313.8)[-1] == pytest.approx(313.8 * -np.expm1(-1e-3 / 313.8),
+                                                                rel=1e-9)
+
+
+def test_forcing_is_linear_in_the_emissions_but_co2():
+    t = ce.grid(100, kinks=(30, 35, 65))
+    U = np.interp(t, (0, 30, 35, 65), (0, 1e6, 1e6, 0))
+    em = {'co2': 5e3, 'h2o': 2e3, 'so4': 0.3, 'soot': 0.06, 'nox': 20.0}
+    one = ce.forcing(t, U, em, s_o3l=1.0, s_o3s=1.0, aic=1e-9)
+    two = ce.forcing(t, U, {k: 2 * v for k, v in em.items()}, s_o3l=1.0, s_o3s=1.0, aic=1e-9)
+    assert set(one) == set(ce.SPECIES)
+    for s in ('h2o', 'so4', 'soot', 'ch4', 'o3l', 'o3s'):
+        np.testing.assert_allclose(two[s], 2 * one[s])
+    # log CO2 forcing: sub-linear, and still there long after the phase-out (long memory)
+    assert two['co2'][-1] < 2 * one['co2'][-1]
+    assert one['co2'][-1] > 0.5 * one['co2'].max() and one['ch4'][-1] < 0
+
+
+def test_response_atr_of_all_species_is_the_atr():
+    t = ce.grid(100, kinks=(30, 35, 65))
+    U = np.interp(t, (0, 30, 35, 65), (0, 1e6, 1e6, 0))
+    rf = ce.forcing(t, U, {'co2': 5e3, 'h2o': 2e3, 'so4': 0.3, 'soot': 0.06, 'nox': 20.0},
+                    s_o3l=1.0, s_o3s=1.0, aic=0.0)
+    DeltaT = ce.temperature(t, sum(rf.values()))
+    response = ce.ClimateResponse(t=t, U=U, rf=rf, DeltaT=DeltaT, ATR=ce.average(t, DeltaT))
+    assert response.ATR_of(ce.SPECIES) == pytest.approx(response.ATR, rel=1e-12)
+    parts = sum(response.ATR_of((s,)) for s in ce.SPECIES)
+    assert parts == pytest.approx(response.ATR, rel=1e-12)       # the response is linear in RF
@@ -11,6 +11,7 @@ import _sample_configs as sc
 from PhlyGreen.config import (
     ConfigError, MissionConfig, EnergyConfig, CellConfig, WellToTankConfig,
     ClimateImpactConfig, AerodynamicsConfig, ConstraintsConfig, StagesConfig, Segment,
+    TankConfig,
 )
 
 
@@ -60,6 +61,29 @@ def test_negative_range_raises():
                       payload_weight=4560, crew_weight=500)
 
 
+def test_unknown_mission_integrator_raises():
+    with pytest.raises(ConfigError):
+        MissionConfig(range_mission=750, range_diversion=220, beta_start=0.97,
+                      payload_weight=4560, crew_weight=500, integrator="Euler")
+
+
+def test_unknown_battery_sizing_raises():
+    with pytest.raises(ConfigError):
+        MissionConfig(range_mission=750, range_diversion=220, beta_start=0.97,
+                      payload_weight=4560, crew_weight=500, battery_sizing="Bisection")
+
+
+def test_unknown_tank_tracking_raises():
+    with pytest.raises(ConfigError):
+        MissionConfig(range_mission=750, range_diversion=220, beta_start=0.97,
+                      payload_weight=4560, crew_weight=500, tank_tracking="Euler")
+
+
+def test_unknown_tank_property_backend_raises():
+    with pytest.raises(ConfigError):
+        TankConfig(max_diameter=2.4, property_backend="Refprop")
+
+
 def test_efficiency_above_one_raises():
     with pytest.raises(ConfigError):
         EnergyConfig(Ef=43.5e6, eta_gearbox=1.2)
@@ -94,3 +118,8 @@ def test_segment_with_type_requires_inputs():
 def test_takeoff_segment_serializes_to_phi_only():
     seg = Segment(name="Takeoff", phi=0.0)
     assert seg.to_stage_dict() == {"Supplied Power Ratio": {"phi": 0.0}}
+
+
+def test_unknown_atr_method_raises():
+    with pytest.raises(ConfigError):
+        ClimateImpactConfig(H=100, N=1.6e7, Y=30, atr_method="Monte Carlo")
@@ -0,0 +1,105 @@
+"""Unit tests for the resumable CRN batch runner
+(Systems/Powertrain/emissions_pipeline/crn_batch.py).
+
+Fast: a stub worker stands in for the CRN, and the batches run in this process.
+"""
+
+import os
+import sys
+import types
+
+import numpy as np
+import pytest
+
+PIPELINE = os.path.join(os.path.dirname(__file__), "..", "..", "PhlyGreen", "Systems",
+                        "Powertrain", "emissions_pipeline")
+sys.path.insert(0, os.path.abspath(PIPELINE))
+import crn_batch  # noqa: E402
+
+CALLS = []
+
+
+def _worker(payload):
+    CALLS.append(payload)
+    if payload < 0:
+        raise ValueError(f"no flame at {payload}")
+    return {"EI": 2.0 * payload}
+
+
+@pytest.fixture
+def store(tmp_path):
+    CALLS.clear()
+    return crn_batch.CRNResultStore(str(tmp_path / "results.sqlite"))
+
+
+def _jobs(payloads):
+    return [(crn_batch.job_key(p, "sig"), p) for p in payloads]
+
+
+def test_put_and_lookup(store):
+    rec = {"key": "a", "result": {"EI": [1.0, 2.0]}, "error_type": None, "message": None,
+           "traceback": None, "wall_time": 0.5, "finished": 1.0}
+    store.put(rec)
+    assert store.lookup(["a", "b"]) == [rec, None]
+    store.put(dict(rec, result={"EI": 3.0}))              # the last run of a key wins
+    assert store.lookup(["a"])[0]["result"] == {"EI": 3.0}
+    assert len(store) == 1
+
+
+def test_resume_skips_finished_points(store):
+    jobs = _jobs([1.0, 2.0, 3.0])
+    assert crn_batch.run_batch(jobs[:2], _worker, store, workers=1) == 2
+    assert crn_batch.run_batch(jobs, _worker, store, workers=1) == 1
+    assert CALLS == [1.0, 2.0, 3.0]
+    assert [rec["result"]["EI"] for rec in store.lookup([k for k, _ in jobs])] == [2.0, 4.0, 6.0]
+
+
+def test_failed_points_are_recorded_and_retried_on_request(store):
+    jobs = _jobs([1.0, -1.0])
+    assert crn_batch.run_batch(jobs, _worker, store, workers=1) == 2
+    ok, failed = store.lookup([k for k, _ in jobs])
+    assert ok["error_type"] is None and ok["wall_time"] >= 0.0
+    assert failed["result"] is None and failed["error_type"] == "ValueError"
+    assert failed["message"] == "no flame at -1.0" and "_worker" in failed["traceback"]
+
+    assert crn_batch.run_batch(jobs, _worker, store, workers=1) == 0     # failures are kept
+    assert crn_batch.run_batch(jobs, _worker, store, workers=1, retry_failed=True) == 1
+    assert CALLS == [1.0, -1.0, -1.0]
+
+
+def test_signature_follows_the_module_source_and_constants(tmp_path):
+    src, mech = tmp_path / "evap.py", tmp_path / "mech.yaml"
+    src.write_text("K = 1.0\n")
+    mech.write_text("species: []\n")
+    evap = types.SimpleNamespace(__file__=str(src), mech="mech.yaml", phase="gas",
+                                 **{n: 1.0 for n in crn_batch.EVAP_CONSTANTS})
+    evap.MODE_DATA = {"TO": {"T_in": 795.0}}
+    base = crn_batch.job_key("point", crn_batch.crn_signature(evap, "stepwise"))
+
+    evap.N_TAU_SEED = 20.0
+    seed = crn_batch.job_key("point", crn_batch.crn_signature(evap, "stepwise"))
+    evap.N_TAU_SEED = 1.0
+    evap.MODE_DATA["TO"]["T_in"] = 800.0
+    mode = crn_batch.job_key("point", crn_batch.crn_signature(evap, "stepwise"))
+    evap.MODE_DATA["TO"]["T_in"] = 795.0
+    src.write_text("K = 2.0\n")
+    edited = crn_batch.job_key("point", crn_batch.crn_signature(evap, "stepwise"))
+    assert len({base, seed, mode, edited}) == 4
+    src.write_text("K = 1.0\n")
+    assert crn_batch.job_key("point", crn_batch.crn_signature(evap, "stepwise")) == base
+
+
+def test_warm_start_plan_seeds_from_earlier_waves_only():
+    build = pytest.importorskip("build_pw127_surrogate")
+    rng = np.random.default_rng(3)
+    points, x = rng.random((20, 3)), rng.random((20, 4))
+    waves, seeds = build.warm_start_plan(points, x, wave=6)
+    assert [len(w) for w in waves] == [6, 6, 6, 2]
+    assert sorted(i for w in waves for i in w) == list(range(20))
+    assert all(seeds[i] is None for i in waves[0])
+    for w in range(1, len(waves)):
+        earlier = [j for wave in waves[:w] for j in wave]
+        for i in waves[w]:
+            d = np.sum((x[earlier] - x[i]) ** 2, axis=1)
+            assert seeds[i] == earlier[int(np.argmin(d))]
+    assert build.warm_start_plan(points, x, wave=6) == (waves, seeds)
@@ -75,3 +75,191 @@ def test_motor_efficiency_in_range_and_power_dependent():
 def test_motor_weight_positive():
     m = MotorEfficiencyModel(design_kw=1000, design_v=800, design_rpm=3000)
     assert m.weight() > 0
+
+
+def test_surrogate_registry_loads_once_and_reloads_changed_files(tmp_path):
+    from PhlyGreen.Systems.Powertrain import surrogate_registry
+    artifact = tmp_path / "map.txt"
+    artifact.write_text("v1")
+    loads = []
+
+    def loader(path):
+        loads.append(path)
+        return open(path).read()
+
+    assert surrogate_registry.get("test", artifact, loader) == "v1"
+    assert surrogate_registry.get("test", str(artifact), loader) == "v1"
+    assert len(loads) == 1
+    artifact.write_text("v2 (retrained)")
+    assert surrogate_registry.get("test", artifact, loader) == "v2 (retrained)"
+    assert len(loads) == 2
+
+
+def test_gas_turbine_models_share_the_packaged_surrogate():
+    from PhlyGreen.Systems.Powertrain.efficiency import GasTurbineEfficiencyModel
+    a = GasTurbineEfficiencyModel(design_power=2.0e6)
+    b = GasTurbineEfficiencyModel(design_power=1.0e6, n_engines=2)
+    assert a.surrogate is b.surrogate
+
+
+def test_propeller_artifact_matches_scipy_rbf_and_batches():
+    import numpy as np
+    from scipy.interpolate import Rbf
+    from PhlyGreen.Systems.Powertrain.propeller_surrogate import PropellerSurrogate, RBFKernel
+    rng = np.random.default_rng(0)
+    pts = rng.uniform(0.0, 1.0, (3, 40))
+    rbf = Rbf(*pts, np.sin(3.0 * pts[0]) + pts[1], function='multiquadric', smooth=0.1)
+    query = rng.uniform(0.0, 1.0, (2, 7))
+    kernel = RBFKernel.from_rbf(rbf)
+    assert kernel(*query, 0.5) == pytest.approx(rbf(*query, np.full(7, 0.5)), rel=1e-10)
+
+    prop = PropellerSurrogate.load_npz()
+    power, alt, speed = np.array([300.0, 900.0, 1800.0]), np.array([0.0, 3000.0, 7000.0]), 120.0
+    pitch = prop.solve_pitch(power, alt, speed, 1200.0)
+    eta = prop.get_efficiency(power, alt, speed, pitch, 1200.0)
+    assert pitch.shape == eta.shape == (3,)
+    single = prop.solve_pitch(900.0, 3000.0, speed, 1200.0)
+    assert isinstance(single, float) and single == pytest.approx(pitch[1], rel=1e-12)
+    assert prop.get_efficiency(900.0, 3000.0, speed, single, 1200.0) == pytest.approx(eta[1])
+
+
+def test_uniform_grid_table_is_exact_on_trilinear_data_and_clamps():
+    import numpy as np
+    from PhlyGreen.Utilities.Interpolation import UniformGridTable
+    grid = ((0.0, 10.0, 11), (-1.0, 1.0, 5), (0.0, 2.0, 3))
+    A, M, F = np.meshgrid(*[np.linspace(lo, hi, n) for lo, hi, n in grid], indexing="ij")
+    table = UniformGridTable(grid, 1.0 + 0.5 * A - 2.0 * M * F + A * M * F)
+    x = np.array([0.0, 3.3, 9.99]), np.array([-1.0, 0.25, 0.7]), np.array([0.1, 1.9, 2.0])
+    exact = 1.0 + 0.5 * x[0] - 2.0 * x[1] * x[2] + x[0] * x[1] * x[2]
+    assert table(*x) == pytest.approx(exact, rel=1e-12)
+    assert table(3.3, 0.25, 1.9) == pytest.approx(exact[1], rel=1e-12)
+    assert table(-5.0, -3.0, 9.0) == pytest.approx(table(0.0, -1.0, 2.0))
+
+
+def test_tabulated_gas_turbine_map_tracks_the_rbf():
+    import numpy as np
+    from PhlyGreen.Systems.Powertrain import surrogate_registry
+    rbf = surrogate_registry.gas_turbine()
+    table = surrogate_registry.gas_turbine(tabulated=True)
+    assert table is not rbf and table.table is not None
+    rng = np.random.default_rng(1)
+    for alt, mach, frac in zip(rng.uniform(0, 30000, 200), rng.uniform(0, 0.6, 200),
+                               rng.uniform(0.1, 1.0, 200)):
+        ref = rbf.predict(2000.0, alt, mach, 2000.0 * frac)
+        tab = table.predict(2000.0, alt, mach, 2000.0 * frac)
+        assert tab[0] == pytest.approx(ref[0], abs=1e-3)
+        assert tab[1:] == pytest.approx(ref[1:])
+
+
+def test_gas_turbine_weight_memo_is_kept_by_the_registry():
+    from PhlyGreen.Systems.Powertrain import surrogate_registry
+    rbf = surrogate_registry.gas_turbine()
+    table = surrogate_registry.gas_turbine(tabulated=True)
+    assert not hasattr(rbf, "_weights")
+    weight = rbf.predict(1234.5, 10000.0, 0.3, 800.0)[1]
+    memo = surrogate_registry.memo("gas_turbine_weight_lb", rbf._artifact)
+    assert memo[1234.5] == weight
+    assert table.predict(1234.5, 10000.0, 0.3, 800.0)[1] == weight   # same artifact, same memo
+
+
+@pytest.mark.parametrize("blades, cli", [(6, 0.5), (3, 0.45), (5, 0.72)])
+def test_hamilton_batch_matches_scalar(blades, cli):
+    import types
+    import numpy as np
+    import PhlyGreen.Utilities.Units as Units
+    from PhlyGreen.Systems.Powertrain.propeller_hamilton import Propeller
+    aircraft = types.SimpleNamespace(
+        constraint=types.SimpleNamespace(DISA=0.0),
+        PropellerInput={'Propeller Diameter': Units.ftTom(13), 'RPM': 1063.0, 'N_ENGINES': 2.,
+                        'N_BLADES': blades, 'ACTIVITY_FACTOR': 150,
+                        'INTEGRATED_LIFT_COEFFICIENT': cli})
+    prop = Propeller(aircraft)
+    prop.SetInput()
+    alt = np.array([0.0, 1500.0, 4000.0, 7000.0])
+    vel = np.array([60.0, 95.0, 130.0, 160.0])
+    power = np.array([4.0e6, 2.5e6, 1.5e6, 2.0e6])
+    batch = prop.ComputePropEfficiencyBatch(alt, vel, power)
+    scalar = [prop.ComputePropEfficiency(a, v, p) for a, v, p in zip(alt, vel, power)]
+    assert batch == pytest.approx(scalar, rel=0, abs=1e-10)
+    assert prop.ComputePropEfficiencyBatch(alt[1], vel[1], power[1]) == pytest.approx(scalar[1], abs=1e-10)
+
+
+def test_hamilton_geometry_change_after_setinput_is_picked_up():
+    import types
+    import PhlyGreen.Utilities.Units as Units
+    from PhlyGreen.Systems.Powertrain.propeller_hamilton import Propeller
+
+    def propeller(activity_factor):
+        aircraft = types.SimpleNamespace(
+            constraint=types.SimpleNamespace(DISA=0.0),
+            PropellerInput={'Propeller Diameter': Units.ftTom(13), 'RPM': 1063.0, 'N_ENGINES': 2.,
+                            'N_BLADES': 6, 'ACTIVITY_FACTOR': activity_factor,
+                            'INTEGRATED_LIFT_COEFFICIENT': 0.5})
+        prop = Propeller(aircraft)
+        prop.SetInput()
+        return prop
+
+    prop = propeller(150)
+    prop.TabulateEfficiency(points=(31, 50, 4), tolerance=5e-3)
+    prop.activity_factor = 100
+    assert prop.eta_table is None          # the table belonged to the old geometry
+    fresh = propeller(100)
+    assert prop.ComputePropEfficiency(1500.0, 95.0, 2.5e6) == fresh.ComputePropEfficiency(1500.0, 95.0, 2.5e6)
+    assert prop.ComputePropEfficiencyBatch(1500.0, 95.0, 2.5e6) == pytest.approx(
+        fresh.ComputePropEfficiencyBatch(1500.0, 95.0, 2.5e6), abs=1e-12)
+    assert fresh.ComputePropEfficiency(1500.0, 95.0, 2.5e6) != propeller(150).ComputePropEfficiency(1500.0, 95.0, 2.5e6)
+
+
+def test_hamilton_efficiency_table_within_tolerance_and_falls_back():
+    import types
+    import numpy as np
+    import PhlyGreen.Utilities.Units as Units
+    from PhlyGreen.Systems.Powertrain.propeller_hamilton import Propeller
+    aircraft = types.SimpleNamespace(
+        constraint=types.SimpleNamespace(DISA=0.0),
+        PropellerInput={'Propeller Diameter': Units.ftTom(13), 'RPM': 1063.0, 'N_ENGINES': 2.,
+                        'N_BLADES': 6, 'ACTIVITY_FACTOR': 150,
+                        'INTEGRATED_LIFT_COEFFICIENT': 0.5})
+    prop = Propeller(aircraft)
+    prop.SetInput()
+    alt = np.array([0.0, 1500.0, 4000.0, 7000.0, 3000.0])
+    vel = np.array([60.0, 95.0, 130.0, 160.0, 1.0])
+    power = np.array([4.0e6, 2.5e6, 1.5e6, 2.0e6, 1.0e3])
+    exact = [prop.ComputePropEfficiency(a, v, p) for a, v, p in zip(alt, vel, power)]
+
+    report = prop.TabulateEfficiency(points=(31, 50, 4), tolerance=5e-3)
+    assert report['points'] == (31, 50, 4)
+    assert report['max_error'] <= 5e-3
+    assert 0.0 < report['fallback_cells'] < 0.5
+    assert prop.eta_table_report is report
+    assert prop.TabulateEfficiency(points=(31, 50, 4), tolerance=5e-3) is report  # cached
+    tabulated = [prop.ComputePropEfficiency(a, v, p) for a, v, p in zip(alt, vel, power)]
+    assert tabulated[:4] == pytest.approx(exact[:4], rel=0, abs=5e-3)
+    # CP far below the tabulated range: answered by the exact model
+    assert np.isnan(prop.eta_table(0.01, 1e-4, 0.6))
+    assert tabulated[4] == exact[4]
+
+    # inside the kept cells, not only at their centres
+    grid = prop.eta_table.grid
+    rng = np.random.default_rng(0)
+    J, CP, Mtip = (rng.uniform(lo, hi, 20000) for lo, hi, _ in grid)
+    table = prop.eta_table(J, CP, Mtip)
+    kept = np.isfinite(table)
+    error = np.abs(table[kept] - prop._efficiency_batch(J[kept], CP[kept], Mtip[kept],
+                                                         J[kept]*Mtip[kept]/np.pi, strict=False))
+    assert np.nanmax(error) < 1.2 * 5e-3
+
+
+def test_hamilton_efficiency_tables_are_evicted_least_recently_used(monkeypatch):
+    from PhlyGreen.Systems.Powertrain import propeller_hamilton as ph
+    monkeypatch.setattr(ph, "_TABLES", {})
+    monkeypatch.setattr(ph, "_TABLES_MAX", 2)
+    monkeypatch.setattr(ph.Propeller, "_build_efficiency_table",
+                        lambda self, grid, tolerance: (object(), {'tolerance': tolerance}))
+    prop = ph.Propeller(None)
+    prop.n_blades, prop.activity_factor, prop.cli, prop.V_tip = 6, 150, 0.5, 700.0
+    first = prop.TabulateEfficiency(tolerance=1e-3)
+    prop.TabulateEfficiency(tolerance=2e-3)
+    assert prop.TabulateEfficiency(tolerance=1e-3) is first    # now the most recently used
+    prop.TabulateEfficiency(tolerance=3e-3)                    # evicts the 2e-3 table
+    assert [key[-1] for key in ph._TABLES] == [1e-3, 3e-3]
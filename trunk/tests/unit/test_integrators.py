@@ -0,0 +1,90 @@
+"""Unit tests for the mission integration backends (PhlyGreen.Mission.integrators).
+
+A piecewise right-hand side with jumps at known breaks stands in for the mission ODE: the
+single-pass backends must agree with the per-segment reference, honour the segment pinning
+hook, and spend fewer right-hand-side evaluations doing it.
+"""
+
+import numpy as np
+import pytest
+
+from PhlyGreen.Mission.integrators import RK4_STEP, integrate_segments
+
+BREAKS = np.array([0.0, 300.0, 2000.0, 2600.0])
+RATES = np.array([2.0, 0.5, 1.5])
+
+
+class _Piecewise:
+    """dy0/dt = -1e-4 rate(t) y0 (1 + y1/1000), dy1/dt = rate(t); rate jumps at BREAKS."""
+
+    def __init__(self):
+        self.pinned = None
+        self.calls = 0
+
+    def pin(self, index):
+        self.pinned = index
+
+    def rate(self, t):
+        if self.pinned is not None:
+            return RATES[self.pinned]
+        i = np.searchsorted(BREAKS, t, side='right') - 1
+        return RATES[min(max(i, 0), len(RATES) - 1)]
+
+    def __call__(self, t, y):
+        self.calls += 1
+        r = self.rate(t)
+        return [-1e-4 * r * y[0] * (1 + y[1] / 1000), r]
+
+
+def _run(method, **kwargs):
+    fun = _Piecewise()
+    sols = list(integrate_segments(fun, BREAKS, [1.0, 0.0], method=method, rtol=1e-6,
+                                   enter_segment=fun.pin, **kwargs))
+    return fun, sols
+
+
+def test_single_pass_matches_per_segment_reference():
+    _, ref = _run('BDF')
+    _, new = _run('BDF-single')
+    assert len(new) == len(ref) == len(BREAKS) - 1
+    for a, b in zip(ref, new):
+        assert b.y[:, -1] == pytest.approx(a.y[:, -1], rel=1e-4)
+    # piecewise-linear y1 is integrated exactly
+    assert new[-1].y[1, -1] == pytest.approx(np.sum(RATES * np.diff(BREAKS)), rel=1e-9)
+
+
+def test_single_pass_chains_states_and_unpins():
+    fun, sols = _run('BDF-single')
+    for prev, nxt in zip(sols[:-1], sols[1:]):
+        np.testing.assert_array_equal(prev.y[:, -1], nxt.y[:, 0])
+        assert prev.t[-1] < nxt.t[0] == pytest.approx(prev.t[-1])
+    assert fun.pinned is None
+
+
+def test_single_pass_needs_fewer_rhs_evaluations():
+    ref_fun, ref = _run('BDF')
+    new_fun, new = _run('BDF-single')
+    assert sum(s.nfev for s in new) == new_fun.calls
+    assert new_fun.calls < 0.8 * ref_fun.calls
+
+
+def test_rk4_fixed_marches_an_equal_step_grid_per_segment():
+    fun, rk4 = _run('RK4-fixed', max_step=100.0)
+    for sol, (t0, t1) in zip(rk4, zip(BREAKS[:-1], BREAKS[1:])):
+        n = int(np.ceil((t1 - t0) / 100.0))
+        assert len(sol.t) == n + 1 and sol.nfev == 4 * n
+        np.testing.assert_allclose(np.diff(sol.t[:-1]), (t1 - t0) / n)
+        # exact solution: ln y0 = -1e-4 (y1 + y1^2 / 2000)
+        y1 = sol.y[1, -1]
+        assert sol.y[0, -1] == pytest.approx(np.exp(-1e-4 * (y1 + y1**2 / 2000)), rel=1e-8)
+    assert sum(s.nfev for s in rk4) == fun.calls
+
+
+def test_rk4_fixed_default_step():
+    _, rk4 = _run('RK4-fixed')
+    assert [len(s.t) - 1 for s in rk4] == [int(np.ceil(d / RK4_STEP)) for d in np.diff(BREAKS)]
+
+
+def test_unknown_method_raises():
+    with pytest.raises(ValueError):
+        list(integrate_segments(_Piecewise(), BREAKS, [1.0, 0.0], method='Euler'))
@@ -0,0 +1,41 @@
+"""Unit tests for the array-capable Performance path.
+
+``PoWTO_batch`` must reproduce the stateful, point-by-point ``PoWTO`` over arrays of
+operating points, without touching the stored speed state.
+"""
+
+import numpy as np
+import pytest
+
+import PhlyGreen as pg
+
+
+@pytest.fixture
+def performance():
+    aircraft = pg.build_aircraft()
+    aircraft.aerodynamics.set_quadratic_polar(11.0, 0.8)
+    aircraft.aerodynamics.ClMin = 0.2
+    aircraft.aerodynamics.Cd_0 = 0.025
+    return aircraft.performance
+
+
+@pytest.mark.parametrize("speedtype,speed", [("TAS", 120.0), ("Mach", 0.4), ("KCAS", 190.0)])
+def test_batch_matches_pointwise(performance, speedtype, speed):
+    n = 50
+    alt = np.linspace(0.0, 8000.0, n)
+    beta = np.linspace(0.97, 0.85, n)
+    ps = np.linspace(-4.0, 10.0, n)
+    spd = np.full(n, speed)
+    batch = performance.PoWTO_batch(3500.0, beta, ps, 1, alt, 0.0, spd, speedtype)
+    assert batch.shape == (n,)
+    ref = [performance.PoWTO(3500.0, beta[i], ps[i], 1, alt[i], 0.0, speed, speedtype)
+           for i in range(n)]
+    assert np.allclose(batch, ref, rtol=1e-12)
+
+
+def test_batch_is_stateless(performance):
+    performance.PoWTO(3500.0, 0.95, 0.0, 1, 5000.0, 0.0, 130.0, 'TAS')
+    tas = performance.TAS
+    performance.PoWTO_batch(3500.0, np.array([0.9, 0.95]), 0.0, 1,
+                            np.array([1000.0, 2000.0]), 0.0, np.array([90.0, 95.0]), 'TAS')
+    assert performance.TAS == tas
@@ -0,0 +1,53 @@
+"""Unit tests for the persistent design-result store (PhlyGreen.result_store).
+
+Fast: results are built by hand, no design is run.
+"""
+
+import PhlyGreen as pg
+from PhlyGreen.results import AircraftResults
+import _sample_configs as sc
+
+
+def _config(range_nm=750):
+    config = sc.traditional_aircraft_config()
+    config.mission.range_mission = range_nm
+    return config
+
+
+def test_key_is_canonical_and_ignores_warm_start_hints():
+    config = _config()
+    warm = _config()
+    warm.mission.wto_guess, warm.mission.wto_slope = 18000.0, -0.33
+    assert pg.design_key(config) == pg.design_key(warm)
+    assert pg.design_key(config) != pg.design_key(_config(800))
+    assert pg.design_key(config) != pg.design_key(config, design=False)
+
+
+def test_round_trip_across_store_instances(tmp_path):
+    path = tmp_path / "results.sqlite"
+    results = AircraftResults(WTO=18000.0, Wf=1500.0, configuration="Traditional",
+                              inputs={"MissionInput": {"Range Mission": 750}})
+    pg.ResultStore(path).put(_config(), results)
+    again = pg.ResultStore(path).get(_config())
+    assert again.to_dict() == results.to_dict()
+    assert again.from_cache and not results.from_cache
+    assert pg.ResultStore(path).get(_config(800)) is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    store = pg.ResultStore(tmp_path / "results.sqlite", max_entries=2)
+    for r in (500, 600):
+        store.put(_config(r), AircraftResults(WTO=float(r)))
+    store.get(_config(500))                       # 600 is now the least recently used
+    store.put(_config(700), AircraftResults(WTO=700.0))
+    assert len(store) == 2
+    assert store.get(_config(600)) is None
+    assert store.get(_config(500)).WTO == 500.0
+
+
+def test_size_bound_keeps_the_newest_entry(tmp_path):
+    store = pg.ResultStore(tmp_path / "results.sqlite", max_bytes=1)
+    store.put(_config(500), AircraftResults(WTO=500.0))
+    store.put(_config(600), AircraftResults(WTO=600.0))
+    assert store.get(_config(500)) is None
+    assert store.get(_config(600)).WTO == 600.0
@@ -0,0 +1,70 @@
+"""Unit tests for the per-process Cantera object pool of the CRN emission pipeline
+(Systems/Powertrain/emissions_pipeline/crn/solution_pool.py).
+
+Requires Cantera; skipped automatically if it is not installed.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ct = pytest.importorskip("cantera")
+
+CRN_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "PhlyGreen", "Systems",
+                       "Powertrain", "emissions_pipeline", "crn")
+sys.path.insert(0, os.path.abspath(CRN_DIR))
+import solution_pool  # noqa: E402
+
+MECH = os.path.abspath(os.path.join(CRN_DIR, "kerosene_surrogate_luche.yaml"))
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """An empty pool that counts the mechanism parses."""
+    monkeypatch.setattr(solution_pool, "_MECHANISMS", {})
+    monkeypatch.setattr(solution_pool, "_SCRATCH", {})
+    parses = []
+    solution = ct.Solution
+
+    def counting(*args, **kwargs):
+        if args:                                  # ct.Solution(mech, phase) parses the file
+            parses.append(args)
+        return solution(*args, **kwargs)
+
+    monkeypatch.setattr(solution_pool.ct, "Solution", counting)
+    return parses
+
+
+def test_mechanism_is_parsed_once_and_found_by_relative_path(pool, monkeypatch):
+    a = solution_pool.new_solution(MECH, "gas")
+    monkeypatch.chdir(CRN_DIR)
+    b = solution_pool.new_solution("kerosene_surrogate_luche.yaml", "gas")
+    assert len(pool) == 1 and len(solution_pool._MECHANISMS) == 1
+    assert a is not b and a.species_names == b.species_names
+    assert a.n_reactions == b.n_reactions == ct.Solution(MECH, "gas").n_reactions
+    index = solution_pool.species_index(MECH, "gas")
+    assert index == {s: i for i, s in enumerate(a.species_names)}
+    assert solution_pool.species_index("kerosene_surrogate_luche.yaml", "gas") is index
+
+
+def test_new_solutions_are_independent(pool):
+    a = solution_pool.new_solution(MECH, "gas")
+    b = solution_pool.new_solution(MECH, "gas")
+    a.TPX = 1500.0, 2e6, "O2:1, N2:3.76"
+    b.TPX = 600.0, 1e5, "N2:1"
+    assert a.T == pytest.approx(1500.0) and b.T == pytest.approx(600.0)
+
+
+def test_scratch_is_reused_per_role_in_its_initial_state(pool):
+    fresh = solution_pool.new_solution(MECH, "gas")
+    gas = solution_pool.scratch(MECH, "gas", "mix")
+    gas.TPX = 1800.0, 3e6, "O2:1, N2:3.76"
+    gas.equilibrate("HP")
+    again = solution_pool.scratch(MECH, "gas", "mix")
+    assert again is gas
+    np.testing.assert_array_equal(again.state, fresh.state)
+    other = solution_pool.scratch(MECH, "gas", "outlet")
+    assert other is not gas
+    assert len(pool) == 1
@@ -37,6 +37,15 @@ def test_speed_of_sound_at_sea_level():
     assert Speed.soundspeed(0, 0.0) == pytest.approx(340.3, abs=0.5)
 
 
+def test_temperature_accepts_altitude_arrays():
+    # One call over an array of altitudes matches the point-by-point evaluation, across
+    # the troposphere, tropopause and lower-stratosphere layers.
+    h = np.linspace(-200, 31000, 301)
+    expected = np.array([ISA.atmosphere.Tstd(float(x)) for x in h])
+    assert np.array_equal(ISA.atmosphere.Tstd(h), expected)
+    assert ISA.atmosphere.Tstd(15000) == pytest.approx(216.65)
+
+
 # --- Speed conversions ------------------------------------------------------
 
 def test_mach_to_tas_at_sea_level():
@@ -81,6 +90,18 @@ def test_tas_exceeds_eas_at_altitude():
     assert Speed.EAS2TAS(100.0, 8000) > 100.0
 
 
+@pytest.mark.parametrize("speedtype", ["Mach", "TAS", "CAS", "KTAS", "KCAS"])
+def test_stateless_mach_tas_matches_scalar_conversions(speedtype):
+    speed = {"Mach": 0.45, "TAS": 140.0, "CAS": 110.0, "KTAS": 250.0, "KCAS": 200.0}[speedtype]
+    h = np.array([0.0, 3000.0, 7500.0])
+    mach, tas = Speed.MachTAS(np.full_like(h, speed), speedtype, h)
+    for k in range(len(h)):
+        m_k, tas_k = Speed.MachTAS(speed, speedtype, float(h[k]))
+        assert mach[k] == pytest.approx(m_k)
+        assert tas[k] == pytest.approx(tas_k)
+        assert Speed.TAS2Mach(tas_k, float(h[k])) == pytest.approx(m_k)
+
+
 # --- Units ------------------------------------------------------------------
 
 def test_unit_roundtrips():
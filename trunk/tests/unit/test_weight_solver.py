@@ -49,3 +49,46 @@ def test_reraises_when_no_bracket_exists():
     w = _solver()
     with pytest.raises(Exception):
         w._solve_wto(lambda x: 1.0, 1000, 300000, step=10000, xtol=1e-3)
+
+
+def _warm_solver(guess, slope=None):
+    return Weight(types.SimpleNamespace(MissionInput={'WTO Guess': guess,
+                                                      'WTO Residual Slope': slope}))
+
+
+def test_warm_start_converges_in_few_evaluations_and_reports_slope():
+    # Sizing-like residual: masses grow with WTO at ~0.67 kg/kg, so dR/dWTO ~ -0.33.
+    def func(x):
+        return 6000.0 + 0.6 * x + 1e-6 * x ** 2 - x
+
+    cold = _solver()
+    root = cold._solve_wto(func, 1000, 300000, xtol=0.1)
+    warm = _warm_solver(root * 1.03, cold.residual_slope)
+    assert warm._solve_wto(func, 1000, 300000, xtol=0.1) == pytest.approx(root, abs=0.1)
+    assert warm.residual_evaluations <= 4 < cold.residual_evaluations
+    assert warm.residual_slope == pytest.approx(-0.4 + 2e-6 * root, rel=1e-2)
+
+
+def test_warm_start_returns_the_last_evaluated_weight():
+    # The aircraft state left behind by the residual must belong to the returned root.
+    evaluated = []
+
+    def func(x):
+        evaluated.append(x)
+        return 20000.0 - x
+
+    root = _warm_solver(15000.0)._solve_wto(func, 1000, 300000, xtol=1e-3)
+    assert root == evaluated[-1] == pytest.approx(20000.0, abs=1e-3)
+
+
+def test_warm_start_falls_back_to_bracketed_solve():
+    # The guess lies in a region where the residual errors: the secant iteration gives up
+    # and the cold Brent + scan path still finds the root.
+    def func(x):
+        if x > 200000.0:
+            raise ValueError("infeasible region")
+        return x - 50000.0
+
+    w = _warm_solver(250000.0, slope=-0.5)
+    root = w._solve_wto(func, 1000, 300000, step=10000, xtol=1e-3)
+    assert root == pytest.approx(50000.0, abs=50.0)
@@ -15,7 +15,7 @@ import dataclasses
 
 # Enum-like (model / class / type) fields -> their allowed values. Rendered as selectboxes.
 ENUMS = {
-    "eta_gas_turbine_model": ["constant", "ResponseSurface"],
+    "eta_gas_turbine_model": ["constant", "ResponseSurface", "ResponseSurfaceTable"],
     "eta_propulsive_model": ["constant", "Hamilton", "Surrogate"],
     "eta_electric_motor_model": ["constant", "Smart"],
     "einox_model": ["Filippone", "Surrogate", "unset"],
@@ -306,9 +306,10 @@ def sweep_tab(arch, cfg):
     import numpy as np
     values = np.linspace(lo, hi, int(n))
     prog = st.progress(0.0, text="Sizing…")
-    rows = []
+    rows, warm = [], None
     for i, x in enumerate(values):
-        rows.extend(runner.sweep(cfg, knob, [x]))
+        rows.extend(runner.sweep(cfg, knob, [x], warm_start=warm))
+        warm = rows[-1]["results"] if rows[-1]["ok"] else warm
         prog.progress((i + 1) / len(values))
     prog.empty()
 
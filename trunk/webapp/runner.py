@@ -4,7 +4,9 @@
 mutated). Here we add only what a GUI needs on top: keep the *live aircraft* around (the
 ``postprocess`` plotters need it), turn a non-converging design into a friendly message instead
 of a traceback, and memoize scalar results so a parameter sweep / architecture comparison does
-not re-size an identical design twice.
+not re-size an identical design twice. Scalar results are also kept in the package's persistent
+:class:`PhlyGreen.ResultStore` (``$PHLYGREEN_CACHE_DIR``, default ``~/.cache/phlygreen``), so
+re-opening the dashboard does not re-size designs solved in an earlier session.
 
 No streamlit import here, so this module is unit-testable on its own.
 """
@@ -62,43 +64,74 @@ def _friendly_error(exc):
 # --- memoized scalar results (for sweeps / comparisons) ---------------------------------------
 _RESULTS_CACHE = {}
 _CACHE_CAP = 512
+_STORE = None
 
 
-def results_dict(config):
+def _result_store():
+    """The persistent result store, opened on first use (``None`` if it cannot be opened)."""
+    global _STORE
+    if _STORE is None:
+        try:
+            _STORE = pg.ResultStore()
+        except Exception:                         # noqa: BLE001 — e.g. read-only home
+            _STORE = False
+    return _STORE if _STORE is not False else None
+
+
+def results_dict(config, warm_start=None):
     """Size the design and return ``AircraftResults.to_dict()`` (memoized on the config).
 
+    ``warm_start`` is the results dict of a neighbouring design: its converged take-off
+    weight and residual slope seed the WTO solver. It only changes the cost, so it is not
+    part of the memo key.
+
     Raises on a non-converging design — callers that want graceful handling use
     :func:`safe_results_dict`.
     """
     key = config_key(config)
     if key in _RESULTS_CACHE:
         return _RESULTS_CACHE[key]
-    aircraft = design(config)
-    res = aircraft.results().to_dict()
+    store = _result_store()
+    store_key = pg.design_key(config)
+    cached = store.get(store_key) if store is not None else None
+    if cached is not None:
+        res = cached.to_dict()
+    else:
+        if warm_start and warm_start.get("WTO") is not None:
+            config = clone(config)
+            config.mission.wto_guess = warm_start["WTO"]
+            config.mission.wto_slope = warm_start.get("wto_residual_slope")
+        results = design(config).results()
+        if store is not None:
+            store.put(store_key, results)
+        res = results.to_dict()
     if len(_RESULTS_CACHE) < _CACHE_CAP:
         _RESULTS_CACHE[key] = res
     return res
 
 
-def safe_results_dict(config):
+def safe_results_dict(config, warm_start=None):
     try:
-        return results_dict(config), None
+        return results_dict(config, warm_start), None
     except Exception as exc:                      # noqa: BLE001
         return None, _friendly_error(exc)
 
 
-def sweep(base_config, knob, values):
+def sweep(base_config, knob, values, warm_start=None):
     """Size ``base_config`` for each value of one :class:`controls.Knob`.
 
     Returns a list of rows ``{'x': value, 'ok': bool, 'results': dict|None, 'error': str|None}``,
-    using the knob's setter (the same one the Design tab uses).
+    using the knob's setter (the same one the Design tab uses). Each design warm-starts the
+    WTO solver from the last one that closed (``warm_start`` seeds the first point).
     """
     rows = []
     for x in values:
         cfg = clone(base_config)
         knob.setter(cfg, x)
-        res, err = safe_results_dict(cfg)
+        res, err = safe_results_dict(cfg, warm_start)
         rows.append({"x": float(x), "ok": err is None, "results": res, "error": err})
+        if err is None:
+            warm_start = res
     return rows
 
 
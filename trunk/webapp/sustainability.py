@@ -137,14 +137,7 @@ def _climate_atr(aircraft, co2_only=False):
     if not ci.mission_emissions_calculated:
         aircraft.MissionType = "Continue"
         ci.calculate_mission_emissions()
-    if not co2_only:
-        return ci.ATR()
-    original_rf = ci.rf
-    ci.rf = lambda year: ci.rf_co2(year)        # restrict the forcing to the CO₂ term
-    try:
-        return ci.ATR()
-    finally:
-        ci.rf = original_rf
+    return ci.ATR(species=("co2",) if co2_only else None)   # CO₂ term alone, or every species
 
 
 def gt_emissions(cfg, einox_model="Surrogate", aircraft=None):